@@ -24,6 +24,13 @@ def _invalidate_keys(keys: List[str]) -> None:
             _memory_cache.delete(k)
 
 
+def _invalidate_data_protection_levels(keys: List[str]) -> None:
+    """Drop cached user data protection levels (pub/sub callback)."""
+    from database.helpers import invalidate_data_protection_level_keys
+
+    invalidate_data_protection_level_keys(keys)
+
+
 def _ensure_initialized() -> None:
     """Initialize caches on first access."""
     global _memory_cache, _pubsub_manager, _initialized
@@ -37,6 +44,7 @@ def _ensure_initialized() -> None:
     # Register callbacks: when invalidation message received, clear memory cache
     _pubsub_manager.register_callback('get_public_approved_apps_data*', _invalidate_keys)
     _pubsub_manager.register_callback('get_popular_apps_data', _invalidate_keys)
+    _pubsub_manager.register_callback('data_protection_level:*', _invalidate_data_protection_levels)
 
     # Start pub/sub subscription
     _pubsub_manager.start()
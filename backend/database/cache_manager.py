@@ -3,18 +3,76 @@ In-memory LRU cache manager for reducing Redis egress costs.
 
 This module provides a thread-safe in-memory cache with:
 - LRU eviction when memory limit reached
-- Per-entry TTL support
-- Memory usage tracking
-- Thread-safe operations
+- Per-entry TTL support, with optional stale-while-revalidate in get_or_fetch
+- Memory usage tracking from a cheap structural size estimate
+- Sharded locking so readers of one key don't wait on writers of another,
+  with the byte budget shared by all shards
+- Hit/miss/eviction metrics exported through utils.metrics
 """
 
-import json
+import itertools
+import logging
 import sys
 import threading
 import time
 from collections import OrderedDict
 from dataclasses import dataclass
-from typing import Any, Callable, Dict, Optional
+from typing import Any, Callable, Dict, Optional, Set, Tuple
+
+from utils.metrics import (
+    IN_MEMORY_CACHE_BYTES,
+    IN_MEMORY_CACHE_EVICTIONS_TOTAL,
+    IN_MEMORY_CACHE_REFRESH_FAILURES_TOTAL,
+    IN_MEMORY_CACHE_REQUESTS_TOTAL,
+)
+
+logger = logging.getLogger(__name__)
+
+# Sequences longer than this are sized from an evenly strided sample and
+# extrapolated; app catalog lists hold hundreds of similar dicts.
+_SIZE_SAMPLE = 16
+# Below this depth objects are charged their shallow size only.
+_SIZE_MAX_DEPTH = 6
+
+_SCALARS = (str, bytes, bytearray, int, float, bool, type(None))
+
+
+def estimate_size(obj: Any, _depth: int = 0) -> int:
+    """
+    Estimate the in-memory footprint of a cached value in bytes.
+
+    Walks dicts fully (they are records with a bounded set of fields), samples
+    long sequences and charges objects with a ``__dict__`` (pydantic models)
+    for their fields. This replaces serializing the value to JSON on every
+    ``set``; the result is an estimate for budget accounting, not an exact size.
+
+    Args:
+        obj: Object to measure
+
+    Returns:
+        Estimated size in bytes
+    """
+    size = sys.getsizeof(obj)
+    if isinstance(obj, _SCALARS) or _depth >= _SIZE_MAX_DEPTH:
+        return size
+    depth = _depth + 1
+    if isinstance(obj, dict):
+        for key, value in obj.items():
+            size += estimate_size(key, depth) + estimate_size(value, depth)
+    elif isinstance(obj, (list, tuple, set, frozenset)):
+        count = len(obj)
+        if count <= _SIZE_SAMPLE:
+            size += sum(estimate_size(item, depth) for item in obj)
+        else:
+            if isinstance(obj, (list, tuple)):
+                sample = obj[:: count // _SIZE_SAMPLE][:_SIZE_SAMPLE]
+            else:
+                sample = list(itertools.islice(obj, _SIZE_SAMPLE))
+            sampled = sum(estimate_size(item, depth) for item in sample)
+            size += sampled * count // len(sample)
+    elif hasattr(obj, '__dict__'):
+        size += estimate_size(vars(obj), depth)
+    return size
 
 
 @dataclass
@@ -25,6 +83,25 @@ class CacheEntry:
     timestamp: float
     size_bytes: int
     ttl: int
+    stale_ttl: int = 0
+
+
+class _Shard:
+    """One lock-protected LRU partition of the cache."""
+
+    __slots__ = ('lock', 'cache', 'current_size', 'hits', 'stale_hits', 'misses', 'evictions')
+
+    def __init__(self):
+        self.lock = threading.Lock()
+        self.cache: OrderedDict[str, CacheEntry] = OrderedDict()
+        self.current_size = 0
+        self.hits = 0
+        self.stale_hits = 0
+        self.misses = 0
+        self.evictions = 0
+
+
+_HIT, _STALE, _MISS = 'hit', 'stale', 'miss'
 
 
 class InMemoryCacheManager:
@@ -35,7 +112,12 @@ class InMemoryCacheManager:
     - LRU eviction when memory limit reached
     - Per-entry TTL support
     - Memory usage tracking
-    - Thread-safe operations
+    - Thread-safe operations, one lock per shard
+
+    Keys are spread over ``num_shards`` independently locked LRU partitions
+    that share one byte budget. When it is exceeded, shards give up their
+    least recently used entry in turn, so eviction is LRU within a shard and
+    one large entry is paid for by the whole cache rather than its own shard.
 
     Example:
         cache = InMemoryCacheManager(max_memory_mb=100)
@@ -43,27 +125,82 @@ class InMemoryCacheManager:
         data = cache.get('key')  # Returns {'data': 'value'} if not expired
     """
 
-    def __init__(self, max_memory_mb: int = 100):
+    def __init__(self, max_memory_mb: int = 100, num_shards: int = 16, name: str = 'memory'):
         """
         Initialize cache manager.
 
         Args:
             max_memory_mb: Maximum memory in MB for cache (default: 100MB)
+            num_shards: Number of independently locked partitions (default: 16)
+            name: Label for the exported metrics (default: 'memory')
         """
         self.max_memory_bytes = max_memory_mb * 1024 * 1024
-        self.cache: OrderedDict[str, CacheEntry] = OrderedDict()
-        self.lock = threading.RLock()
-        self.current_size = 0
-
-        # Stats
-        self.hits = 0
-        self.misses = 0
-        self.evictions = 0
+        self.num_shards = max(1, num_shards)
+        self._shards = [_Shard() for _ in range(self.num_shards)]
+        # Round-robin cursor over the shards for eviction
+        self._evict_cursor = itertools.count()
+
+        # Metrics: resolve labelled children once, off the hot path
+        self._hit_counter = IN_MEMORY_CACHE_REQUESTS_TOTAL.labels(cache=name, result=_HIT)
+        self._stale_counter = IN_MEMORY_CACHE_REQUESTS_TOTAL.labels(cache=name, result=_STALE)
+        self._miss_counter = IN_MEMORY_CACHE_REQUESTS_TOTAL.labels(cache=name, result=_MISS)
+        self._eviction_counter = IN_MEMORY_CACHE_EVICTIONS_TOTAL.labels(cache=name)
+        self._bytes_gauge = IN_MEMORY_CACHE_BYTES.labels(cache=name)
+        self._refresh_failure_counter = IN_MEMORY_CACHE_REFRESH_FAILURES_TOTAL.labels(cache=name)
 
         # Singleflight: per-key locks with refcount to prevent thundering herd
         self._fetch_locks: Dict[str, threading.Lock] = {}
         self._fetch_refcounts: Dict[str, int] = {}
         self._fetch_lock_manager = threading.Lock()
+        # Keys with a stale-while-revalidate refresh in flight, and those of them
+        # deleted since the refresh started, whose result must not be written back
+        self._refreshing: Set[str] = set()
+        self._refresh_invalidated: Set[str] = set()
+
+    def _shard(self, key: str) -> _Shard:
+        return self._shards[hash(key) % self.num_shards]
+
+    def _lookup(self, key: str, allow_stale: bool) -> Tuple[Optional[Any], str]:
+        """
+        Look up a key and classify the result as hit, stale or miss.
+
+        Entries past their TTL but inside their stale window are kept (so
+        get_or_fetch can serve them while refreshing) but are misses unless
+        ``allow_stale`` is set.
+        """
+        shard = self._shard(key)
+        freed = 0
+        with shard.lock:
+            entry = shard.cache.get(key)
+            if entry is None:
+                result, value = _MISS, None
+            else:
+                age = time.time() - entry.timestamp
+                if age <= entry.ttl:
+                    result, value = _HIT, entry.data
+                elif age <= entry.ttl + entry.stale_ttl:
+                    result, value = (_STALE, entry.data) if allow_stale else (_MISS, None)
+                else:
+                    freed = self._delete_locked(shard, key)
+                    result, value = _MISS, None
+
+            if result == _HIT:
+                shard.cache.move_to_end(key)
+                shard.hits += 1
+            elif result == _STALE:
+                shard.stale_hits += 1
+            else:
+                shard.misses += 1
+
+        if freed:
+            self._bytes_gauge.dec(freed)
+        if result == _HIT:
+            self._hit_counter.inc()
+        elif result == _STALE:
+            self._stale_counter.inc()
+        else:
+            self._miss_counter.inc()
+        return value, result
 
     def get(self, key: str) -> Optional[Any]:
         """
@@ -75,41 +212,35 @@ class InMemoryCacheManager:
         Returns:
             Cached data if exists and not expired, None otherwise
         """
-        with self.lock:
-            if key not in self.cache:
-                self.misses += 1
-                return None
-
-            entry = self.cache[key]
+        return self._lookup(key, allow_stale=False)[0]
 
-            # Check TTL
-            if time.time() - entry.timestamp > entry.ttl:
-                self._delete_locked(key)
-                self.misses += 1
-                return None
-
-            # Move to end (LRU)
-            self.cache.move_to_end(key)
-            self.hits += 1
-            return entry.data
-
-    def get_or_fetch(self, key: str, fetch_fn: Callable[[], Any], ttl: int = 30) -> Any:
+    def get_or_fetch(self, key: str, fetch_fn: Callable[[], Any], ttl: int = 30, stale_ttl: int = 0) -> Any:
         """
         Get from cache or fetch with singleflight pattern.
 
         Only ONE concurrent request will call fetch_fn, others wait.
         This prevents the thundering herd problem.
 
+        With ``stale_ttl`` set, an entry up to ``stale_ttl`` seconds past its
+        TTL is returned immediately while one background thread refreshes it,
+        so callers never block on fetch_fn for a key that was recently cached.
+        Deleting the key (invalidation) drops the stale copy as well.
+
         Args:
             key: Cache key
             fetch_fn: Function to call if cache miss (should return data)
             ttl: Time to live in seconds (default: 30)
+            stale_ttl: Seconds past ttl an entry may be served while refreshing (default: 0)
 
         Returns:
             Cached or fetched data
         """
-        # Fast path: cache hit
-        if (value := self.get(key)) is not None:
+        # Fast path: cache hit (or a stale hit we may serve while refreshing)
+        value, result = self._lookup(key, allow_stale=stale_ttl > 0)
+        if result == _HIT:
+            return value
+        if result == _STALE:
+            self._refresh_in_background(key, fetch_fn, ttl, stale_ttl)
             return value
 
         # Get or create lock for this key, increment refcount
@@ -130,7 +261,7 @@ class InMemoryCacheManager:
                 # Fetch and cache
                 value = fetch_fn()
                 if value is not None:
-                    self.set(key, value, ttl=ttl)
+                    self.set(key, value, ttl=ttl, stale_ttl=stale_ttl)
                 return value
         finally:
             # Decrement refcount; delete lock only when no waiters remain
@@ -140,30 +271,80 @@ class InMemoryCacheManager:
                     del self._fetch_locks[key]
                     del self._fetch_refcounts[key]
 
-    def set(self, key: str, data: Any, ttl: int = 30):
+    def _refresh_in_background(self, key: str, fetch_fn: Callable[[], Any], ttl: int, stale_ttl: int) -> None:
+        """Start one refresh thread per key; concurrent stale hits piggyback on it."""
+        with self._fetch_lock_manager:
+            if key in self._refreshing:
+                return
+            self._refreshing.add(key)
+        threading.Thread(
+            target=self._refresh,
+            args=(key, fetch_fn, ttl, stale_ttl),
+            name=f'cache-refresh:{key[:64]}',
+            daemon=True,
+        ).start()
+
+    def _refresh(self, key: str, fetch_fn: Callable[[], Any], ttl: int, stale_ttl: int) -> None:
+        try:
+            value = fetch_fn()
+            if value is not None:
+                size_bytes = self._calculate_size(value)
+                # Checked and written under the same lock delete() marks with, so an
+                # invalidation either lands after this write or drops it.
+                with self._fetch_lock_manager:
+                    if key not in self._refresh_invalidated:
+                        self.set(key, value, ttl=ttl, stale_ttl=stale_ttl, size_bytes=size_bytes)
+        except Exception:
+            # Keep serving the stale copy until it ages out; the next stale hit retries.
+            self._refresh_failure_counter.inc()
+            logger.exception('In-memory cache refresh failed key=%s', key)
+        finally:
+            with self._fetch_lock_manager:
+                self._refreshing.discard(key)
+                self._refresh_invalidated.discard(key)
+
+    def set(self, key: str, data: Any, ttl: int = 30, stale_ttl: int = 0, size_bytes: Optional[int] = None):
         """
         Set cache entry with automatic eviction if needed.
 
+        An entry larger than the whole budget is not cached, and any older copy is dropped.
+
         Args:
             key: Cache key
             data: Data to cache
             ttl: Time to live in seconds (default: 30)
+            stale_ttl: Seconds past ttl get_or_fetch may serve the entry while refreshing (default: 0)
+            size_bytes: Precomputed size; estimated from ``data`` when omitted
         """
-        with self.lock:
-            # Calculate size
+        # Size outside the shard lock: it is the only per-value work on this path
+        if size_bytes is None:
             size_bytes = self._calculate_size(data)
 
-            # Remove old entry if exists
-            if key in self.cache:
-                self._delete_locked(key)
-
-            # Evict if needed
-            self._evict_if_needed(size_bytes)
-
-            # Add new entry
-            entry = CacheEntry(data=data, timestamp=time.time(), size_bytes=size_bytes, ttl=ttl)
-            self.cache[key] = entry
-            self.current_size += size_bytes
+        shard = self._shard(key)
+        if size_bytes > self.max_memory_bytes:
+            # Can never fit; evicting everything else for it would only turn into misses.
+            # Drop any older copy so readers don't keep getting it.
+            logger.warning('In-memory cache entry too large key=%s size_bytes=%d', key, size_bytes)
+            with shard.lock:
+                freed = self._delete_locked(shard, key)
+            if freed:
+                self._bytes_gauge.dec(freed)
+            return
+
+        with shard.lock:
+            # Replace old entry if exists
+            freed = self._delete_locked(shard, key)
+            shard.cache[key] = CacheEntry(
+                data=data, timestamp=time.time(), size_bytes=size_bytes, ttl=ttl, stale_ttl=stale_ttl
+            )
+            shard.current_size += size_bytes
+
+        # Evict if needed, after releasing the shard lock so only one shard lock is held at a time
+        evicted_count, evicted_bytes = self._evict_if_needed(key)
+
+        self._bytes_gauge.inc(size_bytes - freed - evicted_bytes)
+        if evicted_count:
+            self._eviction_counter.inc(evicted_count)
 
     def delete(self, key: str):
         """
@@ -172,41 +353,81 @@ class InMemoryCacheManager:
         Args:
             key: Cache key
         """
-        with self.lock:
-            self._delete_locked(key)
+        with self._fetch_lock_manager:
+            if key in self._refreshing:
+                self._refresh_invalidated.add(key)
+        shard = self._shard(key)
+        with shard.lock:
+            freed = self._delete_locked(shard, key)
+        if freed:
+            self._bytes_gauge.dec(freed)
 
     def clear(self):
         """Clear all cache entries."""
-        with self.lock:
-            self.cache.clear()
-            self.current_size = 0
-            self.hits = 0
-            self.misses = 0
-            self.evictions = 0
-
-    def _delete_locked(self, key: str):
+        with self._fetch_lock_manager:
+            self._refresh_invalidated.update(self._refreshing)
+        freed = 0
+        for shard in self._shards:
+            with shard.lock:
+                freed += shard.current_size
+                shard.cache.clear()
+                shard.current_size = 0
+                shard.hits = 0
+                shard.stale_hits = 0
+                shard.misses = 0
+                shard.evictions = 0
+        self._bytes_gauge.dec(freed)
+
+    @staticmethod
+    def _delete_locked(shard: _Shard, key: str) -> int:
         """
-        Internal delete (assumes lock is held).
+        Internal delete (assumes the shard lock is held).
 
         Args:
+            shard: Shard owning the key
             key: Cache key
+
+        Returns:
+            Bytes released
         """
-        if key in self.cache:
-            entry = self.cache.pop(key)
-            self.current_size -= entry.size_bytes
+        entry = shard.cache.pop(key, None)
+        if entry is None:
+            return 0
+        shard.current_size -= entry.size_bytes
+        return entry.size_bytes
 
-    def _evict_if_needed(self, required_bytes: int) -> None:
+    def _current_size(self) -> int:
+        """Bytes held across all shards; read without their locks, so approximate under writes."""
+        return sum(shard.current_size for shard in self._shards)
+
+    def _evict_if_needed(self, keep_key: str) -> Tuple[int, int]:
         """
-        Evict LRU entries until space available.
+        Evict LRU entries, one shard at a time in turn, until the cache is within budget.
 
         Args:
-            required_bytes: Bytes needed for new entry
+            keep_key: Key just written, never evicted to make room for itself
+
+        Returns:
+            (entries evicted, bytes released)
         """
-        while self.current_size + required_bytes > self.max_memory_bytes and len(self.cache) > 0:
-            # Remove oldest (first item in OrderedDict)
-            _key, entry = self.cache.popitem(last=False)
-            self.current_size -= entry.size_bytes
-            self.evictions += 1
+        evicted_count = evicted_bytes = 0
+        # Shards visited in a row with nothing to give up; stop once all have been
+        exhausted = 0
+        while self._current_size() > self.max_memory_bytes and exhausted < self.num_shards:
+            shard = self._shards[next(self._evict_cursor) % self.num_shards]
+            with shard.lock:
+                # Oldest is the first item in the OrderedDict
+                victim = next(iter(shard.cache), None)
+                if victim is None or victim == keep_key:
+                    exhausted += 1
+                    continue
+                entry = shard.cache.pop(victim)
+                shard.current_size -= entry.size_bytes
+                shard.evictions += 1
+            exhausted = 0
+            evicted_count += 1
+            evicted_bytes += entry.size_bytes
+        return evicted_count, evicted_bytes
 
     def _calculate_size(self, obj: Any) -> int:
         """
@@ -218,11 +439,7 @@ class InMemoryCacheManager:
         Returns:
             Estimated size in bytes
         """
-        if isinstance(obj, (list, dict)):
-            # Serialize to JSON and measure
-            json_str = json.dumps(obj, default=str)
-            return sys.getsizeof(json_str)
-        return sys.getsizeof(obj)
+        return estimate_size(obj)
 
     def get_stats(self) -> dict[str, Any]:
         """
@@ -231,17 +448,28 @@ class InMemoryCacheManager:
         Returns:
             Dictionary with cache stats
         """
-        with self.lock:
-            total_requests = self.hits + self.misses
-            hit_rate = (self.hits / total_requests * 100) if total_requests > 0 else 0
-
-            return {
-                'entries': len(self.cache),
-                'size_mb': round(self.current_size / (1024 * 1024), 2),
-                'max_size_mb': round(self.max_memory_bytes / (1024 * 1024), 2),
-                'utilization': round(self.current_size / self.max_memory_bytes * 100, 2),
-                'hits': self.hits,
-                'misses': self.misses,
-                'hit_rate': round(hit_rate, 2),
-                'evictions': self.evictions,
-            }
+        entries = current_size = hits = stale_hits = misses = evictions = 0
+        for shard in self._shards:
+            with shard.lock:
+                entries += len(shard.cache)
+                current_size += shard.current_size
+                hits += shard.hits
+                stale_hits += shard.stale_hits
+                misses += shard.misses
+                evictions += shard.evictions
+
+        total_requests = hits + stale_hits + misses
+        hit_rate = ((hits + stale_hits) / total_requests * 100) if total_requests > 0 else 0
+
+        return {
+            'entries': entries,
+            'size_mb': round(current_size / (1024 * 1024), 2),
+            'max_size_mb': round(self.max_memory_bytes / (1024 * 1024), 2),
+            'utilization': round(current_size / self.max_memory_bytes * 100, 2),
+            'hits': hits,
+            'stale_hits': stale_hits,
+            'misses': misses,
+            'hit_rate': round(hit_rate, 2),
+            'evictions': evictions,
+            'shards': self.num_shards,
+        }
@@ -1,12 +1,14 @@
 import copy
 import json
 import logging
+import os
 import uuid
 import zlib
 from collections.abc import Mapping
 from datetime import datetime, timedelta, timezone
 from typing import List, Optional, Dict, Any, Callable
 
+from cryptography.exceptions import InvalidTag
 from google.api_core.exceptions import AlreadyExists, Conflict, NotFound
 from google.cloud import firestore
 from google.cloud.firestore_v1 import FieldFilter
@@ -33,6 +35,15 @@ _PUBLIC_TRANSCRIPT_MAX_DECODED_BYTES = 512 * 1024
 _PUBLIC_TRANSCRIPT_MAX_SEGMENTS = 4096
 _PUBLIC_TRANSCRIPT_MAX_SEGMENT_TEXT_CHARS = 24_000
 
+# Enhanced transcript segments stored as raw bytes: prefix + nonce + AES-GCM(zlib(json)).
+# The legacy layout is base64(nonce + AES-GCM(hex(zlib(json)))), roughly 2.7x the
+# compressed size. The prefix can never start a zlib stream, so readers tell the two
+# binary layouts apart without another document field. Writes stay on the legacy
+# layout until every reader (including web/admin) understands the binary one.
+_SEGMENTS_BLOB_V2_PREFIX = b'\x00TS\x02'
+_SEGMENTS_BLOB_V2_OVERHEAD = len(_SEGMENTS_BLOB_V2_PREFIX) + 12 + 16  # prefix + nonce + tag
+TRANSCRIPT_SEGMENTS_BINARY_CODEC = os.getenv('TRANSCRIPT_SEGMENTS_BINARY_CODEC', 'false').lower() == 'true'
+
 
 def get_conversation_ids(uid: str) -> List[str]:
     """Return all conversation document IDs for a user without decrypting any fields.
@@ -89,8 +100,24 @@ def _firestore_revision_datetime(value: Any) -> Optional[datetime]:
 # *********************************
 
 
+def _is_encrypted_segments_blob(raw_segments: Any) -> bool:
+    return (
+        isinstance(raw_segments, (bytes, bytearray, memoryview))
+        and bytes(raw_segments[: len(_SEGMENTS_BLOB_V2_PREFIX)]) == _SEGMENTS_BLOB_V2_PREFIX
+    )
+
+
+def _decrypt_segments_blob(raw_segments: bytes, uid: str) -> bytes:
+    """Return the zlib payload of a binary enhanced segments blob."""
+    try:
+        return encryption.decrypt_bytes(memoryview(raw_segments)[len(_SEGMENTS_BLOB_V2_PREFIX) :], uid)
+    except InvalidTag as e:
+        raise ValueError('transcript_segments blob failed authentication') from e
+
+
 def _decrypt_conversation_data(conversation_data: Dict[str, Any], uid: str) -> Dict[str, Any]:
-    data = copy.deepcopy(conversation_data)
+    # Only transcript_segments is replaced, so a shallow copy keeps the caller's dict intact.
+    data = dict(conversation_data)
 
     if 'transcript_segments' not in data:
         return data
@@ -112,6 +139,8 @@ def _decrypt_conversation_data(conversation_data: Dict[str, Any], uid: str) -> D
     elif isinstance(data['transcript_segments'], bytes):
         try:
             compressed_bytes = data['transcript_segments']
+            if _is_encrypted_segments_blob(compressed_bytes):
+                compressed_bytes = _decrypt_segments_blob(compressed_bytes, uid)
             if data.get('transcript_segments_compressed'):
                 decompressed_json = zlib.decompress(compressed_bytes).decode('utf-8')
                 data['transcript_segments'] = json.loads(decompressed_json)
@@ -125,11 +154,15 @@ def _decrypt_conversation_data(conversation_data: Dict[str, Any], uid: str) -> D
 def _prepare_conversation_for_write(data: Dict[str, Any], uid: str, level: str) -> Dict[str, Any]:
     data = copy.deepcopy(data)
     if 'transcript_segments' in data and isinstance(data['transcript_segments'], list):
-        segments_json = json.dumps(data['transcript_segments'])
+        segments_json = json.dumps(data['transcript_segments'], separators=(',', ':'))
         compressed_segments_bytes = zlib.compress(segments_json.encode('utf-8'))
         data['transcript_segments_compressed'] = True
 
-        if level == 'enhanced':
+        if level == 'enhanced' and TRANSCRIPT_SEGMENTS_BINARY_CODEC:
+            data['transcript_segments'] = _SEGMENTS_BLOB_V2_PREFIX + encryption.encrypt_bytes(
+                compressed_segments_bytes, uid
+            )
+        elif level == 'enhanced':
             encrypted_segments = encryption.encrypt(compressed_segments_bytes.hex(), uid)
             data['transcript_segments'] = encrypted_segments
         else:
@@ -162,6 +195,8 @@ def _decode_transcript_segments_strict(uid: str, raw_segments: Any, compressed:
         if compressed:
             return json.loads(zlib.decompress(bytes.fromhex(payload)).decode('utf-8'))
         return json.loads(payload)
+    if _is_encrypted_segments_blob(raw_segments):
+        return json.loads(zlib.decompress(_decrypt_segments_blob(raw_segments, uid)).decode('utf-8'))
     if isinstance(raw_segments, bytes) and compressed:
         return json.loads(zlib.decompress(raw_segments).decode('utf-8'))
     raise ValueError(f'undecodable transcript_segments: {type(raw_segments).__name__} compressed={compressed}')
@@ -205,9 +240,12 @@ def _decode_public_transcript_segments_bounded(
                 raise invalid()
             compressed_bytes = bytes.fromhex(decrypted_hex)
         elif isinstance(raw_segments, (bytes, bytearray, memoryview)):
-            if len(raw_segments) > max_stored_bytes:
+            encrypted_blob = _is_encrypted_segments_blob(raw_segments)
+            if len(raw_segments) > max_stored_bytes + (_SEGMENTS_BLOB_V2_OVERHEAD if encrypted_blob else 0):
                 raise invalid()
             compressed_bytes = bytes(raw_segments)
+            if encrypted_blob:
+                compressed_bytes = _decrypt_segments_blob(compressed_bytes, uid)
         else:
             raise invalid()
 
@@ -273,23 +311,22 @@ def raw_conversation_has_content(uid: str, conversation: Dict[str, Any]) -> bool
     return bool(segments)
 
 
-def _prepare_conversation_for_read(conversation_data: Optional[Dict[str, Any]], uid: str) -> Optional[Dict[str, Any]]:
-    if not conversation_data:
-        return None
-
-    data = copy.deepcopy(conversation_data)
+def _apply_user_title(data: Dict[str, Any]) -> None:
     # User titles are durable overrides. Conversation processing owns the
     # generated title, but must never erase an explicit user edit.
     user_title = data.get('user_title')
     if isinstance(user_title, str):
         structured = data.get('structured')
-        if not isinstance(structured, dict):
-            structured = {}
-            data['structured'] = structured
+        # Copy rather than mutate: the lazy read path shares nested values with the raw document.
+        structured = dict(structured) if isinstance(structured, dict) else {}
         structured['title'] = user_title
+        data['structured'] = structured
+
+
+def _decode_stored_transcript(data: Dict[str, Any], uid: str) -> Dict[str, Any]:
     level = data.get('data_protection_level')
 
-    if level == 'enhanced':
+    if level == 'enhanced' or _is_encrypted_segments_blob(data.get('transcript_segments')):
         return _decrypt_conversation_data(data, uid)
 
     # Handle standard level with potential compression
@@ -305,6 +342,164 @@ def _prepare_conversation_for_read(conversation_data: Optional[Dict[str, Any]],
     return data
 
 
+def _prepare_conversation_for_read(conversation_data: Optional[Dict[str, Any]], uid: str) -> Optional[Dict[str, Any]]:
+    if not conversation_data:
+        return None
+
+    data = copy.deepcopy(conversation_data)
+    _apply_user_title(data)
+    return _decode_stored_transcript(data, uid)
+
+
+_PENDING_NONE = object()
+_TRANSCRIPT_FIELD = 'transcript_segments'
+
+
+class LazyConversation(dict):
+    """Conversation read-path dict whose ``transcript_segments`` decode on first access.
+
+    List pages and lock/existence checks usually never look at the transcript, so
+    the decrypt, zlib and JSON work is deferred until the field is read through any
+    mapping API (``[]``, ``get``, ``in``, iteration, ``items``, ``**``, ``copy``).
+    Overwriting or deleting the field drops the stored blob undecoded.
+
+    Pydantic validates dicts through the C mapping API and does not see a pending
+    field, so call ``materialize()`` before handing a view to ``model_validate`` or
+    returning it against a ``response_model``. ``Conversation(**view)`` is safe.
+    """
+
+    __slots__ = ('_uid', '_pending_segments')
+
+    def __init__(self, data: Dict[str, Any], uid: str):
+        super().__init__(data)
+        self._uid = uid
+        self._pending_segments: Any = _PENDING_NONE
+        if dict.__contains__(self, _TRANSCRIPT_FIELD) and not isinstance(
+            dict.__getitem__(self, _TRANSCRIPT_FIELD), list
+        ):
+            self._pending_segments = dict.pop(self, _TRANSCRIPT_FIELD)
+
+    @property
+    def transcript_decoded(self) -> bool:
+        return self._pending_segments is _PENDING_NONE
+
+    def _resolve(self) -> None:
+        if self._pending_segments is _PENDING_NONE:
+            return
+        stored = {
+            _TRANSCRIPT_FIELD: self._pending_segments,
+            'transcript_segments_compressed': dict.get(self, 'transcript_segments_compressed'),
+            'data_protection_level': dict.get(self, 'data_protection_level'),
+        }
+        dict.__setitem__(self, _TRANSCRIPT_FIELD, _decode_stored_transcript(stored, self._uid)[_TRANSCRIPT_FIELD])
+        # Cleared only after the decoded value is in place, so a concurrent reader never sees neither.
+        self._pending_segments = _PENDING_NONE
+
+    def _discard(self, key: Any) -> None:
+        if key == _TRANSCRIPT_FIELD:
+            self._pending_segments = _PENDING_NONE
+
+    def materialize(self) -> Dict[str, Any]:
+        """Decode the transcript if still pending and return a plain dict copy."""
+        self._resolve()
+        return dict.copy(self)
+
+    def __missing__(self, key: Any) -> Any:
+        if key == _TRANSCRIPT_FIELD and not self.transcript_decoded:
+            self._resolve()
+            return dict.__getitem__(self, key)
+        raise KeyError(key)
+
+    def get(self, key: Any, default: Any = None) -> Any:
+        if key == _TRANSCRIPT_FIELD:
+            self._resolve()
+        return dict.get(self, key, default)
+
+    def __contains__(self, key: Any) -> bool:
+        return (key == _TRANSCRIPT_FIELD and not self.transcript_decoded) or dict.__contains__(self, key)
+
+    def __len__(self) -> int:
+        return dict.__len__(self) + (0 if self.transcript_decoded else 1)
+
+    def __iter__(self):
+        self._resolve()
+        return dict.__iter__(self)
+
+    def keys(self):  # type: ignore[override]  # decodes first so views include the transcript
+        self._resolve()
+        return dict.keys(self)
+
+    def values(self):  # type: ignore[override]  # decodes first so views include the transcript
+        self._resolve()
+        return dict.values(self)
+
+    def items(self):  # type: ignore[override]  # decodes first so views include the transcript
+        self._resolve()
+        return dict.items(self)
+
+    def copy(self) -> Dict[str, Any]:  # type: ignore[override]  # copies are plain dicts
+        return self.materialize()
+
+    def __eq__(self, other: object) -> bool:
+        self._resolve()
+        return dict.__eq__(self, other)
+
+    __hash__ = None  # type: ignore[assignment]  # dicts are unhashable
+
+    def __repr__(self) -> str:
+        self._resolve()
+        return dict.__repr__(self)
+
+    def __reduce__(self):
+        return (dict, (self.materialize(),))
+
+    def __setitem__(self, key: Any, value: Any) -> None:
+        self._discard(key)
+        dict.__setitem__(self, key, value)
+
+    def __delitem__(self, key: Any) -> None:
+        if key == _TRANSCRIPT_FIELD and not self.transcript_decoded:
+            self._discard(key)
+            return
+        dict.__delitem__(self, key)
+
+    def pop(self, key: Any, *default: Any) -> Any:
+        if key == _TRANSCRIPT_FIELD and not self.transcript_decoded:
+            self._resolve()
+        return dict.pop(self, key, *default)
+
+    def popitem(self) -> Any:
+        self._resolve()
+        return dict.popitem(self)
+
+    def setdefault(self, key: Any, default: Any = None) -> Any:
+        if key == _TRANSCRIPT_FIELD:
+            self._resolve()
+        return dict.setdefault(self, key, default)
+
+    def update(self, *args: Any, **kwargs: Any) -> None:
+        updates = dict(*args, **kwargs)
+        if _TRANSCRIPT_FIELD in updates:
+            self._discard(_TRANSCRIPT_FIELD)
+        dict.update(self, updates)
+
+    def clear(self) -> None:
+        self._pending_segments = _PENDING_NONE
+        dict.clear(self)
+
+
+def _prepare_conversation_for_lazy_read(
+    conversation_data: Optional[Dict[str, Any]], uid: str
+) -> Optional[LazyConversation]:
+    """Copy-free read path: shallow view over the raw document, transcript decoded on access."""
+    if not conversation_data:
+        return None
+
+    data = dict(conversation_data)
+    _apply_user_title(data)
+    return LazyConversation(data, uid)
+
+
 def _document_data_with_revision(document) -> Optional[Dict[str, Any]]:
     """Return Firestore document data with its canonical server revision."""
     data = document.to_dict()
@@ -482,6 +677,24 @@ def persist_processing_result_with_lifecycle(
     return _persist(transaction)
 
 
+def _create_conversation_if_absent(conversations_ref, conversation_data: dict) -> bool:
+    conversation_ref = conversations_ref.document(conversation_data['id'])
+    try:
+        conversation_ref.create(conversation_data)
+        return True
+    except (AlreadyExists, Conflict):
+        return False
+
+
+def _prepare_created_conversation(conversation_data: dict) -> None:
+    conversation_data.pop('updated_at', None)
+    if 'audio_base64_url' in conversation_data:
+        del conversation_data['audio_base64_url']
+    if 'photos' in conversation_data:
+        del conversation_data['photos']
+    conversation_data.setdefault('has_photos', False)
+
+
 @set_data_protection_level(data_arg_name='conversation_data')
 @prepare_for_write(
     data_arg_name='conversation_data',
@@ -490,25 +703,61 @@ def persist_processing_result_with_lifecycle(
 )
 def create_conversation_if_absent_with_lifecycle(uid: str, conversation_data: dict) -> bool:
     """Atomically create a conversation document if it does not already exist."""
-    conversation_data.pop('updated_at', None)
-    if 'audio_base64_url' in conversation_data:
-        del conversation_data['audio_base64_url']
-    if 'photos' in conversation_data:
-        del conversation_data['photos']
-    conversation_data.setdefault('has_photos', False)
+    _prepare_created_conversation(conversation_data)
+    conversations_ref = db.collection('users').document(uid).collection(conversations_collection)
+    return _create_conversation_if_absent(conversations_ref, conversation_data)
 
-    user_ref = db.collection('users').document(uid)
-    conversation_ref = user_ref.collection(conversations_collection).document(conversation_data['id'])
+
+@set_data_protection_level(data_arg_name='conversations')
+@prepare_for_write(
+    data_arg_name='conversations',
+    prepare_func=_prepare_conversation_for_write,
+    preserve_result=True,
+)
+def create_conversations_if_absent_with_lifecycle(uid: str, conversations: List[dict]) -> List[Any]:
+    """Create-if-absent for many conversations in one batched commit.
+
+    Returns, per input, True (created), False (already existed) or the exception its
+    create raised. A batch commits all or nothing, so when it fails -- a document that
+    already exists, one over the size limit -- every document falls back to its own
+    create() and the failure stays with the document that caused it. The caller keeps
+    each call within Firestore's per-commit write and byte limits.
+    """
+    if not conversations:
+        return []
+    conversations_ref = db.collection('users').document(uid).collection(conversations_collection)
+    batch = db.batch()
+    for conversation_data in conversations:
+        _prepare_created_conversation(conversation_data)
+        batch.create(conversations_ref.document(conversation_data['id']), conversation_data)
     try:
-        conversation_ref.create(conversation_data)
-        return True
-    except (AlreadyExists, Conflict):
-        return False
+        batch.commit()
+        return [True] * len(conversations)
+    except Exception as e:
+        logger.info(f'create_conversations_if_absent: batch of {len(conversations)} failed, creating one by one: {e}')
 
+    results: List[Any] = []
+    for conversation_data in conversations:
+        try:
+            results.append(_create_conversation_if_absent(conversations_ref, conversation_data))
+        except Exception as e:
+            results.append(e)
+    return results
 
-@prepare_for_read(decrypt_func=_prepare_conversation_for_read)
+
+def get_existing_conversation_ids(uid: str, conversation_ids: List[str]) -> set[str]:
+    """Which of ``conversation_ids`` exist, from one batched read of their ids only."""
+    if not conversation_ids:
+        return set()
+    conversations_ref = db.collection('users').document(uid).collection(conversations_collection)
+    doc_refs = [conversations_ref.document(conversation_id) for conversation_id in conversation_ids]
+    return {doc.id for doc in db.get_all(doc_refs, field_paths=['id']) if doc.exists}
+
+
+@prepare_for_read(decrypt_func=_prepare_conversation_for_read, lazy_decrypt_func=_prepare_conversation_for_lazy_read)
 @with_photos(get_conversation_photos)
-def get_conversation(uid, conversation_id):
+def get_conversation(uid, conversation_id, lazy: bool = False):
+    """Read one conversation; ``lazy=True`` returns a ``LazyConversation`` that decodes the transcript on access."""
     user_ref = db.collection('users').document(uid)
     conversation_ref = user_ref.collection(conversations_collection).document(conversation_id)
     conversation_data = _document_data_with_revision(conversation_ref.get())
@@ -660,7 +909,7 @@ def get_conversations_count(
     return int(result[0][0].value)
 
 
-@prepare_for_read(decrypt_func=_prepare_conversation_for_read)
+@prepare_for_read(decrypt_func=_prepare_conversation_for_read, lazy_decrypt_func=_prepare_conversation_for_lazy_read)
 def get_conversations_without_photos(
     uid: str,
     limit: int = 100,
@@ -674,10 +923,12 @@ def get_conversations_without_photos(
     folder_id: Optional[str] = None,
     starred: Optional[bool] = None,
     budget: Optional[ListReadBudget] = None,
+    lazy: bool = False,
 ):
     """
     Same as get_conversations but without loading photos.
     Much faster for list endpoints and bulk operations where full photo base64 isn't needed.
+    ``lazy=True`` returns ``LazyConversation`` views that decode transcripts only on access.
 
     With a request ``budget`` (#11831) the server-side ``offset()`` is charged
     before the query — Firestore bills and streams every skipped row, so a
@@ -744,13 +995,26 @@ def get_conversations_without_photos(
     return conversations
 
 
-def iter_all_conversations(uid: str, batch_size: int = 400, include_discarded: bool = True):
-    """Yield all conversations for a user, decrypted, in batches. Used for streaming data export."""
-    conversations_ref = db.collection('users').document(uid).collection(conversations_collection)
+def iter_all_conversations(
+    uid: str, batch_size: int = 400, include_discarded: bool = True, start_after_id: Optional[str] = None
+):
+    """Yield all conversations for a user, decrypted, in batches. Used for streaming data export.
+
+    ``start_after_id`` resumes a previous walk right after that conversation (newest first); if it
+    no longer exists the walk restarts from the top.
+    """
+    collection_ref = db.collection('users').document(uid).collection(conversations_collection)
+    conversations_ref = collection_ref
     if not include_discarded:
         conversations_ref = conversations_ref.where(filter=FieldFilter('discarded', '==', False))
     conversations_ref = conversations_ref.order_by('created_at', direction=firestore.Query.DESCENDING)
     cursor = None
+    if start_after_id:
+        snapshot = collection_ref.document(start_after_id).get()
+        if snapshot.exists:
+            cursor = snapshot
+        else:
+            logger.warning(f'iter_all_conversations resume point missing uid={uid} conversation={start_after_id}')
     while True:
         batch_ref = conversations_ref.limit(batch_size)
         if cursor is not None:
@@ -767,6 +1031,53 @@ def iter_all_conversations(uid: str, batch_size: int = 400, include_discarded: b
         cursor = snapshots[-1]
 
 
+def iter_conversation_pages_in_range(
+    uid: str,
+    start_date: datetime,
+    end_date: datetime,
+    statuses: List[str] = [],
+    include_discarded: bool = False,
+    page_size: int = 200,
+    max_conversations: Optional[int] = None,
+):
+    """Yield pages of decrypted conversations (no photos) created in [start_date, end_date], newest first.
+
+    Same query as ``get_conversations_without_photos`` walked with a cursor, so a caller folding a
+    year of conversations holds one page at a time and no page pays for skipped offset rows.
+    """
+    conversations_ref = db.collection('users').document(uid).collection(conversations_collection)
+    if not include_discarded:
+        conversations_ref = conversations_ref.where(filter=FieldFilter('discarded', '==', False))
+    if len(statuses) == 1:
+        conversations_ref = conversations_ref.where(filter=FieldFilter('status', '==', statuses[0]))
+    elif statuses:
+        conversations_ref = conversations_ref.where(filter=FieldFilter('status', 'in', statuses))
+    conversations_ref = conversations_ref.where(filter=FieldFilter('created_at', '>=', start_date))
+    conversations_ref = conversations_ref.where(filter=FieldFilter('created_at', '<=', end_date))
+    conversations_ref = conversations_ref.order_by('created_at', direction=firestore.Query.DESCENDING)
+
+    remaining = max_conversations
+    cursor = None
+    while remaining is None or remaining > 0:
+        limit = page_size if remaining is None else min(page_size, remaining)
+        page_ref = conversations_ref.limit(limit)
+        if cursor is not None:
+            page_ref = page_ref.start_after(cursor)
+        snapshots = list(page_ref.stream())
+        page = []
+        for doc in snapshots:
+            conv = _document_data_with_revision(doc)
+            if conv is not None:
+                page.append(_prepare_conversation_for_read(conv, uid) or conv)
+        if page:
+            yield page
+        if len(snapshots) < limit:
+            break
+        cursor = snapshots[-1]
+        if remaining is not None:
+            remaining -= len(snapshots)
+
+
 def update_conversation(uid: str, conversation_id: str, update_data: dict) -> bool:
     """Apply ``update_data`` to a conversation.
 
@@ -1,7 +1,11 @@
 import inspect
+import os
+import threading
 from functools import wraps
 from typing import Any, Callable, Dict, List, Optional, Tuple, TypeVar, cast
 
+from cachetools import TTLCache
+
 from database import users as users_db, redis_db
 import logging
 
@@ -9,6 +13,119 @@ logger = logging.getLogger(__name__)
 
 F = TypeVar("F", bound=Callable[..., Any])
 
+_MISSING = object()
+ArgReader = Callable[[Tuple[Any, ...], Dict[str, Any]], Any]
+
+
+def _arg_reader(func: Callable[..., Any], name: str) -> Optional[ArgReader]:
+    """Build a reader for argument *name* of *func* from a call's (args, kwargs).
+
+    The parameter position is resolved once, at decoration time, so the per-call
+    cost is a tuple index or dict lookup instead of ``inspect.signature().bind()``.
+    Returns None when *func* has no such named parameter. An argument that was not
+    passed and has no default reads as ``_MISSING``.
+    """
+    parameters = list(inspect.signature(func).parameters.values())
+    param = next((p for p in parameters if p.name == name), None)
+    if param is None or param.kind in (inspect.Parameter.VAR_POSITIONAL, inspect.Parameter.VAR_KEYWORD):
+        return None
+
+    positional_kinds = (inspect.Parameter.POSITIONAL_ONLY, inspect.Parameter.POSITIONAL_OR_KEYWORD)
+    index = parameters.index(param) if param.kind in positional_kinds else None
+    by_keyword = param.kind != inspect.Parameter.POSITIONAL_ONLY
+    default = _MISSING if param.default is inspect.Parameter.empty else param.default
+
+    def read(args: Tuple[Any, ...], kwargs: Dict[str, Any]) -> Any:
+        if index is not None and index < len(args):
+            return args[index]
+        if by_keyword and name in kwargs:
+            return kwargs[name]
+        return default
+
+    return read
+
+
+# ---------------------------------------------------------------------------
+# Process-local TTL cache of user data protection levels.
+#
+# Every decorated write without an explicit level otherwise costs a Redis GET.
+# Levels only change when a migration is finalized; that path calls
+# invalidate_data_protection_level_cache, which drops the entry here and
+# publishes on the cache_invalidation channel (database/redis_pubsub.py) so
+# instances running the subscriber drop it too. Instances that never started
+# the subscriber fall back to the short TTL.
+# ---------------------------------------------------------------------------
+DATA_PROTECTION_LEVEL_CACHE_KEY_PREFIX = 'data_protection_level:'
+_DATA_PROTECTION_LEVEL_CACHE_MAX = 10_000
+_DATA_PROTECTION_LEVEL_CACHE_TTL = int(os.getenv('DATA_PROTECTION_LEVEL_CACHE_TTL_SECONDS', '30'))
+_data_protection_level_cache = TTLCache[str, str](
+    maxsize=_DATA_PROTECTION_LEVEL_CACHE_MAX, ttl=max(1, _DATA_PROTECTION_LEVEL_CACHE_TTL)
+)
+_data_protection_level_cache_lock = threading.Lock()
+
+
+def _get_cached_data_protection_level(uid: str) -> Optional[str]:
+    if _DATA_PROTECTION_LEVEL_CACHE_TTL <= 0:
+        return None
+    with _data_protection_level_cache_lock:
+        return _data_protection_level_cache.get(uid)
+
+
+def _cache_data_protection_level(uid: str, level: str) -> None:
+    if _DATA_PROTECTION_LEVEL_CACHE_TTL <= 0:
+        return
+    with _data_protection_level_cache_lock:
+        _data_protection_level_cache[uid] = level
+
+
+def invalidate_data_protection_level_keys(keys: List[str]) -> None:
+    """Pub/sub callback: drop the cached levels named by ``data_protection_level:<uid>`` keys."""
+    with _data_protection_level_cache_lock:
+        for key in keys:
+            if key.startswith(DATA_PROTECTION_LEVEL_CACHE_KEY_PREFIX):
+                _data_protection_level_cache.pop(key[len(DATA_PROTECTION_LEVEL_CACHE_KEY_PREFIX) :], None)
+
+
+def invalidate_data_protection_level_cache(uid: str) -> None:
+    """Call after changing a user's level to drop it from every instance's local cache."""
+    key = f'{DATA_PROTECTION_LEVEL_CACHE_KEY_PREFIX}{uid}'
+    invalidate_data_protection_level_keys([key])
+    try:
+        from database.cache import get_pubsub_manager
+
+        get_pubsub_manager().publish_invalidation([key])
+    except Exception as e:
+        logger.error(f"Failed to publish data protection level invalidation for {uid}: {e}")
+
+
+def _resolve_data_protection_level(uid: str, firestore_client: Any) -> str:
+    # Transactional callers pass their own client and must read the level from it, not from caches.
+    if firestore_client is None:
+        cached = _get_cached_data_protection_level(uid)
+        if cached:
+            return cached
+
+    level: Optional[str] = None if firestore_client is not None else redis_db.get_user_data_protection_level(uid)
+    cacheable = bool(level)
+
+    if not level:
+        try:
+            user_profile = _get_user_profile_for_data_protection(uid, firestore_client=firestore_client)
+            level = user_profile.get('data_protection_level', 'enhanced') if user_profile else 'enhanced'
+            if firestore_client is None:
+                redis_db.set_user_data_protection_level(uid, level)
+            cacheable = True
+        except Exception as e:
+            logger.error(f"Failed to get user profile for {uid}: {e}")
+            level = 'enhanced'
+
+    if not level:
+        level = 'enhanced'
+
+    if cacheable and firestore_client is None:
+        _cache_data_protection_level(uid, level)
+    return level
+
 
 def _typed_doc(raw: object) -> Dict[str, Any]:
     return cast(Dict[str, Any], raw) if isinstance(raw, dict) else {}
@@ -38,26 +155,25 @@ def set_data_protection_level(data_arg_name: str) -> Callable[[F], F]:
     """
 
     def decorator(func: F) -> F:
+        # Argument positions are resolved once here; the wrapper runs on every DB write.
+        read_uid = _arg_reader(func, 'uid')
+        read_data = _arg_reader(func, data_arg_name)
+        read_firestore_client = _arg_reader(func, 'firestore_client')
+
         @wraps(func)
         def wrapper(*args: Any, **kwargs: Any) -> Any:
-            # Bind the provided arguments to the function's signature to easily access them by name
-            try:
-                sig = inspect.signature(func)
-                bound_args = sig.bind(*args, **kwargs)
-                bound_args.apply_defaults()
-            except TypeError:
-                # This can happen if the decorated function is called with wrong arguments.
-                # Let the original function call raise the more specific error.
+            uid = read_uid(args, kwargs) if read_uid is not None else None
+            if uid is _MISSING:
+                # Called with wrong arguments: let the original call raise the more specific error.
                 return func(*args, **kwargs)
 
-            uid = bound_args.arguments.get('uid')
-            data: Any = bound_args.arguments.get(data_arg_name)
-
             if not uid:
                 raise TypeError(
                     f"Function {func.__name__} decorated with set_data_protection_level must have a 'uid' argument."
                 )
 
+            data: Any = read_data(args, kwargs) if read_data is not None else None
+
             # If data is None or not a dict/list, do nothing and let the original function handle it.
             if not isinstance(data, (dict, list)):
                 return func(*args, **kwargs)
@@ -80,23 +196,10 @@ def set_data_protection_level(data_arg_name: str) -> Callable[[F], F]:
             if not needs_backfill:
                 return func(*args, **kwargs)
 
-            firestore_client = bound_args.arguments.get('firestore_client')
-            level: Optional[str] = (
-                None if firestore_client is not None else redis_db.get_user_data_protection_level(uid)
-            )
-
-            if not level:
-                try:
-                    user_profile = _get_user_profile_for_data_protection(uid, firestore_client=firestore_client)
-                    level = user_profile.get('data_protection_level', 'enhanced') if user_profile else 'enhanced'
-                    if firestore_client is None:
-                        redis_db.set_user_data_protection_level(uid, level)
-                except Exception as e:
-                    logger.error(f"Failed to get user profile for {uid}: {e}")
-                    level = 'enhanced'
-
-            if not level:
-                level = 'enhanced'
+            firestore_client = read_firestore_client(args, kwargs) if read_firestore_client is not None else None
+            if firestore_client is _MISSING:
+                firestore_client = None
+            level = _resolve_data_protection_level(uid, firestore_client)
 
             if isinstance(data, dict):
                 data_dict_after: Dict[str, Any] = cast(Dict[str, Any], data)
@@ -190,12 +293,19 @@ def prepare_for_write(
     return decorator
 
 
-def prepare_for_read(decrypt_func: Callable[[Dict[str, Any], str], Dict[str, Any]]) -> Callable[[F], F]:
+def prepare_for_read(
+    decrypt_func: Callable[[Dict[str, Any], str], Dict[str, Any]],
+    *,
+    lazy_decrypt_func: Optional[Callable[[Dict[str, Any], str], Optional[Dict[str, Any]]]] = None,
+) -> Callable[[F], F]:
     """
     Decorator to decrypt data after reading from the database.
     It processes the return value of the decorated function. If the return value is a dict or
     list of dicts, it applies the decrypt_func based on the 'data_protection_level' field.
 
+    When lazy_decrypt_func is given and the call passes lazy=True, it is applied instead, so
+    callers that rarely need the expensive fields can defer decoding them until first access.
+
     Assumes 'uid' is an argument to the decorated function to be used for decryption.
     """
 
@@ -214,10 +324,14 @@ def prepare_for_read(decrypt_func: Callable[[Dict[str, Any], str], Dict[str, Any
             if result is None:
                 return None
 
+            read_func = decrypt_func
+            if lazy_decrypt_func is not None and bound_args.arguments.get('lazy'):
+                read_func = lazy_decrypt_func
+
             def _process(item: Any) -> Any:
                 if isinstance(item, dict):
                     # The decrypt_func is responsible for checking the level and acting accordingly
-                    return decrypt_func(cast(Dict[str, Any], item), uid)
+                    return read_func(cast(Dict[str, Any], item), uid)
                 return item
 
             if isinstance(result, dict):
@@ -1,7 +1,10 @@
 from datetime import datetime, timezone
+import itertools
+import threading
 from typing import Any, Dict, Iterable, List, Optional, Tuple, TypedDict, cast
 import uuid
 
+from cachetools import TTLCache
 from google.cloud.firestore_v1 import FieldFilter
 
 from models.memory_contracts import deterministic_contract_id
@@ -32,12 +35,31 @@ def _firestore_client(db_client: Any = None) -> Any:
     return db_client if db_client is not None else db
 
 
+# In-process graph write versions, read by the traversal index cache to drop a
+# user's index after this instance writes their graph. Values come from one
+# global counter so an evicted (reset) entry can never match an older version.
+_graph_versions = TTLCache[str, int](maxsize=100_000, ttl=3600)
+_graph_version_counter = itertools.count(1)
+_graph_versions_lock = threading.Lock()
+
+
+def knowledge_graph_version(uid: str) -> int:
+    with _graph_versions_lock:
+        return _graph_versions.get(uid, 0)
+
+
+def mark_knowledge_graph_changed(uid: str) -> None:
+    with _graph_versions_lock:
+        _graph_versions[uid] = next(_graph_version_counter)
+
+
 def delete_memory_graph_assertion(uid: str, memory_id: str, *, db_client: Any = None) -> None:
     """Delete one derived assertion after its authoritative memory is fenced."""
     if not uid.strip() or not memory_id.strip():
         raise ValueError("uid and memory_id are required")
     client = _firestore_client(db_client)
     client.document(f"{users_collection}/{uid}/{memory_graph_assertions_collection}/{memory_id}").delete()
+    mark_knowledge_graph_changed(uid)
 
 
 def _typed_doc(doc: Any) -> Dict[str, Any]:
@@ -227,6 +249,7 @@ def upsert_knowledge_node(uid: str, node_data: Dict[str, Any], *, db_client: Any
         node_data['aliases_lower'] = [a.lower() for a in node_data.get('aliases', [])]
 
     node_ref.set(node_data)
+    mark_knowledge_graph_changed(uid)
     return node_data
 
 
@@ -293,6 +316,7 @@ def upsert_knowledge_edge(uid: str, edge_data: Dict[str, Any], *, db_client: Any
         edge_data['created_at'] = datetime.now(timezone.utc)
 
     edge_ref.set(edge_data)
+    mark_knowledge_graph_changed(uid)
     return edge_data
 
 
@@ -859,6 +883,7 @@ def delete_knowledge_graph(uid: str, *, db_client: Any = None) -> None:
 
     edges_ref = user_ref.collection(knowledge_edges_collection)
     _batch_delete(edges_ref)
+    mark_knowledge_graph_changed(uid)
 
 
 def prune_memory_citations_from_kg(uid: str, memory_ids: List[str], *, db_client: Any = None) -> int:
@@ -906,4 +931,6 @@ def prune_memory_citations_from_kg(uid: str, memory_ids: List[str], *, db_client
             doc.reference.delete()
         pruned += 1
 
+    if pruned:
+        mark_knowledge_graph_changed(uid)
     return pruned
@@ -19,6 +19,26 @@ logger = logging.getLogger(__name__)
 _DOCUMENT_ID_FIELD = '__name__'
 _UNATTRIBUTED_PLAN = '_unattributed'
 
+# Sealed months of `hourly_usage` are summarised in `users/{uid}/usage_rollups/{YYYY-MM}`
+# so the yearly and all-time views stop streaming every hourly doc the account has ever
+# written. `_coverage.sealed_through` is the last month whose rollup has been built.
+_USAGE_ROLLUPS = 'usage_rollups'
+_ROLLUP_COVERAGE_ID = '_coverage'
+# Live writers stamp the current hour, so a month only takes late writes (offline sync,
+# backfills) once it has ended; a day later it is rolled up. Writes that land behind a
+# rollup anyway stamp it `stale_at` and the next read rebuilds that month.
+_ROLLUP_SEAL_GRACE = timedelta(days=1)
+# `stale_at` comes from the writer's clock and `built_from` from the reader's.
+_ROLLUP_CLOCK_MARGIN = timedelta(minutes=10)
+_USAGE_TOTAL_KEYS = (
+    'transcription_seconds',
+    'words_transcribed',
+    'insights_gained',
+    'memories_created',
+    'speech_seconds',
+)
+_USAGE_HISTORY_KEYS = _USAGE_TOTAL_KEYS[:4]
+
 
 def _typed_doc(doc: Any) -> Dict[str, Any]:
     """Typed adapter for a Firestore snapshot's `to_dict()` (SDK stub gap)."""
@@ -33,6 +53,39 @@ def _next_month(now: datetime) -> Tuple[int, int]:
     return now.year, now.month + 1
 
 
+def _month_key(year: int, month: int) -> str:
+    return f'{year}-{month:02d}'
+
+
+def _parse_month_key(value: Any) -> Optional[Tuple[int, int]]:
+    try:
+        year, month = str(value).split('-')
+        return int(year), int(month)
+    except ValueError:
+        return None
+
+
+def _last_sealed_month(now: datetime) -> Tuple[int, int]:
+    """(year, month) of the newest month old enough to be rolled up."""
+    edge = now - _ROLLUP_SEAL_GRACE
+    if edge.month == 1:
+        return edge.year - 1, 12
+    return edge.year, edge.month - 1
+
+
+def _late_write_rollup_ref(client: Any, uid: str, date: datetime, now: datetime) -> Any | None:
+    """The month rollup an hourly write for ``date`` may land behind; None for the current month."""
+    if (date.year, date.month) >= (now.year, now.month):
+        return None
+    return (
+        client.collection('users').document(uid).collection(_USAGE_ROLLUPS).document(_month_key(date.year, date.month))
+    )
+
+
+def _stale_rollup_mark(year: int, month: int) -> Dict[str, Any]:
+    return {'year': year, 'month': month, 'stale_at': datetime.now(timezone.utc)}
+
+
 def _current_month_llm_usage_docs(llm_usage_ref: Any, now: datetime) -> Iterable[Any]:
     """Stream only the current month's `llm_usage/{YYYY-MM-DD}` docs.
 
@@ -385,6 +438,10 @@ def update_hourly_usage(
         update_doc['platforms'] = firestore.ArrayUnion([platform])
 
     hourly_usage_ref.set(update_doc, merge=True)
+    rollup_ref = _late_write_rollup_ref(client, uid, date, update_doc['last_updated'])
+    if rollup_ref is not None:
+        # After the hourly write, so a rollup built from a read that missed it is always stale.
+        rollup_ref.set(_stale_rollup_mark(date.year, date.month), merge=True)
 
 
 @firestore.transactional
@@ -393,6 +450,7 @@ def _update_hourly_usage_once_transaction(
     marker_ref: Any,
     usage_ref: Any,
     update_doc: Dict[str, Any],
+    rollup_ref: Any | None = None,
 ) -> bool:
     marker_snapshot = marker_ref.get(transaction=transaction)
     marker_data = marker_snapshot.to_dict() or {} if marker_snapshot.exists else {}
@@ -400,6 +458,8 @@ def _update_hourly_usage_once_transaction(
         return False
     transaction.set(marker_ref, {'usage_committed_at': datetime.now(timezone.utc)}, merge=True)
     transaction.set(usage_ref, update_doc, merge=True)
+    if rollup_ref is not None:
+        transaction.set(rollup_ref, _stale_rollup_mark(update_doc['year'], update_doc['month']), merge=True)
     return True
 
 
@@ -461,7 +521,8 @@ def update_hourly_usage_once(
     if effective_exclusion:
         safe_exclusion = effective_exclusion.replace('.', '_').replace('/', '_')
         update_doc[f'{plan_prefix}._metadata.cost_exclusions.{safe_exclusion}'] = firestore.Increment(1)
-    return _update_hourly_usage_once_transaction(client.transaction(), marker_ref, usage_ref, update_doc)
+    rollup_ref = _late_write_rollup_ref(client, uid, date, update_doc['last_updated'])
+    return _update_hourly_usage_once_transaction(client.transaction(), marker_ref, usage_ref, update_doc, rollup_ref)
 
 
 def batch_update_hourly_usage(uid: str, hourly_updates: Dict[datetime, Dict[str, Any]]) -> None:
@@ -488,6 +549,17 @@ def batch_update_hourly_usage(uid: str, hourly_updates: Dict[datetime, Dict[str,
             batch.set(hourly_usage_ref, update_doc, merge=True)
         batch.commit()
 
+        now = datetime.now(timezone.utc)
+        late_months = {(date.year, date.month) for date, _ in chunk if (date.year, date.month) < (now.year, now.month)}
+        if late_months:
+            rollups_collection = db.collection('users').document(uid).collection(_USAGE_ROLLUPS)
+            batch = db.batch()
+            for year, month in late_months:
+                batch.set(
+                    rollups_collection.document(_month_key(year, month)), _stale_rollup_mark(year, month), merge=True
+                )
+            batch.commit()
+
 
 def get_today_usage_stats(uid: str, start: datetime, end: datetime) -> Dict[str, Any]:
     """Aggregates hourly usage stats for the UTC bucket range [start, end).
@@ -586,15 +658,13 @@ def get_monthly_usage_stats_since(uid: str, date: datetime, start_date: datetime
 
 
 def get_yearly_usage_stats(uid: str, date: datetime) -> Dict[str, Any]:
-    """Aggregates hourly usage stats for a given year from Firestore."""
-    user_ref = db.collection('users').document(uid)
-    hourly_usage_collection = user_ref.collection('hourly_usage')
-    query = hourly_usage_collection.where(filter=FieldFilter('year', '==', date.year))
-    return _aggregate_stats(query)
+    """Aggregates usage stats for a given year from month rollups and open-month hourly docs."""
+    stats, _ = _read_yearly_usage(uid, date.year)
+    return stats
 
 
 def get_all_time_usage_stats(uid: str) -> Dict[str, Any]:
-    """Aggregates all hourly usage stats for a user from Firestore."""
+    """Aggregates all usage stats for a user from month rollups and open-month hourly docs."""
     stats, _ = _read_all_time_usage(uid)
     return stats
 
@@ -667,101 +737,183 @@ def get_daily_history_for_month(uid: str, date: datetime) -> List[Dict[str, Any]
 
 
 def get_monthly_history_for_year(uid: str, date: datetime) -> List[Dict[str, Any]]:
-    """Gets monthly usage for a specific year by aggregating hourly data."""
-    user_ref = db.collection('users').document(uid)
-    hourly_usage_collection = user_ref.collection('hourly_usage')
-    query = hourly_usage_collection.where(filter=FieldFilter('year', '==', date.year))
-    docs = query.stream()
-    monthly_totals: Dict[int, Dict[str, int]] = {}
-    for doc in docs:
-        data: Dict[str, Any] = _typed_doc(doc)
-        month = cast(int, data.get('month', 0))
-        if month not in monthly_totals:
-            monthly_totals[month] = {
-                'transcription_seconds': 0,
-                'words_transcribed': 0,
-                'insights_gained': 0,
-                'memories_created': 0,
-            }
+    """Gets monthly usage for a specific year from month rollups and open-month hourly docs."""
+    _, history = _read_yearly_usage(uid, date.year)
+    return history
 
-        monthly_totals[month]['transcription_seconds'] += cast(int, data.get('transcription_seconds', 0))
-        monthly_totals[month]['words_transcribed'] += cast(int, data.get('words_transcribed', 0))
-        monthly_totals[month]['insights_gained'] += cast(int, data.get('insights_gained', 0))
-        monthly_totals[month]['memories_created'] += cast(int, data.get('memories_created', 0))
 
-    history: List[Dict[str, Any]] = [
-        {'date': f"{date.year}-{month:02d}-01", **stats} for month, stats in monthly_totals.items()
-    ]
-    history.sort(key=lambda x: cast(str, x['date']))
+def get_yearly_history(uid: str) -> List[Dict[str, Any]]:
+    """Gets yearly usage for all time from month rollups and open-month hourly docs."""
+    _, history = _read_all_time_usage(uid)
     return history
 
 
-def get_yearly_history(uid: str) -> List[Dict[str, Any]]:
-    """Gets yearly usage for all time by aggregating hourly data."""
-    user_ref = db.collection('users').document(uid)
-    hourly_usage_collection = user_ref.collection('hourly_usage')
-    docs = hourly_usage_collection.stream()
-    yearly_totals: Dict[int, Dict[str, int]] = {}
+def _empty_month_rollup() -> Dict[str, Any]:
+    return {'documents': 0, **{key: 0 for key in _USAGE_TOTAL_KEYS}}
+
+
+def _sum_hourly_docs(docs: Iterable[Any], into: Dict[Tuple[int, int], Dict[str, Any]]) -> int:
+    """Fold hourly docs into per-(year, month) totals; returns the number of docs read."""
+    document_count = 0
     for doc in docs:
-        data: Dict[str, Any] = _typed_doc(doc)
-        year = cast(int, data.get('year', 0))
-        if year not in yearly_totals:
-            yearly_totals[year] = {
-                'transcription_seconds': 0,
-                'words_transcribed': 0,
-                'insights_gained': 0,
-                'memories_created': 0,
-            }
+        document_count += 1
+        data = _typed_doc(doc)
+        totals = into.setdefault((int(data.get('year', 0)), int(data.get('month', 0))), _empty_month_rollup())
+        totals['documents'] += 1
+        for key in _USAGE_TOTAL_KEYS:
+            totals[key] += data.get(key, 0)
+    return document_count
 
-        yearly_totals[year]['transcription_seconds'] += cast(int, data.get('transcription_seconds', 0))
-        yearly_totals[year]['words_transcribed'] += cast(int, data.get('words_transcribed', 0))
-        yearly_totals[year]['insights_gained'] += cast(int, data.get('insights_gained', 0))
-        yearly_totals[year]['memories_created'] += cast(int, data.get('memories_created', 0))
 
-    history: List[Dict[str, Any]] = [{'date': f"{year}-01-01", **stats} for year, stats in yearly_totals.items()]
-    history.sort(key=lambda x: cast(str, x['date']))
-    return history
+def _rollup_is_fresh(data: Dict[str, Any]) -> bool:
+    built_from = data.get('built_from')
+    stale_at = data.get('stale_at')
+    return built_from is not None and (stale_at is None or stale_at < built_from)
 
 
-def _read_all_time_usage(uid: str) -> Tuple[Dict[str, Any], List[Dict[str, Any]]]:
-    """Read hourly usage once while building both the total and yearly history."""
+def _save_month_rollups(
+    rollups_collection: Any,
+    rollups: Dict[Tuple[int, int], Dict[str, Any]],
+    built_from: datetime,
+    sealed_through: Optional[Tuple[int, int]],
+) -> None:
+    """Write month rollups, then advance the coverage marker; a failed write only costs a rebuild."""
+    try:
+        batch = db.batch()
+        pending = 0
+        for (year, month), totals in rollups.items():
+            doc = {'year': year, 'month': month, **totals, 'built_from': built_from}
+            batch.set(rollups_collection.document(_month_key(year, month)), doc, merge=True)
+            pending += 1
+            if pending == 400:
+                batch.commit()
+                batch = db.batch()
+                pending = 0
+        if sealed_through is not None:
+            batch.set(
+                rollups_collection.document(_ROLLUP_COVERAGE_ID),
+                {'sealed_through': _month_key(*sealed_through)},
+                merge=True,
+            )
+            pending += 1
+        if pending:
+            batch.commit()
+    except Exception as e:
+        logger.warning('usage rollup write failed, serving unsaved totals: %s', e)
+
+
+def _read_monthly_usage(
+    uid: str, year: Optional[int] = None, now: Optional[datetime] = None
+) -> Tuple[Dict[Tuple[int, int], Dict[str, Any]], int]:
+    """Per-month usage totals, optionally for one year, and the number of docs read.
+
+    Sealed months come from their rollups; months after the coverage marker come from one
+    `id >=` range over hourly docs, and any of them that have since sealed are rolled up
+    on the way. A rollup marked stale by a late write is rebuilt from its month's hourly
+    docs. Only months with at least one hourly doc are returned, like the hourly streams.
+    """
+    now = now or datetime.now(timezone.utc)
+    built_from = now - _ROLLUP_CLOCK_MARGIN
     user_ref = db.collection('users').document(uid)
     hourly_usage_collection = user_ref.collection('hourly_usage')
-    stats: Dict[str, Any] = {
-        'transcription_seconds': 0,
-        'words_transcribed': 0,
-        'insights_gained': 0,
-        'memories_created': 0,
-        'speech_seconds': 0,
-    }
-    yearly_totals: Dict[int, Dict[str, int]] = {}
-    document_count = 0
-    for doc in hourly_usage_collection.stream():
-        document_count += 1
-        data = _typed_doc(doc)
-        for key in stats:
-            stats[key] += data.get(key, 0)
-        year = cast(int, data.get('year', 0))
-        year_stats = yearly_totals.setdefault(
-            year,
-            {
-                'transcription_seconds': 0,
-                'words_transcribed': 0,
-                'insights_gained': 0,
-                'memories_created': 0,
-            },
+    rollups_collection = user_ref.collection(_USAGE_ROLLUPS)
+    sealed_through = _last_sealed_month(now)
+
+    coverage = rollups_collection.document(_ROLLUP_COVERAGE_ID).get()
+    document_count = 1
+    covered_through = _parse_month_key(_typed_doc(coverage).get('sealed_through')) if coverage.exists else None
+
+    months: Dict[Tuple[int, int], Dict[str, Any]] = {}
+    stale: List[Tuple[int, int]] = []
+    if covered_through is not None and (year is None or year <= covered_through[0]):
+        query = rollups_collection
+        if year is not None:
+            query = query.where(filter=FieldFilter('year', '==', year))
+        for doc in query.stream():
+            document_count += 1
+            if doc.id == _ROLLUP_COVERAGE_ID:
+                continue
+            data = _typed_doc(doc)
+            key = (int(data.get('year', 0)), int(data.get('month', 0)))
+            if key > covered_through:
+                continue
+            if _rollup_is_fresh(data):
+                months[key] = {name: data.get(name, 0) for name in ('documents', *_USAGE_TOTAL_KEYS)}
+            else:
+                stale.append(key)
+
+    rebuilt: Dict[Tuple[int, int], Dict[str, Any]] = {}
+    for key in stale:
+        rebuilt[key] = _empty_month_rollup()
+        query = hourly_usage_collection.where(filter=FieldFilter('year', '==', key[0])).where(
+            filter=FieldFilter('month', '==', key[1])
+        )
+        document_count += _sum_hourly_docs(query.stream(), rebuilt)
+
+    open_months: Dict[Tuple[int, int], Dict[str, Any]] = {}
+    if covered_through is None:
+        document_count += _sum_hourly_docs(hourly_usage_collection.stream(), open_months)
+    else:
+        scan_from = (
+            (covered_through[0] + 1, 1) if covered_through[1] == 12 else (covered_through[0], covered_through[1] + 1)
+        )
+        if year is None or year >= scan_from[0] or covered_through < sealed_through:
+            query = hourly_usage_collection.where(filter=FieldFilter('id', '>=', _month_key(*scan_from)))
+            document_count += _sum_hourly_docs(query.stream(), open_months)
+
+    newly_sealed = {key: totals for key, totals in open_months.items() if key <= sealed_through}
+    if rebuilt or (covered_through or (0, 0)) < sealed_through:
+        _save_month_rollups(
+            rollups_collection,
+            {**newly_sealed, **rebuilt},
+            built_from,
+            sealed_through if (covered_through or (0, 0)) < sealed_through else None,
         )
-        for key in year_stats:
-            year_stats[key] += data.get(key, 0)
 
+    months.update(rebuilt)
+    months.update(open_months)
+    return {
+        key: totals
+        for key, totals in months.items()
+        if totals.get('documents', 0) > 0 and (year is None or key[0] == year)
+    }, document_count
+
+
+def _sum_usage(months: Iterable[Dict[str, Any]], keys: Iterable[str]) -> Dict[str, Any]:
+    keys = tuple(keys)
+    stats: Dict[str, Any] = {key: 0 for key in keys}
+    for totals in months:
+        for key in keys:
+            stats[key] += totals.get(key, 0)
+    return stats
+
+
+def _read_yearly_usage(uid: str, year: int) -> Tuple[Dict[str, Any], List[Dict[str, Any]]]:
+    """One read of a year's months for both its total and its monthly history."""
+    months, _ = _read_monthly_usage(uid, year=year)
+    history = [
+        {'date': f"{year}-{month:02d}-01", **_sum_usage([totals], _USAGE_HISTORY_KEYS)}
+        for (_, month), totals in sorted(months.items())
+    ]
+    return _sum_usage(months.values(), _USAGE_TOTAL_KEYS), history
+
+
+def _read_all_time_usage(uid: str) -> Tuple[Dict[str, Any], List[Dict[str, Any]]]:
+    """Read month rollups and open-month hourly docs once for both the total and yearly history."""
+    months, document_count = _read_monthly_usage(uid)
     record_firestore_read(
         FirestoreReadFamily.ALL_TIME_USAGE,
         FirestoreReadMode.UNBOUNDED,
         document_count,
     )
-    history = [{'date': f"{year}-01-01", **year_stats} for year, year_stats in yearly_totals.items()]
-    history.sort(key=lambda x: cast(str, x['date']))
-    return stats, history
+    by_year: Dict[int, List[Dict[str, Any]]] = {}
+    for (year, _), totals in sorted(months.items()):
+        by_year.setdefault(year, []).append(totals)
+    history = [
+        {'date': f"{year}-01-01", **_sum_usage(year_months, _USAGE_HISTORY_KEYS)}
+        for year, year_months in by_year.items()
+    ]
+    return _sum_usage(months.values(), _USAGE_TOTAL_KEYS), history
 
 
 def get_current_user_usage(
@@ -798,8 +950,9 @@ def get_current_user_usage(
         response['monthly'] = UsageStats(**get_monthly_usage_stats(uid, now)).model_dump()
         response['history'] = get_daily_history_for_month(uid, now)
     elif period == 'yearly':
-        response['yearly'] = UsageStats(**get_yearly_usage_stats(uid, now)).model_dump()
-        response['history'] = get_monthly_history_for_year(uid, now)
+        yearly, history = _read_yearly_usage(uid, now.year)
+        response['yearly'] = UsageStats(**yearly).model_dump()
+        response['history'] = history
     elif period == 'all_time':
         all_time, history = _read_all_time_usage(uid)
         response['all_time'] = UsageStats(**all_time).model_dump()
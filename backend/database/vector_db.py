@@ -1125,6 +1125,40 @@ def delete_memory_vectors_batch(uid: str, memory_ids: List[str]) -> int:
 TRANSCRIPT_CHUNKS_NAMESPACE = "ns_tchunks"
 
 
+# Pinecone caps an upsert request at 2 MB; 100 vectors of 3072 float dims stays under it.
+TRANSCRIPT_CHUNK_UPSERT_BATCH = 100
+
+
+def transcript_chunk_vector_record(
+    uid: str, conversation_id: str, chunk: Dict[str, Any], vector: List[float]
+) -> VectorRecordDoc:
+    """One ns_tchunks record; the id is deterministic so re-indexing a conversation overwrites in place."""
+    metadata: VectorMetadataDoc = {
+        'uid': uid,
+        'conversation_id': conversation_id,
+        'chunk_index': chunk['chunk_index'],
+        'created_at': int(chunk['created_at']),
+    }
+    return {
+        'id': f"{uid}-{conversation_id}-c{chunk['chunk_index']}",
+        'values': vector,
+        'metadata': dict(metadata),
+    }
+
+
+def upsert_transcript_chunk_records(records: List[VectorRecordDoc]) -> int:
+    """Upsert pre-embedded chunk records (any mix of conversations) in request-sized slices."""
+    if index is None:
+        logger.warning('Pinecone index not initialized, skipping transcript chunk upsert')
+        return 0
+    upserted = 0
+    for i in range(0, len(records), TRANSCRIPT_CHUNK_UPSERT_BATCH):
+        batch = records[i : i + TRANSCRIPT_CHUNK_UPSERT_BATCH]
+        index.upsert(vectors=batch, namespace=TRANSCRIPT_CHUNKS_NAMESPACE)
+        upserted += len(batch)
+    return upserted
+
+
 def upsert_transcript_chunk_vectors(uid: str, conversation_id: str, chunks: List[Dict[str, Any]]) -> int:
     """chunks: [{'text': str, 'created_at': int unix ts, 'chunk_index': int}]"""
     if index is None:
@@ -1135,26 +1169,10 @@ def upsert_transcript_chunk_vectors(uid: str, conversation_id: str, chunks: List
         return 0
 
     vectors: List[List[float]] = embeddings.embed_documents([c['text'] for c in filtered])
-    payload: List[VectorRecordDoc] = []
-    for c, v in zip(filtered, vectors):
-        metadata: VectorMetadataDoc = {
-            'uid': uid,
-            'conversation_id': conversation_id,
-            'chunk_index': c['chunk_index'],
-            'created_at': int(c['created_at']),
-        }
-        payload.append(
-            {
-                'id': f"{uid}-{conversation_id}-c{c['chunk_index']}",
-                'values': v,
-                'metadata': dict(metadata),
-            }
-        )
-
-    upserted = 0
-    for i in range(0, len(payload), 100):
-        index.upsert(vectors=payload[i : i + 100], namespace=TRANSCRIPT_CHUNKS_NAMESPACE)
-        upserted += len(payload[i : i + 100])
+    payload: List[VectorRecordDoc] = [
+        transcript_chunk_vector_record(uid, conversation_id, c, v) for c, v in zip(filtered, vectors)
+    ]
+    upserted = upsert_transcript_chunk_records(payload)
     logger.info(f'upsert_transcript_chunk_vectors uid={uid} conversation={conversation_id} count={upserted}')
     return upserted
 
@@ -2,13 +2,15 @@
 Database operations for Wrapped (yearly recap) stored in users/{uid}/wrapped/{year}.
 """
 
-from datetime import datetime, timezone
+from datetime import datetime, timedelta, timezone
 from typing import Any, Dict, Optional, cast
 
 from ._client import db
 
 # Collection name under user document
 WRAPPED_COLLECTION = 'wrapped'
+# Per-stage checkpoints under users/{uid}/wrapped/{year}; they outlive the parent doc being reset.
+WRAPPED_STAGES_COLLECTION = 'stages'
 
 
 class WrappedStatus:
@@ -221,3 +223,43 @@ def is_wrapped_stuck(wrapped_data: Dict[str, Any], stale_minutes: int = 15) -> b
     elapsed = (now - updated_at).total_seconds() / 60
 
     return elapsed > stale_minutes
+
+
+def _stages_ref(uid: str, year: int) -> Any:
+    user_ref = db.collection('users').document(uid)
+    return user_ref.collection(WRAPPED_COLLECTION).document(str(year)).collection(WRAPPED_STAGES_COLLECTION)
+
+
+def get_wrapped_stage_results(uid: str, year: int, max_age: timedelta) -> Dict[str, Any]:
+    """
+    Get the checkpointed stage results of an earlier, unfinished generation.
+
+    Args:
+        uid: User ID
+        year: Year (e.g., 2025)
+        max_age: Results saved longer ago than this are ignored
+
+    Returns:
+        Stage name -> saved result
+    """
+    cutoff = datetime.now(timezone.utc) - max_age
+    results: Dict[str, Any] = {}
+    for doc in _stages_ref(uid, year).stream():
+        data = _typed_doc(doc)
+        saved_at = _coerce_timestamp(data.get('saved_at'))
+        if saved_at is not None and saved_at >= cutoff and 'value' in data:
+            results[doc.id] = data['value']
+    return results
+
+
+def save_wrapped_stage_result(uid: str, year: int, stage: str, value: Any) -> None:
+    """Checkpoint one stage result so a retried generation can skip the stage."""
+    _stages_ref(uid, year).document(stage).set({'value': value, 'saved_at': datetime.now(timezone.utc)})
+
+
+def clear_wrapped_stage_results(uid: str, year: int) -> None:
+    """Delete the stage checkpoints once the generation they belong to is saved."""
+    batch = db.batch()
+    for doc in _stages_ref(uid, year).stream():
+        batch.delete(doc.reference)
+    batch.commit()
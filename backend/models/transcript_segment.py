@@ -94,18 +94,26 @@ class TranscriptSegment(BaseModel):
         if not new_segments or len(new_segments) == 0:
             return segments, [], []
 
-        def _extract_last_incomplete_sentence(text: str) -> Tuple[Optional[str], str]:
+        def _extract_last_incomplete_sentence(text: str) -> Tuple[Optional[str], int]:
+            """Return the trailing unterminated sentence and the offset of its ender, or -1.
+
+            Scans back from the end instead of splitting the whole text, which grows
+            with every merge of a long monologue. ``_prefix_before`` rebuilds the
+            preceding sentences only on the branch that needs them.
+            """
             text = text.strip()
-            if not text:
-                return None, ""
-            parts = [p for p in SENTENCE_SPLIT_RE.split(text) if p]
-            if not parts:
-                return None, text
-            last = parts[-1]
-            if last[-1] not in SENTENCE_ENDERS:
-                prefix = " ".join(parts[:-1]).strip() if len(parts) > 1 else ""
-                return last, prefix
-            return None, text
+            if not text or text[-1] in SENTENCE_ENDERS:
+                return None, -1
+            ender = max(text.rfind(ch) for ch in SENTENCE_ENDERS)
+            if ender < 0:
+                return text, -1
+            return text[ender + 1 :].lstrip(), ender
+
+        def _prefix_before(text: str, ender: int) -> str:
+            if ender < 0:
+                return ""
+            parts = [p for p in SENTENCE_SPLIT_RE.split(text.strip()[: ender + 1]) if p]
+            return " ".join(parts).strip()
 
         def _split_first_sentence(text: str) -> Tuple[str, str]:
             text = text.strip()
@@ -170,7 +178,7 @@ class TranscriptSegment(BaseModel):
                 return a, b
 
             if a.speaker != b.speaker and not (a.is_user and b.is_user) and a.text and b.text:
-                last_incomplete, prefix = _extract_last_incomplete_sentence(a.text)
+                last_incomplete, ender = _extract_last_incomplete_sentence(a.text)
                 if last_incomplete:
                     first_sentence, rest = _split_first_sentence(b.text)
                     if _can_backward_merge_first_sentence(first_sentence, rest, last_incomplete):
@@ -181,6 +189,7 @@ class TranscriptSegment(BaseModel):
                         a.text = f'{a.text} {first_sentence}'.strip()
                         return a, None
                 if last_incomplete and len(last_incomplete) < len(b.text.strip()):
+                    prefix = _prefix_before(a.text, ender)
                     b.text = f'{last_incomplete} {b.text}'.strip()
                     if prefix:
                         a.text = prefix
@@ -228,8 +237,10 @@ class TranscriptSegment(BaseModel):
 
         segments.extend(joined_similar_segments)
 
-        # Normalize punctuation spacing
-        for segment in segments:
+        # Normalize punctuation spacing. Only the joined tail changed; earlier
+        # segments were normalized when they were joined, and re-walking them
+        # made every live tick linear in the transcript length.
+        for segment in joined_similar_segments:
             segment.text = (
                 segment.text.strip().replace('  ', ' ').replace(' ,', ',').replace(' .', '.').replace(' ?', '?')
             )
@@ -95,7 +95,9 @@ router = APIRouter()
 
 
 def _get_valid_conversation_by_id(uid: str, conversation_id: str) -> dict:
-    conversation = conversations_db.get_conversation(uid, conversation_id)
+    # Lazy view: lock/existence checks and field reads never decode the transcript.
+    # Materialize before returning it against a response_model.
+    conversation = conversations_db.get_conversation(uid, conversation_id, lazy=True)
     if conversation is None:
         raise HTTPException(status_code=404, detail="Conversation not found")
 
@@ -105,6 +107,12 @@ def _get_valid_conversation_by_id(uid: str, conversation_id: str) -> dict:
     return conversation
 
 
+def _materialized(conversation: dict) -> dict:
+    """Plain-dict copy of a lazy conversation view; response_model validation cannot see pending fields."""
+    materialize = getattr(conversation, 'materialize', None)
+    return materialize() if callable(materialize) else conversation
+
+
 def _speaker_assignment(segment: TranscriptSegment) -> str:
     if segment.is_user:
         return 'self'
@@ -585,13 +593,15 @@ def get_conversations(
         folder_id=folder_id,
         starred=starred,
         budget=budget,
+        lazy=True,
     )
 
+    # Locked rows have their transcript replaced here without ever decoding it.
     redact_conversations_for_list(conversations)
     if budget.truncated and response is not None:
         response.headers[OMI_LIST_TRUNCATED_HEADER] = OMI_LIST_TRUNCATED_VALUE
     budget.observe('truncated' if budget.truncated else 'complete')
-    return conversations
+    return [_materialized(conversation) for conversation in conversations]
 
 
 @router.get('/v1/conversations/count', tags=['conversations'], response_model=ConversationsCountResponse)
@@ -657,6 +667,7 @@ def get_conversation_by_id(
             )
         if conversation.get('source') != 'omi' or (not include_discarded and conversation.get('discarded', False)):
             raise HTTPException(status_code=404, detail="Conversation not found")
+    conversation = _materialized(conversation)
     # Lazy processing: a desktop conversation stored raw (deferred) for a freemium/Neo user is
     # enriched on first open. Other conversations are returned unchanged.
     if conversation.get('deferred'):
@@ -670,7 +681,7 @@ def get_conversation_by_id(
 def patch_conversation_title(conversation_id: str, title: str, uid: str = Depends(auth.get_current_user_uid)):
     _get_valid_conversation_by_id(uid, conversation_id)
     conversations_db.update_conversation_title(uid, conversation_id, title)
-    return {'status': 'Ok', 'conversation': _get_valid_conversation_by_id(uid, conversation_id)}
+    return {'status': 'Ok', 'conversation': _materialized(_get_valid_conversation_by_id(uid, conversation_id))}
 
 
 @router.delete(
@@ -1524,7 +1535,7 @@ def set_conversation_starred(conversation_id: str, starred: bool, uid: str = Dep
     logger.info(f'update_conversation_starred {conversation_id} {starred} {uid}')
     _get_valid_conversation_by_id(uid, conversation_id)
     conversations_db.set_conversation_starred(uid, conversation_id, starred)
-    return {"status": "Ok", "conversation": _get_valid_conversation_by_id(uid, conversation_id)}
+    return {"status": "Ok", "conversation": _materialized(_get_valid_conversation_by_id(uid, conversation_id))}
 
 
 @router.get(
@@ -595,9 +595,9 @@ class ListenReceiver:
                 self.channel_mix_buffers, audio_bytes_enabled=self.host.audio_bytes_send is not None
             )
             if decision.should_mix:
-                mixed = mix_n_channel_buffers(
-                    [bytearray(buffer[: decision.min_len]) for buffer in self.channel_mix_buffers]
-                )
+                # The mix reads the shared aligned prefix (decision.min_len) through
+                # zero-copy views, so the channel buffers are passed as-is.
+                mixed = mix_n_channel_buffers(self.channel_mix_buffers)
                 if mixed and self.host.audio_bytes_send is not None:
                     self.host.audio_bytes_send(mixed, self.host.state.last_audio_received_time or time.time())
                 for buffer in self.channel_mix_buffers:
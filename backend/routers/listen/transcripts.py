@@ -21,7 +21,7 @@ from models.message_event import (
     TranslationEvent,
 )
 from models.transcript_segment import TranscriptSegment, Translation
-from utils.app_integrations import trigger_realtime_integrations
+from utils.app_integrations import RealtimeFanoutSession, trigger_realtime_integrations
 from utils.conversations.factory import deserialize_conversation
 from utils.observability.fallback import record_fallback
 from utils.speaker_assignment import process_speaker_assigned_segments, should_update_speaker_to_person_map
@@ -78,12 +78,60 @@ class ConversationCache:
         self.data = None
 
 
+class LiveSegmentIndex:
+    """Position index over the live conversation's stored segment dicts.
+
+    The cached conversation keeps its transcript as the dicts last written to
+    Firestore. This maps segment id to list position so per-segment updates
+    (translations) skip a scan of an hour-long transcript. Positions are
+    carried across tail merges and rebuilt lazily when the list is replaced
+    or an entry is found out of place.
+    """
+
+    def __init__(self) -> None:
+        self._segments: Optional[List[Dict[str, Any]]] = None
+        self._positions: Dict[str, int] = {}
+
+    def find(self, segments: List[Dict[str, Any]], segment_id: str) -> Optional[int]:
+        index = self._positions.get(segment_id) if segments is self._segments else None
+        if index is None or index >= len(segments) or segments[index].get('id') != segment_id:
+            self._segments = segments
+            self._positions = {segment['id']: i for i, segment in enumerate(segments) if segment.get('id')}
+            index = self._positions.get(segment_id)
+        return index
+
+    def replace_tail(
+        self, previous: List[Dict[str, Any]], current: List[Dict[str, Any]], kept: int, removed: Sequence[str]
+    ) -> None:
+        """Carry positions from ``previous`` to ``current``, which shares its first ``kept`` entries."""
+        if previous is not self._segments:
+            self._segments = None
+            return
+        for segment_id in removed:
+            self._positions.pop(segment_id, None)
+        for index in range(kept, len(current)):
+            segment_id = current[index].get('id')
+            if segment_id:
+                self._positions[segment_id] = index
+        self._segments = current
+
+    def clear(self) -> None:
+        self._segments = None
+        self._positions = {}
+
+
+def _without_segments(data: Dict[str, Any]) -> Dict[str, Any]:
+    """Conversation fields without the transcript, which the live loop merges from the stored dicts."""
+    return {**data, 'transcript_segments': []}
+
+
 class TranscriptProcessor:
     def __init__(self, host: Any):
         self.host = host
         self.segment_buffer: deque[Dict[str, Any]] = deque(maxlen=host.limits.max_segment_buffer_size)
         self.photo_buffer: deque[ConversationPhoto] = deque(maxlen=host.limits.max_photo_buffer_size)
         self.cache = ConversationCache(self._load_conversation)
+        self.segment_index = LiveSegmentIndex()
         self.current_session_segments: Dict[str, bool] = {}
         self.suggested_segments: set[str] = set()
         self.language_cache = TranscriptSegmentLanguageCache()
@@ -91,6 +139,7 @@ class TranscriptProcessor:
         self.translation_lock = asyncio.Lock()
         self.translation_enabled = host.translation_language is not None
         self.translation_coordinator: Optional[TranslationCoordinator] = None
+        self.realtime_fanout: Optional[RealtimeFanoutSession] = None
         if self.translation_enabled:
             self.translation_coordinator = TranslationCoordinator(
                 target_language=host.translation_language or 'en',
@@ -128,39 +177,40 @@ class TranscriptProcessor:
                 )
                 if not conversation:
                     return
-                for index, segment in enumerate(conversation.get('transcript_segments', [])):
-                    if segment['id'] != segment_id:
-                        continue
-                    translations = segment.get('translations', [])
-                    translation = Translation(lang=self.host.translation_language, text=translated_text).model_dump()
-                    replacement = next(
-                        (
-                            i
-                            for i, value in enumerate(translations)
-                            if value.get('lang') == self.host.translation_language
-                        ),
-                        None,
-                    )
-                    if replacement is None:
-                        translations.append(translation)
-                    else:
-                        translations[replacement] = translation
-                    conversation['transcript_segments'][index]['translations'] = translations
-                    await self.host.persistence.call(
-                        conversations_db.update_conversation_segments,
-                        self.host.request.uid,
-                        conversation_id,
-                        conversation['transcript_segments'],
-                        data_protection_level=(
-                            self.cache.protection_level
-                            if conversation_id == self.host.state.current_conversation_id
-                            else None
-                        ),
-                    )
-                    if conversation_id == self.host.state.current_conversation_id:
-                        self.cache.update_segments(conversation['transcript_segments'])
-                        self.host.send_event(TranslationEvent(segments=[conversation['transcript_segments'][index]]))
+                stored = conversation.get('transcript_segments', [])
+                index = (
+                    self.segment_index.find(stored, segment_id)
+                    if conversation_id == self.host.state.current_conversation_id
+                    else next((i for i, segment in enumerate(stored) if segment['id'] == segment_id), None)
+                )
+                if index is None:
                     return
+                segment = stored[index]
+                translations = segment.get('translations', [])
+                translation = Translation(lang=self.host.translation_language, text=translated_text).model_dump()
+                replacement = next(
+                    (i for i, value in enumerate(translations) if value.get('lang') == self.host.translation_language),
+                    None,
+                )
+                if replacement is None:
+                    translations.append(translation)
+                else:
+                    translations[replacement] = translation
+                conversation['transcript_segments'][index]['translations'] = translations
+                await self.host.persistence.call(
+                    conversations_db.update_conversation_segments,
+                    self.host.request.uid,
+                    conversation_id,
+                    conversation['transcript_segments'],
+                    data_protection_level=(
+                        self.cache.protection_level
+                        if conversation_id == self.host.state.current_conversation_id
+                        else None
+                    ),
+                )
+                if conversation_id == self.host.state.current_conversation_id:
+                    self.cache.update_segments(conversation['transcript_segments'])
+                    self.host.send_event(TranslationEvent(segments=[conversation['transcript_segments'][index]]))
         except Exception as error:
             logger.error(
                 'Translation persist failed segment=%s uid=%s type=%s',
@@ -180,15 +230,8 @@ class TranscriptProcessor:
         updated: List[TranscriptSegment] = []
         removed: List[str] = []
         if segments:
-            conversation.transcript_segments, updated, removed = TranscriptSegment.combine_segments(
-                conversation.transcript_segments, segments
-            )
-            sort_transcript_segments_in_place(conversation.transcript_segments)
-            speaker = self.host.speakers
-            targets = conversation.transcript_segments if self.host.state.speaker_map_dirty else updated
-            process_speaker_assigned_segments(targets, speaker.segment_assignments, speaker.speaker_to_person)
-            self.host.state.speaker_map_dirty = False
-            serialised = [segment.model_dump() for segment in conversation.transcript_segments]
+            stored = await self._stored_segments(conversation.id)
+            serialised, kept, updated, removed = self._merge_tail(stored, segments)
             written = await self.host.persistence.call(
                 conversations_db.update_conversation_segments,
                 self.host.request.uid,
@@ -200,6 +243,7 @@ class TranscriptProcessor:
             if not written:
                 return None
             self.cache.update_segments(serialised)
+            self.segment_index.replace_tail(stored, serialised, kept, removed)
         if photos:
             stored = await self.host.persistence.call(
                 conversations_db.store_conversation_photos, self.host.request.uid, conversation.id, photos
@@ -220,6 +264,48 @@ class TranscriptProcessor:
         )
         return conversation, updated, removed
 
+    async def _stored_segments(self, conversation_id: str) -> List[Dict[str, Any]]:
+        """The stored segment dicts to merge into.
+
+        The live Conversation is built without its transcript, so when the cache does not hold
+        this conversation the segments are reloaded from the document (which also re-primes the
+        cache the merged segments are written back to).
+        """
+        if self.cache.data is None or self.cache.conversation_id != conversation_id:
+            await self.cache.get(conversation_id, force_refresh=True)
+        if self.cache.data is not None and self.cache.conversation_id == conversation_id:
+            return self.cache.data.get('transcript_segments') or []
+        return []
+
+    def _merge_tail(
+        self, stored: List[Dict[str, Any]], segments: List[TranscriptSegment]
+    ) -> tuple[List[Dict[str, Any]], int, List[TranscriptSegment], List[str]]:
+        """Merge new segments into the stored transcript, materializing only its tail.
+
+        combine_segments only ever reads or replaces the last existing segment,
+        so one TranscriptSegment is built per tick instead of the whole
+        transcript, and unchanged segments keep their stored dicts. A speaker
+        map change still re-resolves every segment, as before.
+
+        Returns (segments to store, count of leading stored dicts kept as-is,
+        updated segments, removed segment ids).
+        """
+        tail = TranscriptSegment(**stored[-1]) if stored else None
+        merged, updated, removed = TranscriptSegment.combine_segments([tail] if tail else [], segments)
+        kept = len(stored) if tail is not None and merged and merged[0] is tail else max(len(stored) - 1, 0)
+        speaker = self.host.speakers
+        starts = ([stored[kept - 1].get('start', 0)] if kept else []) + [segment.start for segment in updated]
+        in_order = all(earlier <= later for earlier, later in zip(starts, starts[1:]))
+        if self.host.state.speaker_map_dirty or not in_order:
+            everything = [TranscriptSegment(**segment) for segment in stored[:kept]] + updated
+            sort_transcript_segments_in_place(everything)
+            targets = everything if self.host.state.speaker_map_dirty else updated
+            process_speaker_assigned_segments(targets, speaker.segment_assignments, speaker.speaker_to_person)
+            self.host.state.speaker_map_dirty = False
+            return [segment.model_dump() for segment in everything], 0, updated, removed
+        process_speaker_assigned_segments(updated, speaker.segment_assignments, speaker.speaker_to_person)
+        return stored[:kept] + [segment.model_dump() for segment in updated], kept, updated, removed
+
     async def flush_speaker_assignments(self, conversation_id: Optional[str]) -> None:
         speaker = self.host.speakers
         if not conversation_id or not (speaker.speaker_to_person or speaker.segment_assignments):
@@ -265,101 +351,112 @@ class TranscriptProcessor:
 
     async def process_loop(self) -> None:
         diarized_speaker_ids_by_conversation: Dict[str, set[int]] = {}
-        while self.host.state.active or self.segment_buffer or self.photo_buffer:
-            if await self.host.wait(0.6) and not (self.segment_buffer or self.photo_buffer):
-                break
-            if not self.segment_buffer and not self.photo_buffer:
-                continue
-            raw_segments = sort_segments_by_start(list(self.segment_buffer))
-            conversation_id = self.host.state.current_conversation_id
-            if conversation_id:
-                diarized_speaker_ids_by_conversation.setdefault(conversation_id, set()).update(
-                    int(segment['speaker_id']) for segment in raw_segments if isinstance(segment.get('speaker_id'), int)
-                )
-            self.segment_buffer.clear()
-            photos = list(self.photo_buffer)
-            self.photo_buffer.clear()
-            if not self.host.state.first_audio_byte_timestamp:
-                continue
-            data = await self.cache.get(self.host.state.current_conversation_id)
-            if not data:
-                continue
-            finished_at = datetime.now(timezone.utc)
-            started_at: Optional[datetime] = None
-            offset = 0.0
-            new_segments: List[TranscriptSegment] = []
-            if raw_segments:
-                self.host.state.last_transcript_time = time.time()
-                if not data.get('transcript_segments'):
-                    started_at = datetime.fromtimestamp(
-                        self.host.state.first_audio_byte_timestamp + raw_segments[0]['start'], tz=timezone.utc
+        try:
+            while self.host.state.active or self.segment_buffer or self.photo_buffer:
+                if await self.host.wait(0.6) and not (self.segment_buffer or self.photo_buffer):
+                    break
+                if not self.segment_buffer and not self.photo_buffer:
+                    continue
+                raw_segments = sort_segments_by_start(list(self.segment_buffer))
+                conversation_id = self.host.state.current_conversation_id
+                if conversation_id:
+                    diarized_speaker_ids_by_conversation.setdefault(conversation_id, set()).update(
+                        int(segment['speaker_id'])
+                        for segment in raw_segments
+                        if isinstance(segment.get('speaker_id'), int)
                     )
-                    data['started_at'] = started_at
-                conversation_started = data['started_at']
-                if isinstance(conversation_started, str):
-                    conversation_started = datetime.fromisoformat(conversation_started)
-                offset = self.host.state.first_audio_byte_timestamp - conversation_started.timestamp()
-                for raw in raw_segments:
-                    raw['start'] += offset
-                    raw['end'] += offset
-                    segment = TranscriptSegment(**raw, speech_profile_processed=True)
-                    if (
-                        self.host.request.onboarding_mode
-                        and raw.get('speaker_id') != self.host.onboarding_omi_speaker_id
-                    ):
-                        segment.is_user = True
-                    new_segments.append(segment)
-                    self.current_session_segments[cast(str, segment.id)] = segment.speech_profile_processed
-                self.host.state.words_transcribed_since_last_record += len(
-                    ' '.join(segment.text for segment in new_segments).split()
-                )
-            transcript_segments, _, _ = TranscriptSegment.combine_segments([], new_segments)
-            current = deserialize_conversation(data)
-            result = await self._update_live_conversation(current, transcript_segments, photos, finished_at, started_at)
-            rolled_over = False
-            if result is None:
-                await self.host.conversations.create_new_in_progress_conversation(rollover=True)
-                result = await self._write_fresh(transcript_segments, photos, finished_at, started_at)
-                rolled_over = True
-            if rolled_over:
-                record_fallback(
-                    component='other',
-                    from_mode='fenced_generation',
-                    to_mode='fresh_generation',
-                    reason='local_heal',
-                    outcome='recovered' if result else 'exhausted',
-                    log=logger,
-                )
-            if not result or not result[0]:
-                continue
-            conversation, updated, removed = result
-            if removed:
-                self.host.send_event(SegmentsDeletedEvent(segment_ids=removed))
-            if not transcript_segments:
-                continue
-            client_segments = [segment.model_dump() for segment in updated]
-            delivered = await self._deliver_segments(client_segments)
-            if delivered and client_segments:
-                self.host.complete_live_transcription()
-            if self.host.transcript_send is not None and self.host.user_has_credits:
-                self.host.transcript_send([segment.model_dump() for segment in transcript_segments])
-            elif not self.host.pusher_enabled and self.host.user_has_credits:
-                try:
-                    await trigger_realtime_integrations(
-                        self.host.request.uid,
-                        [segment.model_dump() for segment in transcript_segments],
-                        self.host.state.current_conversation_id,
-                        source=self.host.request.source,
-                        client_kind=self.host.client_kind,
+                self.segment_buffer.clear()
+                photos = list(self.photo_buffer)
+                self.photo_buffer.clear()
+                if not self.host.state.first_audio_byte_timestamp:
+                    continue
+                data = await self.cache.get(self.host.state.current_conversation_id)
+                if not data:
+                    continue
+                finished_at = datetime.now(timezone.utc)
+                started_at: Optional[datetime] = None
+                offset = 0.0
+                new_segments: List[TranscriptSegment] = []
+                if raw_segments:
+                    self.host.state.last_transcript_time = time.time()
+                    if not data.get('transcript_segments'):
+                        started_at = datetime.fromtimestamp(
+                            self.host.state.first_audio_byte_timestamp + raw_segments[0]['start'], tz=timezone.utc
+                        )
+                        data['started_at'] = started_at
+                    conversation_started = data['started_at']
+                    if isinstance(conversation_started, str):
+                        conversation_started = datetime.fromisoformat(conversation_started)
+                    offset = self.host.state.first_audio_byte_timestamp - conversation_started.timestamp()
+                    for raw in raw_segments:
+                        raw['start'] += offset
+                        raw['end'] += offset
+                        segment = TranscriptSegment(**raw, speech_profile_processed=True)
+                        if (
+                            self.host.request.onboarding_mode
+                            and raw.get('speaker_id') != self.host.onboarding_omi_speaker_id
+                        ):
+                            segment.is_user = True
+                        new_segments.append(segment)
+                        self.current_session_segments[cast(str, segment.id)] = segment.speech_profile_processed
+                    self.host.state.words_transcribed_since_last_record += len(
+                        ' '.join(segment.text for segment in new_segments).split()
                     )
-                except Exception as error:
-                    logger.error('Realtime integration trigger failed type=%s', type(error).__name__)
-            if self.host.onboarding_handler and not self.host.onboarding_handler.completed:
-                self.host.onboarding_handler.on_segments_received(
-                    [segment.model_dump() for segment in transcript_segments]
+                transcript_segments, _, _ = TranscriptSegment.combine_segments([], new_segments)
+                current = deserialize_conversation(_without_segments(data))
+                result = await self._update_live_conversation(
+                    current, transcript_segments, photos, finished_at, started_at
                 )
-            await self._translate(updated, conversation.id, removed)
-            await self._speaker_detection(updated, offset)
+                rolled_over = False
+                if result is None:
+                    await self.host.conversations.create_new_in_progress_conversation(rollover=True)
+                    result = await self._write_fresh(transcript_segments, photos, finished_at, started_at)
+                    rolled_over = True
+                if rolled_over:
+                    record_fallback(
+                        component='other',
+                        from_mode='fenced_generation',
+                        to_mode='fresh_generation',
+                        reason='local_heal',
+                        outcome='recovered' if result else 'exhausted',
+                        log=logger,
+                    )
+                if not result or not result[0]:
+                    continue
+                conversation, updated, removed = result
+                if removed:
+                    self.host.send_event(SegmentsDeletedEvent(segment_ids=removed))
+                if not transcript_segments:
+                    continue
+                client_segments = [segment.model_dump() for segment in updated]
+                delivered = await self._deliver_segments(client_segments)
+                if delivered and client_segments:
+                    self.host.complete_live_transcription()
+                if self.host.transcript_send is not None and self.host.user_has_credits:
+                    self.host.transcript_send([segment.model_dump() for segment in transcript_segments])
+                elif not self.host.pusher_enabled and self.host.user_has_credits:
+                    if self.realtime_fanout is None:
+                        self.realtime_fanout = RealtimeFanoutSession(self.host.request.uid)
+                    try:
+                        await trigger_realtime_integrations(
+                            self.host.request.uid,
+                            [segment.model_dump() for segment in transcript_segments],
+                            self.host.state.current_conversation_id,
+                            source=self.host.request.source,
+                            client_kind=self.host.client_kind,
+                            fanout=self.realtime_fanout,
+                        )
+                    except Exception as error:
+                        logger.error('Realtime integration trigger failed type=%s', type(error).__name__)
+                if self.host.onboarding_handler and not self.host.onboarding_handler.completed:
+                    self.host.onboarding_handler.on_segments_received(
+                        [segment.model_dump() for segment in transcript_segments]
+                    )
+                await self._translate(updated, conversation.id, removed)
+                await self._speaker_detection(updated, offset)
+        finally:
+            if self.realtime_fanout is not None:
+                await self.realtime_fanout.close()
         try:
             await asyncio.wait_for(self.host.state.speaker_id_done.wait(), timeout=15.0)
         except asyncio.TimeoutError:
@@ -390,7 +487,7 @@ class TranscriptProcessor:
         data = await self.cache.get(self.host.state.current_conversation_id, force_refresh=True)
         return (
             await self._update_live_conversation(
-                deserialize_conversation(data), segments, photos, finished_at, started_at
+                deserialize_conversation(_without_segments(data)), segments, photos, finished_at, started_at
             )
             if data
             else None
@@ -475,5 +572,6 @@ class TranscriptProcessor:
         self.current_session_segments.clear()
         self.suggested_segments.clear()
         self.cache.clear()
+        self.segment_index.clear()
         self.language_cache.cache.clear()
         self.translation_service.clear_session_cache()
@@ -30,6 +30,7 @@ from utils.pusher_protocol import (
 )
 from utils.apps import is_audio_bytes_app_enabled
 from utils.app_integrations import (
+    RealtimeFanoutSession,
     trigger_realtime_integrations,
     trigger_realtime_audio_bytes,
 )
@@ -95,7 +96,11 @@ BG_DRAIN_TIMEOUT = 30.0  # seconds
 
 
 async def _dispatch_transcript_item(
-    uid: str, segments: List[Dict[str, Any]], memory_id: Optional[str], client_kind: ClientKind = 'unknown'
+    uid: str,
+    segments: List[Dict[str, Any]],
+    memory_id: Optional[str],
+    client_kind: ClientKind = 'unknown',
+    fanout: Optional[RealtimeFanoutSession] = None,
 ) -> None:
     async def run(sink: str, call: Awaitable[Any]) -> None:
         try:
@@ -103,8 +108,11 @@ async def _dispatch_transcript_item(
         except Exception as e:
             logger.error('Error processing transcript %s type=%s uid=%s', sink, type(e).__name__, uid)
 
+    integration_kwargs: Dict[str, Any] = {'client_kind': client_kind}
+    if fanout is not None:
+        integration_kwargs['fanout'] = fanout
     await asyncio.gather(
-        run('integrations', trigger_realtime_integrations(uid, segments, memory_id, client_kind=client_kind)),
+        run('integrations', trigger_realtime_integrations(uid, segments, memory_id, **integration_kwargs)),
         run('webhook', realtime_transcript_webhook(uid, segments, client_kind=client_kind)),
     )
 
@@ -176,6 +184,7 @@ async def _websocket_util_trigger(
     private_cloud_queue: deque[PrivateCloudChunk] = deque(maxlen=PRIVATE_CLOUD_QUEUE_MAX_SIZE)
     audio_bytes_event = asyncio.Event()  # Signals when items are added for instant wake
     audio_budget = ByteBudget(BUFFERED_AUDIO_MAX_BYTES)
+    realtime_fanout = RealtimeFanoutSession(uid)
 
     async def process_private_cloud_queue() -> None:
         """Background task that batches private cloud sync uploads by conversation_id.
@@ -384,7 +393,9 @@ async def _websocket_util_trigger(
             transcript_queue.clear()
 
             for item in batch:
-                await _dispatch_transcript_item(uid, item['segments'], item['memory_id'], resolved_client_kind)
+                await _dispatch_transcript_item(
+                    uid, item['segments'], item['memory_id'], resolved_client_kind, fanout=realtime_fanout
+                )
 
     async def process_audio_bytes_queue() -> None:
         """Event-driven consumer for audio bytes triggers (app integrations + webhooks)."""
@@ -411,7 +422,9 @@ async def _websocket_util_trigger(
             for item in batch:
                 try:
                     if item['type'] == 'app':
-                        await trigger_realtime_audio_bytes(uid, item['sample_rate'], item['data'])
+                        await trigger_realtime_audio_bytes(
+                            uid, item['sample_rate'], item['data'], fanout=realtime_fanout
+                        )
                     elif item['type'] == 'webhook':
                         await send_audio_bytes_developer_webhook(uid, item['sample_rate'], item['data'])
                 except Exception as e:
@@ -759,6 +772,7 @@ async def _websocket_util_trigger(
 
         all_to_cancel = [t for t in bg_main_tasks if not t.done()]
         await drain_tasks(all_to_cancel, timeout=5.0, label="pusher_cleanup", cancel=True)
+        await realtime_fanout.close()
 
         PUSHER_ACTIVE_WS_CONNECTIONS.dec()
 
@@ -28,6 +28,7 @@ from services.users.account_deletion import background_wipe_user_data, start_acc
 from database.app_review_config import should_hide_subscription_ui
 from database.webhook_health import record_dev_webhook_success
 from database.conversations import get_in_progress_conversation, get_conversation
+from database.helpers import invalidate_data_protection_level_cache
 from database.redis_db import (
     cache_user_geolocation,
     get_cached_user_geolocation,
@@ -1011,6 +1012,7 @@ def finalize_migration_request(request: MigrationTargetRequest, uid: str = Depen
 
     finalize_migration(uid, request.target_level)
     set_user_data_protection_level(uid, request.target_level)
+    invalidate_data_protection_level_cache(uid)
     return {'status': 'ok'}
 
 
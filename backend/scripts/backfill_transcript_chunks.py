@@ -0,0 +1,101 @@
+"""Backfill verbatim transcript-chunk vectors (ns_tchunks) for existing users.
+
+Streams each named user's conversations, embeds chunks from many conversations per
+embedding request and upserts in full batches (utils/conversations/transcript_chunk_backfill.py).
+Per-user progress is kept in a JSON checkpoint file, rewritten after every upsert flush, so
+an interrupted run picks up where it stopped. Default mode is a dry run that reports chunk,
+token and embedding-call counts; the operator names the users explicitly.
+
+Usage:
+    cd backend
+    python scripts/backfill_transcript_chunks.py --uid YOUR_UID
+    python scripts/backfill_transcript_chunks.py --uids-file uids.txt --apply --checkpoint-file tchunks.json
+    python scripts/backfill_transcript_chunks.py --uid YOUR_UID --apply --no-resume
+"""
+
+from __future__ import annotations
+
+import argparse
+import json
+import os
+import sys
+from dataclasses import asdict
+from pathlib import Path
+from typing import Any, Dict, List
+
+BACKEND_DIR = Path(__file__).resolve().parents[1]
+if str(BACKEND_DIR) not in sys.path:
+    sys.path.insert(0, str(BACKEND_DIR))
+
+from utils.conversations.transcript_chunk_backfill import (  # noqa: E402
+    EMBED_MAX_INPUTS,
+    EMBED_TOKEN_BUDGET,
+    FLUSH_RECORDS,
+    TranscriptChunkCheckpoint,
+    backfill_transcript_chunks,
+)
+
+
+def _build_parser() -> argparse.ArgumentParser:
+    parser = argparse.ArgumentParser(description="Backfill transcript-chunk vectors for named users")
+    parser.add_argument("--uid", action="append", default=[], help="Firebase uid to backfill (repeatable)")
+    parser.add_argument("--uids-file", default=None, help="File with one uid per line")
+    parser.add_argument("--apply", action="store_true", help="Embed and upsert (default is dry-run)")
+    parser.add_argument("--checkpoint-file", default="transcript_chunk_backfill.json", help="Per-user resume state")
+    parser.add_argument("--no-resume", action="store_true", help="Ignore prior checkpoints and start from the top")
+    parser.add_argument("--token-budget", type=int, default=EMBED_TOKEN_BUDGET, help="Max tokens per embedding call")
+    parser.add_argument("--max-inputs", type=int, default=EMBED_MAX_INPUTS, help="Max chunks per embedding call")
+    parser.add_argument("--flush-records", type=int, default=FLUSH_RECORDS, help="Records buffered per upsert flush")
+    parser.add_argument("--max-conversations", type=int, default=None, help="Stop each user after this many")
+    return parser
+
+
+def _load_checkpoints(path: str) -> Dict[str, Dict[str, Any]]:
+    if not os.path.exists(path):
+        return {}
+    with open(path) as f:
+        return json.load(f)
+
+
+def _save_checkpoints(path: str, checkpoints: Dict[str, Dict[str, Any]]) -> None:
+    tmp_path = f"{path}.tmp"
+    with open(tmp_path, "w") as f:
+        json.dump(checkpoints, f, indent=2, sort_keys=True)
+    os.replace(tmp_path, path)
+
+
+def main(argv: List[str] | None = None) -> int:
+    args = _build_parser().parse_args(argv)
+    uids = list(args.uid)
+    if args.uids_file:
+        with open(args.uids_file) as f:
+            uids.extend(line.strip() for line in f if line.strip())
+    if not uids:
+        print("name at least one user with --uid or --uids-file", file=sys.stderr)
+        return 2
+
+    checkpoints = {} if args.no_resume else _load_checkpoints(args.checkpoint_file)
+
+    def save(uid: str, checkpoint: TranscriptChunkCheckpoint) -> None:
+        checkpoints[uid] = asdict(checkpoint)
+        _save_checkpoints(args.checkpoint_file, checkpoints)
+
+    incomplete = 0
+    for uid in dict.fromkeys(uids):
+        report = backfill_transcript_chunks(
+            uid,
+            checkpoint=TranscriptChunkCheckpoint(**checkpoints[uid]) if uid in checkpoints else None,
+            on_checkpoint=lambda checkpoint, uid=uid: save(uid, checkpoint),
+            dry_run=not args.apply,
+            token_budget=args.token_budget,
+            max_inputs=args.max_inputs,
+            flush_records=args.flush_records,
+            max_conversations=args.max_conversations,
+        )
+        print(json.dumps(asdict(report)))
+        incomplete += not report.completed
+    return 1 if args.apply and incomplete else 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
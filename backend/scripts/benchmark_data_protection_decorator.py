@@ -0,0 +1,140 @@
+#!/usr/bin/env python3
+"""set_data_protection_level — decorator overhead micro-benchmark
+
+Times the database/helpers.py decorator against the previous implementation,
+which called ``inspect.signature(func).bind()`` and read the level from Redis
+on every decorated write. Both wrap no-op stand-ins carrying the exact
+signatures of the production write functions, so no Firestore or Redis is
+touched: Redis is a counting fake with a configurable round-trip delay.
+
+Usage:
+    python3 scripts/benchmark_data_protection_decorator.py
+    python3 scripts/benchmark_data_protection_decorator.py --iterations 50000 --redis-rtt-us 300
+"""
+
+import argparse
+import inspect
+import os
+import sys
+import time
+from typing import Any, Callable, Dict, List, Optional, Tuple
+from unittest.mock import patch
+
+sys.path.insert(0, os.path.join(os.path.dirname(__file__), '..'))
+os.environ.setdefault('ENCRYPTION_SECRET', 'omi_benchmark_only_secret_that_is_long_enough_32b')
+
+from database import helpers  # noqa: E402
+
+# (module, function, data argument) for every @set_data_protection_level write.
+# save_memories takes a list of documents; the others take one.
+WRITE_FUNCTIONS = [
+    ('database.conversations', 'upsert_conversation_with_lifecycle', 'conversation_data'),
+    ('database.memories', 'create_memory', 'data'),
+    ('database.memories', 'save_memories', 'data'),
+    ('database.chat', 'add_message', 'message_data'),
+    ('database.phone_calls', 'upsert_phone_number', 'phone_number_data'),
+]
+
+
+def legacy_set_data_protection_level(data_arg_name: str) -> Callable[[Callable[..., Any]], Callable[..., Any]]:
+    """Pre-change reference: bind the full signature and hit Redis on every call."""
+
+    def decorator(func: Callable[..., Any]) -> Callable[..., Any]:
+        def wrapper(*args: Any, **kwargs: Any) -> Any:
+            bound_args = inspect.signature(func).bind(*args, **kwargs)
+            bound_args.apply_defaults()
+            uid = bound_args.arguments.get('uid')
+            data = bound_args.arguments.get(data_arg_name)
+            items = data if isinstance(data, list) else [data]
+            if any(isinstance(item, dict) and item.get('data_protection_level') is None for item in items):
+                level = helpers.redis_db.get_user_data_protection_level(uid) or 'enhanced'
+                for item in items:
+                    if isinstance(item, dict) and item.get('data_protection_level') is None:
+                        item['data_protection_level'] = level
+            return func(*args, **kwargs)
+
+        return wrapper
+
+    return decorator
+
+
+class CountingRedis:
+    """Stands in for database.redis_db: counts level reads and sleeps one round trip each."""
+
+    def __init__(self, rtt_seconds: float):
+        self.rtt_seconds = rtt_seconds
+        self.reads = 0
+
+    def get_user_data_protection_level(self, uid: str) -> Optional[str]:
+        self.reads += 1
+        if self.rtt_seconds:
+            deadline = time.perf_counter() + self.rtt_seconds
+            while time.perf_counter() < deadline:
+                pass
+        return 'enhanced'
+
+    def set_user_data_protection_level(self, uid: str, level: str) -> None:
+        pass
+
+
+def stand_in(module_name: str, function_name: str) -> Callable[..., Any]:
+    """No-op function with the production write function's signature."""
+    module = __import__(module_name, fromlist=[function_name])
+
+    def write(*args: Any, **kwargs: Any) -> None:
+        return None
+
+    write.__signature__ = inspect.signature(inspect.unwrap(getattr(module, function_name)))  # type: ignore[attr-defined]  # stand-in mirrors the real signature
+    write.__name__ = function_name
+    return write
+
+
+def payload(function_name: str, with_level: bool) -> Any:
+    item: Dict[str, Any] = {'id': 'x'}
+    if with_level:
+        item['data_protection_level'] = 'enhanced'
+    return [item] if function_name == 'save_memories' else item
+
+
+def time_calls(fn: Callable[..., Any], function_name: str, with_level: bool, iterations: int) -> float:
+    """Mean microseconds per decorated call, fresh payload each call."""
+    payloads = [payload(function_name, with_level) for _ in range(iterations)]
+    started = time.perf_counter()
+    for index in range(iterations):
+        fn('uid-1', payloads[index])
+    return (time.perf_counter() - started) / iterations * 1e6
+
+
+def run(iterations: int, redis_rtt_us: float) -> List[Tuple[str, float, float, int, int]]:
+    rows = []
+    for module_name, function_name, data_arg_name in WRITE_FUNCTIONS:
+        write = stand_in(module_name, function_name)
+        legacy = legacy_set_data_protection_level(data_arg_name)(write)
+        current = helpers.set_data_protection_level(data_arg_name)(write)
+        for with_level in (True, False):
+            redis = CountingRedis(redis_rtt_us / 1e6)
+            helpers._data_protection_level_cache.clear()
+            with patch.object(helpers, 'redis_db', redis):
+                legacy_us = time_calls(legacy, function_name, with_level, iterations)
+                legacy_reads, redis.reads = redis.reads, 0
+                current_us = time_calls(current, function_name, with_level, iterations)
+            label = f'{function_name} ({"level set" if with_level else "backfill"})'
+            rows.append((label, legacy_us, current_us, legacy_reads, redis.reads))
+    return rows
+
+
+def main() -> int:
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument('--iterations', type=int, default=20000)
+    parser.add_argument('--redis-rtt-us', type=float, default=0.0, help='simulated Redis round trip per level read')
+    args = parser.parse_args()
+
+    print(f'{"write":<52}{"legacy us":>11}{"new us":>9}{"speedup":>9}{"redis reads":>16}')
+    for label, legacy_us, current_us, legacy_reads, current_reads in run(args.iterations, args.redis_rtt_us):
+        reads = f'{legacy_reads}->{current_reads}'
+        print(f'{label:<52}{legacy_us:>11.2f}{current_us:>9.2f}{legacy_us / current_us:>8.1f}x{reads:>16}')
+    return 0
+
+
+if __name__ == '__main__':
+    sys.exit(main())
@@ -0,0 +1,123 @@
+#!/usr/bin/env python3
+"""Listen audio helpers — parity + micro-benchmark
+
+Checks that the NumPy ``mix_n_channel_buffers`` and ``resample_pcm`` in
+utils/listen_audio.py are sample-exact against the original struct/list
+implementations, then times both on frame sizes the multi-channel listen
+receiver sees (phone-call and desktop streams).
+
+Usage:
+    python3 scripts/benchmark_listen_audio.py
+    python3 scripts/benchmark_listen_audio.py --frame-ms 20,100,1000 --iterations 2000
+"""
+
+import argparse
+import os
+import random
+import struct
+import sys
+import time
+from typing import Callable, List, Sequence
+
+sys.path.insert(0, os.path.join(os.path.dirname(__file__), '..'))
+
+from utils.listen_audio import mix_n_channel_buffers, resample_pcm  # noqa: E402
+
+RATE_PAIRS = [(8000, 16000), (16000, 8000), (44100, 16000), (48000, 16000), (16000, 48000), (22050, 16000)]
+
+
+def legacy_mix_n_channel_buffers(buffers: List[bytearray]) -> bytes:
+    """Pre-NumPy reference: per-sample Python sum and clamp."""
+    min_len = min((len(buffer) for buffer in buffers), default=0)
+    if min_len < 2:
+        return b''
+    min_len -= min_len % 2
+    sample_count = min_len // 2
+    channels = [struct.unpack(f'<{sample_count}h', buffer[:min_len]) for buffer in buffers]
+    mixed = [max(-32768, min(32767, sum(channel[index] for channel in channels))) for index in range(sample_count)]
+    return struct.pack(f'<{len(mixed)}h', *mixed)
+
+
+def legacy_resample_pcm(pcm_data: bytes, source_rate: int, target_rate: int) -> bytes:
+    """Pre-NumPy reference: duplication/decimation with a list comprehension."""
+    if source_rate == target_rate or source_rate <= 0 or target_rate <= 0:
+        return pcm_data
+    sample_count = len(pcm_data) // 2
+    if sample_count == 0:
+        return pcm_data
+    samples = struct.unpack(f'<{sample_count}h', pcm_data[: sample_count * 2])
+    ratio = target_rate / source_rate
+    output_count = int(sample_count * ratio)
+    output = [samples[min(int(index / ratio), sample_count - 1)] for index in range(output_count)]
+    return struct.pack(f'<{len(output)}h', *output)
+
+
+def random_pcm(rng: random.Random, sample_count: int, odd_tail: bool = False) -> bytearray:
+    data = bytearray(struct.pack(f'<{sample_count}h', *(rng.randint(-32768, 32767) for _ in range(sample_count))))
+    if odd_tail:
+        data.append(rng.randint(0, 255))
+    return data
+
+
+def check_parity(rng: random.Random, cases: int) -> int:
+    """Compare new vs legacy outputs on random inputs. Returns the number of mismatches."""
+    mismatches = 0
+    for _ in range(cases):
+        channels = rng.randint(1, 4)
+        buffers = [random_pcm(rng, rng.randint(0, 800), odd_tail=rng.random() < 0.3) for _ in range(channels)]
+        if mix_n_channel_buffers(buffers) != legacy_mix_n_channel_buffers(buffers):
+            mismatches += 1
+            print(f'mix mismatch channels={channels} lens={[len(b) for b in buffers]}')
+
+        source_rate, target_rate = rng.choice(RATE_PAIRS)
+        pcm = bytes(random_pcm(rng, rng.randint(0, 2000), odd_tail=rng.random() < 0.3))
+        if resample_pcm(pcm, source_rate, target_rate) != legacy_resample_pcm(pcm, source_rate, target_rate):
+            mismatches += 1
+            print(f'resample mismatch {source_rate}->{target_rate} bytes={len(pcm)}')
+    return mismatches
+
+
+def time_call(fn: Callable[[], object], iterations: int) -> float:
+    """Mean microseconds per call."""
+    started = time.perf_counter()
+    for _ in range(iterations):
+        fn()
+    return (time.perf_counter() - started) / iterations * 1e6
+
+
+def run_benchmark(frame_ms_values: Sequence[int], iterations: int, rng: random.Random) -> None:
+    print(f'{"case":<34}{"legacy us":>12}{"numpy us":>12}{"speedup":>10}')
+    for frame_ms in frame_ms_values:
+        samples_16k = 16 * frame_ms
+        stereo = [random_pcm(rng, samples_16k) for _ in range(2)]
+        legacy = time_call(lambda: legacy_mix_n_channel_buffers(stereo), iterations)
+        new = time_call(lambda: mix_n_channel_buffers(stereo), iterations)
+        print(f'{f"mix 2ch {frame_ms}ms":<34}{legacy:>12.1f}{new:>12.1f}{legacy / new:>9.1f}x')
+
+        for source_rate, target_rate in ((48000, 16000), (8000, 16000)):
+            pcm = bytes(random_pcm(rng, source_rate * frame_ms // 1000))
+            legacy = time_call(lambda: legacy_resample_pcm(pcm, source_rate, target_rate), iterations)
+            new = time_call(lambda: resample_pcm(pcm, source_rate, target_rate), iterations)
+            label = f'resample {source_rate}->{target_rate} {frame_ms}ms'
+            print(f'{label:<34}{legacy:>12.1f}{new:>12.1f}{legacy / new:>9.1f}x')
+
+
+def main() -> int:
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument('--frame-ms', default='20,100,1000', help='comma-separated frame durations to time')
+    parser.add_argument('--iterations', type=int, default=500)
+    parser.add_argument('--parity-cases', type=int, default=500)
+    parser.add_argument('--seed', type=int, default=7)
+    args = parser.parse_args()
+
+    rng = random.Random(args.seed)
+    mismatches = check_parity(rng, args.parity_cases)
+    print(f'parity: {args.parity_cases} random cases, {mismatches} mismatches')
+    if mismatches:
+        return 1
+    run_benchmark([int(value) for value in args.frame_ms.split(',')], args.iterations, rng)
+    return 0
+
+
+if __name__ == '__main__':
+    sys.exit(main())
@@ -0,0 +1,87 @@
+#!/usr/bin/env python3
+"""Memory ingestion secret redaction — parity + throughput benchmark
+
+Checks that ``redact_text`` in utils/memory_ingestion/redaction.py returns the
+same text and the same RedactionRecords as the original per-pattern slicing
+implementation, including cascaded matches (a later pattern matching across an
+earlier placeholder), then times both on long transcripts with and without
+secrets.
+
+Usage:
+    python3 scripts/benchmark_memory_redaction.py
+    python3 scripts/benchmark_memory_redaction.py --words 2000,20000 --iterations 50
+"""
+
+import argparse
+import os
+import random
+import sys
+import time
+from typing import Callable, Sequence
+
+sys.path.insert(0, os.path.join(os.path.dirname(__file__), '..'))
+
+from tests.unit.memory_redaction_test_support import (  # noqa: E402
+    check_parity,
+    legacy_redact_text,
+    random_transcript,
+)
+from utils.memory_ingestion.ids import StableIdFactory  # noqa: E402
+from utils.memory_ingestion.redaction import redact_text  # noqa: E402
+
+
+def time_call(fn: Callable[[], object], iterations: int) -> float:
+    """Mean milliseconds per call."""
+    started = time.perf_counter()
+    for _ in range(iterations):
+        fn()
+    return (time.perf_counter() - started) / iterations * 1e3
+
+
+def run_benchmark(word_counts: Sequence[int], iterations: int, rng: random.Random) -> None:
+    factory = StableIdFactory('bench')
+    print(f'{"case":<34}{"legacy ms":>12}{"scanner ms":>12}{"speedup":>10}')
+    for words in word_counts:
+        cases = (
+            ('plain speech', 0.0, 0.0),
+            ('credential talk', 0.0, 0.05),
+            ('sparse secrets', 0.002, 0.05),
+            ('dense secrets', 0.05, 0.05),
+        )
+        for label, secret_rate, credential_rate in cases:
+            text = random_transcript(rng, words, secret_rate=secret_rate, credential_rate=credential_rate)
+            legacy = time_call(
+                lambda text=text: legacy_redact_text(
+                    text, source_event_id='event-1', id_factory=factory, hmac_key='bench-key'
+                ),
+                iterations,
+            )
+            new = time_call(
+                lambda text=text: redact_text(
+                    text, source_event_id='event-1', id_factory=factory, hmac_key='bench-key'
+                ),
+                iterations,
+            )
+            name = f'{words} words {label}'
+            print(f'{name:<34}{legacy:>12.2f}{new:>12.2f}{legacy / new:>9.1f}x')
+
+
+def main() -> int:
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument('--words', default='500,5000,20000', help='comma-separated transcript lengths to time')
+    parser.add_argument('--iterations', type=int, default=20)
+    parser.add_argument('--parity-cases', type=int, default=500)
+    parser.add_argument('--seed', type=int, default=7)
+    args = parser.parse_args()
+
+    rng = random.Random(args.seed)
+    mismatches = check_parity(rng, args.parity_cases)
+    print(f'parity: {args.parity_cases} random cases, {mismatches} mismatches')
+    if mismatches:
+        return 1
+    run_benchmark([int(value) for value in args.words.split(',')], args.iterations, rng)
+    return 0
+
+
+if __name__ == '__main__':
+    sys.exit(main())
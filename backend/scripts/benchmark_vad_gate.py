@@ -0,0 +1,209 @@
+#!/usr/bin/env python3
+"""VAD streaming gate — buffer parity + per-chunk replay benchmark
+
+Checks that the preallocated VadSampleBuffer in utils/stt/vad_gate.py hands the
+model exactly the windows the original concatenate/np.interp buffering did, for
+every supported rate and arbitrary (even mid-sample) chunk splits. Then replays
+recorded sessions through VADStreamingGate.process_audio chunk by chunk and
+reports per-chunk CPU time and allocated bytes, next to the same replay using
+the original buffering.
+
+Sessions are WAV files or raw PCM16 files (--raw-rate/--raw-channels); with no
+--input a synthetic speech/silence session is generated.
+
+Usage:
+    python3 scripts/benchmark_vad_gate.py
+    python3 scripts/benchmark_vad_gate.py --input session1.wav,session2.wav --chunk-ms 20,100
+    python3 scripts/benchmark_vad_gate.py --input capture.pcm --raw-rate 48000 --no-model
+"""
+
+import argparse
+import audioop
+import os
+import random
+import statistics
+import sys
+import time
+import tracemalloc
+import wave
+from collections import deque
+from typing import Any, Callable, Deque, List, Sequence, Tuple
+
+import numpy as np
+
+sys.path.insert(0, os.path.join(os.path.dirname(__file__), '..'))
+
+from utils.stt import vad_gate  # noqa: E402
+from utils.stt.vad_gate import VADStreamingGate  # noqa: E402
+
+Session = Tuple[str, bytes, int, int]  # name, pcm, sample_rate, channels
+
+
+class LegacyBufferGate(VADStreamingGate):
+    """Pre-ring-buffer reference: float32 concatenation for VAD input, deque of chunks for pre-roll."""
+
+    def __init__(self, *args: Any, **kwargs: Any):
+        super().__init__(*args, **kwargs)
+        self._legacy_vad_buffer = np.array([], dtype=np.float32)
+        self._legacy_pre_roll: Deque[bytes] = deque()
+        self._legacy_pre_roll_ms = 0.0
+
+    def _convert_for_vad_legacy(self, pcm_data: bytes) -> np.ndarray:
+        data = self._pcm_remainder + pcm_data if self._pcm_remainder else pcm_data
+        frame_bytes = self._sample_width * self.channels
+        leftover = len(data) % frame_bytes
+        if leftover:
+            self._pcm_remainder = data[len(data) - leftover :]
+            data = data[: len(data) - leftover]
+        else:
+            self._pcm_remainder = b''
+        if not data:
+            return np.array([], dtype=np.float32)
+        if self.channels == 2:
+            data = audioop.tomono(data, self._sample_width, 0.5, 0.5)
+        data_int16 = np.frombuffer(data, dtype=np.int16)
+        if self.sample_rate != self._vad_sample_rate:
+            ratio = self._vad_sample_rate / self.sample_rate
+            n_out = int(len(data_int16) * ratio)
+            indices = np.linspace(0, len(data_int16) - 1, n_out)
+            data_int16 = np.interp(indices, np.arange(len(data_int16)), data_int16.astype(np.float64)).astype(np.int16)
+        return data_int16.astype(np.float32) / 32768.0
+
+    def _take_vad_windows(self, pcm_data: bytes) -> np.ndarray:
+        self._legacy_vad_buffer = np.concatenate([self._legacy_vad_buffer, self._convert_for_vad_legacy(pcm_data)])
+        n_windows = len(self._legacy_vad_buffer) // self._vad_window_samples
+        consumed = n_windows * self._vad_window_samples
+        windows = self._legacy_vad_buffer[:consumed].reshape(n_windows, self._vad_window_samples)
+        self._legacy_vad_buffer = self._legacy_vad_buffer[consumed:]
+        return windows
+
+    def _buffer_pre_roll(self, pcm_data: bytes) -> None:
+        # Same allocation pattern as the deque pre-roll; the ring still serves the state machine.
+        self._legacy_pre_roll.append(pcm_data)
+        self._legacy_pre_roll_ms += len(pcm_data) / (self._frame_bytes * self.sample_rate) * 1000.0
+        while self._legacy_pre_roll_ms > self._pre_roll_ms and len(self._legacy_pre_roll) > 1:
+            evicted = self._legacy_pre_roll.popleft()
+            self._legacy_pre_roll_ms -= len(evicted) / (self._frame_bytes * self.sample_rate) * 1000.0
+        super()._buffer_pre_roll(pcm_data)
+
+
+def read_session(path: str, raw_rate: int, raw_channels: int) -> Session:
+    if path.lower().endswith('.wav'):
+        with wave.open(path, 'rb') as wf:
+            return os.path.basename(path), wf.readframes(wf.getnframes()), wf.getframerate(), wf.getnchannels()
+    with open(path, 'rb') as f:
+        return os.path.basename(path), f.read(), raw_rate, raw_channels
+
+
+def synthetic_session(rng: random.Random, seconds: int, sample_rate: int) -> Session:
+    """Alternating noise bursts and near-silence, so the gate walks every state."""
+    parts = []
+    remaining = seconds * sample_rate
+    loud = False
+    while remaining > 0:
+        n = min(remaining, int(rng.uniform(0.5, 4.0) * sample_rate))
+        amplitude = 8000 if loud else 30
+        parts.append(np.asarray([rng.randint(-amplitude, amplitude) for _ in range(n)], dtype=np.int16).tobytes())
+        remaining -= n
+        loud = not loud
+    return f'synthetic-{seconds}s-{sample_rate}hz', b''.join(parts), sample_rate, 1
+
+
+def split_chunks(pcm: bytes, sample_rate: int, channels: int, chunk_ms: int) -> List[bytes]:
+    size = sample_rate * channels * 2 * chunk_ms // 1000
+    return [pcm[i : i + size] for i in range(0, len(pcm), size)]
+
+
+def make_gate(cls: Callable[..., VADStreamingGate], sample_rate: int, channels: int) -> VADStreamingGate:
+    return cls(sample_rate=sample_rate, channels=channels, mode='active', uid='bench', session_id='bench')
+
+
+def check_parity(rng: random.Random, cases: int) -> int:
+    """Feed random splits to both buffers and compare every window. Returns the number of mismatches."""
+    mismatches = 0
+    for case in range(cases):
+        sample_rate = rng.choice([8000, 16000, 22050, 44100, 48000])
+        channels = rng.choice([1, 2])
+        new = make_gate(VADStreamingGate, sample_rate, channels)
+        legacy = make_gate(LegacyBufferGate, sample_rate, channels)
+        for _ in range(rng.randint(1, 40)):
+            chunk = rng.randbytes(rng.choice([0, 1, 3, 2 * rng.randint(1, 3000), rng.randint(1, 9000)]))
+            got = new._take_vad_windows(chunk).copy()
+            want = legacy._take_vad_windows(chunk)
+            if got.shape != want.shape or not np.array_equal(got, want):
+                mismatches += 1
+                print(f'mismatch: case={case} rate={sample_rate} channels={channels} chunk={len(chunk)}')
+                break
+    return mismatches
+
+
+def replay(gate: VADStreamingGate, chunks: Sequence[bytes]) -> Tuple[List[float], List[int]]:
+    """Per-chunk CPU microseconds and bytes allocated by process_audio."""
+    cpu_us: List[float] = []
+    alloc: List[int] = []
+    wall = 1000.0
+    tracemalloc.start()
+    try:
+        for chunk in chunks:
+            tracemalloc.reset_peak()
+            before, _ = tracemalloc.get_traced_memory()
+            started = time.process_time_ns()
+            gate.process_audio(chunk, wall)
+            cpu_us.append((time.process_time_ns() - started) / 1e3)
+            _, peak = tracemalloc.get_traced_memory()
+            alloc.append(max(0, peak - before))
+            wall += 0.02
+    finally:
+        tracemalloc.stop()
+    return cpu_us, alloc
+
+
+def _percentile(values: List[float], q: float) -> float:
+    return statistics.quantiles(values, n=100)[int(q) - 1] if len(values) > 1 else (values[0] if values else 0.0)
+
+
+def run_benchmark(sessions: Sequence[Session], chunk_sizes: Sequence[int]) -> None:
+    print(f'{"session":<32}{"chunk":>7}{"gate":>8}{"cpu p50 us":>12}{"cpu p95 us":>12}{"alloc/chunk B":>15}')
+    for name, pcm, sample_rate, channels in sessions:
+        for chunk_ms in chunk_sizes:
+            chunks = split_chunks(pcm, sample_rate, channels, chunk_ms)
+            for label, cls in (('legacy', LegacyBufferGate), ('ring', VADStreamingGate)):
+                cpu_us, alloc = replay(make_gate(cls, sample_rate, channels), chunks)
+                print(
+                    f'{name[:31]:<32}{chunk_ms:>5}ms{label:>8}{_percentile(cpu_us, 50):>12.1f}'
+                    f'{_percentile(cpu_us, 95):>12.1f}{statistics.fmean(alloc):>15.0f}'
+                )
+
+
+def main() -> int:
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument('--input', default='', help='comma-separated WAV or raw PCM16 session recordings')
+    parser.add_argument('--raw-rate', type=int, default=16000, help='sample rate of raw PCM inputs')
+    parser.add_argument('--raw-channels', type=int, default=1, help='channel count of raw PCM inputs')
+    parser.add_argument('--chunk-ms', default='20,100', help='comma-separated chunk sizes to replay')
+    parser.add_argument('--synthetic-seconds', type=int, default=60)
+    parser.add_argument('--parity-cases', type=int, default=200)
+    parser.add_argument('--no-model', action='store_true', help='replace Silero inference with a constant')
+    parser.add_argument('--seed', type=int, default=19)
+    args = parser.parse_args()
+
+    if args.no_model:
+        vad_gate._get_ort_session = lambda: None  # type: ignore[assignment]
+        vad_gate.run_vad_window = lambda window, state, context: (0.0, state, context)  # type: ignore[assignment]
+
+    rng = random.Random(args.seed)
+    mismatches = check_parity(rng, args.parity_cases)
+    print(f'parity: {args.parity_cases} random cases, {mismatches} mismatches')
+    if mismatches:
+        return 1
+
+    if args.input:
+        sessions = [read_session(path, args.raw_rate, args.raw_channels) for path in args.input.split(',')]
+    else:
+        sessions = [synthetic_session(rng, args.synthetic_seconds, rate) for rate in (16000, 48000)]
+    run_benchmark(sessions, [int(value) for value in args.chunk_ms.split(',')])
+    return 0
+
+
+if __name__ == '__main__':
+    sys.exit(main())
@@ -256,7 +256,12 @@ def decode_firestore_segments(raw: Mapping[str, Any], uid: str) -> list[Mapping[
     if isinstance(stored_segments, list):
         decoded_segments = stored_segments
     elif raw.get('transcript_segments_compressed') is True:
-        if isinstance(stored_segments, bytes):
+        if isinstance(stored_segments, bytes) and stored_segments.startswith(b'\x00TS\x02'):
+            raise RuntimeError(
+                'enhanced transcript storage is not decoded by this read-only scanner; '
+                'scan a decrypted local export with --input'
+            )
+        elif isinstance(stored_segments, bytes):
             compressed = stored_segments
         elif isinstance(stored_segments, str):
             raise RuntimeError(
@@ -396,8 +396,9 @@ class Stack:
         return self.storage_dir / 'sync-temporal' / Path(*relative.parts)
 
     def fair_use_meter_ms(self, uid: str) -> int:
-        values = redis.Redis(host='127.0.0.1', port=self.redis_port).hgetall(f'fair_use:v2:bucket:sync_fresh:{uid}')
-        return sum(int(value) for value in values.values())
+        values = redis.Redis(host='127.0.0.1', port=self.redis_port).hgetall(f'fair_use:v3:speech:sync_fresh:{uid}')
+        # The day tier of the rollup hash holds every recorded millisecond exactly once.
+        return sum(int(value) for field, value in values.items() if field.startswith(b'd:'))
 
 
 def _pcm16_upload_bytes() -> bytes:
@@ -4,13 +4,17 @@ Unit tests for InMemoryCacheManager.
 
 import sys
 import os
+import threading
 import time
 import unittest
+from unittest.mock import patch
+
+from prometheus_client import REGISTRY
 
 # Add parent directory to path
 sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
 
-from database.cache_manager import InMemoryCacheManager
+from database.cache_manager import InMemoryCacheManager, estimate_size
 
 
 class TestInMemoryCacheManager(unittest.TestCase):
@@ -204,6 +208,124 @@ class TestInMemoryCacheManager(unittest.TestCase):
         self.assertEqual(result, {'data': 'cached'})
         self.assertFalse(fetch_called)
 
+    def test_get_or_fetch_serves_stale_while_refreshing(self):
+        """An entry inside its stale window is returned at once and refreshed by one background fetch."""
+        refreshed = threading.Event()
+        fetch_calls = []
+
+        def fetch_fn():
+            fetch_calls.append(1)
+            refreshed.set()
+            return {'data': 'fresh'}
+
+        with patch('database.cache_manager.time.time', return_value=1000.0):
+            self.cache.set('catalog', {'data': 'old'}, ttl=30, stale_ttl=60)
+        with patch('database.cache_manager.time.time', return_value=1045.0):
+            self.assertIsNone(self.cache.get('catalog'))
+            self.assertEqual(self.cache.get_or_fetch('catalog', fetch_fn, ttl=30, stale_ttl=60), {'data': 'old'})
+            self.assertTrue(refreshed.wait(timeout=2))
+            for thread in threading.enumerate():
+                if thread.name.startswith('cache-refresh:'):
+                    thread.join(timeout=2)
+            self.assertEqual(self.cache.get('catalog'), {'data': 'fresh'})
+
+        self.assertEqual(len(fetch_calls), 1)
+        self.assertEqual(self.cache.get_stats()['stale_hits'], 1)
+
+    def test_stale_window_expires_and_delete_drops_stale_copy(self):
+        """Past ttl + stale_ttl, or after delete, get_or_fetch blocks on a fresh fetch."""
+        with patch('database.cache_manager.time.time', return_value=1000.0):
+            self.cache.set('catalog', 'old', ttl=30, stale_ttl=60)
+            self.cache.set('other', 'old', ttl=30, stale_ttl=60)
+        self.cache.delete('other')
+        with patch('database.cache_manager.time.time', return_value=1091.0):
+            self.assertEqual(self.cache.get_or_fetch('catalog', lambda: 'new', ttl=30, stale_ttl=60), 'new')
+            self.assertEqual(self.cache.get_or_fetch('other', lambda: 'new', ttl=30, stale_ttl=60), 'new')
+
+    def test_delete_during_refresh_drops_the_refreshed_value(self):
+        """An invalidation that lands while a background refresh is fetching is not undone by it."""
+        fetching = threading.Event()
+        release = threading.Event()
+
+        def fetch_fn():
+            fetching.set()
+            release.wait(timeout=2)
+            return 'refreshed'
+
+        with patch('database.cache_manager.time.time', return_value=1000.0):
+            self.cache.set('catalog', 'old', ttl=30, stale_ttl=60)
+        with patch('database.cache_manager.time.time', return_value=1045.0):
+            self.assertEqual(self.cache.get_or_fetch('catalog', fetch_fn, ttl=30, stale_ttl=60), 'old')
+            self.assertTrue(fetching.wait(timeout=2))
+            self.cache.delete('catalog')
+            release.set()
+            for thread in threading.enumerate():
+                if thread.name.startswith('cache-refresh:'):
+                    thread.join(timeout=2)
+            self.assertIsNone(self.cache.get('catalog'))
+            self.assertEqual(self.cache.get_or_fetch('catalog', lambda: 'new', ttl=30, stale_ttl=60), 'new')
+
+    def test_large_entry_is_charged_to_the_shared_budget(self):
+        """An entry above one shard's share evicts just enough, from every shard, to fit."""
+        for i in range(100):
+            self.cache.set(f'key_{i}', 'x', ttl=30, size_bytes=4096)
+        big = 700 * 1024
+        self.cache.set('big', 'x', ttl=30, size_bytes=big)
+
+        self.assertEqual(self.cache.get('big'), 'x')
+        stats = self.cache.get_stats()
+        self.assertLessEqual(sum(shard.current_size for shard in self.cache._shards), self.cache.max_memory_bytes)
+        self.assertEqual(stats['evictions'], 100 - (self.cache.max_memory_bytes - big) // 4096)
+        self.assertEqual(stats['entries'], 101 - stats['evictions'])
+
+    def test_entry_larger_than_the_budget_is_not_cached(self):
+        """A value that can never fit leaves the rest of the cache alone and drops its older copy."""
+        self.cache.set('other', 'kept', ttl=30)
+        self.cache.set('big', 'old', ttl=30)
+        self.cache.set('big', 'new', ttl=30, size_bytes=self.cache.max_memory_bytes + 1)
+
+        self.assertIsNone(self.cache.get('big'))
+        self.assertEqual(self.cache.get('other'), 'kept')
+        self.assertEqual(self.cache.get_stats()['evictions'], 0)
+
+    def test_size_estimate_tracks_payload_without_serializing(self):
+        """Estimated sizes grow with the payload and account for sampled long lists."""
+        app = {'id': 'app', 'name': 'App', 'description': 'd' * 500, 'capabilities': ['chat', 'memories']}
+        one = estimate_size([app])
+        many = estimate_size([dict(app, id=f'app-{i}') for i in range(400)])
+        self.assertGreater(one, 500)
+        self.assertGreater(many, 300 * one)
+        self.assertLess(many, 500 * one)
+
+    def test_shards_account_size_and_stats_together(self):
+        """Stats aggregate every shard and deletes return bytes to the budget."""
+        for i in range(64):
+            self.cache.set(f'key_{i}', 'x' * 100, ttl=30)
+        stats = self.cache.get_stats()
+        self.assertEqual(stats['entries'], 64)
+        self.assertEqual(stats['shards'], 16)
+
+        for i in range(64):
+            self.cache.delete(f'key_{i}')
+        self.assertEqual(self.cache.get_stats()['entries'], 0)
+        self.assertEqual(sum(shard.current_size for shard in self.cache._shards), 0)
+
+    def test_metrics_exported(self):
+        """Hits, misses and evictions are exported under the cache's metric label."""
+        cache = InMemoryCacheManager(max_memory_mb=1, num_shards=1, name='metrics_test')
+        cache.set('a', 'value', ttl=30)
+        cache.get('a')
+        cache.get('missing')
+        cache.set('big', 'x', ttl=30, size_bytes=cache.max_memory_bytes)
+
+        def sample(name, **labels):
+            return REGISTRY.get_sample_value(name, dict(cache='metrics_test', **labels)) or 0
+
+        self.assertEqual(sample('in_memory_cache_requests_total', result='hit'), 1)
+        self.assertEqual(sample('in_memory_cache_requests_total', result='miss'), 1)
+        self.assertEqual(sample('in_memory_cache_evictions_total'), 1)
+        self.assertEqual(sample('in_memory_cache_bytes'), cache.max_memory_bytes)
+
 
 if __name__ == '__main__':
     unittest.main()
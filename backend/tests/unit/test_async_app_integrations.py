@@ -699,3 +699,110 @@ class TestAsyncTriggerRealtimeIntegrations:
 
         call_url = mock_client.post.call_args[0][0]
         assert "&uid=uid-1" in call_url
+
+
+class TestRealtimeFanoutSession:
+    """A listen session reuses subscriptions, DNS pins and batches health writes across ticks."""
+
+    @staticmethod
+    def _client(status_code=200):
+        response = MagicMock(status_code=status_code, text="")
+        response.json.return_value = {}
+        client = AsyncMock()
+        client.post = AsyncMock(return_value=response)
+        return client
+
+    @pytest.mark.asyncio
+    async def test_ticks_reuse_subscriptions_pins_and_usage_writes(self):
+        app1 = _make_app("a1", "https://app1.test/hook", triggers_realtime=True)
+        now = [100.0]
+        fanout = app_integrations.RealtimeFanoutSession("uid-1", clock=lambda: now[0])
+        client = self._client()
+        get_apps = MagicMock(return_value=[app1])
+        pin = MagicMock(
+            side_effect=lambda url: ("https://203.0.113.7/hook?uid=uid-1", {"headers": {}, "extensions": {}})
+        )
+
+        with patch.object(app_integrations, "get_available_apps", get_apps), patch.object(
+            app_integrations.redis_db, "get_enabled_apps", return_value=["a1"], create=True
+        ), patch.object(app_integrations, "process_mentor_notification", return_value=None), patch.object(
+            app_integrations, "get_webhook_client", return_value=client
+        ), patch.object(
+            app_integrations, "safe_request_target", pin
+        ), patch.object(
+            app_integrations, "record_app_usage"
+        ) as usage:
+            for _ in range(3):
+                await app_integrations.trigger_realtime_integrations("uid-1", [{"text": "hi"}], "conv-1", fanout=fanout)
+                now[0] += 1
+            assert client.post.call_count == 3
+            assert client.post.call_args[0][0] == "https://203.0.113.7/hook?uid=uid-1"
+            assert get_apps.call_count == 1
+            assert pin.call_count == 1
+            assert usage.call_count == 1
+
+            now[0] += 120
+            await app_integrations.trigger_realtime_integrations("uid-1", [{"text": "hi"}], "conv-1", fanout=fanout)
+
+        assert get_apps.call_count == 2
+        assert pin.call_count == 2
+
+    @pytest.mark.asyncio
+    async def test_enabled_app_change_rebuilds_the_snapshot_on_the_next_tick(self):
+        app1 = _make_app("a1", "https://app1.test/hook", triggers_realtime=True)
+        app2 = _make_app("a2", "https://app2.test/hook", triggers_realtime=True)
+        app2.enabled = False
+        fanout = app_integrations.RealtimeFanoutSession("uid-1", clock=lambda: 0.0)
+        client = self._client()
+        enabled = MagicMock(return_value=["a1"])
+
+        with patch.object(app_integrations, "get_available_apps", return_value=[app1, app2]) as get_apps, patch.object(
+            app_integrations.redis_db, "get_enabled_apps", enabled, create=True
+        ), patch.object(app_integrations, "process_mentor_notification", return_value=None), patch.object(
+            app_integrations, "get_webhook_client", return_value=client
+        ):
+            await app_integrations.trigger_realtime_integrations("uid-1", [{"text": "hi"}], None, fanout=fanout)
+            app2.enabled = True
+            enabled.return_value = ["a1", "a2"]
+            await app_integrations.trigger_realtime_integrations("uid-1", [{"text": "hi"}], None, fanout=fanout)
+
+        assert get_apps.call_count == 2
+        assert client.post.call_count == 3
+
+    @pytest.mark.asyncio
+    async def test_successes_are_flushed_in_batches_and_before_a_failure(self):
+        app1 = _make_app("a1", "https://app1.test/hook", triggers_realtime=True)
+        now = [0.0]
+        fanout = app_integrations.RealtimeFanoutSession("uid-1", clock=lambda: now[0])
+        client = self._client()
+        writes = MagicMock()
+        writes.record_app_webhook_failure.return_value = 0
+
+        with patch.object(app_integrations, "get_available_apps", return_value=[app1]), patch.object(
+            app_integrations.redis_db, "get_enabled_apps", return_value=["a1"], create=True
+        ), patch.object(app_integrations, "process_mentor_notification", return_value=None), patch.object(
+            app_integrations, "get_webhook_client", return_value=client
+        ), patch.object(
+            app_integrations, "record_app_webhook_success", writes.record_app_webhook_success
+        ), patch.object(
+            app_integrations, "record_app_webhook_failure", writes.record_app_webhook_failure
+        ):
+            for _ in range(5):
+                await app_integrations.trigger_realtime_integrations("uid-1", [{"text": "hi"}], None, fanout=fanout)
+                now[0] += 1
+            writes.record_app_webhook_success.assert_not_called()
+
+            now[0] += 30
+            await app_integrations.trigger_realtime_integrations("uid-1", [{"text": "hi"}], None, fanout=fanout)
+            writes.record_app_webhook_success.assert_called_once_with("a1")
+
+            await app_integrations.trigger_realtime_integrations("uid-1", [{"text": "hi"}], None, fanout=fanout)
+            client.post.return_value = MagicMock(status_code=503, text="down")
+            await app_integrations.trigger_realtime_integrations("uid-1", [{"text": "hi"}], None, fanout=fanout)
+            await fanout.close()
+
+        assert [name for name, _args, _kwargs in writes.mock_calls] == [
+            "record_app_webhook_success",
+            "record_app_webhook_success",
+            "record_app_webhook_failure",
+        ]
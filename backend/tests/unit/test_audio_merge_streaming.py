@@ -0,0 +1,159 @@
+"""Streaming audio merge: same bytes as the in-memory merge, bounded prefetch, WAV cache built on disk."""
+
+import os
+import random
+import threading
+from concurrent.futures import Future
+from types import SimpleNamespace
+
+import pytest
+
+from utils.other import storage as storage_mod
+from utils.sync.playback import pcm_to_wav
+
+
+class _FakeBlob:
+    def __init__(self, bucket, name):
+        self.bucket = bucket
+        self.name = name
+        self.metadata = None
+
+    @property
+    def size(self):
+        return len(self.bucket.objects[self.name])
+
+    def exists(self):
+        return self.name in self.bucket.objects
+
+    def upload_from_string(self, data, content_type=None):
+        self.bucket.objects[self.name] = bytes(data)
+
+    def upload_from_filename(self, filename, content_type=None):
+        with open(filename, 'rb') as f:
+            self.bucket.objects[self.name] = f.read()
+        self.bucket.uploaded_files.append(filename)
+
+    def download_as_bytes(self):
+        if self.name not in self.bucket.objects:
+            raise storage_mod.NotFound(self.name)
+        with self.bucket.lock:
+            self.bucket.downloads += 1
+        return self.bucket.objects[self.name]
+
+
+class _FakeBucket:
+    def __init__(self):
+        self.objects = {}
+        self.downloads = 0
+        self.uploaded_files = []
+        self.lock = threading.Lock()
+
+    def blob(self, name):
+        return _FakeBlob(self, name)
+
+    def list_blobs(self, prefix):
+        return [self.blob(name) for name in sorted(self.objects) if name.startswith(prefix)]
+
+
+class _InlineExecutor:
+    def submit(self, fn, *args, **kwargs):
+        future = Future()
+        future.set_result(fn(*args, **kwargs))
+        return future
+
+
+@pytest.fixture
+def bucket(monkeypatch):
+    fake = _FakeBucket()
+    monkeypatch.setattr(storage_mod, 'storage_client', SimpleNamespace(bucket=lambda name: fake))
+    monkeypatch.setenv('PRIVATE_CLOUD_SEEKABLE_OPUS', 'false')
+    return fake
+
+
+def _store_pcm_chunks(bucket, rng, count):
+    timestamps = []
+    clock = 1000.0
+    for _ in range(count):
+        pcm = rng.randbytes(rng.choice([0, 3, 320, 6400, 32000 * 3 + 1]))
+        bucket.objects[f'chunks/uid/conv/{clock:.3f}.bin'] = pcm
+        timestamps.append(round(clock, 3))
+        clock += rng.choice([len(pcm) / 32000, rng.uniform(0, 40), rng.uniform(-1, 0)])
+    return timestamps
+
+
+def _reference_merge(bucket, timestamps, fill_gaps):
+    """The pre-streaming merge over .bin chunks: aligned PCM, silence for gaps, missing chunks skipped."""
+    chunks = {}
+    for ts in timestamps:
+        data = bucket.objects.get(f'chunks/uid/conv/{ts:.3f}.bin')
+        if data is not None:
+            chunks[ts] = data[: len(data) - len(data) % 2]
+    merged = bytearray()
+    if not fill_gaps:
+        for ts in timestamps:
+            merged.extend(chunks.get(ts, b''))
+        return bytes(merged)
+    current = sorted(timestamps)[0]
+    for ts in sorted(timestamps):
+        if ts not in chunks:
+            continue
+        if ts - current > 0:
+            merged.extend(bytes(int((ts - current) * 16000) * 2))
+        merged.extend(chunks[ts])
+        current = ts + len(chunks[ts]) / 32000
+    return bytes(merged)
+
+
+def test_stream_matches_the_in_memory_merge(bucket):
+    for seed in range(8):
+        rng = random.Random(seed)
+        bucket.objects.clear()
+        timestamps = _store_pcm_chunks(bucket, rng, rng.randint(1, 12))
+        requested = timestamps + [timestamps[-1] + 5.0] + rng.sample(timestamps, min(2, len(timestamps)))
+        rng.shuffle(requested)
+        for fill_gaps in (True, False):
+            expected = _reference_merge(bucket, requested, fill_gaps)
+            if not expected:
+                with pytest.raises(FileNotFoundError):
+                    storage_mod.download_audio_chunks_and_merge('uid', 'conv', requested, fill_gaps=fill_gaps)
+                continue
+            blocks = list(
+                storage_mod.stream_audio_chunks_and_merge(
+                    'uid', 'conv', requested, fill_gaps=fill_gaps, prefetch=rng.randint(1, 4)
+                )
+            )
+            assert b''.join(blocks) == expected
+            assert all(0 < len(block) <= max(storage_mod._MERGE_SILENCE_BLOCK_BYTES, 32000 * 3) for block in blocks)
+            assert (
+                storage_mod.download_audio_chunks_and_merge('uid', 'conv', requested, fill_gaps=fill_gaps) == expected
+            )
+
+
+def test_stream_prefetches_a_bounded_window(bucket):
+    timestamps = [1000.0 + index for index in range(40)]
+    for ts in timestamps:
+        bucket.objects[f'chunks/uid/conv/{ts:.3f}.bin'] = bytes(32000)
+
+    stream = storage_mod.stream_audio_chunks_and_merge('uid', 'conv', timestamps, prefetch=3)
+    next(stream)
+    stream.close()
+
+    assert bucket.downloads <= 4
+
+
+def test_merged_wav_is_written_and_cached_from_disk(bucket, monkeypatch):
+    monkeypatch.setattr(storage_mod, 'storage_executor', _InlineExecutor())
+    rng = random.Random(4)
+    timestamps = _store_pcm_chunks(bucket, rng, 6)
+    pcm = storage_mod.download_audio_chunks_and_merge('uid', 'conv', timestamps)
+
+    wav, cached = storage_mod.get_or_create_merged_audio('uid', 'conv', 'af', timestamps)
+
+    assert cached is False
+    assert wav == pcm_to_wav(pcm)
+    assert bucket.objects['merged/uid/conv/af.wav'] == wav
+    assert len(bucket.uploaded_files) == 1 and not os.path.exists(bucket.uploaded_files[0])
+
+    bucket.objects.pop('merged/uid/conv/af.wav')
+    assert storage_mod.get_or_create_merged_audio('uid', 'conv', 'af', timestamps, return_data=False) == (None, False)
+    assert bucket.objects['merged/uid/conv/af.wav'] == wav
@@ -42,6 +42,8 @@ def _load_playback(request):
         "is_playback_unavailable",
     ):
         setattr(storage_module, name, MagicMock())
+    storage_module.get_seekable_merged_audio = MagicMock(return_value=None)
+    storage_module.SeekableMergedAudio = object
     storage_module._PRECACHE_FILE_SEM = MagicMock()
     with stub_modules({"utils.cloud_tasks": cloud_tasks_module, "utils.other.storage": storage_module}):
         module = load_module_fresh("utils.sync.playback", os.path.join(str(BACKEND), "utils", "sync", "playback.py"))
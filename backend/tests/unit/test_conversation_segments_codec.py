@@ -0,0 +1,77 @@
+"""Binary enhanced transcript codec in database/conversations.py and its legacy read compatibility."""
+
+import json
+import zlib
+from unittest.mock import patch
+
+import pytest
+
+import database.conversations as conversations_db
+from utils import encryption
+
+UID = 'uid-codec'
+SEGMENTS = [
+    {'id': f'seg-{i}', 'text': f'segment number {i} ' * 8, 'speaker_id': i % 3, 'is_user': i % 2 == 0}
+    for i in range(40)
+]
+
+
+def _write(level: str, binary: bool) -> dict:
+    with patch.object(conversations_db, 'TRANSCRIPT_SEGMENTS_BINARY_CODEC', binary):
+        written = conversations_db._prepare_conversation_for_write({'transcript_segments': SEGMENTS}, UID, level)
+    written['data_protection_level'] = level
+    return written
+
+
+def test_binary_enhanced_blob_round_trips_and_is_smaller_than_legacy():
+    binary = _write('enhanced', binary=True)
+    legacy = _write('enhanced', binary=False)
+
+    assert isinstance(binary['transcript_segments'], bytes)
+    assert isinstance(legacy['transcript_segments'], str)
+    assert len(binary['transcript_segments']) * 2 < len(legacy['transcript_segments'])
+    for stored in (binary, legacy):
+        assert conversations_db._prepare_conversation_for_read(stored, UID)['transcript_segments'] == SEGMENTS
+
+
+def test_standard_level_is_unchanged_by_the_flag():
+    written = _write('standard', binary=True)
+
+    assert json.loads(zlib.decompress(written['transcript_segments'])) == SEGMENTS
+
+
+def test_read_does_not_mutate_the_stored_document():
+    stored = _write('enhanced', binary=True)
+    snapshot = dict(stored)
+
+    conversations_db._prepare_conversation_for_read(stored, UID)
+
+    assert stored == snapshot
+
+
+def test_binary_blob_from_another_user_reads_as_empty_and_is_undecodable_for_strict_callers():
+    stored = _write('enhanced', binary=True)
+
+    assert conversations_db._prepare_conversation_for_read(stored, 'someone-else')['transcript_segments'] == []
+    with pytest.raises(ValueError):
+        conversations_db._decode_transcript_segments_strict('someone-else', stored['transcript_segments'], True)
+    assert conversations_db.raw_conversation_has_content('someone-else', stored) is True
+
+
+def test_strict_and_public_decoders_accept_binary_blob():
+    stored = _write('enhanced', binary=True)['transcript_segments']
+
+    assert conversations_db._decode_transcript_segments_strict(UID, stored, True) == SEGMENTS
+    public = conversations_db._decode_public_transcript_segments_bounded(UID, stored, compressed=True)
+    assert [segment['text'] for segment in public] == [segment['text'] for segment in SEGMENTS]
+
+
+def test_legacy_hex_payload_still_reads():
+    compressed = zlib.compress(json.dumps(SEGMENTS).encode('utf-8'))
+    stored = {
+        'data_protection_level': 'enhanced',
+        'transcript_segments': encryption.encrypt(compressed.hex(), UID),
+        'transcript_segments_compressed': True,
+    }
+
+    assert conversations_db._prepare_conversation_for_read(stored, UID)['transcript_segments'] == SEGMENTS
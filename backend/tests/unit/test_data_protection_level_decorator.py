@@ -0,0 +1,94 @@
+"""set_data_protection_level: decoration-time argument lookup and the local protection-level cache."""
+
+from unittest.mock import MagicMock, patch
+
+import pytest
+
+from database import helpers
+
+
+@pytest.fixture(autouse=True)
+def _fresh_level_cache():
+    helpers._data_protection_level_cache.clear()
+    yield
+    helpers._data_protection_level_cache.clear()
+
+
+@helpers.set_data_protection_level(data_arg_name='conversation_data')
+def _write(uid, conversation_data, firestore_client=None, *, note: str = ''):
+    return conversation_data
+
+
+@helpers.set_data_protection_level(data_arg_name='items')
+def _write_many(uid, items):
+    return items
+
+
+def _redis(level='standard'):
+    redis_db = MagicMock()
+    redis_db.get_user_data_protection_level.return_value = level
+    return patch.object(helpers, 'redis_db', redis_db)
+
+
+def test_positional_and_keyword_arguments_are_both_found():
+    with _redis() as redis_db:
+        assert _write('u1', {})['data_protection_level'] == 'standard'
+        assert _write(uid='u2', conversation_data={})['data_protection_level'] == 'standard'
+        assert _write('u3', conversation_data={}, note='x')['data_protection_level'] == 'standard'
+        assert _write_many('u4', [{}, {'data_protection_level': 'enhanced'}, 'skip']) == [
+            {'data_protection_level': 'standard'},
+            {'data_protection_level': 'enhanced'},
+            'skip',
+        ]
+
+    assert redis_db.get_user_data_protection_level.call_count == 4
+
+
+def test_level_is_cached_per_uid_until_invalidated():
+    with _redis('standard') as redis_db, patch('database.cache.get_pubsub_manager') as get_pubsub_manager:
+        for _ in range(3):
+            assert _write('u1', {})['data_protection_level'] == 'standard'
+        assert redis_db.get_user_data_protection_level.call_count == 1
+
+        redis_db.get_user_data_protection_level.return_value = 'enhanced'
+        helpers.invalidate_data_protection_level_cache('u1')
+
+        assert _write('u1', {})['data_protection_level'] == 'enhanced'
+    get_pubsub_manager.return_value.publish_invalidation.assert_called_once_with(['data_protection_level:u1'])
+
+
+def test_pubsub_keys_drop_only_matching_uids():
+    helpers._cache_data_protection_level('u1', 'standard')
+    helpers._cache_data_protection_level('u2', 'standard')
+
+    helpers.invalidate_data_protection_level_keys(['data_protection_level:u1', 'get_popular_apps_data'])
+
+    assert helpers._get_cached_data_protection_level('u1') is None
+    assert helpers._get_cached_data_protection_level('u2') == 'standard'
+
+
+def test_profile_failure_falls_back_to_enhanced_without_caching():
+    with _redis(None), patch.object(helpers, '_get_user_profile_for_data_protection', side_effect=RuntimeError):
+        assert _write('u1', {})['data_protection_level'] == 'enhanced'
+
+    assert helpers._get_cached_data_protection_level('u1') is None
+
+
+def test_transactional_client_bypasses_caches():
+    helpers._cache_data_protection_level('u1', 'standard')
+    client = MagicMock()
+    client.collection.return_value.document.return_value.get.return_value.to_dict.return_value = {
+        'data_protection_level': 'enhanced'
+    }
+
+    with _redis('standard') as redis_db:
+        assert _write('u1', {}, client)['data_protection_level'] == 'enhanced'
+
+    redis_db.get_user_data_protection_level.assert_not_called()
+
+
+def test_wrong_arguments_raise_from_the_wrapped_function():
+    with pytest.raises(TypeError, match='missing 1 required positional argument'):
+        _write(conversation_data={})
+    with pytest.raises(TypeError, match="must have a 'uid' argument"):
+        _write('', {})
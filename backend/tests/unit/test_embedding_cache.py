@@ -0,0 +1,105 @@
+"""Embedding cache: content-hash tiers, float16 round-trip, and coalesced provider calls."""
+
+import threading
+import time
+
+import fakeredis
+import numpy as np
+import pytest
+
+import utils.llm.embedding_cache as embedding_cache
+from utils.llm.embedding_cache import CachedEmbeddings
+
+
+class _Provider:
+    def __init__(self):
+        self.calls = []
+        self.gate = None
+        self.error = None
+
+    def embed_documents(self, texts):
+        self.calls.append(list(texts))
+        if self.gate is not None and len(self.calls) == 1:
+            self.gate.wait(5)
+        if self.error is not None:
+            raise self.error
+        return [[len(text) / 7, -0.123456789, float(sum(map(ord, text)) % 97)] for text in texts]
+
+
+@pytest.fixture
+def provider(monkeypatch):
+    redis_client = fakeredis.FakeRedis()
+    monkeypatch.setattr(embedding_cache, '_redis', lambda: redis_client)
+    monkeypatch.setattr(embedding_cache, 'EMBEDDING_CACHE_ENABLED', True)
+    monkeypatch.setattr(embedding_cache, 'get_byok_key', lambda provider: None)
+    embedding_cache.clear_embedding_cache()
+    provider = _Provider()
+    provider.redis = redis_client
+    yield provider
+    embedding_cache.clear_embedding_cache()
+
+
+def _rounded(vector):
+    return np.asarray(vector, dtype=np.float16).astype(np.float64).tolist()
+
+
+def test_repeated_text_is_served_from_local_then_redis_tier(provider):
+    cached = CachedEmbeddings(provider, model='m-large')
+    texts = ['budget on tuesday', 'call mom', 'budget on tuesday']
+
+    first = cached.embed_documents(texts)
+    assert provider.calls == [['budget on tuesday', 'call mom']]
+    assert first == [_rounded(vector) for vector in provider.embed_documents(texts)]
+    provider.calls.clear()
+
+    assert cached.embed_documents(texts) == first and cached.embed_query('call mom') == first[1]
+    embedding_cache.clear_embedding_cache()
+    assert cached.embed_documents(texts) == first
+    assert provider.calls == []
+    assert len(provider.redis.get(embedding_cache._cache_key('m-large', 'call mom'))) == 3 * 2
+
+    CachedEmbeddings(provider, model='m-small').embed_query('call mom')
+    assert provider.calls == [['call mom']]
+
+
+def test_concurrent_misses_coalesce_into_one_request(provider, monkeypatch):
+    monkeypatch.setattr(embedding_cache, '_MAX_INFLIGHT_CALLS', 1)
+    cached = CachedEmbeddings(provider, model='m-large')
+    provider.gate = threading.Event()
+    results = {}
+
+    def embed(name, texts):
+        results[name] = cached.embed_documents(texts)
+
+    threads = [threading.Thread(target=embed, args=('first', ['alpha']))]
+    threads[0].start()
+    while not provider.calls:
+        time.sleep(0.001)
+    followers = {'b': ['beta', 'alpha'], 'c': ['gamma'], 'd': ['delta', 'beta'], 'e': ['alpha']}
+    for name, texts in followers.items():
+        threads.append(threading.Thread(target=embed, args=(name, texts)))
+        threads[-1].start()
+    # Every follower is parked on the condition before the first request returns.
+    while len(cached._cond._waiters) < len(followers):
+        time.sleep(0.001)
+    assert sum(map(len, cached._groups['m-large:default'].pending)) == 3
+    provider.gate.set()
+    for thread in threads:
+        thread.join(5)
+
+    assert len(provider.calls) == 2 and provider.calls[0] == ['alpha']
+    assert sorted(provider.calls[1]) == ['beta', 'delta', 'gamma']
+    for name, texts in {'first': ['alpha'], **followers}.items():
+        assert results[name] == [_rounded(provider.embed_documents([text])[0]) for text in texts]
+    assert cached._groups == {}
+
+
+def test_provider_error_reaches_every_waiter_and_is_not_cached(provider):
+    cached = CachedEmbeddings(provider, model='m-large')
+    provider.error = RuntimeError('quota')
+
+    with pytest.raises(RuntimeError, match='quota'):
+        cached.embed_documents(['alpha', 'beta'])
+    provider.error = None
+    assert cached.embed_query('alpha') == _rounded(provider.embed_documents(['alpha'])[0])
+    assert provider.calls[1] == ['alpha']
@@ -0,0 +1,74 @@
+"""Per-uid cipher cache and preallocated audio-file decryption in utils/encryption."""
+
+import os
+import struct
+from unittest.mock import patch
+
+import pytest
+from cryptography.exceptions import InvalidTag
+from cryptography.hazmat.primitives.ciphers.aead import AESGCM
+
+from utils import encryption
+
+
+@pytest.fixture(autouse=True)
+def _fresh_cache():
+    encryption.clear_cipher_cache()
+    yield
+    encryption.clear_cipher_cache()
+
+
+def _legacy_encrypt_audio_chunk(data: bytes, uid: str) -> bytes:
+    nonce = os.urandom(12)
+    payload = nonce + AESGCM(encryption.derive_key(uid)).encrypt(nonce, data, None)
+    return struct.pack('>I', len(payload)) + payload
+
+
+def test_key_is_derived_once_per_uid():
+    with patch.object(encryption, '_derive_key', wraps=encryption._derive_key) as derive:
+        for _ in range(5):
+            assert encryption.decrypt(encryption.encrypt('hello', 'uid-a'), 'uid-a') == 'hello'
+        encryption.encrypt('hello', 'uid-b')
+
+    assert derive.call_count == 2
+
+
+def test_rotated_secret_misses_the_cache():
+    payload = encryption.encrypt('before rotation', 'uid-a')
+    rotated = b'r' * 40
+
+    with patch.object(encryption, 'ENCRYPTION_SECRET', rotated):
+        # The old ciphertext no longer authenticates under the new secret.
+        assert encryption.decrypt(payload, 'uid-a') == payload
+        rotated_payload = encryption.encrypt('after rotation', 'uid-a')
+        assert encryption.decrypt(rotated_payload, 'uid-a') == 'after rotation'
+
+    assert encryption.decrypt(payload, 'uid-a') == 'before rotation'
+
+
+def test_decrypt_audio_file_reads_legacy_chunks():
+    chunks = [os.urandom(n) for n in (3200, 0, 1, 6400, 17)]
+    merged = b''.join(_legacy_encrypt_audio_chunk(chunk, 'uid-a') for chunk in chunks)
+    merged += encryption.encrypt_audio_chunk(b'tail', 'uid-a')
+
+    assert encryption.decrypt_audio_file(merged, 'uid-a') == b''.join(chunks) + b'tail'
+    assert encryption.decrypt_audio_file(bytearray(merged), 'uid-a') == b''.join(chunks) + b'tail'
+
+
+def test_decrypt_audio_chunk_reports_bytes_consumed():
+    first = encryption.encrypt_audio_chunk(b'abc', 'uid-a')
+    second = encryption.encrypt_audio_chunk(b'defgh', 'uid-a')
+
+    data, consumed = encryption.decrypt_audio_chunk(first + second, 'uid-a', len(first))
+
+    assert (data, consumed) == (b'defgh', len(second))
+
+
+def test_decrypt_audio_file_rejects_truncated_or_foreign_data():
+    merged = encryption.encrypt_audio_chunk(b'x' * 100, 'uid-a')
+
+    with pytest.raises(InvalidTag):
+        encryption.decrypt_audio_file(merged[:-1], 'uid-a')
+    with pytest.raises(InvalidTag):
+        encryption.decrypt_audio_file(merged, 'uid-b')
+    assert encryption.decrypt_audio_file(b'', 'uid-a') == b''
@@ -47,16 +47,23 @@ class TestRecordSpeechMs:
         _mock_redis.reset_mock()
         _mock_redis.pipeline.side_effect = None
         _mock_redis.pipeline.return_value = MagicMock()
-        _mock_redis.zrangebyscore.return_value = []
 
     @patch.object(fair_use_mod, 'FAIR_USE_ENABLED', True)
     def test_records_positive_speech(self):
-        pipe = MagicMock()
-        _mock_redis.pipeline.return_value = pipe
         fair_use_mod.record_speech_ms('user1', 5000)
-        assert pipe.hincrby.called
-        assert pipe.zadd.called
-        assert pipe.execute.called
+
+        _mock_redis.eval.assert_called_once()
+        args = _mock_redis.eval.call_args.args
+        assert args[0] == fair_use_mod._RECORD_SPEECH_SCRIPT
+        assert args[1] == 3
+        assert args[2:5] == (
+            'fair_use:v3:speech:realtime:user1',
+            'fair_use:v2:bucket:realtime:user1',
+            'fair_use:v2:speech:realtime:user1',
+        )
+        assert args[6] == 5000
+        assert not _mock_redis.pipeline.called
+        assert not _mock_redis.zrangebyscore.called
 
     @patch.object(fair_use_mod, 'FAIR_USE_ENABLED', True)
     def test_content_id_uses_atomic_once_increment(self):
@@ -64,9 +71,9 @@ class TestRecordSpeechMs:
 
         _mock_redis.eval.assert_called_once()
         args = _mock_redis.eval.call_args.args
-        assert args[1] == 3
-        assert args[2].endswith(':sync_backfill:user1:content-1')
-        assert args[3].startswith('fair_use:v2:bucket:sync_backfill:user1')
+        assert args[1] == 4
+        assert args[2] == 'fair_use:v3:speech:sync_backfill:user1'
+        assert args[5].endswith(':sync_backfill:user1:content-1')
         assert not _mock_redis.pipeline.return_value.execute.called
 
     @patch.object(fair_use_mod, 'FAIR_USE_ENABLED', True)
@@ -86,13 +93,13 @@ class TestRecordSpeechMs:
     def test_custom_stt_lane_records_under_its_own_keys(self):
         """#7690: custom-STT speech is metered in an isolated lane, never
         coerced into the live-enforced realtime lane."""
-        pipe = MagicMock()
-        _mock_redis.pipeline.return_value = pipe
         fair_use_mod.record_speech_ms('user1', 5000, source='custom_stt')
-        bucket_key = pipe.hincrby.call_args.args[0]
-        zset_key = pipe.zadd.call_args.args[0]
-        assert bucket_key == 'fair_use:v2:bucket:custom_stt:user1'
-        assert zset_key == 'fair_use:v2:speech:custom_stt:user1'
+        args = _mock_redis.eval.call_args.args
+        assert args[2:5] == (
+            'fair_use:v3:speech:custom_stt:user1',
+            'fair_use:v2:bucket:custom_stt:user1',
+            'fair_use:v2:speech:custom_stt:user1',
+        )
 
     def test_custom_stt_source_is_valid_and_outside_live_enforcement(self):
         """#7690: the lane must exist (unknown sources coerce to realtime,
@@ -103,90 +110,37 @@ class TestRecordSpeechMs:
 
     @patch.object(fair_use_mod, 'FAIR_USE_ENABLED', True)
     def test_ignores_zero_speech(self):
-        pipe = MagicMock()
-        _mock_redis.pipeline.return_value = pipe
         fair_use_mod.record_speech_ms('user1', 0)
-        assert not pipe.execute.called
+        assert not _mock_redis.eval.called
 
     @patch.object(fair_use_mod, 'FAIR_USE_ENABLED', True)
     def test_ignores_negative_speech(self):
-        pipe = MagicMock()
-        _mock_redis.pipeline.return_value = pipe
         fair_use_mod.record_speech_ms('user1', -100)
-        assert not pipe.execute.called
+        assert not _mock_redis.eval.called
 
     @patch.object(fair_use_mod, 'FAIR_USE_ENABLED', False)
     def test_noop_when_disabled(self):
-        pipe = MagicMock()
-        _mock_redis.pipeline.return_value = pipe
         fair_use_mod.record_speech_ms('user1', 5000)
-        assert not pipe.execute.called
+        assert not _mock_redis.eval.called
 
     @patch.object(fair_use_mod, 'FAIR_USE_ENABLED', True)
     def test_handles_redis_error(self):
-        _mock_redis.pipeline.side_effect = Exception('Redis down')
+        _mock_redis.eval.side_effect = Exception('Redis down')
         # Should not raise
         fair_use_mod.record_speech_ms('user1', 5000)
 
     @patch.object(fair_use_mod, 'FAIR_USE_ENABLED', True)
-    def test_prunes_stale_hash_fields(self):
-        """Stale bucket hash fields are pruned alongside stale zset members."""
-        pipe = MagicMock()
-        _mock_redis.pipeline.return_value = pipe
-        # Simulate stale members returned by zrangebyscore
-        _mock_redis.zrangebyscore.return_value = [b'100', b'101']
-        fair_use_mod.record_speech_ms('user1', 5000)
-        # hdel should be called to prune the stale hash fields
-        pipe.hdel.assert_called_once()
-        args = pipe.hdel.call_args[0]
-        assert '100' in args
-        assert '101' in args
-
-    @patch.object(fair_use_mod, 'FAIR_USE_ENABLED', True)
-    def test_no_hdel_when_no_stale_members(self):
-        """No hdel when there are no stale bucket members to prune."""
-        pipe = MagicMock()
-        _mock_redis.pipeline.return_value = pipe
-        _mock_redis.zrangebyscore.return_value = []
-        fair_use_mod.record_speech_ms('user1', 5000)
-        assert not pipe.hdel.called
-
-    @patch.object(fair_use_mod, 'FAIR_USE_ENABLED', True)
-    def test_expire_set_on_both_keys(self):
-        """Both bucket hash and zset keys get expire() with FAIR_USE_REDIS_RETENTION_SECONDS."""
-        pipe = MagicMock()
-        _mock_redis.pipeline.return_value = pipe
-        fair_use_mod.record_speech_ms('user1', 5000)
-        # expire should be called twice: once for bucket hash, once for zset
-        expire_calls = [c for c in pipe.expire.call_args_list]
-        assert len(expire_calls) == 2
-        # Both should use the retention seconds
-        for call in expire_calls:
-            assert call[0][1] == fair_use_mod.FAIR_USE_REDIS_RETENTION_SECONDS
-
-    @patch.object(fair_use_mod, 'FAIR_USE_ENABLED', True)
-    def test_cutoff_boundary_zrangebyscore_args(self):
-        """zrangebyscore is called with inclusive range [0, cutoff_ts] for pruning."""
-        import time
+    @patch.object(fair_use_mod, 'FAIR_USE_BUCKET_SECONDS', 60)
+    def test_bucket_and_retention_arguments(self):
+        """Buckets at or before now - retention are pruned, matching the old inclusive zset cutoff."""
+        with patch.object(fair_use_mod, 'time', MagicMock(time=MagicMock(return_value=1_800_000_030))):
+            fair_use_mod.record_speech_ms('user1', 5000)
 
-        pipe = MagicMock()
-        _mock_redis.pipeline.return_value = pipe
-        _mock_redis.zrangebyscore.return_value = []
-        fair_use_mod.record_speech_ms('user1', 5000)
-        # Verify zrangebyscore was called with correct cutoff
-        zrange_call = _mock_redis.zrangebyscore.call_args
-        assert zrange_call is not None
-        # Args: (zset_key, min_score=0, max_score=cutoff_ts)
-        _key, min_score, max_score = zrange_call[0]
-        assert min_score == 0
-        # cutoff = now - RETENTION; max_score should be close to that
-        expected_cutoff = int(time.time()) - fair_use_mod.FAIR_USE_REDIS_RETENTION_SECONDS
-        assert abs(max_score - expected_cutoff) <= 2  # within 2s tolerance
-        # zremrangebyscore in pipe uses same range (inclusive upper bound)
-        zrem_calls = [c for c in pipe.zremrangebyscore.call_args_list]
-        assert len(zrem_calls) == 1
-        assert zrem_calls[0][0][1] == 0  # min
-        assert abs(zrem_calls[0][0][2] - expected_cutoff) <= 2  # max
+        bucket, ms, ttl, hour_span, day_span, retained, step = _mock_redis.eval.call_args.args[5:]
+        retention = fair_use_mod.FAIR_USE_REDIS_RETENTION_SECONDS
+        assert (bucket, ms, ttl, hour_span, day_span) == (1_800_000_030 // 60, 5000, retention, 60, 1440)
+        assert (retained - 1) * 60 <= 1_800_000_030 - retention < retained * 60
+        assert step == fair_use_mod._ROLLUP_PRUNE_STEP
 
 
 class TestGetRollingSpeechMs:
@@ -197,7 +151,7 @@ class TestGetRollingSpeechMs:
 
     @patch.object(fair_use_mod, 'FAIR_USE_ENABLED', True)
     def test_returns_zeros_when_no_data(self):
-        _mock_redis.zrangebyscore.return_value = []
+        _mock_redis.eval.return_value = [0, 0, 0]
         result = fair_use_mod.get_rolling_speech_ms('user1')
         assert result == {'daily_ms': 0, 'three_day_ms': 0, 'weekly_ms': 0}
 
@@ -205,42 +159,45 @@ class TestGetRollingSpeechMs:
     def test_returns_zeros_when_disabled(self):
         result = fair_use_mod.get_rolling_speech_ms('user1')
         assert result == {'daily_ms': 0, 'three_day_ms': 0, 'weekly_ms': 0}
+        assert not _mock_redis.eval.called
 
     @patch.object(fair_use_mod, 'FAIR_USE_ENABLED', True)
     @patch.object(fair_use_mod, 'FAIR_USE_BUCKET_SECONDS', 60)
-    def test_aggregates_buckets_correctly(self):
-        import time
-
-        now = int(time.time())
-        # Bucket from 1 hour ago (within daily window)
-        recent_bucket = str((now - 3600) // 60)
-        # Bucket from 2 days ago (within 3-day window, outside daily)
-        two_day_bucket = str((now - 2 * 86400) // 60)
-        # Bucket from 5 days ago (within weekly, outside 3-day)
-        five_day_bucket = str((now - 5 * 86400) // 60)
-
-        _mock_redis.zrangebyscore.side_effect = [
-            [recent_bucket.encode(), two_day_bucket.encode(), five_day_bucket.encode()],
-            [],
-            [],
-        ]
-        _mock_redis.hmget.return_value = [b'1000', b'2000', b'3000']
+    def test_reads_all_windows_in_one_script_call(self):
+        now = 1_800_000_030
+        _mock_redis.eval.return_value = [1000, 3000, 6000]
 
-        result = fair_use_mod.get_rolling_speech_ms('user1')
+        with patch.object(fair_use_mod, 'time', MagicMock(time=MagicMock(return_value=now))):
+            result = fair_use_mod.get_rolling_speech_ms('user1')
 
-        assert result['daily_ms'] == 1000
-        assert result['three_day_ms'] == 3000  # 1000 + 2000
-        assert result['weekly_ms'] == 6000  # 1000 + 2000 + 3000
+        assert result == {'daily_ms': 1000, 'three_day_ms': 3000, 'weekly_ms': 6000}
+        _mock_redis.eval.assert_called_once()
+        args = _mock_redis.eval.call_args.args
+        assert args[0] == fair_use_mod._ROLLING_SPEECH_SCRIPT
+        keys = args[2 : 2 + args[1]]
+        assert keys[0::3] == (
+            'fair_use:v3:speech:realtime:user1',
+            'fair_use:v3:speech:sync_fresh:user1',
+            'fair_use:v3:speech:legacy:user1',
+        )
+        last, hour_span, day_span, _ttl, *first_buckets = args[2 + args[1] :]
+        assert (last, hour_span, day_span) == (now // 60, 60, 1440)
+        # First bucket whose start is inside each window (bucket start >= now - window).
+        for first, window in zip(first_buckets, (86400, 3 * 86400, 7 * 86400)):
+            assert (first - 1) * 60 < now - window <= first * 60
+        assert not _mock_redis.zrangebyscore.called and not _mock_redis.hmget.called
 
     @patch.object(fair_use_mod, 'FAIR_USE_ENABLED', True)
     def test_live_totals_include_legacy_meter_during_ttl_transition(self):
-        now_bucket = str(int(__import__('time').time()) // fair_use_mod.FAIR_USE_BUCKET_SECONDS)
-        _mock_redis.zrangebyscore.side_effect = [[], [], [now_bucket.encode()]]
-        _mock_redis.hmget.return_value = [b'4000']
+        _mock_redis.eval.return_value = [4000, 4000, 4000]
 
-        result = fair_use_mod.get_rolling_speech_ms('user1')
+        assert fair_use_mod.get_rolling_speech_ms('user1')['daily_ms'] == 4000
+        live_keys = _mock_redis.eval.call_args.args[2:11]
+        assert 'fair_use:speech:user1' in live_keys and 'fair_use:bucket:user1' in live_keys
 
-        assert result['daily_ms'] == 4000
+        fair_use_mod.get_rolling_speech_ms('user1', sources=('sync_backfill',))
+        args = _mock_redis.eval.call_args.args
+        assert args[1] == 3 and 'fair_use:speech:user1' not in args
 
 
 class TestCheckSoftCaps:
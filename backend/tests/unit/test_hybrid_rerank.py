@@ -0,0 +1,81 @@
+"""Vectorized BM25 + RRF: exact parity with the per-doc scalar implementation."""
+
+import math
+import random
+from typing import Any, Dict, List
+
+from utils.retrieval import hybrid
+
+
+def _legacy_bm25(query: str, docs: List[str], k1: float = 1.5, b: float = 0.75) -> List[float]:
+    doc_tokens = [hybrid._tokenize(d) for d in docs]
+    n = len(doc_tokens)
+    if n == 0:
+        return []
+    avgdl = (sum(len(d) for d in doc_tokens) / n) or 1.0
+    df: Dict[str, int] = {}
+    for toks in doc_tokens:
+        for t in set(toks):
+            df[t] = df.get(t, 0) + 1
+    scores = []
+    for toks in doc_tokens:
+        freq: Dict[str, int] = {}
+        for t in toks:
+            freq[t] = freq.get(t, 0) + 1
+        s = 0.0
+        for t in hybrid._tokenize(query):
+            tf = freq.get(t)
+            if not tf:
+                continue
+            n_t = df.get(t, 0)
+            idf = math.log(1 + (n - n_t + 0.5) / (n_t + 0.5))
+            s += idf * (tf * (k1 + 1)) / (tf + k1 * (1 - b + b * len(toks) / avgdl))
+        scores.append(s)
+    return scores
+
+
+def _legacy_rrf(query: str, candidates: List[Dict[str, Any]], limit: int, k: int = 60) -> List[Dict[str, Any]]:
+    bm = _legacy_bm25(query, [c.get("content", "") for c in candidates])
+    bm_order = sorted(range(len(candidates)), key=lambda i: (bm[i], -i), reverse=True)
+    bm_rank = {i: r for r, i in enumerate(bm_order)}
+    fused = []
+    for i, c in enumerate(candidates):
+        item = dict(c)
+        item["_bm25"] = bm[i]
+        item["_hybrid_score"] = 1.0 / (k + i + 1) + 1.0 / (k + bm_rank[i] + 1)
+        fused.append(item)
+    fused.sort(key=lambda x: x["_hybrid_score"], reverse=True)
+    return fused[: max(0, limit)]
+
+
+_WORDS = ["phone", "number", "Alice", "works", "at", "omi", "pizza", "hiking", "415", "the", "user", "likes"]
+
+
+def _text(rng: random.Random) -> str:
+    return " ".join(rng.choice(_WORDS) for _ in range(rng.randint(0, 12))) + rng.choice(["", ".", "!!", " -"])
+
+
+def test_scores_and_rankings_match_the_scalar_implementation():
+    rng = random.Random(17)
+    hybrid.clear_doc_token_cache()
+    for _ in range(300):
+        candidates = [{"id": str(i), "content": _text(rng)} for i in range(rng.randint(0, 40))]
+        if candidates and rng.random() < 0.2:
+            candidates[0] = {"id": "no-content"}
+        queries = [_text(rng) for _ in range(rng.randint(1, 4))]
+        limit = rng.randint(0, 50)
+        contents = [c.get("content", "") for c in candidates]
+
+        assert hybrid.bm25_scores_batch(queries, contents) == [_legacy_bm25(q, contents) for q in queries]
+        expected = [_legacy_rrf(q, candidates, limit) for q in queries]
+        assert hybrid.rrf_rerank_batch(queries, candidates, limit) == expected
+        assert hybrid.rrf_rerank(queries[0], candidates, limit) == expected[0]
+
+
+def test_only_returned_candidates_are_copied():
+    candidates = [{"id": str(i), "content": f"memory {i}"} for i in range(5)]
+    out = hybrid.rrf_rerank("memory 3", candidates, limit=2)
+
+    assert [item["id"] for item in out] == ["0", "3"]
+    assert all("_hybrid_score" not in c for c in candidates)
+    assert all(item is not candidate for item in out for candidate in candidates)
@@ -0,0 +1,169 @@
+"""Cached knowledge-graph traversal index: parity with per-call traversal and invalidation."""
+
+from __future__ import annotations
+
+import random
+from types import SimpleNamespace
+from typing import Any, Dict, List, Set
+
+import pytest
+
+from database import knowledge_graph as kg_db
+from utils.memory import kg_graph_traversal
+from utils.memory.kg_graph_index import KnowledgeGraphIndex
+
+UID = "uid-kg-index"
+
+
+def _legacy_traverse(graph: Dict[str, Any], query: str, hops: int, allowed: Set[str], max_edges: int, max_triples: int):
+    """Per-call reference: seed scan, adjacency with reversed edge copies, list-popping BFS."""
+    nodes = graph["nodes"]
+    nodes_by_id = {node["id"]: node for node in nodes}
+    query = query.strip().lower()
+    exact: List[str] = []
+    partial: List[str] = []
+    for node in nodes:
+        label = (node.get("label") or "").lower()
+        aliases = [str(alias).lower() for alias in node.get("aliases") or []]
+        if label == query or query in aliases:
+            exact.append(node["id"])
+        elif query in label or any(query in alias for alias in aliases):
+            partial.append(node["id"])
+    seeds = exact or partial
+    if not query or not seeds:
+        return [], []
+
+    adjacency: Dict[str, List[Dict[str, Any]]] = {}
+    for edge in graph["edges"]:
+        if not edge.get("source_id") or not edge.get("target_id"):
+            continue
+        adjacency.setdefault(edge["source_id"], []).append(edge)
+        reverse = {**edge, "source_id": edge["target_id"], "target_id": edge["source_id"]}
+        adjacency.setdefault(edge["target_id"], []).append(reverse)
+
+    visited = set(seeds)
+    seen_edges: Set[str] = set()
+    triples = []
+    frontier = [(node_id, 0) for node_id in seeds]
+    while frontier and len(triples) < max_triples:
+        current, depth = frontier.pop(0)
+        if depth >= hops:
+            continue
+        for edge in adjacency.get(current, [])[:max_edges]:
+            if edge.get("id") and edge["id"] in seen_edges:
+                continue
+            memory_ids = tuple(m for m in edge.get("memory_ids") or [] if m in allowed)
+            source = nodes_by_id.get(edge["source_id"])
+            target = nodes_by_id.get(edge["target_id"])
+            if not memory_ids or not source or not target:
+                continue
+            if edge.get("id"):
+                seen_edges.add(edge["id"])
+            triples.append((source["id"], edge["label"], target["id"], memory_ids, depth + 1))
+            if len(triples) >= max_triples:
+                break
+            neighbor = edge["target_id"]
+            if neighbor not in visited and depth + 1 < hops:
+                visited.add(neighbor)
+                frontier.append((neighbor, depth + 1))
+    return seeds, triples
+
+
+def _random_graph(rng: random.Random) -> Dict[str, Any]:
+    names = ["alice", "bob", "carol", "omi", "seattle", "alicia", "robert", "bobby"]
+    nodes = [
+        {
+            "id": f"n{index}",
+            "label": rng.choice(names).title(),
+            "aliases": rng.sample(names, rng.randint(0, 2)),
+        }
+        for index in range(rng.randint(1, 12))
+    ]
+    edges = []
+    for index in range(rng.randint(0, 40)):
+        edges.append(
+            {
+                "id": rng.choice([f"e{index}", f"e{index % 5}", None]),
+                "source_id": rng.choice([node["id"] for node in nodes] + ["missing"]),
+                "target_id": rng.choice([node["id"] for node in nodes] + ["missing", ""]),
+                "label": rng.choice(["knows", "works_at", "located_in"]),
+                "memory_ids": rng.sample(["m1", "m2", "m3", "m4"], rng.randint(0, 2)),
+            }
+        )
+    return {"nodes": nodes, "edges": edges}
+
+
+def _item(memory_id: str, content: str, *, long_term: bool = True):
+    return SimpleNamespace(memory_id=memory_id, content=content, long_term=long_term)
+
+
+@pytest.fixture
+def memory_items(monkeypatch):
+    items = [_item("m1", " one "), _item("m2", "two"), _item("m3", "three", long_term=False)]
+    monkeypatch.setattr(kg_graph_traversal, "is_indexable_long_term_atom", lambda item: item.long_term)
+    monkeypatch.setattr(kg_graph_traversal, "fetch_authoritative_product_memory_items", lambda **_kwargs: items)
+    kg_graph_traversal.clear_knowledge_graph_index()
+    yield items
+    kg_graph_traversal.clear_knowledge_graph_index()
+
+
+def test_index_traversal_matches_per_call_traversal(memory_items, monkeypatch):
+    rng = random.Random(16)
+    monkeypatch.setattr(kg_graph_traversal, "MAX_EDGES_PER_NODE", 3)
+    monkeypatch.setattr(kg_graph_traversal, "MAX_TRIPLES", 7)
+    for _ in range(400):
+        graph = _random_graph(rng)
+        query = rng.choice(["alice", "bob", "ali", "OMI ", "bert", "zed", ""])
+        hops = rng.randint(1, 2)
+        monkeypatch.setattr(kg_db, "get_knowledge_graph", lambda _uid, graph=graph: graph)
+        kg_graph_traversal.clear_knowledge_graph_index(UID)
+
+        seeds, triples = _legacy_traverse(graph, query, hops, {"m1", "m2"}, 3, 7)
+        for result in (
+            kg_graph_traversal.traverse_knowledge_graph(UID, query, hops=hops),
+            kg_graph_traversal.traverse_knowledge_graph(UID, query, hops=hops, graph=graph),
+        ):
+            assert result.seed_node_ids == seeds
+            assert [
+                (t.source_id, t.relation, t.target_id, t.memory_ids, t.hop_distance) for t in result.triples
+            ] == triples
+            cited = list(dict.fromkeys(memory_id for t in triples for memory_id in t[3]))
+            assert [citation["memory_id"] for citation in result.memory_citations] == cited
+
+
+def test_index_is_reused_until_the_graph_changes(memory_items, monkeypatch):
+    graph = {
+        "nodes": [{"id": "a", "label": "Alice"}, {"id": "b", "label": "Bob"}],
+        "edges": [{"id": "e", "source_id": "a", "target_id": "b", "label": "knows", "memory_ids": ["m1"]}],
+    }
+    loads = []
+    monkeypatch.setattr(kg_db, "get_knowledge_graph", lambda uid: loads.append(uid) or graph)
+
+    first = kg_graph_traversal.traverse_knowledge_graph(UID, "alice")
+    second = kg_graph_traversal.traverse_knowledge_graph(UID, "bob")
+    assert loads == [UID]
+    assert first.memory_citations == [{"memory_id": "m1", "content": "one"}]
+    assert [t.target_id for t in second.triples] == ["a"]
+
+    kg_db.mark_knowledge_graph_changed(UID)
+    kg_graph_traversal.traverse_knowledge_graph(UID, "alice")
+    assert loads == [UID, UID]
+
+    kg_graph_traversal.clear_knowledge_graph_index(UID)
+    kg_graph_traversal.traverse_knowledge_graph(UID, "alice")
+    assert loads == [UID, UID, UID]
+
+
+def test_neighbors_respects_the_fan_out_limit():
+    graph = {
+        "nodes": [{"id": "hub", "label": "Hub"}] + [{"id": f"n{i}", "label": f"N{i}"} for i in range(5)],
+        "edges": [
+            {"id": f"e{i}", "source_id": "hub", "target_id": f"n{i}", "label": "r", "memory_ids": ["m"]}
+            for i in range(5)
+        ],
+    }
+    index = KnowledgeGraphIndex(graph, {"m"})
+
+    assert [half_edge.neighbor_id for half_edge in index.neighbors("hub", 3)] == ["n0", "n1", "n2"]
+    assert [half_edge.neighbor_id for half_edge in index.neighbors("n4", 3)] == ["hub"]
+    assert index.neighbors("missing", 3) == ()
@@ -0,0 +1,88 @@
+"""LazyConversation: copy-free read path that decodes transcript_segments on first access."""
+
+import copy
+import json
+import pickle
+from unittest.mock import patch
+
+import database.conversations as conversations_db
+from models.conversation import Conversation
+
+UID = 'uid-lazy'
+SEGMENTS = [{'id': 's1', 'text': 'hello there', 'speaker': 'SPEAKER_00', 'start': 0.0, 'end': 1.0, 'is_user': False}]
+
+
+def _raw(level: str = 'enhanced', **extra) -> dict:
+    written = conversations_db._prepare_conversation_for_write({'transcript_segments': SEGMENTS}, UID, level)
+    return {'id': 'c1', 'data_protection_level': level, 'structured': {'title': 'Generated'}, **written, **extra}
+
+
+def _counting_decoder():
+    return patch.object(conversations_db, '_decode_stored_transcript', wraps=conversations_db._decode_stored_transcript)
+
+
+def test_field_reads_and_redaction_never_decode_the_transcript():
+    with _counting_decoder() as decode:
+        view = conversations_db._prepare_conversation_for_lazy_read(_raw(is_locked=True), UID)
+        assert view.get('is_locked') is True
+        assert 'transcript_segments' in view
+        assert len(view) == 6
+        view['transcript_segments'] = []
+
+    decode.assert_not_called()
+    assert view.materialize()['transcript_segments'] == []
+
+
+def test_first_access_decodes_once_for_every_mapping_api():
+    for read in (
+        lambda v: v['transcript_segments'],
+        lambda v: v.get('transcript_segments'),
+        lambda v: dict(v)['transcript_segments'],
+        lambda v: {**v}['transcript_segments'],
+        lambda v: dict(v.items())['transcript_segments'],
+        lambda v: copy.deepcopy(v)['transcript_segments'],
+        lambda v: pickle.loads(pickle.dumps(v))['transcript_segments'],
+        lambda v: json.loads(json.dumps(v))['transcript_segments'],
+    ):
+        with _counting_decoder() as decode:
+            view = conversations_db._prepare_conversation_for_lazy_read(_raw(), UID)
+            assert read(view) == SEGMENTS
+            assert view['transcript_segments'] == SEGMENTS
+        assert decode.call_count == 1
+
+
+def test_lazy_view_matches_eager_read_for_both_levels():
+    for level in ('standard', 'enhanced'):
+        raw = _raw(level, user_title='Mine')
+        eager = conversations_db._prepare_conversation_for_read(raw, UID)
+        lazy = conversations_db._prepare_conversation_for_lazy_read(raw, UID)
+
+        assert lazy == eager
+        assert lazy.materialize() == eager
+        assert type(lazy.materialize()) is dict
+        # The user-title override must not leak into the raw document's nested dict.
+        assert raw['structured']['title'] == 'Generated'
+
+
+def test_conversation_model_construction_sees_the_transcript():
+    view = conversations_db._prepare_conversation_for_lazy_read(
+        _raw(created_at='2026-01-01T00:00:00Z', started_at=None, finished_at=None), UID
+    )
+
+    conversation = Conversation(**view)
+
+    assert [segment.text for segment in conversation.transcript_segments] == ['hello there']
+
+
+def test_prepare_for_read_uses_lazy_path_only_when_requested():
+    raw = _raw()
+
+    @conversations_db.prepare_for_read(
+        decrypt_func=conversations_db._prepare_conversation_for_read,
+        lazy_decrypt_func=conversations_db._prepare_conversation_for_lazy_read,
+    )
+    def fetch(uid, lazy: bool = False):
+        return [dict(raw)]
+
+    assert not isinstance(fetch(UID)[0], conversations_db.LazyConversation)
+    assert isinstance(fetch(UID, lazy=True)[0], conversations_db.LazyConversation)
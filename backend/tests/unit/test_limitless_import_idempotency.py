@@ -30,6 +30,8 @@ class _FakeConversationStore:
         self.docs = {}
         self.owners = {}
         self.fail_ids = set()
+        self.batches = []
+        self.existence_reads = 0
 
     def reset(self):
         self.docs = {}
@@ -46,6 +48,20 @@ class _FakeConversationStore:
         self.owners[cid] = uid
         return True
 
+    def persist_imported_conversations(self, uid, conversations):
+        self.batches.append(len(conversations))
+        results = []
+        for data in conversations:
+            try:
+                results.append(self.persist_imported_conversation(uid, data))
+            except Exception as e:
+                results.append(e)
+        return results
+
+    def get_existing_conversation_ids(self, uid, conversation_ids):
+        self.existence_reads += 1
+        return {cid for cid in conversation_ids if cid in self.docs and self.owners.get(cid) == uid}
+
     def find_legacy_limitless_conversation_id(self, uid, started_at):
         for cid, data in self.docs.items():
             if self.owners.get(cid) != uid:
@@ -63,6 +79,16 @@ def store(monkeypatch):
         "persist_imported_conversation",
         fake.persist_imported_conversation,
     )
+    monkeypatch.setattr(
+        limitless.lifecycle_service,
+        "persist_imported_conversations",
+        fake.persist_imported_conversations,
+    )
+    monkeypatch.setattr(
+        limitless.conversations_db,
+        "get_existing_conversation_ids",
+        fake.get_existing_conversation_ids,
+    )
     monkeypatch.setattr(
         limitless,
         "find_legacy_limitless_conversation_id",
@@ -318,3 +344,105 @@ def test_retry_after_partial_failure_creates_only_missing(tmp_path, store):
         limitless.conversation_id_for_lifelog(UID, FN_B),
     }
     assert store.docs[limitless.conversation_id_for_lifelog(UID, FN_B)]["transcript_segments"][0]["text"] == "ok"
+
+
+def _day_lifelogs(count: int) -> dict:
+    return {
+        f"lifelogs/2025-10-{day:02d}_07h00m25s_Day-{day}.md": _lifelog_md(f"Day {day}.") for day in range(1, count + 1)
+    }
+
+
+def test_lifelogs_are_written_in_bounded_batches(tmp_path, store, monkeypatch):
+    monkeypatch.setattr(limitless, "_WRITE_BATCH_MAX_DOCS", 4)
+    monkeypatch.setattr(limitless, "_PARSE_AHEAD", 3)
+
+    _run_import(tmp_path, _zip_bytes(_day_lifelogs(10)))
+
+    assert len(store.docs) == 10
+    assert store.batches == [4, 4, 2] and store.existence_reads == 3
+    final = limitless.import_jobs_db.update_import_job.call_args_list[-1].args[1]
+    assert final["status"] == "completed" and final["processed_files"] == 10
+    assert final["conversations_created"] == 10 and final["checkpoint"] is None
+
+
+def test_oversized_batch_is_split_by_bytes(tmp_path, store, monkeypatch):
+    monkeypatch.setattr(limitless, "_WRITE_BATCH_MAX_BYTES", 1)
+
+    _run_import(tmp_path, _zip_bytes(_day_lifelogs(3)))
+
+    assert store.batches == [1, 1, 1]
+
+
+def test_import_resumes_after_checkpoint(tmp_path, store, monkeypatch):
+    files = _day_lifelogs(6)
+    paths = list(files)
+    checkpoint = {
+        "path": paths[2],
+        "processed_files": 3,
+        "conversations_created": 3,
+        "conversations_skipped": 0,
+        "errors": 1,
+        "first_error": "Error processing earlier.md: boom",
+    }
+    monkeypatch.setattr(
+        limitless.import_jobs_db,
+        "get_import_job",
+        MagicMock(return_value={"status": "processing", "checkpoint": checkpoint}),
+    )
+
+    _run_import(tmp_path, _zip_bytes(files))
+
+    created = {limitless.conversation_id_for_lifelog(UID, path) for path in paths[3:]}
+    assert set(store.docs) == created
+    final = limitless.import_jobs_db.update_import_job.call_args_list[-1].args[1]
+    assert final["processed_files"] == 6 and final["conversations_created"] == 6
+    assert final["error"] == "1 files failed to process"
+
+
+def test_progress_checkpoint_covers_only_flushed_lifelogs(tmp_path, store, monkeypatch):
+    monkeypatch.setattr(limitless, "_WRITE_BATCH_MAX_DOCS", 2)
+    monkeypatch.setattr(limitless, "_PROGRESS_INTERVAL_SECONDS", 0)
+    files = _day_lifelogs(5)
+
+    _run_import(tmp_path, _zip_bytes(files))
+
+    for call in limitless.import_jobs_db.update_import_job.call_args_list:
+        checkpoint = call.args[1].get("checkpoint")
+        if checkpoint:
+            flushed = list(files)[: checkpoint["processed_files"]]
+            assert checkpoint["path"] == flushed[-1]
+            assert checkpoint["conversations_created"] == len(flushed)
+
+
+def test_cancel_stops_the_import(tmp_path, store, monkeypatch):
+    monkeypatch.setattr(limitless, "_WRITE_BATCH_MAX_DOCS", 2)
+    monkeypatch.setattr(limitless, "_PROGRESS_INTERVAL_SECONDS", 0)
+    statuses = iter([{"status": "processing"}] * 3)
+    monkeypatch.setattr(
+        limitless.import_jobs_db,
+        "get_import_job",
+        MagicMock(side_effect=lambda job_id: next(statuses, {"status": "cancelled"})),
+    )
+
+    _run_import(tmp_path, _zip_bytes(_day_lifelogs(8)))
+
+    assert len(store.docs) == 2
+    assert all(
+        call.args[1].get("status") != "completed" for call in limitless.import_jobs_db.update_import_job.call_args_list
+    )
+    limitless.send_notification.assert_not_called()
+
+
+def test_zip_is_removed_and_user_notified_when_import_fails(tmp_path, store, monkeypatch):
+    def unavailable(uid, conversation_ids):
+        raise RuntimeError("firestore unavailable")
+
+    monkeypatch.setattr(limitless.conversations_db, "get_existing_conversation_ids", unavailable)
+    zip_path = tmp_path / "export.zip"
+
+    _run_import(tmp_path, _zip_bytes({f"lifelogs/{FN_A}": _lifelog_md()}))
+
+    assert not zip_path.exists()
+    final = limitless.import_jobs_db.update_import_job.call_args_list[-1].args[1]
+    assert final["status"] == "failed" and final["error"] == "firestore unavailable"
+    assert limitless.send_notification.call_args.kwargs["data"]["type"] == "import_failed"
@@ -0,0 +1,60 @@
+"""Sample-exact parity of the NumPy listen audio helpers with the original struct versions."""
+
+import random
+import struct
+
+import pytest
+
+from scripts.benchmark_listen_audio import (
+    RATE_PAIRS,
+    check_parity,
+    legacy_mix_n_channel_buffers,
+    legacy_resample_pcm,
+    random_pcm,
+)
+from utils.listen_audio import mix_n_channel_buffers, resample_pcm
+
+# Import scipy's polyphase filter at collection time so its import cost is not
+# charged to the per-test CPU budget.
+pytest.importorskip('scipy.signal')
+
+
+def test_random_inputs_match_legacy_outputs():
+    assert check_parity(random.Random(11), cases=60) == 0
+
+
+@pytest.mark.parametrize('source_rate,target_rate', RATE_PAIRS)
+def test_resample_nearest_matches_legacy_for_every_rate_pair(source_rate, target_rate):
+    pcm = bytes(random_pcm(random.Random(source_rate + target_rate), 1601, odd_tail=True))
+    assert resample_pcm(pcm, source_rate, target_rate) == legacy_resample_pcm(pcm, source_rate, target_rate)
+
+
+def test_mix_accepts_bytes_and_bytearray_views_without_mutating_inputs():
+    first = bytearray(struct.pack('<3h', 32767, -32768, 5))
+    second = bytes(struct.pack('<3h', 1, -1, 6))
+    snapshot = (bytes(first), second)
+
+    mixed = mix_n_channel_buffers([first, second])
+
+    assert struct.unpack('<3h', mixed) == (32767, -32768, 11)
+    assert mixed == legacy_mix_n_channel_buffers([first, bytearray(second)])
+    assert (bytes(first), second) == snapshot
+
+
+@pytest.mark.parametrize('method', ['linear', 'polyphase'])
+def test_interpolating_methods_keep_length_and_int16_range(method):
+    pcm = struct.pack('<6h', 32767, -32768, 32767, -32768, 32767, -32768)
+    result = resample_pcm(pcm, 8000, 16000, method=method)
+    samples = struct.unpack(f'<{len(result) // 2}h', result)
+    assert len(samples) == 12
+    assert all(-32768 <= sample <= 32767 for sample in samples)
+
+
+def test_linear_upsample_interpolates_between_neighbours():
+    result = resample_pcm(struct.pack('<3h', 0, 100, 200), 8000, 16000, method='linear')
+    assert struct.unpack('<6h', result) == (0, 50, 100, 150, 200, 200)
+
+
+def test_unknown_method_is_rejected():
+    with pytest.raises(ValueError):
+        resample_pcm(struct.pack('<2h', 1, 2), 8000, 16000, method='cubic')  # type: ignore[arg-type]
@@ -0,0 +1,162 @@
+"""Incremental live transcript merge: parity with the whole-transcript path and the segment index.
+
+TranscriptProcessor._merge_tail merges each tick's segments into the stored segment dicts while
+materializing only the tail. These tests replay random ticks through it and through the previous
+path (deserialize everything, combine, sort, assign speakers, dump everything) and require the
+same stored transcript, updates and removals.
+"""
+
+import asyncio
+import random
+from datetime import datetime, timezone
+from types import SimpleNamespace
+
+from models.transcript_segment import TranscriptSegment
+import routers.listen.transcripts as transcripts_mod
+from routers.listen.transcripts import LiveSegmentIndex, TranscriptProcessor, _without_segments
+from utils.conversations.factory import deserialize_conversation
+from utils.speaker_assignment import process_speaker_assigned_segments
+
+_WORDS = ['hello', 'world', 'yes', 'okay', 'Then', 'we', 'go', 'and', 'i', 'think', 'so', 'fine']
+_ENDINGS = ['', '', '', '.', '?', '!', ',']
+
+
+def _processor(speaker_to_person=None, segment_assignments=None) -> TranscriptProcessor:
+    host = SimpleNamespace(
+        limits=SimpleNamespace(max_segment_buffer_size=100, max_photo_buffer_size=100),
+        state=SimpleNamespace(active=True, current_conversation_id='conv-1', speaker_map_dirty=False),
+        speakers=SimpleNamespace(
+            speaker_to_person=speaker_to_person or {}, segment_assignments=segment_assignments or {}
+        ),
+        translation_language=None,
+    )
+    return TranscriptProcessor(host)
+
+
+def _random_tick(rng: random.Random, tick: int, clock: list) -> list:
+    raw = []
+    for index in range(rng.randint(1, 3)):
+        text = ' '.join(rng.choice(_WORDS) + rng.choice(_ENDINGS) for _ in range(rng.randint(1, 10)))
+        start = clock[0] + rng.uniform(-0.5, 0.2) if rng.random() < 0.1 else clock[0]
+        raw.append(
+            {
+                'id': f't{tick}-{index}',
+                'text': text,
+                'speaker': f'SPEAKER_0{rng.randint(0, 2)}',
+                'is_user': rng.random() < 0.2,
+                'start': start,
+                'end': start + rng.uniform(0.2, 3.0),
+            }
+        )
+        clock[0] += rng.uniform(0.1, 4.0)
+    raw.sort(key=lambda segment: segment['start'])
+    segments, _, _ = TranscriptSegment.combine_segments([], [TranscriptSegment(**segment) for segment in raw])
+    return segments
+
+
+def _legacy_merge(stored: list, segments: list, speaker: SimpleNamespace, dirty: bool):
+    existing = [TranscriptSegment(**segment) for segment in stored]
+    merged, updated, removed = TranscriptSegment.combine_segments(existing, segments)
+    merged.sort(key=lambda segment: segment.start)
+    targets = merged if dirty else updated
+    process_speaker_assigned_segments(targets, speaker.segment_assignments, speaker.speaker_to_person)
+    return [segment.model_dump() for segment in merged], updated, removed
+
+
+def test_tail_merge_matches_whole_transcript_merge():
+    for seed in range(150):
+        rng = random.Random(seed)
+        processor = _processor(speaker_to_person={1: ('person-1', 'Ada')})
+        speaker = processor.host.speakers
+        stored: list = []
+        legacy: list = []
+        clock = [0.0]
+        for tick in range(rng.randint(1, 10)):
+            segments = _random_tick(rng, tick, clock)
+            dirty = rng.random() < 0.15
+            processor.host.state.speaker_map_dirty = dirty
+            legacy_copy = [segment.model_copy(deep=True) for segment in segments]
+
+            stored, kept, updated, removed = processor._merge_tail(stored, segments)
+            legacy, legacy_updated, legacy_removed = _legacy_merge(legacy, legacy_copy, speaker, dirty)
+
+            assert stored == legacy, f'seed={seed} tick={tick}'
+            assert [s.model_dump() for s in updated] == [s.model_dump() for s in legacy_updated]
+            assert removed == legacy_removed
+            assert kept <= len(stored)
+            assert processor.host.state.speaker_map_dirty is False
+
+
+def test_unchanged_segments_keep_their_stored_dicts():
+    processor = _processor()
+    first = [TranscriptSegment(id='a', text='Hello there.', speaker='SPEAKER_00', is_user=False, start=0, end=1)]
+    stored, _, _, _ = processor._merge_tail([], first)
+    second = [TranscriptSegment(id='b', text='New topic.', speaker='SPEAKER_01', is_user=False, start=5, end=6)]
+    third = [TranscriptSegment(id='c', text='Another one.', speaker='SPEAKER_00', is_user=False, start=9, end=10)]
+    stored, _, _, _ = processor._merge_tail(stored, second)
+    head = stored[0]
+
+    stored, kept, updated, _ = processor._merge_tail(stored, third)
+
+    assert stored[0] is head
+    assert kept == 1
+    assert [segment['id'] for segment in stored] == ['a', 'b', 'c']
+    assert [segment.id for segment in updated] == ['b', 'c']
+
+
+def test_segment_index_follows_tail_replacement_and_list_swaps():
+    index = LiveSegmentIndex()
+    stored = [{'id': 'a'}, {'id': 'b'}, {'id': 'c'}]
+    assert index.find(stored, 'c') == 2
+
+    merged = stored[:2] + [{'id': 'd'}, {'id': 'e'}]
+    index.replace_tail(stored, merged, 2, ['c'])
+    assert index.find(merged, 'e') == 3
+    assert index.find(merged, 'c') is None
+
+    reloaded = [{'id': 'e'}, {'id': 'a'}]
+    assert index.find(reloaded, 'e') == 0
+    assert index.find(reloaded, 'missing') is None
+
+
+def test_cold_cache_merges_into_the_stored_transcript(monkeypatch):
+    now = datetime(2025, 1, 1, tzinfo=timezone.utc)
+    stored = [
+        TranscriptSegment(
+            id='a', text='Hello there.', speaker='SPEAKER_00', is_user=False, start=0, end=1
+        ).model_dump(),
+        TranscriptSegment(
+            id='b', text='Second line.', speaker='SPEAKER_01', is_user=False, start=4, end=5
+        ).model_dump(),
+    ]
+    document = {
+        'id': 'conv-1',
+        'created_at': now,
+        'started_at': now,
+        'finished_at': now,
+        'structured': {},
+        'transcript_segments': stored,
+    }
+    writes = []
+
+    async def call(fn, *args, **kwargs):
+        return fn(*args, **kwargs)
+
+    monkeypatch.setattr(transcripts_mod.conversations_db, 'get_conversation', lambda uid, cid: dict(document))
+    monkeypatch.setattr(
+        transcripts_mod.conversations_db,
+        'update_conversation_segments',
+        lambda uid, cid, segments, **kwargs: writes.append(segments) or True,
+    )
+    monkeypatch.setattr(transcripts_mod.conversations_db, 'update_conversation_finished_at', lambda *args: None)
+    processor = _processor()
+    processor.host.request = SimpleNamespace(uid='uid-1')
+    processor.host.persistence = SimpleNamespace(call=call)
+    tick = [TranscriptSegment(id='c', text='New topic.', speaker='SPEAKER_00', is_user=False, start=9, end=10)]
+
+    assert processor.cache.data is None
+    conversation = deserialize_conversation(_without_segments(document))
+    asyncio.run(processor._update_live_conversation(conversation, tick, [], now, None))
+
+    assert [segment['id'] for segment in writes[0]] == ['a', 'b', 'c']
+    assert processor.cache.data['transcript_segments'] == writes[0]
@@ -597,6 +597,7 @@ def _transcript_processor_for_delivery(monkeypatch, websocket):
     processor.photo_buffer = deque()
     processor.cache = SimpleNamespace(get=cache_get)
     processor.current_session_segments = {}
+    processor.realtime_fanout = None
     processor._update_live_conversation = update
     processor._translate = no_op
     processor._speaker_detection = no_op
@@ -808,3 +809,26 @@ async def test_heartbeat_stops_after_close_message_instead_of_crashing():
     await runtime._heartbeat()
 
     assert runtime.state.active is False
+
+
+@pytest.mark.anyio
+async def test_transcript_loop_closes_realtime_fanout_when_cancelled(monkeypatch):
+    """Pending webhook health writes are flushed even when the loop dies mid-tick."""
+    websocket = SimpleNamespace(send_json=lambda _payload: _async_result(None))
+    processor, _delivered, flushed = _transcript_processor_for_delivery(monkeypatch, websocket)
+    closed = []
+
+    async def close():
+        closed.append(True)
+
+    async def cancelled(*_args, **_kwargs):
+        raise asyncio.CancelledError()
+
+    processor.realtime_fanout = SimpleNamespace(close=close)
+    processor._translate = cancelled
+
+    with pytest.raises(asyncio.CancelledError):
+        await processor.process_loop()
+
+    assert closed == [True]
+    assert flushed == []
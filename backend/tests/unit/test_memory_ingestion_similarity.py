@@ -0,0 +1,95 @@
+"""Indexed dedupe matchers must make exactly the decisions of the linear scans they replace."""
+
+from __future__ import annotations
+
+import random
+
+from utils.memory_ingestion.similarity import (
+    MemoryTextIndex,
+    NearDuplicateIndex,
+    edit_distance_within,
+    memory_texts_match,
+)
+
+_WORDS = ["alice", "bob", "lives", "in", "paris", "works", "at", "acme", "likes", "tea", "coffee", "berlin", "a"]
+
+
+def _levenshtein(a: str, b: str) -> int:
+    prev_row = list(range(len(b) + 1))
+    for i, ca in enumerate(a):
+        curr_row = [i + 1]
+        for j, cb in enumerate(b):
+            curr_row.append(min(prev_row[j + 1] + 1, curr_row[j] + 1, prev_row[j] + (ca != cb)))
+        prev_row = curr_row
+    return prev_row[-1]
+
+
+def _mutate(rng: random.Random, text: str) -> str:
+    chars = list(text)
+    for _ in range(rng.randint(0, 6)):
+        op = rng.randrange(3)
+        position = rng.randint(0, len(chars))
+        if op == 0:
+            chars.insert(position, rng.choice("abcde |_"))
+        elif chars and op == 1:
+            del chars[min(position, len(chars) - 1)]
+        elif chars:
+            chars[min(position, len(chars) - 1)] = rng.choice("abcde |_")
+    return "".join(chars)
+
+
+def _phrase(rng: random.Random) -> str:
+    return " ".join(rng.choice(_WORDS) for _ in range(rng.randint(0, 7)))
+
+
+def test_banded_edit_distance_agrees_with_full_levenshtein():
+    rng = random.Random(3)
+    for _ in range(1500):
+        a = _phrase(rng)[: rng.randint(0, 20)]
+        b = _mutate(rng, a) if rng.random() < 0.7 else _phrase(rng)[:20]
+        limit = rng.randint(0, 5)
+        assert edit_distance_within(a, b, limit) == (_levenshtein(a, b) <= limit), (a, b, limit)
+
+
+def test_near_duplicate_index_matches_pairwise_scan():
+    for seed in range(8):
+        rng = random.Random(seed)
+        seeds = [f"{rng.choice(_WORDS)}|{rng.choice(_WORDS)}|{_phrase(rng)}" for _ in range(8)]
+        index = NearDuplicateIndex(max_distance=4)
+        kept: list[str] = []
+        for _ in range(30):
+            text = _mutate(rng, rng.choice(seeds)) if rng.random() < 0.8 else _phrase(rng)[:6]
+            expected = any(_levenshtein(text, existing) < 5 for existing in kept)
+            assert index.contains_near(text) == expected, (seed, text)
+            if not expected:
+                kept.append(text)
+                index.add(text)
+        assert len(index) == len(kept)
+
+
+def test_memory_text_index_returns_first_match_of_linear_scan():
+    for seed in range(40):
+        rng = random.Random(seed)
+        texts = [_phrase(rng) for _ in range(50)]
+        texts += [_mutate(rng, rng.choice(texts)).strip() for _ in range(10)]
+        index = MemoryTextIndex(texts)
+        for _ in range(40):
+            roll = rng.random()
+            if roll < 0.4:
+                query = rng.choice(texts)
+            elif roll < 0.7:
+                query = rng.choice(texts)[rng.randint(0, 6) :]
+            else:
+                query = _phrase(rng)
+            expected = next((i for i, text in enumerate(texts) if memory_texts_match(query, text)), None)
+            assert index.first_match(query) == expected, (seed, query)
+
+
+def test_memory_text_index_covers_each_match_clause():
+    index = MemoryTextIndex(["", "alice lives in paris", "works at acme corp", "bob likes tea and coffee"])
+
+    assert index.first_match("") == 0
+    assert index.first_match("ce lives in par") == 1
+    assert index.first_match("alice works at acme corp today") == 2
+    assert index.first_match("coffee tea likes bob") == 3
+    assert index.first_match("nothing shared") is None
@@ -0,0 +1,203 @@
+"""Seekable Opus container: format parity with the legacy blobs and range reads that match the full merge.
+
+A pass-through codec stands in for libopus (packet == PCM frame), so decoded windows must equal byte
+slices of the full decode exactly and any index/offset/pre-roll mistake shows up as a mismatch.
+"""
+
+import random
+from types import SimpleNamespace
+
+import pytest
+from cachetools import TTLCache
+
+from utils import encryption
+from utils.other import opus_container
+from utils.other import storage as storage_mod
+
+
+class _PassThroughEncoder:
+    def __init__(self, sample_rate, channels, application):
+        pass
+
+    def encode(self, frame, frame_size):
+        return bytes(frame)
+
+
+class _PassThroughDecoder:
+    def __init__(self, sample_rate, channels):
+        pass
+
+    def decode(self, packet, frame_size):
+        return bytes(packet)
+
+
+_FAKE_OPUS = SimpleNamespace(Encoder=_PassThroughEncoder, Decoder=_PassThroughDecoder, APPLICATION_VOIP=2048)
+
+
+class _FakeBlob:
+    def __init__(self, bucket, name):
+        self.bucket = bucket
+        self.name = name
+        self.metadata = None
+
+    @property
+    def size(self):
+        return len(self.bucket.objects[self.name][0])
+
+    def upload_from_string(self, data, content_type=None):
+        self.bucket.objects[self.name] = (bytes(data), self.metadata)
+
+    def download_as_bytes(self, start=None, end=None):
+        if self.name not in self.bucket.objects:
+            raise storage_mod.NotFound(self.name)
+        data = self.bucket.objects[self.name][0]
+        data = data[start or 0 : None if end is None else end + 1]
+        self.bucket.downloaded += len(data)
+        return data
+
+
+class _FakeBucket:
+    def __init__(self):
+        self.objects = {}
+        self.downloaded = 0
+
+    def blob(self, name):
+        blob = _FakeBlob(self, name)
+        if name in self.objects:
+            blob.metadata = self.objects[name][1]
+        return blob
+
+    def list_blobs(self, prefix):
+        return [self.blob(name) for name in sorted(self.objects) if name.startswith(prefix)]
+
+
+@pytest.fixture
+def bucket(monkeypatch):
+    fake = _FakeBucket()
+    monkeypatch.setattr(storage_mod, 'storage_client', SimpleNamespace(bucket=lambda name: fake))
+    monkeypatch.setattr(storage_mod, '_get_opuslib', lambda: _FAKE_OPUS)
+    monkeypatch.setattr(storage_mod, '_seekable_layout_cache', TTLCache(maxsize=16, ttl=60))
+    monkeypatch.setenv('PRIVATE_CLOUD_SEEKABLE_OPUS', 'true')
+    return fake
+
+
+def _pcm(rng, length):
+    return rng.randbytes(length)
+
+
+def test_container_decodes_like_the_legacy_format(bucket):
+    rng = random.Random(3)
+    for length in (0, 1, 100, 640, 641, 640 * 50, 640 * 51 + 7, 640 * 130 + 2):
+        pcm = _pcm(rng, length)
+        legacy = storage_mod.encode_pcm_to_opus(pcm)
+        container = storage_mod.encode_pcm_to_seekable_opus(pcm)
+        sealed = storage_mod.encode_pcm_to_seekable_opus(pcm, seal=lambda b: encryption.encrypt_audio_chunk(b, 'uid'))
+
+        assert not opus_container.is_opus_container(legacy)
+        assert opus_container.is_opus_container(container)
+        assert storage_mod.decode_opus_to_pcm(container) == storage_mod.decode_opus_to_pcm(legacy)
+        assert encryption.decrypt_audio_file(sealed, 'uid') == container
+        index = opus_container.parse_opus_container_header(container)
+        assert index.pcm_bytes == len(storage_mod.decode_opus_to_pcm(legacy))
+        assert index.block_range(0, len(index.block_sizes) - 1) == (index.header_size, len(container))
+        overhead = encryption.AUDIO_CHUNK_OVERHEAD
+        assert index.block_range(0, len(index.block_sizes) - 1, overhead)[1] == len(sealed)
+
+
+def test_truncated_container_raises():
+    container = storage_mod.opus_container.build_opus_container(
+        [b'\x01' * 10] * 60, 640 * 60, sample_rate=16000, channels=1, frame_ms=20
+    )
+    with pytest.raises(ValueError):
+        opus_container.parse_opus_container_header(container[:20])
+    with pytest.raises(ValueError):
+        opus_container.parse_opus_container_header(container[:25])
+    with pytest.raises(ValueError):
+        storage_mod.decode_opus_to_pcm(container[:-3])
+
+
+def test_window_decode_reads_only_covering_blocks(bucket):
+    rng = random.Random(5)
+    pcm = _pcm(rng, 640 * 240 + 100)
+    container = storage_mod.encode_pcm_to_seekable_opus(pcm)
+    index = opus_container.parse_opus_container_header(container)
+    full = storage_mod.decode_opus_to_pcm(container)
+    for _ in range(200):
+        start = rng.randrange(0, len(full))
+        end = rng.randrange(start, len(full) + 1)
+        requested = []
+
+        def read_blocks(first, last):
+            requested.append((first, last))
+            lo, hi = index.block_range(first, last)
+            return container[lo:hi]
+
+        assert storage_mod.decode_opus_container_window(index, read_blocks, start, end) == full[start:end]
+        if start < end:
+            first, last = requested[0]
+            assert last - first <= (end - start) // (640 * 50) + 2
+
+
+def _upload_conversation(rng, protection_levels):
+    timestamps = []
+    clock = 1000.0
+    for level in protection_levels:
+        pcm = _pcm(rng, rng.choice([2, 641, 640 * rng.randint(1, 200) + rng.randint(0, 639)]))
+        storage_mod.upload_audio_chunk(pcm, 'uid', 'conv', clock, data_protection_level=level)
+        timestamps.append(round(clock, 3))
+        clock += rng.choice([len(pcm) / 32000, rng.uniform(0, 8), rng.uniform(-1, 0)])
+    return timestamps
+
+
+def test_range_reads_match_the_full_merge(bucket):
+    for seed in range(6):
+        rng = random.Random(seed)
+        bucket.objects.clear()
+        levels = [rng.choice(['standard', 'enhanced']) for _ in range(rng.randint(1, 6))]
+        timestamps = _upload_conversation(rng, levels)
+        requested = timestamps + ([timestamps[-1] + 30.0] if seed % 2 else [])
+
+        merged = storage_mod.download_audio_chunks_and_merge('uid', 'conv', requested, fill_gaps=True)
+        audio = storage_mod.get_seekable_merged_audio('uid', 'conv', requested)
+
+        assert audio is not None
+        assert audio.size == len(merged)
+        for _ in range(30):
+            start = rng.randrange(0, len(merged))
+            end = rng.randrange(start, len(merged) + 1)
+            assert audio.read(start, end) == merged[start:end], f'seed={seed}'
+
+
+def test_small_range_downloads_a_fraction_of_the_conversation(bucket):
+    rng = random.Random(11)
+    timestamps = [1000.0 + 10 * index for index in range(6)]
+    for timestamp in timestamps:
+        storage_mod.upload_audio_chunk(
+            _pcm(rng, 32000 * 10), 'uid', 'conv', timestamp, data_protection_level='enhanced'
+        )
+    stored = sum(len(data) for data, _ in bucket.objects.values())
+
+    bucket.downloaded = 0
+    audio = storage_mod.get_seekable_merged_audio('uid', 'conv', timestamps)
+    audio.read(32000 * 25, 32000 * 26)
+
+    assert bucket.downloaded < stored / 10
+
+
+def test_legacy_or_batch_blobs_fall_back_to_the_full_merge(bucket, monkeypatch):
+    rng = random.Random(2)
+    storage_mod.upload_audio_chunk(_pcm(rng, 6400), 'uid', 'conv', 1000.0, data_protection_level='standard')
+    monkeypatch.setenv('PRIVATE_CLOUD_SEEKABLE_OPUS', 'false')
+    storage_mod.upload_audio_chunk(_pcm(rng, 6400), 'uid', 'conv', 1001.0, data_protection_level='standard')
+
+    assert storage_mod.get_seekable_merged_audio('uid', 'conv', [1000.0]) is not None
+    assert storage_mod.get_seekable_merged_audio('uid', 'conv', [1000.0, 1001.0]) is None
+
+    bucket.objects['chunks/uid/conv/1002.000-1003.000.batch.bin'] = (b'\x00' * 64, None)
+    assert storage_mod.get_seekable_merged_audio('uid', 'conv', [1000.0, 1002.0]) is None
+
+    # A conversation that cannot be range-read is remembered, so later scrubs skip the listing.
+    listings = []
+    monkeypatch.setattr(bucket, 'list_blobs', lambda prefix: listings.append(prefix) or [])
+    assert storage_mod.get_seekable_merged_audio('uid', 'conv', [1000.0, 1002.0]) is None
+    assert listings == []
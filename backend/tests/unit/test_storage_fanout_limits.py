@@ -29,7 +29,7 @@ def _function_body(src, function_name):
 
 
 class TestChunkDownloadSlidingWindow:
-    """download_audio_chunks_and_merge must use a sliding window, not submit all at once."""
+    """stream_audio_chunks_and_merge must use a sliding window, not submit all at once."""
 
     def test_chunk_semaphore_exists_at_module_level(self):
         """Module must define _STORAGE_CHUNK_SEM."""
@@ -48,10 +48,10 @@ class TestChunkDownloadSlidingWindow:
         assert 'BoundedSemaphore(32)' in src
 
     def test_sliding_window_uses_wait_first_completed(self):
-        """download_audio_chunks_and_merge must use FIRST_COMPLETED wait for sliding window."""
+        """The streaming merge must use FIRST_COMPLETED wait for its sliding window."""
         src = _read_source('utils/other/storage.py')
         assert 'FIRST_COMPLETED' in src
-        func_start = src.index('def download_audio_chunks_and_merge')
+        func_start = src.index('def stream_audio_chunks_and_merge')
         next_def = src.index('\ndef ', func_start + 1)
         func_body = src[func_start:next_def]
         assert 'FIRST_COMPLETED' in func_body
@@ -59,7 +59,7 @@ class TestChunkDownloadSlidingWindow:
     def test_chunk_sem_acquired_before_submit(self):
         """Chunk semaphore must be acquired before storage_executor.submit, not inside the task."""
         src = _read_source('utils/other/storage.py')
-        func_start = src.index('def download_audio_chunks_and_merge')
+        func_start = src.index('def stream_audio_chunks_and_merge')
         next_def = src.index('\ndef ', func_start + 1)
         func_body = src[func_start:next_def]
         assert '_STORAGE_CHUNK_SEM.acquire()' in func_body
@@ -67,7 +67,7 @@ class TestChunkDownloadSlidingWindow:
     def test_chunk_sem_released_in_done_callback(self):
         """Chunk semaphore must be released via done callback for exception safety."""
         src = _read_source('utils/other/storage.py')
-        func_start = src.index('def download_audio_chunks_and_merge')
+        func_start = src.index('def stream_audio_chunks_and_merge')
         next_def = src.index('\ndef ', func_start + 1)
         func_body = src[func_start:next_def]
         assert '_STORAGE_CHUNK_SEM.release()' in func_body
@@ -76,7 +76,7 @@ class TestChunkDownloadSlidingWindow:
     def test_no_unbounded_dict_comprehension_submit(self):
         """Old pattern of submitting all futures via dict comprehension must be gone."""
         src = _read_source('utils/other/storage.py')
-        func_start = src.index('def download_audio_chunks_and_merge')
+        func_start = src.index('def stream_audio_chunks_and_merge')
         next_def = src.index('\ndef ', func_start + 1)
         func_body = src[func_start:next_def]
         assert 'storage_executor.submit(download_single_chunk, ts): ts for ts' not in func_body
@@ -85,7 +85,7 @@ class TestChunkDownloadSlidingWindow:
     def test_combined_job_stream(self):
         """Individual chunks and batch blobs must be treated as one job stream."""
         src = _read_source('utils/other/storage.py')
-        func_start = src.index('def download_audio_chunks_and_merge')
+        func_start = src.index('def stream_audio_chunks_and_merge')
         next_def = src.index('\ndef ', func_start + 1)
         func_body = src[func_start:next_def]
         assert "('individual'" in func_body or "('batch'" in func_body
@@ -159,43 +159,36 @@ class TestRecordSpeechMsSource:
     def test_source_defaults_to_realtime(self):
         """Calling without source uses 'realtime' default."""
         fair_use_mod.record_speech_ms('user1', 5000)
-        pipe = self._mock_redis.pipeline.return_value
-        pipe.hincrby.assert_called_once()
+        self._mock_redis.eval.assert_called_once()
+        assert self._mock_redis.eval.call_args.args[2] == 'fair_use:v3:speech:realtime:user1'
 
     @patch.object(fair_use_mod, 'FAIR_USE_ENABLED', True)
     def test_source_sync_accepted(self):
         """The legacy sync alias maps to the fresh lane."""
         fair_use_mod.record_speech_ms('user1', 5000, source='sync')
-        pipe = self._mock_redis.pipeline.return_value
-        pipe.hincrby.assert_called_once()
-        call_args = pipe.hincrby.call_args
+        call_args = self._mock_redis.eval.call_args
+        assert 'fair_use:v3:speech:sync_fresh:user1' in str(call_args)
         assert 'fair_use:v2:bucket:sync_fresh:user1' in str(call_args)
 
     @patch.object(fair_use_mod, 'FAIR_USE_ENABLED', True)
     def test_source_separates_live_and_fresh_redis_keys(self):
         """Realtime and fresh sync usage remain independently queryable."""
-        pipe_mock = MagicMock()
-        self._mock_redis.pipeline.return_value = pipe_mock
-
         with patch.object(fair_use_mod.time, 'time', return_value=1_800_000_000):
             fair_use_mod.record_speech_ms('user1', 1000, source='realtime')
-            realtime_calls = [str(c) for c in pipe_mock.method_calls]
-
-            pipe_mock.reset_mock()
-            self._mock_redis.pipeline.return_value = pipe_mock
+            realtime_call = str(self._mock_redis.eval.call_args)
 
             fair_use_mod.record_speech_ms('user1', 1000, source='sync')
-            sync_calls = [str(c) for c in pipe_mock.method_calls]
+            sync_call = str(self._mock_redis.eval.call_args)
 
-        assert realtime_calls != sync_calls
-        assert any('fair_use:v2:bucket:realtime:user1' in call for call in realtime_calls)
-        assert any('fair_use:v2:bucket:sync_fresh:user1' in call for call in sync_calls)
+        assert realtime_call != sync_call
+        assert 'fair_use:v3:speech:realtime:user1' in realtime_call
+        assert 'fair_use:v3:speech:sync_fresh:user1' in sync_call
 
     @patch.object(fair_use_mod, 'FAIR_USE_ENABLED', True)
     def test_backfill_uses_non_live_key(self):
         fair_use_mod.record_speech_ms('user1', 1000, source='sync_backfill')
-        call_args = self._mock_redis.pipeline.return_value.hincrby.call_args
-        assert 'fair_use:v2:bucket:sync_backfill:user1' in str(call_args)
+        call_args = self._mock_redis.eval.call_args
+        assert 'fair_use:v3:speech:sync_backfill:user1' in str(call_args)
 
 
 class TestCheckSoftCapsWithPrecomputedTotals:
@@ -18,7 +18,9 @@ import os
 import struct
 import sys
 import tempfile
+import threading
 import wave
+from concurrent.futures import ThreadPoolExecutor
 from types import ModuleType
 from typing import cast
 from unittest.mock import MagicMock, patch
@@ -709,6 +711,67 @@ class TestDecodeFilesToWavOpus:
             assert wav_files == [bin_path.replace('.bin', '.wav')]
             assert get_wav_duration(wav_files[0]) > 0
 
+    # --- Parallel decode ---
+
+    def test_parallel_decode_keeps_input_order(self):
+        """Files fanned out over helper threads come back in upload order."""
+        klass, _ = _good_decoder()
+        with (
+            tempfile.TemporaryDirectory() as d,
+            patch('utils.sync.files.Decoder', klass),
+            ThreadPoolExecutor(max_workers=3) as pool,
+            patch('utils.sync.files.sync_executor', pool),
+            patch('utils.sync.files.SYNC_DECODE_PARALLELISM', 4),
+        ):
+            paths = [self._opus_filename(d, ts=1710000000 + i) for i in range(6)]
+            for path in paths:
+                self._write_valid_opus_bin(path)
+
+            wav_files = decode_files_to_wav(paths)
+
+            assert wav_files == [path.replace('.bin', '.wav') for path in paths]
+            assert all(not os.path.exists(path) for path in paths)
+
+    def test_saturated_executor_does_not_block_decode(self):
+        """Helpers that never get a worker are cancelled; the caller decodes everything."""
+        klass, _ = _good_decoder()
+        release = threading.Event()
+        with (
+            tempfile.TemporaryDirectory() as d,
+            patch('utils.sync.files.Decoder', klass),
+            ThreadPoolExecutor(max_workers=1) as pool,
+            patch('utils.sync.files.sync_executor', pool),
+        ):
+            pool.submit(release.wait, 5)
+            paths = [self._opus_filename(d, ts=1710000000 + i) for i in range(3)]
+            for path in paths:
+                self._write_valid_opus_bin(path)
+
+            try:
+                wav_files = decode_files_to_wav(paths)
+            finally:
+                release.set()
+
+            assert wav_files == [path.replace('.bin', '.wav') for path in paths]
+
+    def test_frames_spanning_several_write_batches_are_all_written(self):
+        """PCM flushed across batch boundaries lands in order with nothing dropped."""
+        pcm_frames = [bytes([i]) * len(FAKE_PCM_FRAME) for i in range(7)]
+        instance = MagicMock()
+        instance.decode.side_effect = pcm_frames
+        with (
+            tempfile.TemporaryDirectory() as d,
+            patch('utils.sync.files.Decoder', MagicMock(return_value=instance)),
+            patch('utils.sync.files._DECODE_BATCH_FRAMES', 3),
+        ):
+            bin_path = os.path.join(d, 'test.bin')
+            wav_path = os.path.join(d, 'test.wav')
+            _write_opus_bin(bin_path, [FAKE_OPUS_FRAME] * 7)
+
+            assert decode_opus_file_to_wav(bin_path, wav_path) is True
+            with wave.open(wav_path, 'rb') as wav_file:
+                assert wav_file.readframes(wav_file.getnframes()) == b''.join(pcm_frames)
+
 
 class TestMergeAndCapVadSegments:
     """VAD merge + per-segment length cap that guards the STT worker from GPU OOM."""
@@ -34,6 +34,8 @@ def _load_playback(request):
         "is_playback_unavailable",
     ):
         setattr(storage_module, name, MagicMock())
+    storage_module.get_seekable_merged_audio = MagicMock(return_value=None)
+    storage_module.SeekableMergedAudio = object
     storage_module._PRECACHE_FILE_SEM = MagicMock()
     with stub_modules({"utils.cloud_tasks": cloud_tasks_module, "utils.other.storage": storage_module}):
         module = load_module_fresh("utils.sync.playback", os.path.join(str(BACKEND), "utils", "sync", "playback.py"))
@@ -320,6 +322,91 @@ def test_download_inline_wav_pcm_and_ranges(monkeypatch):
     assert merge_calls == [(('u', 'c', [1.0]), {'fill_gaps': True, 'sample_rate': playback.AUDIO_SAMPLE_RATE})]
 
 
+def test_download_inline_wav_merges_when_no_cached_bytes_are_returned(monkeypatch):
+    monkeypatch.setattr(playback, 'is_audio_merge_dispatch_enabled', lambda: False)
+    monkeypatch.setattr(playback, 'get_or_create_merged_audio', lambda **kwargs: (None, False))
+    monkeypatch.setattr(playback, 'download_audio_chunks_and_merge', lambda *args, **kwargs: b'pcm')
+
+    response = playback.download_audio_file_response(
+        'u', 'c', 'a', {'id': 'a', 'chunk_timestamps': [1.0]}, FakeRequest(), 'wav'
+    )
+    assert response.status_code == 200
+    assert asyncio.run(_response_body(response)) == playback.pcm_to_wav(b'pcm')
+
+
+class FakeSeekableAudio:
+    def __init__(self, pcm):
+        self.pcm = pcm
+        self.size = len(pcm)
+        self.reads = []
+
+    def read(self, start, end):
+        self.reads.append((start, end))
+        return self.pcm[start:end]
+
+
+def test_wav_header_matches_pcm_to_wav():
+    pcm = bytes(range(256)) * 3
+    assert playback.wav_header(len(pcm)) == playback.pcm_to_wav(pcm)[:44]
+
+
+def test_download_range_reads_seekable_chunks_without_merging(monkeypatch):
+    monkeypatch.setattr(playback, 'is_audio_merge_dispatch_enabled', lambda: False)
+    pcm = bytes(range(200)) * 4
+    audio = FakeSeekableAudio(pcm)
+    monkeypatch.setattr(playback, 'get_seekable_merged_audio', lambda *args, **kwargs: audio)
+    monkeypatch.setattr(playback, 'get_or_create_merged_audio', MagicMock(side_effect=AssertionError('merged')))
+    monkeypatch.setattr(playback, 'download_audio_chunks_and_merge', MagicMock(side_effect=AssertionError('merged')))
+    wav = playback.pcm_to_wav(pcm)
+
+    for header, expected in (('bytes=10-99', wav[10:100]), ('bytes=500-1000', wav[500:]), ('bytes=-20', wav[-20:])):
+        response = playback.download_audio_file_response(
+            'u', 'c', 'a', {'id': 'a', 'chunk_timestamps': [1.0]}, FakeRequest({'Range': header}), 'wav'
+        )
+        assert response.status_code == 206
+        assert response.headers['content-range'].endswith(f'/{len(wav)}')
+        assert asyncio.run(_response_body(response)) == expected
+
+    response = playback.download_audio_file_response(
+        'u', 'c', 'a', {'id': 'a', 'chunk_timestamps': [1.0]}, FakeRequest({'Range': 'bytes=0-9'}), 'pcm'
+    )
+    assert asyncio.run(_response_body(response)) == pcm[:10]
+    assert audio.reads[0] == (0, 56)
+
+
+def test_open_ended_and_long_ranges_use_the_cached_merged_wav(monkeypatch):
+    monkeypatch.setattr(playback, 'is_audio_merge_dispatch_enabled', lambda: False)
+    seekable = MagicMock(side_effect=AssertionError('listed chunks'))
+    monkeypatch.setattr(playback, 'get_seekable_merged_audio', seekable)
+    wav = playback.pcm_to_wav(b'\x01' * 100)
+    monkeypatch.setattr(playback, 'get_or_create_merged_audio', lambda **kwargs: (wav, True))
+
+    for header in ('bytes=0-', f'bytes=0-{playback.SEEKABLE_RANGE_MAX_BYTES}'):
+        response = playback.download_audio_file_response(
+            'u', 'c', 'a', {'id': 'a', 'chunk_timestamps': [1.0]}, FakeRequest({'Range': header}), 'wav'
+        )
+        assert response.status_code == 206
+        assert asyncio.run(_response_body(response)) == wav
+
+    seekable.assert_not_called()
+
+
+def test_download_range_falls_back_to_merge_when_seekable_read_fails(monkeypatch):
+    monkeypatch.setattr(playback, 'is_audio_merge_dispatch_enabled', lambda: False)
+    audio = FakeSeekableAudio(b'')
+    audio.size = 10
+    audio.read = MagicMock(side_effect=ValueError('corrupt block'))
+    monkeypatch.setattr(playback, 'get_seekable_merged_audio', lambda *args, **kwargs: audio)
+    monkeypatch.setattr(playback, 'download_audio_chunks_and_merge', lambda *args, **kwargs: b'0123456789')
+
+    response = playback.download_audio_file_response(
+        'u', 'c', 'a', {'id': 'a', 'chunk_timestamps': [1.0]}, FakeRequest({'Range': 'bytes=2-4'}), 'pcm'
+    )
+
+    assert response.status_code == 206
+    assert asyncio.run(_response_body(response)) == b'234'
+
+
 def test_download_errors_preserve_contract(monkeypatch):
     monkeypatch.setattr(playback, 'is_audio_merge_dispatch_enabled', lambda: False)
     with pytest.raises(HTTPException) as exc:
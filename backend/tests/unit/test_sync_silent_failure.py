@@ -776,6 +776,8 @@ class TestProcessSegmentReal:
         sys.modules['utils.other.storage'].download_audio_chunks_and_merge = MagicMock()
         sys.modules['utils.other.storage'].get_or_create_merged_audio = MagicMock()
         sys.modules['utils.other.storage'].get_merged_audio_signed_url = MagicMock()
+        sys.modules['utils.other.storage'].get_seekable_merged_audio = MagicMock(return_value=None)
+        sys.modules['utils.other.storage'].SeekableMergedAudio = object
         sys.modules['utils.other.storage'].upload_audio_chunk = MagicMock()
         sys.modules['utils.other.storage'].precache_conversation_audio = MagicMock()
         sys.modules['utils.other.storage'].is_playback_unavailable = MagicMock(return_value=False)
@@ -818,6 +820,7 @@ class TestProcessSegmentReal:
             return_value=('deepgram', 'multi', 'nova-3')
         )
         sys.modules['utils.stt.vad'].vad_is_empty = MagicMock()
+        sys.modules['utils.stt.vad'].run_files_vad = MagicMock(return_value=[])
         sys.modules['utils.speaker_assignment'].process_speaker_assigned_segments = MagicMock()
         sys.modules['utils.speaker_identification'].detect_speaker_from_text = MagicMock(return_value=None)
         sys.modules['utils.stt.speaker_embedding'].extract_embedding_from_bytes = MagicMock()
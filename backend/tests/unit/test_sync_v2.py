@@ -3018,6 +3018,46 @@ class TestAsyncCoordinatorBehavioral:
         finally:
             self._cleanup(stubs['saved_modules'])
 
+    @pytest.mark.asyncio
+    async def test_vad_phase_reuses_batched_local_segments(self, monkeypatch):
+        """One batched local VAD pass feeds every file; no per-file VAD call is made."""
+        monkeypatch.delenv('HOSTED_VAD_API_URL', raising=False)
+        module, stubs = self._load_sync_module()
+        try:
+            pipeline = stubs['pipeline']
+            speech = [{'start': 0.0, 'end': 2.0, 'duration': 2.0}]
+            pipeline.run_files_vad = MagicMock(return_value=[speech, []])
+            pipeline.retrieve_vad_segments = MagicMock()
+            pipeline._cleanup_files = MagicMock()
+
+            errors, _ = await pipeline._run_sync_vad_phase(['/tmp/a.wav', '/tmp/b.wav'], set())
+
+            assert errors == []
+            pipeline.run_files_vad.assert_called_once_with(['/tmp/a.wav', '/tmp/b.wav'], cache=True)
+            passed = {c.args[0]: c.kwargs['voice_segments'] for c in pipeline.retrieve_vad_segments.call_args_list}
+            assert passed == {'/tmp/a.wav': speech, '/tmp/b.wav': []}
+        finally:
+            self._cleanup(stubs['saved_modules'])
+
+    @pytest.mark.asyncio
+    async def test_vad_phase_falls_back_per_file_when_batch_fails(self, monkeypatch):
+        """A failed batch leaves every file on the per-file hosted/local VAD path."""
+        monkeypatch.delenv('HOSTED_VAD_API_URL', raising=False)
+        module, stubs = self._load_sync_module()
+        try:
+            pipeline = stubs['pipeline']
+            pipeline.run_files_vad = MagicMock(side_effect=RuntimeError('onnx failure'))
+            calls = []
+            pipeline.retrieve_vad_segments = lambda path, _paths, _errors: calls.append(path)
+            pipeline._cleanup_files = MagicMock()
+
+            errors, _ = await pipeline._run_sync_vad_phase(['/tmp/a.wav', '/tmp/b.wav'], set())
+
+            assert errors == []
+            assert sorted(calls) == ['/tmp/a.wav', '/tmp/b.wav']
+        finally:
+            self._cleanup(stubs['saved_modules'])
+
 
 # ---------------------------------------------------------------------------
 # 8. v2 endpoint execution tests via FastAPI TestClient
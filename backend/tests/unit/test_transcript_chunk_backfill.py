@@ -0,0 +1,149 @@
+"""Bulk transcript-chunk indexing: same vectors as per-conversation upserts, batched calls, resumable checkpoints."""
+
+import random
+from datetime import datetime, timedelta, timezone
+
+import pytest
+
+import database.vector_db as vector_db
+import utils.conversations.transcript_chunk_backfill as backfill
+from utils.conversations.transcript_chunk_backfill import backfill_transcript_chunks
+
+UID = 'uid-tchunks'
+
+
+class _FakeIndex:
+    def __init__(self):
+        self.requests = []
+        self.vectors = {}
+
+    def upsert(self, vectors, namespace):
+        assert namespace == vector_db.TRANSCRIPT_CHUNKS_NAMESPACE
+        self.requests.append(len(vectors))
+        for record in vectors:
+            self.vectors[record['id']] = record
+
+
+class _FakeEmbeddings:
+    def __init__(self):
+        self.calls = []
+        self.fail_on_call = None
+
+    def embed_documents(self, texts):
+        self.calls.append(list(texts))
+        if self.fail_on_call == len(self.calls):
+            raise RuntimeError('embedding outage')
+        return [[float(len(text)), float(text.count(' '))] for text in texts]
+
+
+def _conversations(rng, count):
+    started = datetime(2026, 3, 1, tzinfo=timezone.utc)
+    conversations = []
+    for i in range(count):
+        segments = [
+            {
+                'text': ' '.join(rng.choice(['hi', 'budget', 'tuesday', 'omi']) for _ in range(rng.randint(0, 30))),
+                'is_user': rng.random() < 0.5,
+                'speaker_id': rng.randint(0, 2),
+            }
+            for _ in range(rng.randint(0, 30))
+        ]
+        conversations.append(
+            {
+                'id': f'conv-{i}',
+                'status': rng.choice(['completed'] * 5 + ['processing']),
+                'started_at': rng.choice([started + timedelta(hours=i), None]),
+                'created_at': started + timedelta(hours=i, minutes=5),
+                'transcript_segments': segments,
+            }
+        )
+    return conversations
+
+
+@pytest.fixture
+def store(monkeypatch):
+    state = {'conversations': [], 'index': _FakeIndex(), 'embeddings': _FakeEmbeddings()}
+
+    def iter_all_conversations(uid, batch_size=400, include_discarded=True, start_after_id=None):
+        assert uid == UID and include_discarded is False
+        ids = [c['id'] for c in state['conversations']]
+        start = ids.index(start_after_id) + 1 if start_after_id in ids else 0
+        yield from state['conversations'][start:]
+
+    monkeypatch.setattr(backfill.conversations_db, 'iter_all_conversations', iter_all_conversations)
+    monkeypatch.setattr(backfill, 'num_tokens_from_string', lambda text: len(text.split()))
+    monkeypatch.setattr(backfill, 'embeddings', state['embeddings'])
+    monkeypatch.setattr(vector_db, 'embeddings', state['embeddings'])
+    monkeypatch.setattr(vector_db, 'index', state['index'])
+    return state
+
+
+def _per_conversation_vectors(store):
+    """What the live path writes: upsert_transcript_chunk_vectors once per completed conversation."""
+    index = _FakeIndex()
+    vector_db.index = index
+    for conversation in store['conversations']:
+        if conversation['status'] == 'completed':
+            chunks = backfill.conversation_transcript_chunks(conversation)
+            vector_db.upsert_transcript_chunk_vectors(UID, conversation['id'], chunks)
+    vector_db.index = store['index']
+    return index.vectors
+
+
+def test_bulk_index_matches_per_conversation_upserts(store):
+    rng = random.Random(20)
+    store['conversations'] = _conversations(rng, 60)
+    expected = _per_conversation_vectors(store)
+    store['embeddings'].calls.clear()
+
+    report = backfill_transcript_chunks(UID, token_budget=300, max_inputs=7, flush_records=25)
+
+    assert store['index'].vectors == expected
+    assert report.completed and report.upserted == len(expected) == report.chunks
+    assert report.embed_calls == len(store['embeddings'].calls)
+    for texts in store['embeddings'].calls:
+        assert len(texts) <= 7
+        assert len(texts) == 1 or sum(len(text.split()) for text in texts) <= 300
+    assert all(size <= vector_db.TRANSCRIPT_CHUNK_UPSERT_BATCH for size in store['index'].requests)
+    assert report.skipped == sum(c['status'] != 'completed' for c in store['conversations'])
+
+
+def test_interrupted_run_resumes_from_the_last_upserted_conversation(store):
+    rng = random.Random(7)
+    store['conversations'] = _conversations(rng, 80)
+    expected = _per_conversation_vectors(store)
+    saved = []
+    store['embeddings'].calls.clear()
+    store['embeddings'].fail_on_call = 9
+
+    with pytest.raises(RuntimeError):
+        backfill_transcript_chunks(UID, on_checkpoint=saved.append, token_budget=200, max_inputs=5, flush_records=10)
+
+    resume_from = saved[-1]
+    assert not resume_from.completed and resume_from.conversations > 0
+    assert resume_from.last_conversation_id == store['conversations'][resume_from.conversations - 1]['id']
+    done = {f"{UID}-{c['id']}-c" for c in store['conversations'][: resume_from.conversations]}
+    indexed_before_failure = {key: value for key, value in expected.items() if key[: key.rindex('-c') + 2] in done}
+    assert indexed_before_failure.items() <= store['index'].vectors.items()
+
+    store['embeddings'].fail_on_call = None
+    report = backfill_transcript_chunks(UID, checkpoint=resume_from, on_checkpoint=saved.append, token_budget=200)
+
+    assert report.resumed_after == resume_from.last_conversation_id
+    assert report.completed and saved[-1].completed
+    assert saved[-1].conversations == len(store['conversations'])
+    assert store['index'].vectors == expected
+    assert backfill_transcript_chunks(UID, checkpoint=saved[-1]).upserted == 0
+
+
+def test_dry_run_counts_without_embedding_or_checkpointing(store):
+    store['conversations'] = _conversations(random.Random(3), 20)
+    saved = []
+
+    report = backfill_transcript_chunks(UID, dry_run=True, on_checkpoint=saved.append, max_inputs=4)
+
+    assert store['embeddings'].calls == [] and store['index'].requests == [] and saved == []
+    assert report.chunks == sum(
+        len(backfill.conversation_transcript_chunks(c)) for c in store['conversations'] if c['status'] == 'completed'
+    )
+    assert report.embed_calls >= report.chunks / 4
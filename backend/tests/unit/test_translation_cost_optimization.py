@@ -528,3 +528,35 @@ def test_coordinator_does_not_negative_cache_unchanged_foreign_text():
     assert store.negative == set()
     assert not coordinator.language_state.monolingual
     assert coordinator.language_state.consecutive_target == 0
+
+
+class _BulkCountingStore(DictTranslationStore):
+    def __init__(self) -> None:
+        super().__init__()
+        self.bulk_calls: list[tuple[str, int]] = []
+
+    def get_many(self, fingerprints, target_language):
+        self.bulk_calls.append(('get', len(fingerprints)))
+        return super().get_many(fingerprints, target_language)
+
+    def is_negative_many(self, fingerprints, target_language):
+        self.bulk_calls.append(('negative', len(fingerprints)))
+        return super().is_negative_many(fingerprints, target_language)
+
+
+def test_cache_lookups_are_batched_per_phase_not_per_unit():
+    store = _BulkCountingStore()
+    store.values[(fingerprint_text('Cached.'), 'fr')] = CachedTranslation('En cache.', 'en')
+    store.negative.add((fingerprint_text('Skip.'), 'fr'))
+    provider = FakeProvider(TranslationProvider.google, responses=[translations(('Nouveau.', 'en'))])
+    service, _cache = build_service({TranslationProvider.google: provider}, store=store)
+
+    outcomes = service.translate_outcomes(
+        'fr', [('a', 'Cached.'), ('b', 'Skip.'), ('c', 'Fresh. Skip.'), ('d', 'Fresh. Cached.')]
+    )
+
+    assert [outcome.text for outcome in outcomes] == ['En cache.', 'Skip.', 'Nouveau. Skip.', 'Nouveau. En cache.']
+    assert provider.calls[0]['contents'] == ['Fresh.']
+    # Units: one read for all four, one negative read for the three misses. Segments: 'Cached.'
+    # is now in memory, so one read for the other two sentences and one negative read for both.
+    assert store.bulk_calls == [('get', 4), ('negative', 3), ('get', 2), ('negative', 2)]
@@ -97,6 +97,9 @@ class FailingRedis:
     def exists(self, key):
         raise redis.exceptions.ConnectionError('down')
 
+    def mget(self, keys):
+        raise redis.exceptions.ConnectionError('down')
+
     def set(self, key, value, **kwargs):
         raise redis.exceptions.ConnectionError('down')
 
@@ -255,6 +258,9 @@ class RecordingRedis:
     def exists(self, key):
         return key in self.values
 
+    def mget(self, keys):
+        return [self.values.get(key) for key in keys]
+
     def set(self, key, value, *, ex):
         self.values[key] = value
         self.sets.append((key, value, ex))
@@ -285,3 +291,61 @@ def test_malformed_redis_payload_is_a_cache_miss(raw):
     store = RedisTranslationStore(client_factory=lambda: client)
 
     assert store.get('fingerprint', 'es') is None
+
+
+class CountingRedis(RecordingRedis):
+    def __init__(self) -> None:
+        super().__init__()
+        self.mgets: list[list[str]] = []
+
+    def get(self, key):
+        raise AssertionError('bulk lookups must not fall back to per-key GET')
+
+    def exists(self, key):
+        raise AssertionError('bulk lookups must not fall back to per-key EXISTS')
+
+    def mget(self, keys):
+        self.mgets.append(list(keys))
+        return super().mget(keys)
+
+
+def test_redis_store_bulk_lookups_use_one_mget_each():
+    client = CountingRedis()
+    store = RedisTranslationStore(client_factory=lambda: client)
+    store.put('hit', 'es', CachedTranslation('Hola', 'en'), ttl_seconds=600)
+    store.put_negative('neg', 'es', ttl_seconds=300)
+    client.values['translate:v1:bad:es'] = 'not-json'
+
+    assert store.get_many(['hit', 'bad', 'miss'], 'es') == {'hit': CachedTranslation('Hola', 'en')}
+    assert store.is_negative_many(['neg', 'miss'], 'es') == {'neg'}
+    assert store.get_many([], 'es') == {}
+    assert client.mgets == [
+        ['translate:v1:hit:es', 'translate:v1:bad:es', 'translate:v1:miss:es'],
+        ['translate:v2:neg:neg:es', 'translate:v2:neg:miss:es'],
+    ]
+
+
+def test_cache_get_many_serves_memory_first_and_batches_the_rest():
+    client = CountingRedis()
+    cache = TranslationCache(
+        persistent=RedisTranslationStore(client_factory=lambda: client), metrics=NoopTranslationMetrics()
+    )
+    cache.put('warm', 'es', CachedTranslation('Caliente', 'en'), profile())
+    client.values['translate:v1:cold:es'] = '{"text": "Frio", "detected_lang": "en"}'
+    client.mgets.clear()
+
+    found = cache.get_many(['warm', 'cold', 'cold', 'missing'], 'es')
+
+    assert found == {'warm': CachedTranslation('Caliente', 'en'), 'cold': CachedTranslation('Frio', 'en')}
+    assert client.mgets == [['translate:v1:cold:es', 'translate:v1:missing:es']]
+    assert cache.get_many(['cold'], 'es') == {'cold': CachedTranslation('Frio', 'en')}
+    assert len(client.mgets) == 1
+
+
+def test_bulk_lookups_treat_redis_outage_as_misses():
+    cache = TranslationCache(
+        persistent=RedisTranslationStore(client_factory=FailingRedis), metrics=NoopTranslationMetrics()
+    )
+
+    assert cache.get_many(['fingerprint'], 'es') == {}
+    assert cache.is_negative_many(['fingerprint'], 'es') == set()
@@ -45,6 +45,12 @@ class _FakeCache:
     def is_negative(self, fingerprint: str, target_language: str) -> bool:
         return fingerprint in self._negative
 
+    def get_many(self, fingerprints, target_language: str) -> dict:
+        return {}
+
+    def is_negative_many(self, fingerprints, target_language: str) -> set[str]:
+        return {fingerprint for fingerprint in fingerprints if fingerprint in self._negative}
+
     def put(self, fingerprint: str, target_language: str, value: object, profile: object) -> None:
         return None
 
@@ -237,7 +237,7 @@ def test_hourly_transcription_writer_keeps_plan_and_missing_cost_explicit(mock_d
         {'transcription_seconds': 12},
     )
 
-    update = hourly_ref.set.call_args.args[0]
+    update = hourly_ref.set.call_args_list[0].args[0]
     assert getattr(update['plan_usage.plus.transcription_seconds'], '_value', None) == 12
     assert getattr(update['plan_usage.plus._metadata.cost_status_counts.missing'], '_value', None) == 1
     assert all('cost_usd' not in key for key in update)
@@ -392,43 +392,6 @@ def test_usage_endpoint_serves_the_users_local_day_not_the_utc_day(mock_db, monk
     assert result['today']['transcription_seconds'] == 900, result['today']
 
 
-def test_all_time_usage_builds_totals_and_history_from_one_stream(mock_db, monkeypatch):
-    query = MagicMock()
-    query.stream.return_value = iter(
-        [
-            _Snap({'year': 2025, 'transcription_seconds': 10, 'speech_seconds': 8}),
-            _Snap({'year': 2026, 'transcription_seconds': 20, 'words_transcribed': 4, 'speech_seconds': 16}),
-        ]
-    )
-    mock_db.collection.return_value.document.return_value.collection.return_value = query
-    record_read = MagicMock()
-    monkeypatch.setattr(user_usage, 'record_firestore_read', record_read)
-
-    result = user_usage.get_current_user_usage('uid', 'all_time')
-
-    assert result['all_time']['transcription_seconds'] == 30
-    assert result['all_time']['words_transcribed'] == 4
-    assert result['all_time']['speech_seconds'] == 24
-    assert result['history'] == [
-        {
-            'date': '2025-01-01',
-            'transcription_seconds': 10,
-            'words_transcribed': 0,
-            'insights_gained': 0,
-            'memories_created': 0,
-        },
-        {
-            'date': '2026-01-01',
-            'transcription_seconds': 20,
-            'words_transcribed': 4,
-            'insights_gained': 0,
-            'memories_created': 0,
-        },
-    ]
-    query.stream.assert_called_once_with()
-    record_read.assert_called_once_with(FirestoreReadFamily.ALL_TIME_USAGE, FirestoreReadMode.UNBOUNDED, 2)
-
-
 def test_fully_attributed_document_creates_no_phantom_unattributed_row(mock_db):
     """A document whose plan_usage accounts for all its questions must not also
     report those questions as unattributed.
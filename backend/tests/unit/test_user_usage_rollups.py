@@ -0,0 +1,214 @@
+"""Usage history served from month rollups: same totals as streaming every hourly doc, fewer reads."""
+
+import os
+import random
+from datetime import datetime, timedelta, timezone
+
+import pytest
+
+os.environ.setdefault(
+    "ENCRYPTION_SECRET",
+    "omi_ZwB2ZNqB2HHpMK6wStk7sTpavJiPTFg7gXUHnc4tFABPU6pZ2c2DKgehtfgi4RZv",
+)
+
+from google.cloud import firestore  # noqa: E402
+
+from database import user_usage  # noqa: E402
+
+UID = 'uid-rollups'
+METRICS = ('transcription_seconds', 'words_transcribed', 'insights_gained', 'memories_created', 'speech_seconds')
+
+
+class _Snap:
+    def __init__(self, doc_id, data):
+        self.id = doc_id
+        self.exists = data is not None
+        self._data = data
+
+    def to_dict(self):
+        return dict(self._data) if self._data is not None else None
+
+
+class _Store:
+    """Just enough Firestore: nested collections, where/stream, merge sets, batches, Increment."""
+
+    def __init__(self):
+        self.docs = {}
+
+    def collection(self, name):
+        return _Collection(self, (name,))
+
+    def batch(self):
+        return _Batch()
+
+    def write(self, path, data, merge):
+        doc = dict(self.docs.get(path) or {}) if merge else {}
+        for key, value in data.items():
+            if isinstance(value, firestore.Increment):
+                doc[key] = doc.get(key, 0) + value.value
+            elif not isinstance(value, firestore.ArrayUnion):
+                doc[key] = value
+        self.docs[path] = doc
+
+
+class _Collection:
+    _OPS = {'==': lambda a, b: a == b, '>=': lambda a, b: a >= b, '<': lambda a, b: a < b}
+
+    def __init__(self, store, path, filters=()):
+        self.store = store
+        self.path = path
+        self.filters = filters
+
+    def document(self, doc_id):
+        return _DocRef(self.store, self.path + (doc_id,))
+
+    def where(self, *, filter):
+        return _Collection(self.store, self.path, self.filters + ((filter.field_path, filter.op_string, filter.value),))
+
+    def stream(self):
+        for path, data in sorted(self.store.docs.items()):
+            if path[:-1] != self.path:
+                continue
+            if all(field in data and self._OPS[op](data[field], value) for field, op, value in self.filters):
+                yield _Snap(path[-1], data)
+
+
+class _DocRef:
+    def __init__(self, store, path):
+        self.store = store
+        self.path = path
+
+    def collection(self, name):
+        return _Collection(self.store, self.path + (name,))
+
+    def get(self):
+        return _Snap(self.path[-1], self.store.docs.get(self.path))
+
+    def set(self, data, merge=False):
+        self.store.write(self.path, data, merge)
+
+
+class _Batch:
+    def __init__(self):
+        self.writes = []
+
+    def set(self, ref, data, merge=False):
+        self.writes.append((ref, data, merge))
+
+    def commit(self):
+        for ref, data, merge in self.writes:
+            ref.set(data, merge=merge)
+
+
+@pytest.fixture
+def store(monkeypatch):
+    store = _Store()
+    reads = []
+    monkeypatch.setattr(user_usage, 'db', store)
+    monkeypatch.setattr(user_usage, 'resolve_usage_plan_id', lambda *_args, **_kwargs: 'plus')
+    monkeypatch.setattr(user_usage, 'record_firestore_read', lambda family, mode, count: reads.append(count))
+    store.reads = reads
+    return store
+
+
+def _seed_hours(store, rng, now, count):
+    hourly = store.collection('users').document(UID).collection('hourly_usage')
+    for _ in range(count):
+        date = now - timedelta(hours=rng.randint(0, 3 * 365 * 24))
+        doc_id = f'{date.year}-{date.month:02d}-{date.day:02d}-{date.hour:02d}'
+        hourly.document(doc_id).set(
+            {
+                'year': date.year,
+                'month': date.month,
+                'day': date.day,
+                'hour': date.hour,
+                'id': doc_id,
+                **{key: rng.randint(0, 500) for key in rng.sample(METRICS, rng.randint(1, 5))},
+            }
+        )
+
+
+def _expected(store, year=None):
+    """The pre-rollup readers: stream every hourly doc."""
+    totals = {key: 0 for key in METRICS}
+    history = {}
+    for path, data in store.docs.items():
+        if path[-2] != 'hourly_usage' or (year is not None and data['year'] != year):
+            continue
+        bucket = f"{data['year']}-{data['month']:02d}-01" if year is not None else f"{data['year']}-01-01"
+        row = history.setdefault(bucket, {key: 0 for key in METRICS[:4]})
+        for key in METRICS:
+            totals[key] += data.get(key, 0)
+            if key in row:
+                row[key] += data.get(key, 0)
+    return totals, [{'date': date, **row} for date, row in sorted(history.items())]
+
+
+def _assert_matches(store, now):
+    totals, history = _expected(store)
+    result = user_usage.get_current_user_usage(UID, 'all_time')
+    assert result['all_time'] == totals and result['history'] == history
+    assert user_usage.get_yearly_history(UID) == history
+    for year in (now.year - 3, now.year - 1, now.year):
+        totals, history = _expected(store, year)
+        result = user_usage.get_current_user_usage(UID, 'yearly', now=now.replace(year=year, day=1))
+        assert result['yearly'] == totals and result['history'] == history
+        assert user_usage.get_monthly_history_for_year(UID, now.replace(year=year, day=1)) == history
+
+
+def test_rollups_match_hourly_streams_and_stop_rereading_sealed_months(store):
+    now = datetime.now(timezone.utc)
+    _seed_hours(store, random.Random(22), now, 4000)
+    hourly_docs = sum(path[-2] == 'hourly_usage' for path in store.docs)
+
+    _assert_matches(store, now)
+    assert store.reads[0] == hourly_docs + 1
+
+    _assert_matches(store, now)
+    rollups = sum(path[-2] == 'usage_rollups' for path in store.docs)
+    open_hours = sum(
+        path[-2] == 'hourly_usage' and (data['year'], data['month']) > user_usage._last_sealed_month(now)
+        for path, data in store.docs.items()
+    )
+    assert store.reads[-1] == 1 + rollups + open_hours < hourly_docs / 10
+
+
+def test_late_writes_to_sealed_months_rebuild_their_rollup(store):
+    now = datetime.now(timezone.utc)
+    _seed_hours(store, random.Random(4), now, 800)
+    _assert_matches(store, now)
+
+    user_usage.update_hourly_usage(UID, now - timedelta(days=95), {'transcription_seconds': 7, 'speech_seconds': 3})
+    user_usage.batch_update_hourly_usage(
+        UID,
+        {
+            now - timedelta(days=400): {'words_transcribed': 11},
+            now - timedelta(days=700): {'insights_gained': 2, 'memories_created': 1},
+        },
+    )
+
+    stale = [path for path, data in store.docs.items() if path[-2] == 'usage_rollups' and 'stale_at' in data]
+    assert len(stale) == 3
+    _assert_matches(store, now)
+
+    # Rebuilt inside the clock margin they stay stale; once the writes are older, the rebuild sticks.
+    assert not any(user_usage._rollup_is_fresh(store.docs[path]) for path in stale)
+    for path in stale:
+        store.docs[path]['stale_at'] -= 2 * user_usage._ROLLUP_CLOCK_MARGIN
+    _assert_matches(store, now)
+    assert all(user_usage._rollup_is_fresh(store.docs[path]) for path in stale)
+
+
+def test_rebuild_that_raced_a_late_write_stays_stale(store):
+    now = datetime.now(timezone.utc)
+    _seed_hours(store, random.Random(9), now, 300)
+    _assert_matches(store, now)
+    late = now - timedelta(days=200)
+    rollup_path = ('users', UID, 'usage_rollups', f'{late.year}-{late.month:02d}')
+
+    # The hourly write landed after the reader's snapshot, but its rollup was saved afterwards.
+    user_usage.update_hourly_usage(UID, late, {'memories_created': 5})
+    store.docs[rollup_path]['built_from'] = datetime.now(timezone.utc) - user_usage._ROLLUP_CLOCK_MARGIN
+
+    assert not user_usage._rollup_is_fresh(store.docs[rollup_path])
+    _assert_matches(store, now)
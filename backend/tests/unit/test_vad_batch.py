@@ -0,0 +1,203 @@
+"""Unit tests for the cross-session VAD batch scheduler (utils/stt/vad_batch.py)."""
+
+import asyncio
+import struct
+from unittest.mock import MagicMock, patch
+
+import numpy as np
+import pytest
+
+from utils.stt import vad_batch
+from utils.stt.vad import VAD_CONTEXT_SAMPLES, VAD_WINDOW_SAMPLES, make_fresh_state, run_vad_window
+from utils.stt.vad_batch import VADBatchScheduler
+from utils.stt.vad_gate import GatedSTTSocket, VADStreamingGate
+
+
+def _tone_windows(n_windows: int, freq_hz: float, amplitude: float = 0.5) -> np.ndarray:
+    t = np.arange(n_windows * VAD_WINDOW_SAMPLES) / 16000
+    samples = (np.sin(2 * np.pi * freq_hz * t) * amplitude).astype(np.float32)
+    return samples.reshape(n_windows, VAD_WINDOW_SAMPLES)
+
+
+def _sequential(windows, state, context):
+    probs = []
+    for window in windows:
+        prob, state, context = run_vad_window(window, state, context)
+        probs.append(prob)
+    return np.array(probs, dtype=np.float32), state, context
+
+
+class _RecordingBatch:
+    """Fake run_vad_batch: prob = window mean + carried state, state counts windows."""
+
+    def __init__(self):
+        self.batch_sizes = []
+
+    def __call__(self, windows, states, contexts):
+        self.batch_sizes.append(len(windows))
+        probs = windows.mean(axis=1) + states[0, :, 0]
+        return probs.astype(np.float32), states + 1.0, windows[:, -VAD_CONTEXT_SAMPLES:]
+
+
+class TestVADBatchScheduler:
+    @pytest.mark.asyncio
+    async def test_batched_streams_match_sequential_inference(self):
+        """Real Silero: concurrent gates with unequal window counts match per-gate calls."""
+        scheduler = VADBatchScheduler(max_batch_size=8, max_delay_ms=1)
+        inputs = [
+            (_tone_windows(3, 220.0), *make_fresh_state()),
+            (_tone_windows(1, 440.0, 0.05), *make_fresh_state()),
+            (_tone_windows(2, 0.0), *make_fresh_state()),
+        ]
+
+        results = await asyncio.gather(*(scheduler.infer(*args) for args in inputs))
+
+        for args, (probs, state, context) in zip(inputs, results):
+            expected_probs, expected_state, expected_context = _sequential(*args)
+            np.testing.assert_allclose(probs, expected_probs, atol=1e-5)
+            np.testing.assert_allclose(state, expected_state, atol=1e-5)
+            np.testing.assert_array_equal(context, expected_context)
+            assert state.shape == (2, 1, 128)
+            assert context.shape == (1, VAD_CONTEXT_SAMPLES)
+        # Three window steps, each one ORT call shared by every stream still running.
+        assert scheduler.batches_total == 3
+        assert scheduler.windows_total == 6
+        assert scheduler.max_batch_seen == 3
+
+    @pytest.mark.asyncio
+    async def test_state_threads_through_each_stream_lane(self):
+        fake = _RecordingBatch()
+        scheduler = VADBatchScheduler(max_batch_size=8, max_delay_ms=1)
+        long_windows = np.full((3, VAD_WINDOW_SAMPLES), 0.1, dtype=np.float32)
+        short_windows = np.full((1, VAD_WINDOW_SAMPLES), 0.2, dtype=np.float32)
+
+        with patch('utils.stt.vad_batch.run_vad_batch', side_effect=fake):
+            (long_probs, long_state, _), (short_probs, short_state, _) = await asyncio.gather(
+                scheduler.infer(long_windows, *make_fresh_state()),
+                scheduler.infer(short_windows, *make_fresh_state()),
+            )
+
+        np.testing.assert_allclose(long_probs, [0.1, 1.1, 2.1], atol=1e-6)
+        np.testing.assert_allclose(short_probs, [0.2], atol=1e-6)
+        assert long_state[0, 0, 0] == 3.0
+        assert short_state[0, 0, 0] == 1.0
+        assert fake.batch_sizes == [2, 1, 1]
+
+    @pytest.mark.asyncio
+    async def test_full_batch_flushes_without_waiting_for_delay(self):
+        fake = _RecordingBatch()
+        scheduler = VADBatchScheduler(max_batch_size=2, max_delay_ms=60_000)
+        windows = np.zeros((1, VAD_WINDOW_SAMPLES), dtype=np.float32)
+
+        with patch('utils.stt.vad_batch.run_vad_batch', side_effect=fake):
+            await asyncio.wait_for(
+                asyncio.gather(
+                    scheduler.infer(windows, *make_fresh_state()),
+                    scheduler.infer(windows, *make_fresh_state()),
+                ),
+                timeout=1.0,
+            )
+
+        assert fake.batch_sizes == [2]
+
+    @pytest.mark.asyncio
+    async def test_inference_failure_reaches_every_waiting_gate(self):
+        scheduler = VADBatchScheduler(max_batch_size=8, max_delay_ms=1)
+        windows = np.zeros((1, VAD_WINDOW_SAMPLES), dtype=np.float32)
+
+        with patch('utils.stt.vad_batch.run_vad_batch', side_effect=RuntimeError('ort failure')):
+            results = await asyncio.gather(
+                scheduler.infer(windows, *make_fresh_state()),
+                scheduler.infer(windows, *make_fresh_state()),
+                return_exceptions=True,
+            )
+
+        assert all(isinstance(result, RuntimeError) for result in results)
+
+    @pytest.mark.asyncio
+    async def test_interrupted_flush_resolves_taken_windows_and_requeues_the_rest(self):
+        """A flush cancelled mid-batch must not leave the gates it dequeued waiting forever."""
+        fake = _RecordingBatch()
+        scheduler = VADBatchScheduler(max_batch_size=8, max_delay_ms=60_000)
+        windows = np.zeros((1, VAD_WINDOW_SAMPLES), dtype=np.float32)
+        calls = []
+
+        def cancelled_once(*args):
+            calls.append(1)
+            if len(calls) == 1:
+                raise asyncio.CancelledError()
+            return fake(*args)
+
+        with patch('utils.stt.vad_batch.run_vad_batch', side_effect=cancelled_once):
+            taken = [asyncio.ensure_future(scheduler.infer(windows, *make_fresh_state())) for _ in range(2)]
+            queued = asyncio.ensure_future(scheduler.infer(windows, *make_fresh_state()))
+            await asyncio.sleep(0)
+            # Two streams per batch: the first batch is taken, the third stream still queued.
+            scheduler.max_batch_size = 2
+            with pytest.raises(asyncio.CancelledError):
+                scheduler._flush()
+            results = await asyncio.wait_for(asyncio.gather(*taken, queued, return_exceptions=True), timeout=1.0)
+
+        assert all(isinstance(result, RuntimeError) for result in results[:2])
+        assert isinstance(results[2], tuple)
+        assert fake.batch_sizes == [1]
+
+    @pytest.mark.asyncio
+    async def test_scheduler_disabled_by_default(self):
+        assert vad_batch.get_vad_batch_scheduler() is None
+
+    @pytest.mark.asyncio
+    async def test_scheduler_is_shared_per_event_loop(self):
+        with patch.object(vad_batch, 'VAD_GATE_BATCH_ENABLED', True):
+            assert vad_batch.get_vad_batch_scheduler() is vad_batch.get_vad_batch_scheduler()
+
+
+class TestGatedSocketBatchedSend:
+    @staticmethod
+    def _pcm(duration_ms: int, amplitude: int) -> bytes:
+        n_samples = 16 * duration_ms
+        return struct.pack(f'<{n_samples}h', *([amplitude] * n_samples))
+
+    @pytest.mark.asyncio
+    async def test_send_async_matches_sync_gate_decisions(self):
+        """Batched gates make the same per-chunk decisions as the inline path."""
+        chunks = [self._pcm(30, 0)] * 4 + [self._pcm(30, 8000)] * 6 + [self._pcm(30, 0)] * 4
+
+        def _fake_window(window, state, context):
+            return (0.9 if window.mean() > 0.1 else 0.1), state, context
+
+        def _fake_batch(windows, states, contexts):
+            return np.where(windows.mean(axis=1) > 0.1, 0.9, 0.1), states, windows[:, -VAD_CONTEXT_SAMPLES:]
+
+        with (
+            patch('utils.stt.vad_gate.run_vad_window', side_effect=_fake_window),
+            patch('utils.stt.vad_batch.run_vad_batch', side_effect=_fake_batch),
+        ):
+            sync_conn, batched_conn = MagicMock(), MagicMock()
+            sync_conn.is_connection_dead = batched_conn.is_connection_dead = False
+            sync_conn.send.return_value = batched_conn.send.return_value = True
+            sync_socket = GatedSTTSocket(sync_conn, gate=VADStreamingGate(mode='active'))
+            batched_socket = GatedSTTSocket(batched_conn, gate=VADStreamingGate(mode='active'))
+            scheduler = VADBatchScheduler(max_batch_size=8, max_delay_ms=1)
+
+            with patch('utils.stt.vad_gate.get_vad_batch_scheduler', return_value=scheduler):
+                for i, chunk in enumerate(chunks):
+                    assert sync_socket.send(chunk, wall_time=100.0 + i * 0.03) is True
+                    assert await batched_socket.send_async(chunk, wall_time=100.0 + i * 0.03) is True
+
+        assert batched_conn.send.call_args_list == sync_conn.send.call_args_list
+        assert batched_socket.get_metrics() == sync_socket.get_metrics()
+        assert scheduler.windows_total > 0
+
+    @pytest.mark.asyncio
+    async def test_send_async_without_scheduler_uses_inline_vad(self):
+        conn = MagicMock()
+        conn.is_connection_dead = False
+        gate = MagicMock(spec=VADStreamingGate)
+        gate.process_audio.return_value = MagicMock(audio_to_send=b'', should_finalize=False)
+        socket = GatedSTTSocket(conn, gate=gate)
+
+        assert await socket.send_async(b'\x00\x00' * 160) is True
+
+        gate.process_audio.assert_called_once()
+        gate.process_audio_async.assert_not_called()
@@ -1487,6 +1487,67 @@ class TestTimeBasedPreRoll:
         assert len(out.audio_to_send) > len(_make_pcm(30))  # More than just current chunk
         assert gate._pre_roll_total_ms == 0.0  # Pre-roll should be cleared
 
+    def test_preroll_is_sample_accurate(self):
+        """Onset replays exactly the last pre_roll_ms of input, cut inside the oldest chunk."""
+        gate = self._make_gate()
+        stream = bytes(range(256)) * 85  # 17 chunks of 40ms, distinguishable content
+        _set_vad_speech(False)
+        for i in range(0, 16 * 1280, 1280):  # 40ms chunks
+            gate.process_audio(stream[i : i + 1280], 1000.0 + i / 32000)
+        assert gate._pre_roll_total_ms == pytest.approx(gate._pre_roll_ms)
+
+        _set_vad_speech(True)
+        out = gate.process_audio(stream[16 * 1280 :], 1000.7)
+        assert out.audio_to_send == stream[-9600:]  # 300ms = 4800 samples
+
+    def test_preroll_keeps_whole_chunk_longer_than_budget(self):
+        gate = self._make_gate()
+        _set_vad_speech(False)
+        gate.process_audio(_make_pcm(200), 1000.0)
+        _set_vad_speech(True)
+        long_chunk = bytes(range(256)) * 125  # 1s
+        out = gate.process_audio(long_chunk, 1000.2)
+        assert out.audio_to_send == long_chunk
+
+    def test_preroll_starts_on_a_frame_boundary(self):
+        """Chunks split mid-sample must not shift the replayed pre-roll by a byte."""
+        gate = self._make_gate()
+        stream = struct.pack('<24000h', *range(-12000, 12000))
+        _set_vad_speech(False)
+        offset = 0
+        for size in [701, 1283, 999, 2001, 1500, 3333]:
+            gate.process_audio(stream[offset : offset + size], 1000.0 + offset / 32000)
+            offset += size
+        _set_vad_speech(True)
+        out = gate.process_audio(stream[offset : offset + 641], 1001.0)
+        offset += 641
+        assert offset % 2 == 0
+        assert len(out.audio_to_send) % 2 == 0
+        assert out.audio_to_send == stream[offset - len(out.audio_to_send) : offset]
+        assert abs(len(out.audio_to_send) - 9600) <= 1
+
+    def test_resampled_vad_windows_match_np_interp(self):
+        """The cached resample plan feeds the model the same windows as np.interp."""
+        rng = np.random.default_rng(19)
+        for sample_rate in (8000, 44100, 48000):
+            pcm = rng.integers(-32768, 32767, size=sample_rate, dtype=np.int16)
+            gate = VADStreamingGate(sample_rate=sample_rate, channels=1, mode='active')
+            chunk = sample_rate // 50
+            windows = [gate._take_vad_windows(pcm[i : i + chunk].tobytes()).copy() for i in range(0, len(pcm), chunk)]
+
+            expected = []
+            for i in range(0, len(pcm), chunk):
+                part = pcm[i : i + chunk]
+                n_out = int(len(part) * 16000 / sample_rate)
+                resampled = np.interp(
+                    np.linspace(0, len(part) - 1, n_out), np.arange(len(part)), part.astype(np.float64)
+                )
+                expected.append(resampled.astype(np.int16))
+            flat = np.concatenate(expected).astype(np.float32) / 32768.0
+            got = np.concatenate(windows).reshape(-1)
+            assert np.array_equal(got, flat[: len(got)])
+            assert len(flat) - len(got) < 512
+
 
 class TestMapperMonotonicity:
     """Property-style invariant tests for DgWallMapper."""
@@ -3,6 +3,7 @@
 Covers:
 - vad_is_empty() hosted success, hosted failure → ONNX fallback, cache behavior
 - _run_file_vad() segment generation, empty/short file, threshold/window boundaries
+- batched multi-stream file VAD parity with the per-window path
 - ONNX session singleton wiring
 """
 
@@ -87,44 +88,55 @@ def _write_wav_file(path: str, duration_sec: float, freq_hz: float = 0.0):
         f.write(data)
 
 
-def _mock_run_vad_window_speech(window, state, context):
-    """Mock that always detects speech (prob=0.9)."""
-    new_state = state.copy()
-    new_state += 0.01
-    new_context = context.copy()
-    return 0.9, new_state, new_context
+class _PatternSession:
+    """Fake ORT session that follows a per-window speech/silence pattern.
 
-
-def _mock_run_vad_window_silence(window, state, context):
-    """Mock that never detects speech (prob=0.1)."""
-    new_state = state.copy()
-    new_context = context.copy()
-    return 0.1, new_state, new_context
-
-
-def _mock_run_vad_window_pattern(pattern):
-    """Return a mock that follows a per-window speech/silence pattern.
-
-    pattern: list of bools — True=speech, False=silence.
-    Repeats the last value for windows beyond the pattern length.
+    pattern: list of bools — True=speech, False=silence. Every stream in a
+    batched call sees the same pattern; the last value repeats beyond its end.
     """
-    call_count = [0]
-
-    def _fn(window, state, context):
-        idx = call_count[0]
-        call_count[0] += 1
-        is_speech = pattern[idx] if idx < len(pattern) else pattern[-1]
-        new_state = state.copy()
-        new_state += 0.01
-        new_context = context.copy()
-        return (0.9 if is_speech else 0.1), new_state, new_context
-
-    return _fn
-
 
-def _mock_make_fresh_state():
-    """Return (state, context) tuple matching make_fresh_state signature."""
-    return np.zeros(_STATE_SHAPE, dtype=np.float32), np.zeros((1, VAD_CONTEXT_SAMPLES), dtype=np.float32)
+    def __init__(self, pattern):
+        self.pattern = pattern
+        self.calls = 0
+
+    def run(self, _output_names, feed):
+        idx = self.calls
+        self.calls += 1
+        is_speech = self.pattern[idx] if idx < len(self.pattern) else self.pattern[-1]
+        batch = feed['input'].shape[0]
+        assert feed['input'].shape == (batch, VAD_CONTEXT_SAMPLES + VAD_WINDOW_SAMPLES)
+        assert feed['state'].shape == (2, batch, 128)
+        return np.full((batch, 1), 0.9 if is_speech else 0.1, dtype=np.float32), feed['state'] + 0.01
+
+
+def _mock_session_speech():
+    """Session that always detects speech (prob=0.9)."""
+    return _PatternSession([True])
+
+
+def _mock_session_silence():
+    """Session that never detects speech (prob=0.1)."""
+    return _PatternSession([False])
+
+
+def _legacy_segments(flags):
+    """Reference per-window flag loop the vectorized segment extraction replaced."""
+    window_sec = VAD_WINDOW_SAMPLES / VAD_SAMPLE_RATE
+    segments = []
+    in_speech = False
+    start = 0.0
+    for i, flag in enumerate(flags):
+        t = i * window_sec
+        if flag and not in_speech:
+            in_speech = True
+            start = t
+        elif not flag and in_speech:
+            in_speech = False
+            segments.append({'start': start, 'end': t, 'duration': t - start})
+    if in_speech:
+        end = len(flags) * window_sec
+        segments.append({'start': start, 'end': end, 'duration': end - start})
+    return segments
 
 
 # ---------------------------------------------------------------------------
@@ -424,9 +436,8 @@ class TestVadIsEmptyCache:
 class TestRunFileVad:
     """_run_file_vad() processes audio files through ONNX Silero VAD."""
 
-    @patch('utils.stt.vad.run_vad_window', side_effect=_mock_run_vad_window_silence)
-    @patch('utils.stt.vad.make_fresh_state', side_effect=_mock_make_fresh_state)
-    def test_silence_returns_empty(self, mock_state, mock_vad, tmp_wav_dir):
+    @patch('utils.stt.vad._get_ort_session', side_effect=_mock_session_silence)
+    def test_silence_returns_empty(self, mock_sess, tmp_wav_dir):
         """Silent audio produces no segments."""
         wav_path = str(tmp_wav_dir / 'silence.wav')
         _write_wav_file(wav_path, 0.5)
@@ -434,9 +445,8 @@ class TestRunFileVad:
         segments = _run_file_vad(wav_path)
         assert segments == []
 
-    @patch('utils.stt.vad.run_vad_window', side_effect=_mock_run_vad_window_speech)
-    @patch('utils.stt.vad.make_fresh_state', side_effect=_mock_make_fresh_state)
-    def test_all_speech_single_segment(self, mock_state, mock_vad, tmp_wav_dir):
+    @patch('utils.stt.vad._get_ort_session', side_effect=_mock_session_speech)
+    def test_all_speech_single_segment(self, mock_sess, tmp_wav_dir):
         """Audio with all-speech produces one segment spanning the whole file."""
         wav_path = str(tmp_wav_dir / 'speech.wav')
         _write_wav_file(wav_path, 0.1, freq_hz=440.0)
@@ -447,8 +457,7 @@ class TestRunFileVad:
         assert segments[0]['end'] > 0
         assert segments[0]['duration'] > 0
 
-    @patch('utils.stt.vad.make_fresh_state', side_effect=_mock_make_fresh_state)
-    def test_speech_silence_speech_produces_two_segments(self, mock_state, tmp_wav_dir):
+    def test_speech_silence_speech_produces_two_segments(self, tmp_wav_dir):
         """Speech-silence-speech pattern produces two segments."""
         wav_path = str(tmp_wav_dir / 'pattern.wav')
         # 0.5s = ~15 windows at 512 samples/16kHz (32ms each)
@@ -456,9 +465,7 @@ class TestRunFileVad:
 
         # Pattern: 2 speech, 2 silence, 2 speech
         pattern = [True, True, False, False, True, True]
-        mock_fn = _mock_run_vad_window_pattern(pattern)
-
-        with patch('utils.stt.vad.run_vad_window', side_effect=mock_fn):
+        with patch('utils.stt.vad._get_ort_session', return_value=_PatternSession(pattern)):
             segments = _run_file_vad(wav_path)
 
         assert len(segments) == 2
@@ -490,18 +497,16 @@ class TestRunFileVad:
         with pytest.raises(VADAudioDecodeError):
             vad_is_empty_strict(bad_path)
 
-    @patch('utils.stt.vad.run_vad_window', side_effect=_mock_run_vad_window_silence)
-    @patch('utils.stt.vad.make_fresh_state', side_effect=_mock_make_fresh_state)
-    def test_strict_valid_silence_returns_true(self, mock_state, mock_vad, tmp_wav_dir):
+    @patch('utils.stt.vad._get_ort_session', side_effect=_mock_session_silence)
+    def test_strict_valid_silence_returns_true(self, mock_sess, tmp_wav_dir):
         """A successfully decoded, VAD-negative file remains expected silence."""
         wav_path = str(tmp_wav_dir / 'strict-silence.wav')
         _write_wav_file(wav_path, 0.1)
 
         assert vad_is_empty_strict(wav_path) is True
 
-    @patch('utils.stt.vad.run_vad_window', side_effect=RuntimeError('VAD inference failed'))
-    @patch('utils.stt.vad.make_fresh_state', side_effect=_mock_make_fresh_state)
-    def test_strict_inference_failure_propagates(self, mock_state, mock_vad, tmp_wav_dir):
+    @patch('utils.stt.vad._get_ort_session', side_effect=RuntimeError('VAD inference failed'))
+    def test_strict_inference_failure_propagates(self, mock_sess, tmp_wav_dir):
         """Strict eligibility never converts an inference failure into silence."""
         wav_path = str(tmp_wav_dir / 'strict-inference.wav')
         _write_wav_file(wav_path, 0.1, freq_hz=440.0)
@@ -509,9 +514,8 @@ class TestRunFileVad:
         with pytest.raises(VADProcessingError, match='local VAD could not evaluate audio'):
             vad_is_empty_strict(wav_path)
 
-    @patch('utils.stt.vad.run_vad_window', side_effect=_mock_run_vad_window_speech)
-    @patch('utils.stt.vad.make_fresh_state', side_effect=_mock_make_fresh_state)
-    def test_short_file_fewer_than_one_window(self, mock_state, mock_vad, tmp_wav_dir):
+    @patch('utils.stt.vad._get_ort_session', side_effect=_mock_session_speech)
+    def test_short_file_fewer_than_one_window(self, mock_sess, tmp_wav_dir):
         """File shorter than one 512-sample window produces no segments."""
         wav_path = str(tmp_wav_dir / 'tiny.wav')
         # 511 samples at 16kHz = ~31.9ms, just under one 512-sample window
@@ -521,19 +525,16 @@ class TestRunFileVad:
         segments = _run_file_vad(wav_path)
         # Less than one full window → no windows processed → no segments
         assert segments == []
-        mock_vad.assert_not_called()
+        mock_sess.assert_not_called()
 
-    @patch('utils.stt.vad.make_fresh_state', side_effect=_mock_make_fresh_state)
-    def test_open_segment_closed_at_end(self, mock_state, tmp_wav_dir):
+    def test_open_segment_closed_at_end(self, tmp_wav_dir):
         """Speech at end of file is properly closed."""
         wav_path = str(tmp_wav_dir / 'trail.wav')
         _write_wav_file(wav_path, 0.2, freq_hz=440.0)
 
         # Pattern: silence then speech (not closed by silence)
         pattern = [False, True, True]
-        mock_fn = _mock_run_vad_window_pattern(pattern)
-
-        with patch('utils.stt.vad.run_vad_window', side_effect=mock_fn):
+        with patch('utils.stt.vad._get_ort_session', return_value=_PatternSession(pattern)):
             segments = _run_file_vad(wav_path)
 
         assert len(segments) == 1
@@ -542,6 +543,97 @@ class TestRunFileVad:
         assert abs(segments[0]['start'] - window_sec) < 1e-6
 
 
+# ---------------------------------------------------------------------------
+# Tests: batched file VAD
+# ---------------------------------------------------------------------------
+
+
+class TestBatchedFileVad:
+    """Batched Silero inference must match the sequential per-window path."""
+
+    def test_vectorized_segments_match_flag_loop(self):
+        rng = np.random.default_rng(7)
+        for length in (0, 1, 2, 17, 300):
+            for density in (0.0, 0.3, 0.8, 1.0):
+                flags = rng.random(length) < density
+                assert vad._segments_from_speech_flags(flags) == _legacy_segments(flags.tolist())
+
+    def test_batched_probabilities_match_sequential_windows(self):
+        rng = np.random.default_rng(3)
+        t = np.arange(VAD_WINDOW_SAMPLES * 24) / VAD_SAMPLE_RATE
+        tone = (np.sin(2 * np.pi * 220 * t) * 0.5).astype(np.float32)
+        streams = [
+            tone,
+            (rng.standard_normal(VAD_WINDOW_SAMPLES * 9 + 100) * 0.05).astype(np.float32),
+            np.zeros(VAD_WINDOW_SAMPLES - 1, dtype=np.float32),
+            tone[: VAD_WINDOW_SAMPLES * 15],
+        ]
+
+        batched = vad._speech_probabilities_batch(streams)
+
+        for samples, probs in zip(streams, batched):
+            state, context = make_fresh_state()
+            expected = []
+            for offset in range(0, len(samples) - VAD_WINDOW_SAMPLES + 1, VAD_WINDOW_SAMPLES):
+                prob, state, context = run_vad_window(samples[offset : offset + VAD_WINDOW_SAMPLES], state, context)
+                expected.append(prob)
+            assert len(probs) == len(expected)
+            np.testing.assert_allclose(probs, expected, atol=1e-5)
+
+    def test_run_files_vad_preserves_order_and_skips_unreadable(self, tmp_wav_dir):
+        speech = str(tmp_wav_dir / 'speech.wav')
+        silence = str(tmp_wav_dir / 'silence.wav')
+        corrupt = str(tmp_wav_dir / 'corrupt.wav')
+        _write_wav_file(speech, 0.2, freq_hz=440.0)
+        _write_wav_file(silence, 0.1)
+        with open(corrupt, 'wb') as f:
+            f.write(b'NOT A WAV FILE')
+
+        session = _PatternSession([True])
+        with patch('utils.stt.vad._get_ort_session', return_value=session):
+            results = vad.run_files_vad([speech, corrupt, silence, speech], max_batch_streams=2)
+
+        assert results[1] == []
+        assert results[0] == results[3] == _legacy_segments([True] * (3200 // VAD_WINDOW_SAMPLES))
+        assert results[2] == _legacy_segments([True] * (1600 // VAD_WINDOW_SAMPLES))
+        # Two groups of two streams; each group costs one call per window of its longest file.
+        assert session.calls == 2 * (3200 // VAD_WINDOW_SAMPLES)
+
+    @patch.object(vad, 'redis_db')
+    def test_run_files_vad_reuses_and_fills_the_vad_is_empty_cache(self, mock_redis, tmp_wav_dir):
+        cached_path = str(tmp_wav_dir / 'cached.wav')
+        speech = str(tmp_wav_dir / 'speech.wav')
+        _write_wav_file(speech, 0.2, freq_hz=440.0)
+        cached = [{'start': 0.0, 'end': 1.0, 'duration': 1.0}]
+        mock_redis.get_generic_cache.side_effect = lambda key: cached if key == f'vad_is_empty:{cached_path}' else None
+
+        session = _PatternSession([True])
+        with patch('utils.stt.vad._get_ort_session', return_value=session):
+            results = vad.run_files_vad([cached_path, speech], cache=True)
+
+        expected = _legacy_segments([True] * (3200 // VAD_WINDOW_SAMPLES))
+        assert results == [cached, expected]
+        # Only the miss is decoded and run, then cached like vad_is_empty(cache=True) does.
+        assert session.calls == 3200 // VAD_WINDOW_SAMPLES
+        mock_redis.set_generic_cache.assert_called_once_with(f'vad_is_empty:{speech}', expected, ttl=60 * 60 * 24)
+
+    @patch('utils.stt.vad._get_ort_session')
+    def test_run_vad_batch_threads_per_stream_context(self, mock_get_sess):
+        mock_sess = MagicMock()
+        mock_sess.run.return_value = (np.array([[0.2], [0.7]], dtype=np.float32), np.ones((2, 2, 128), np.float32))
+        mock_get_sess.return_value = mock_sess
+        windows = np.arange(2 * VAD_WINDOW_SAMPLES, dtype=np.float32).reshape(2, VAD_WINDOW_SAMPLES)
+        states, contexts = vad.make_fresh_batch_state(2)
+
+        probs, new_states, new_contexts = vad.run_vad_batch(windows, states, contexts)
+
+        np.testing.assert_allclose(probs, [0.2, 0.7])
+        assert new_states.shape == (2, 2, 128)
+        np.testing.assert_array_equal(new_contexts, windows[:, -VAD_CONTEXT_SAMPLES:])
+        feed = mock_sess.run.call_args[0][1]
+        assert feed['input'].shape == (2, VAD_CONTEXT_SAMPLES + VAD_WINDOW_SAMPLES)
+
+
 # ---------------------------------------------------------------------------
 # Tests: ONNX session wiring
 # ---------------------------------------------------------------------------
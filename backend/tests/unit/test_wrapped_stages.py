@@ -0,0 +1,178 @@
+"""Wrapped generation as a stage graph: concurrent LLM stages, paged corpus, checkpointed retries."""
+
+import os
+import threading
+from datetime import datetime, timedelta, timezone
+from unittest.mock import MagicMock
+
+import pytest
+
+os.environ.setdefault(
+    "ENCRYPTION_SECRET",
+    "omi_ZwB2ZNqB2HHpMK6wStk7sTpavJiPTFg7gXUHnc4tFABPU6pZ2c2DKgehtfgi4RZv",
+)
+
+import utils.wrapped.generate_2025 as wrapped  # noqa: E402
+from utils.wrapped.stages import Stage, run_stages  # noqa: E402
+
+UID = "uid-wrapped"
+LLM_STAGE_FUNCTIONS = {
+    "decision_style": "_determine_archetype_with_llm",
+    "top_phrases": "_find_top_phrases_with_llm",
+    "memorable_days": "_analyze_memorable_days_with_llm",
+    "funniest_event": "_find_funniest_event_with_llm",
+    "most_embarrassing_event": "_find_most_embarrassing_event_with_llm",
+    "top_buddies": "_find_top_buddies_with_llm",
+    "obsessions": "_find_obsessions_with_llm",
+    "movie_recommendations": "_find_movie_recommendations_with_llm",
+    "struggles_wins": "_find_struggles_and_wins_with_llm",
+}
+LLM_STAGES = tuple(LLM_STAGE_FUNCTIONS)
+
+
+def test_independent_stages_run_concurrently_after_their_deps():
+    barrier = threading.Barrier(3, timeout=5)
+    order = []
+
+    def leaf(name):
+        def run(base):
+            order.append(name)
+            barrier.wait()
+            return f"{name}:{base}"
+
+        return run
+
+    stages = [Stage("base", lambda: order.append("base") or 1, checkpoint=False)]
+    stages += [Stage(name, leaf(name), deps=("base",)) for name in ("a", "b", "c")]
+
+    assert run_stages(stages, max_workers=3) == {"a": "a:1", "b": "b:1", "c": "c:1"}
+    assert order[0] == "base" and sorted(order[1:]) == ["a", "b", "c"]
+
+
+def test_checkpointed_stages_are_skipped_with_feeders_they_no_longer_need():
+    calls = []
+    saved = {}
+
+    def stage(name, deps=(), checkpoint=True):
+        return Stage(name, lambda **kwargs: calls.append(name) or name.upper(), deps=deps, checkpoint=checkpoint)
+
+    stages = [
+        stage("fetch", checkpoint=False),
+        stage("stats", deps=("fetch",)),
+        stage("llm", deps=("fetch", "stats")),
+    ]
+    assert run_stages(stages, max_workers=2, checkpoints={"stats": "S", "llm": "L"}) == {"stats": "S", "llm": "L"}
+    assert calls == []
+
+    result = run_stages(stages, max_workers=2, checkpoints={"stats": "S"}, save_checkpoint=saved.__setitem__)
+    assert result == {"stats": "S", "llm": "LLM"} and calls == ["fetch", "llm"] and saved == {"llm": "LLM"}
+
+    with pytest.raises(ValueError, match="cycle"):
+        run_stages([stage("x", deps=("y",)), stage("y", deps=("x",))], max_workers=1)
+
+
+def _conversation(created_at, title, seconds, category="work"):
+    return {
+        "id": f"c-{created_at.isoformat()}",
+        "created_at": created_at,
+        "started_at": created_at,
+        "finished_at": created_at + timedelta(seconds=seconds),
+        "status": "completed",
+        "discarded": False,
+        "structured": {"title": title, "overview": f"about {title}", "category": category},
+        "transcript_segments": [
+            {"text": "okay sounds good, i think we should", "is_user": True, "start": 0, "end": seconds}
+        ],
+    }
+
+
+@pytest.fixture
+def generation(monkeypatch):
+    base = datetime(2025, 12, 30, tzinfo=timezone.utc)
+    conversations = [_conversation(base - timedelta(days=day), f"Day {day}", 600 + day) for day in range(120)]
+    page_calls = []
+
+    def pages(uid, **kwargs):
+        page_calls.append(kwargs)
+        for start in range(0, len(conversations), kwargs["page_size"]):
+            yield conversations[start : start + kwargs["page_size"]]
+
+    checkpoints = {}
+    monkeypatch.setattr(wrapped.conversations_db, "iter_conversation_pages_in_range", pages)
+    monkeypatch.setattr(
+        wrapped.action_items_db, "get_action_items", lambda **kwargs: [{"completed": True}, {"completed": False}]
+    )
+    monkeypatch.setattr(wrapped.wrapped_db, "get_wrapped_stage_results", lambda uid, year, max_age: dict(checkpoints))
+    monkeypatch.setattr(
+        wrapped.wrapped_db,
+        "save_wrapped_stage_result",
+        lambda uid, year, name, value: checkpoints.update({name: value}),
+    )
+    for name in ("clear_wrapped_stage_results", "update_wrapped_status", "update_wrapped_progress"):
+        monkeypatch.setattr(wrapped.wrapped_db, name, MagicMock())
+    monkeypatch.setattr(wrapped, "send_notification", MagicMock())
+    monkeypatch.setattr(wrapped, "_CONVERSATION_PAGE_SIZE", 50)
+
+    contexts = {}
+
+    def fake_llm(name):
+        def run(corpus, stats=None):
+            contexts[name] = corpus.context()
+            if name == "struggles_wins":
+                return {"struggle": {"title": "s"}, "personal_win": {"title": "w"}}
+            return {"name": name}
+
+        return run
+
+    for stage, fn in LLM_STAGE_FUNCTIONS.items():
+        monkeypatch.setattr(wrapped, fn, fake_llm(stage))
+
+    return conversations, page_calls, checkpoints, contexts
+
+
+def _saved_result():
+    (call,) = wrapped.wrapped_db.update_wrapped_status.call_args_list
+    return call.kwargs["result"]
+
+
+def test_generation_streams_pages_and_shares_one_context(generation):
+    conversations, page_calls, checkpoints, contexts = generation
+
+    wrapped.generate_wrapped_2025(UID, 2025)
+
+    result = _saved_result()
+    assert page_calls[0]["max_conversations"] == wrapped._MAX_CONVERSATIONS
+    assert result["total_conversations"] == 120 and result["days_active"] == 120
+    assert result["total_time_hours"] == round(sum(600 + day for day in range(120)) / 3600, 1)
+    assert result["action_items_completion_rate"] == 0.5
+    assert result["signature_phrase"] == {"phrase": "sounds good", "count": wrapped._SIGNATURE_PHRASE_SAMPLE}
+    assert result["struggle"] == {"title": "s"} and result["top_buddies"] == {"name": "top_buddies"}
+
+    assert len(set(contexts.values())) == 1 and len(contexts) == len(LLM_STAGES)
+    (context,) = set(contexts.values())
+    assert context.startswith("[2025-12-30 00:00] Day 0: about Day 0") and context.count("\n\n") == 119
+    assert set(checkpoints) == {"stats", *LLM_STAGES}
+    wrapped.wrapped_db.clear_wrapped_stage_results.assert_called_once_with(UID, 2025)
+
+
+def test_retry_reruns_only_unfinished_stages(generation, monkeypatch):
+    _conversations, page_calls, checkpoints, contexts = generation
+    failures = [RuntimeError("firestore unavailable")]
+
+    def update_wrapped_status(uid, year, status, **kwargs):
+        if status == wrapped.WrappedStatus.DONE and failures:
+            raise failures.pop()
+
+    monkeypatch.setattr(wrapped.wrapped_db, "update_wrapped_status", MagicMock(side_effect=update_wrapped_status))
+
+    wrapped.generate_wrapped_2025(UID, 2025)
+    assert set(checkpoints) == {"stats", *LLM_STAGES} and len(page_calls) == 1
+    wrapped.wrapped_db.clear_wrapped_stage_results.assert_not_called()
+
+    contexts.clear()
+    wrapped.generate_wrapped_2025(UID, 2025)
+    assert contexts == {} and len(page_calls) == 1, "a fully checkpointed retry neither refetches nor calls the LLM"
+
+    del checkpoints["funniest_event"]
+    wrapped.generate_wrapped_2025(UID, 2025)
+    assert set(contexts) == {"funniest_event"} and len(page_calls) == 2
@@ -1,6 +1,6 @@
 import asyncio
 import threading
-from typing import List
+from typing import Callable, List
 import os
 import time
 
@@ -165,6 +165,148 @@ def _handle_webhook_health_action(app_id: str, action: int, error: str):
         )
 
 
+# Realtime fan-out runs on every transcript tick (~600 ms) and audio-bytes flush
+# of a listen session, so a session snapshots the per-tick lookups instead of
+# repeating them for every delivery.
+_FANOUT_APPS_TTL_SECONDS = 30  # bound on catalog changes (webhook URL edits) reaching a live session
+_FANOUT_PIN_TTL_SECONDS = 60
+_FANOUT_PIN_REJECT_TTL_SECONDS = 10
+_FANOUT_HEALTH_FLUSH_SECONDS = 30  # below the 60s success debounce in database.webhook_health
+
+
+class RealtimeFanoutSession:
+    """Per listen/pusher session state for realtime app fan-out.
+
+    - Subscriptions: the user's enabled realtime apps are rebuilt from
+      ``get_available_apps`` only when the Redis enabled-app set changes (so
+      enabling/disabling an app from any service applies on the next tick) or
+      after ``_FANOUT_APPS_TTL_SECONDS``; ``invalidate()`` forces a rebuild.
+    - DNS pins: ``safe_request_target`` results are reused for
+      ``_FANOUT_PIN_TTL_SECONDS``. Requests still go to the validated, pinned
+      IP, so rebinding the hostname meanwhile has no effect; the TTL only
+      bounds how long a legitimate DNS change takes to be picked up.
+    - Webhook health: successes are collected and written once per app every
+      ``_FANOUT_HEALTH_FLUSH_SECONDS``. Failures are written immediately (they
+      drive warnings and auto-disable), after any pending success for the same
+      app so the health script sees events in order.
+    - Usage history: one ``record_app_usage`` write per app and conversation.
+
+    Owned by one event loop; call ``close()`` when the session ends.
+    """
+
+    def __init__(self, uid: str, clock: Callable[[], float] = time.monotonic):
+        self.uid = uid
+        self._clock = clock
+        self._apps_lock = threading.Lock()
+        self._apps: tuple[float, frozenset[str], List[App]] | None = None
+        self._pins: dict[str, tuple[float, asyncio.Future]] = {}
+        self._pending_successes: set[str] = set()
+        self._last_flush = clock()
+        self._usage_recorded: set[tuple[str, str]] = set()
+
+    def invalidate(self) -> None:
+        with self._apps_lock:
+            self._apps = None
+
+    def _active_apps(self, predicate: Callable[[App], bool]) -> List[App]:
+        enabled = frozenset(redis_db.get_enabled_apps(self.uid))
+        now = self._clock()
+        with self._apps_lock:
+            snapshot = self._apps
+        if snapshot is None or snapshot[1] != enabled or now - snapshot[0] >= _FANOUT_APPS_TTL_SECONDS:
+            apps = [app for app in get_available_apps(self.uid) if app.enabled]
+            snapshot = (now, enabled, apps)
+            with self._apps_lock:
+                self._apps = snapshot
+        return [app for app in snapshot[2] if predicate(app) and not is_app_webhook_disabled(app.id)]
+
+    async def active_apps(self, predicate: Callable[[App], bool]) -> List[App]:
+        """Enabled apps matching ``predicate`` whose webhook is not auto-disabled."""
+        return await run_blocking(db_executor, self._active_apps, predicate)
+
+    async def request_target(self, url: str) -> tuple[str, dict]:
+        """``safe_request_target`` for ``url``, reusing a recent pin; concurrent callers share one lookup."""
+        now = self._clock()
+        entry = self._pins.get(url)
+        if entry is None or entry[0] <= now:
+            future = asyncio.ensure_future(run_blocking(db_executor, safe_request_target, url))
+            entry = (now + _FANOUT_PIN_TTL_SECONDS, future)
+            self._pins[url] = entry
+        try:
+            return await asyncio.shield(entry[1])
+        except UnsafeWebhookURLError:
+            if self._pins.get(url) is entry:
+                self._pins[url] = (min(entry[0], now + _FANOUT_PIN_REJECT_TTL_SECONDS), entry[1])
+            raise
+        except Exception:
+            if self._pins.get(url) is entry:
+                del self._pins[url]
+            raise
+
+    def record_success(self, app_id: str) -> None:
+        self._pending_successes.add(app_id)
+
+    def _write_failure(self, app_id: str, flush_success: bool, status_code: int, error: str) -> int:
+        if flush_success:
+            record_app_webhook_success(app_id)
+        return record_app_webhook_failure(app_id, status_code, error)
+
+    async def record_failure(self, app_id: str, status_code: int, error: str) -> int:
+        flush_success = app_id in self._pending_successes
+        self._pending_successes.discard(app_id)
+        action = await run_blocking(db_executor, self._write_failure, app_id, flush_success, status_code, error)
+        if action == ACTION_DISABLE:
+            self.invalidate()
+        return action
+
+    def first_usage(self, app_id: str, conversation_id: str) -> bool:
+        key = (app_id, conversation_id)
+        if key in self._usage_recorded:
+            return False
+        self._usage_recorded.add(key)
+        return True
+
+    @staticmethod
+    def _write_successes(app_ids: list[str]) -> None:
+        for app_id in app_ids:
+            record_app_webhook_success(app_id)
+
+    async def flush(self) -> None:
+        self._last_flush = self._clock()
+        if not self._pending_successes:
+            return
+        app_ids = sorted(self._pending_successes)
+        self._pending_successes.clear()
+        await run_blocking(db_executor, self._write_successes, app_ids)
+
+    async def maybe_flush(self) -> None:
+        if self._pending_successes and self._clock() - self._last_flush >= _FANOUT_HEALTH_FLUSH_SECONDS:
+            await self.flush()
+
+    async def close(self) -> None:
+        try:
+            await self.flush()
+        except Exception as e:
+            logger.warning('Realtime fan-out health flush failed uid=%s: %s', self.uid, type(e).__name__)
+
+
+async def _record_delivery_failure(
+    fanout: RealtimeFanoutSession | None, app_id: str, status_code: int, error_str: str
+) -> None:
+    if fanout is not None:
+        action = await fanout.record_failure(app_id, status_code, error_str)
+    else:
+        action = await run_blocking(db_executor, record_app_webhook_failure, app_id, status_code, error_str)
+    await run_blocking(db_executor, _handle_webhook_health_action, app_id, action, error_str)
+
+
+async def _record_delivery_success(fanout: RealtimeFanoutSession | None, app_id: str) -> None:
+    if fanout is not None:
+        fanout.record_success(app_id)
+    else:
+        await run_blocking(db_executor, record_app_webhook_success, app_id)
+
+
 PROACTIVE_NOTI_LIMIT_SECONDS = 30  # 1 noti / 30s
 
 
@@ -407,6 +549,7 @@ async def trigger_realtime_integrations(
     source: str | None = None,
     *,
     client_kind: ClientKind = 'unknown',
+    fanout: RealtimeFanoutSession | None = None,
 ):
     logger.info(f"trigger_realtime_integrations {uid}")
     """REALTIME STREAMING"""
@@ -416,13 +559,16 @@ async def trigger_realtime_integrations(
         conversation_id,
         source=source,
         client_kind=bounded_client_kind(client_kind),
+        fanout=fanout,
     )
 
 
-async def trigger_realtime_audio_bytes(uid: str, sample_rate: int, data: bytearray):
+async def trigger_realtime_audio_bytes(
+    uid: str, sample_rate: int, data: bytearray, fanout: RealtimeFanoutSession | None = None
+):
     logger.info(f"trigger_realtime_audio_bytes {uid}")
     """REALTIME AUDIO STREAMING"""
-    return await _async_trigger_realtime_audio_bytes(uid, sample_rate, data)
+    return await _async_trigger_realtime_audio_bytes(uid, sample_rate, data, fanout=fanout)
 
 
 # proactive notification
@@ -767,9 +913,14 @@ def _process_proactive_notification(uid: str, app: App, data):
     return message
 
 
-async def _async_trigger_realtime_audio_bytes(uid: str, sample_rate: int, data: bytearray):
-    apps: List[App] = await run_blocking(db_executor, get_available_apps, uid)
-    filtered_apps = [app for app in apps if app.triggers_realtime_audio_bytes() and app.enabled]
+async def _async_trigger_realtime_audio_bytes(
+    uid: str, sample_rate: int, data: bytearray, fanout: RealtimeFanoutSession | None = None
+):
+    if fanout is not None:
+        filtered_apps = await fanout.active_apps(lambda app: app.triggers_realtime_audio_bytes())
+    else:
+        apps: List[App] = await run_blocking(db_executor, get_available_apps, uid)
+        filtered_apps = [app for app in apps if app.triggers_realtime_audio_bytes() and app.enabled]
     if not filtered_apps:
         return {}
 
@@ -782,7 +933,7 @@ async def _async_trigger_realtime_audio_bytes(uid: str, sample_rate: int, data:
         if not app.external_integration.webhook_url:
             return
 
-        if await run_blocking(db_executor, is_app_webhook_disabled, app.id):
+        if fanout is None and await run_blocking(db_executor, is_app_webhook_disabled, app.id):
             return
 
         url = app.external_integration.webhook_url
@@ -795,7 +946,10 @@ async def _async_trigger_realtime_audio_bytes(uid: str, sample_rate: int, data:
         # developer-configured webhook URL is a config error, not a delivery
         # failure — reject without recording failure or tripping the breaker.
         try:
-            pinned_url, pin_kwargs = await run_blocking(db_executor, safe_request_target, url)
+            if fanout is not None:
+                pinned_url, pin_kwargs = await fanout.request_target(url)
+            else:
+                pinned_url, pin_kwargs = await run_blocking(db_executor, safe_request_target, url)
         except UnsafeWebhookURLError as e:
             logger.warning('Rejected non-public webhook URL for app %s: %s', app.id, e)
             return
@@ -820,20 +974,14 @@ async def _async_trigger_realtime_audio_bytes(uid: str, sample_rate: int, data:
                 )
             if response.status_code >= 200 and response.status_code < 300:
                 cb.record_success()
-                await run_blocking(db_executor, record_app_webhook_success, app.id)
+                await _record_delivery_success(fanout, app.id)
             else:
                 cb.record_failure()
-                error_str = f'HTTP {response.status_code}'
-                action = await run_blocking(
-                    db_executor, record_app_webhook_failure, app.id, response.status_code, error_str
-                )
-                await run_blocking(db_executor, _handle_webhook_health_action, app.id, action, error_str)
+                await _record_delivery_failure(fanout, app.id, response.status_code, f'HTTP {response.status_code}')
             logger.info(f'trigger_realtime_audio_bytes {app.id} status: {response.status_code}')
         except Exception as e:
             cb.record_failure()
-            error_str = type(e).__name__
-            action = await run_blocking(db_executor, record_app_webhook_failure, app.id, 0, error_str)
-            await run_blocking(db_executor, _handle_webhook_health_action, app.id, action, error_str)
+            await _record_delivery_failure(fanout, app.id, 0, type(e).__name__)
             logger.error(f"Plugin integration error: {e}")
 
     chunk_size = 8
@@ -842,6 +990,8 @@ async def _async_trigger_realtime_audio_bytes(uid: str, sample_rate: int, data:
         await gather_safe(*[_single(app) for app in chunk], label="realtime_audio_bytes", max_concurrency=8)
         if not latest_wins_check(uid, version):
             break
+    if fanout is not None:
+        await fanout.maybe_flush()
     return {}
 
 
@@ -852,6 +1002,7 @@ async def _async_trigger_realtime_integrations(
     source: str | None = None,
     *,
     client_kind: ClientKind = 'unknown',
+    fanout: RealtimeFanoutSession | None = None,
 ) -> dict:
     # Paywall: skip mentor + third-party proactive notifications when this
     # transcription session belongs to a paywalled desktop user.
@@ -874,8 +1025,11 @@ async def _async_trigger_realtime_integrations(
             mentor_results['mentor'] = mentor_message
             logger.info(f"Sent mentor notification to user {uid}")
 
-    apps: List[App] = await run_blocking(db_executor, get_available_apps, uid)
-    filtered_apps = [app for app in apps if app.triggers_realtime() and app.enabled]
+    if fanout is not None:
+        filtered_apps = await fanout.active_apps(lambda app: app.triggers_realtime())
+    else:
+        apps: List[App] = await run_blocking(db_executor, get_available_apps, uid)
+        filtered_apps = [app for app in apps if app.triggers_realtime() and app.enabled]
     if not filtered_apps:
         # Return mentor results if any, even if no external apps
         if mentor_results:
@@ -891,7 +1045,7 @@ async def _async_trigger_realtime_integrations(
         if not app.external_integration.webhook_url:
             return
 
-        if await run_blocking(db_executor, is_app_webhook_disabled, app.id):
+        if fanout is None and await run_blocking(db_executor, is_app_webhook_disabled, app.id):
             return
 
         url = app.external_integration.webhook_url
@@ -905,7 +1059,10 @@ async def _async_trigger_realtime_integrations(
         # developer-configured webhook URL is a config error, not a delivery
         # failure — reject without recording failure or tripping the breaker.
         try:
-            pinned_url, pin_kwargs = await run_blocking(db_executor, safe_request_target, url)
+            if fanout is not None:
+                pinned_url, pin_kwargs = await fanout.request_target(url)
+            else:
+                pinned_url, pin_kwargs = await run_blocking(db_executor, safe_request_target, url)
         except UnsafeWebhookURLError as e:
             journey_attempt.fail('invalid_response')
             logger.warning('Rejected non-public webhook URL for app %s: %s', app.id, e)
@@ -930,11 +1087,7 @@ async def _async_trigger_realtime_integrations(
             if response.status_code < 200 or response.status_code >= 300:
                 journey_attempt.fail('upstream_rejected')
                 cb.record_failure()
-                error_str = f'HTTP {response.status_code}'
-                action = await run_blocking(
-                    db_executor, record_app_webhook_failure, app.id, response.status_code, error_str
-                )
-                await run_blocking(db_executor, _handle_webhook_health_action, app.id, action, error_str)
+                await _record_delivery_failure(fanout, app.id, response.status_code, f'HTTP {response.status_code}')
                 logger.info(
                     f'trigger_realtime_integrations {app.id} status: {response.status_code} results: {sanitize(response.text[:100])}'
                 )
@@ -942,9 +1095,13 @@ async def _async_trigger_realtime_integrations(
 
             journey_attempt.succeed()
             cb.record_success()
-            await run_blocking(db_executor, record_app_webhook_success, app.id)
+            await _record_delivery_success(fanout, app.id)
 
-            if (app.uid is None or app.uid != uid) and conversation_id is not None:
+            if (
+                (app.uid is None or app.uid != uid)
+                and conversation_id is not None
+                and (fanout is None or fanout.first_usage(app.id, conversation_id))
+            ):
                 await run_blocking(
                     db_executor,
                     record_app_usage,
@@ -984,13 +1141,13 @@ async def _async_trigger_realtime_integrations(
         except Exception as e:
             journey_attempt.fail('upstream_timeout' if isinstance(e, TimeoutError) else 'provider_error')
             cb.record_failure()
-            error_str = type(e).__name__
-            action = await run_blocking(db_executor, record_app_webhook_failure, app.id, 0, error_str)
-            await run_blocking(db_executor, _handle_webhook_health_action, app.id, action, error_str)
+            await _record_delivery_failure(fanout, app.id, 0, type(e).__name__)
             logger.error(f"App integration error: {e}")
             return
 
     await gather_safe(*[_single(app) for app in filtered_apps], label="realtime_integrations", max_concurrency=10)
+    if fanout is not None:
+        await fanout.maybe_flush()
 
     # Merge mentor results with app results
     all_results = {**mentor_results, **results}
@@ -87,6 +87,10 @@ logger = logging.getLogger(__name__)
 _reviewers_env: Optional[str] = os.getenv('MARKETPLACE_APP_REVIEWERS')
 MarketplaceAppReviewUIDs: List[str] = _reviewers_env.split(',') if _reviewers_env else []
 
+# Shared catalog lists may be served this long past their 30s TTL while one
+# background fetch refreshes them; pub/sub invalidation still drops them at once.
+_CATALOG_STALE_TTL_SECONDS = 30
+
 
 def _safe_build_app(app_dict: dict[str, Any]) -> Optional[App]:
     """Build an App from a raw marketplace record, skipping (not raising on) a malformed one.
@@ -326,7 +330,7 @@ def get_popular_apps() -> List[App]:
         return apps
 
     # Singleflight: only ONE request fetches, others wait
-    return memory_cache.get_or_fetch(cache_key, fetch_and_process, ttl=30) or []
+    return memory_cache.get_or_fetch(cache_key, fetch_and_process, ttl=30, stale_ttl=_CATALOG_STALE_TTL_SECONDS) or []
 
 
 def get_available_apps(uid: str, include_reviews: bool = False) -> List[App]:
@@ -350,7 +354,11 @@ def get_available_apps(uid: str, include_reviews: bool = False) -> List[App]:
 
     # Singleflight: only ONE request fetches, others wait
     public_approved_data: List[Dict[str, Any]] = (
-        cast(List[Dict[str, Any]], memory_cache.get_or_fetch(cache_key, fetch_public_approved, ttl=30)) or []
+        cast(
+            List[Dict[str, Any]],
+            memory_cache.get_or_fetch(cache_key, fetch_public_approved, ttl=30, stale_ttl=_CATALOG_STALE_TTL_SECONDS),
+        )
+        or []
     )
 
     # Cache per-user app slice (private + unapproved + tester apps) with 30s TTL (#5439 sub-task 3)
@@ -549,7 +557,7 @@ def get_approved_available_apps(include_reviews: bool = False) -> list[App]:
         return apps
 
     # Singleflight: only ONE request fetches, others wait
-    return memory_cache.get_or_fetch(cache_key, fetch_and_process, ttl=30) or []
+    return memory_cache.get_or_fetch(cache_key, fetch_and_process, ttl=30, stale_ttl=_CATALOG_STALE_TTL_SECONDS) or []
 
 
 def set_app_review(app_id: str, uid: str, review: Dict[str, Any]) -> Dict[str, str]:
@@ -148,6 +148,18 @@ def persist_imported_conversation(uid: str, conversation_data: dict[str, Any]) -
     return conversations_db.create_conversation_if_absent_with_lifecycle(uid, conversation_data)
 
 
+def persist_imported_conversations(uid: str, conversations: list[dict[str, Any]]) -> list[Any]:
+    """Batched :func:`persist_imported_conversation` for bulk imports.
+
+    Returns, per input, True (created), False (already existed) or the exception
+    raised while creating it, so one bad document does not fail its neighbours.
+    """
+    for conversation_data in conversations:
+        _require_status(conversation_data, ConversationStatus.completed)
+        conversation_data['imported'] = True
+    return conversations_db.create_conversations_if_absent_with_lifecycle(uid, conversations)
+
+
 def transition(
     uid: str,
     conversation_id: str,
@@ -0,0 +1,166 @@
+"""Bulk (re)indexing of verbatim transcript chunks into ns_tchunks.
+
+The live path (process_conversation.save_transcript_chunk_vectors) embeds and upserts one
+conversation at a time: one embedding request plus one small upsert per conversation, which
+makes backfilling existing users far too slow. This pipeline streams a user's conversations,
+packs chunks from many conversations into each embedding request up to a token budget, and
+upserts the resulting records in full Pinecone-sized batches.
+
+Progress is reported as a TranscriptChunkCheckpoint that only moves past a conversation once
+all of its chunks are upserted, so a resumed run never skips work; re-upserting a chunk is
+idempotent because vector ids are deterministic.
+"""
+
+import logging
+from dataclasses import dataclass, replace
+from typing import Any, Callable, Dict, List, Optional, Tuple
+
+import database.conversations as conversations_db
+import database.vector_db as vector_db
+from models.conversation_enums import ConversationStatus
+from utils.conversations.transcript_chunks import build_transcript_chunks
+from utils.llm.clients import embeddings, num_tokens_from_string
+
+logger = logging.getLogger(__name__)
+
+# OpenAI rejects an embedding request over 300k input tokens; leave headroom for tokenizer drift.
+EMBED_TOKEN_BUDGET = 200_000
+# embed_documents splits its input into 1000-text requests; staying at or under that keeps
+# one embedding call to one HTTP request.
+EMBED_MAX_INPUTS = 1000
+# Embedded records buffered between upserts. Each flush is also a checkpoint.
+FLUSH_RECORDS = 1000
+
+
+@dataclass(frozen=True)
+class TranscriptChunkCheckpoint:
+    """Resume point for one user: everything up to and including last_conversation_id is indexed."""
+
+    last_conversation_id: Optional[str] = None
+    conversations: int = 0
+    chunks: int = 0
+    completed: bool = False
+
+
+@dataclass
+class TranscriptChunkBackfillReport:
+    uid: str
+    dry_run: bool
+    resumed_after: Optional[str] = None
+    conversations: int = 0
+    skipped: int = 0
+    chunks: int = 0
+    tokens: int = 0
+    embed_calls: int = 0
+    upserted: int = 0
+    completed: bool = False
+
+
+def conversation_transcript_chunks(conversation: Dict[str, Any]) -> List[Dict[str, Any]]:
+    """Chunk a conversation dict exactly the way hydrate_chunk_texts rebuilds it."""
+    segments: List[Dict[str, Any]] = conversation.get('transcript_segments') or []
+    return build_transcript_chunks(segments, conversation.get('started_at') or conversation.get('created_at'))
+
+
+def backfill_transcript_chunks(
+    uid: str,
+    *,
+    checkpoint: Optional[TranscriptChunkCheckpoint] = None,
+    on_checkpoint: Optional[Callable[[TranscriptChunkCheckpoint], None]] = None,
+    dry_run: bool = False,
+    token_budget: int = EMBED_TOKEN_BUDGET,
+    max_inputs: int = EMBED_MAX_INPUTS,
+    flush_records: int = FLUSH_RECORDS,
+    max_conversations: Optional[int] = None,
+    stop_requested: Optional[Callable[[], bool]] = None,
+) -> TranscriptChunkBackfillReport:
+    """Index every completed, non-discarded conversation of one user, resuming after ``checkpoint``.
+
+    Dry runs chunk and count tokens (and the embedding calls a real run would make) without
+    embedding, upserting or reporting checkpoints.
+    """
+    checkpoint = checkpoint or TranscriptChunkCheckpoint()
+    report = TranscriptChunkBackfillReport(uid=uid, dry_run=dry_run, resumed_after=checkpoint.last_conversation_id)
+    if checkpoint.completed:
+        report.completed = True
+        return report
+
+    pending: List[Tuple[str, Dict[str, Any]]] = []
+    pending_tokens = 0
+    records: List[vector_db.VectorRecordDoc] = []
+    # queued: conversations whose chunks are all in pending or records; embedded: all in records;
+    # saved: all upserted and reported.
+    queued = embedded = saved = checkpoint
+
+    def embed_pending() -> None:
+        nonlocal pending, pending_tokens, embedded
+        if pending:
+            report.embed_calls += 1
+            if not dry_run:
+                vectors = embeddings.embed_documents([chunk['text'] for _, chunk in pending])
+                records.extend(
+                    vector_db.transcript_chunk_vector_record(uid, conversation_id, chunk, vector)
+                    for (conversation_id, chunk), vector in zip(pending, vectors)
+                )
+        pending = []
+        pending_tokens = 0
+        embedded = queued
+
+    def flush() -> None:
+        nonlocal records, saved
+        if dry_run:
+            return
+        if records:
+            report.upserted += vector_db.upsert_transcript_chunk_records(records)
+            records = []
+        if embedded != saved:
+            saved = embedded
+            if on_checkpoint is not None:
+                on_checkpoint(saved)
+
+    exhausted = True
+    for conversation in conversations_db.iter_all_conversations(
+        uid, include_discarded=False, start_after_id=checkpoint.last_conversation_id
+    ):
+        if (stop_requested is not None and stop_requested()) or (
+            max_conversations is not None and report.conversations + report.skipped >= max_conversations
+        ):
+            exhausted = False
+            break
+        conversation_id = conversation.get('id')
+        if not conversation_id:
+            continue
+        chunks: List[Dict[str, Any]] = []
+        if conversation.get('status') == ConversationStatus.completed.value:
+            chunks = conversation_transcript_chunks(conversation)
+            report.conversations += 1
+        else:
+            report.skipped += 1
+        for chunk in chunks:
+            tokens = num_tokens_from_string(chunk['text'])
+            if pending and (pending_tokens + tokens > token_budget or len(pending) >= max_inputs):
+                embed_pending()
+                if len(records) >= flush_records:
+                    flush()
+            pending.append((conversation_id, chunk))
+            pending_tokens += tokens
+            report.tokens += tokens
+        report.chunks += len(chunks)
+        queued = replace(
+            queued,
+            last_conversation_id=conversation_id,
+            conversations=queued.conversations + 1,
+            chunks=queued.chunks + len(chunks),
+        )
+
+    embed_pending()
+    if exhausted:
+        embedded = replace(embedded, completed=True)
+    flush()
+    report.completed = exhausted
+    logger.info(
+        f'backfill_transcript_chunks uid={uid} dry_run={dry_run} conversations={report.conversations} '
+        f'chunks={report.chunks} tokens={report.tokens} embed_calls={report.embed_calls} '
+        f'upserted={report.upserted} completed={report.completed}'
+    )
+    return report
@@ -1,7 +1,10 @@
 import base64
 import os
 import struct
+import threading
+from typing import Tuple
 
+from cachetools import TTLCache
 from cryptography.hazmat.primitives import hashes
 from cryptography.hazmat.primitives.ciphers.aead import AESGCM
 from cryptography.hazmat.primitives.kdf.hkdf import HKDF
@@ -21,13 +24,59 @@ def derive_key(uid: str) -> bytes:
     """
     Derives a user-specific 32-byte key from the master secret and user ID (salt).
     """
+    return _derive_key(ENCRYPTION_SECRET, uid)
+
+
+def _derive_key(secret: bytes, uid: str) -> bytes:
     hkdf = HKDF(
         algorithm=hashes.SHA256(),
         length=32,
         salt=uid.encode('utf-8'),
         info=b'user-data-encryption',
     )
-    return hkdf.derive(ENCRYPTION_SECRET)
+    return hkdf.derive(secret)
+
+
+# ---------------------------------------------------------------------------
+# In-memory TTL cache of per-user AESGCM ciphers.
+#
+# HKDF runs once per user per TTL window instead of once per encrypt/decrypt
+# call (and once per chunk inside decrypt_audio_file). Entries are keyed by the
+# master secret as well as the uid, so rotating ENCRYPTION_SECRET can never
+# hand out a cipher derived from the previous secret.
+# ---------------------------------------------------------------------------
+_CIPHER_CACHE_MAX = 4096
+_CIPHER_CACHE_TTL = 600  # seconds
+_cipher_cache = TTLCache[Tuple[bytes, str], AESGCM](maxsize=_CIPHER_CACHE_MAX, ttl=_CIPHER_CACHE_TTL)
+_cipher_cache_lock = threading.Lock()
+
+_NONCE_SIZE = 12
+_TAG_SIZE = 16
+_LENGTH_PREFIX = struct.Struct('>I')
+
+# Bytes encrypt_audio_chunk adds around a payload: length prefix, nonce and tag.
+AUDIO_CHUNK_OVERHEAD = _LENGTH_PREFIX.size + _NONCE_SIZE + _TAG_SIZE
+
+
+def _get_cipher(uid: str) -> AESGCM:
+    """Return the AESGCM cipher for *uid*, deriving its key at most once per TTL window."""
+    secret = ENCRYPTION_SECRET
+    cache_key = (secret, uid)
+    with _cipher_cache_lock:
+        cipher = _cipher_cache.get(cache_key)
+    if cipher is not None:
+        return cipher
+
+    cipher = AESGCM(_derive_key(secret, uid))
+    with _cipher_cache_lock:
+        _cipher_cache[cache_key] = cipher
+    return cipher
+
+
+def clear_cipher_cache() -> None:
+    """Drop every cached cipher, e.g. right after rotating ENCRYPTION_SECRET."""
+    with _cipher_cache_lock:
+        _cipher_cache.clear()
 
 
 def encrypt(data: str, uid: str) -> str:
@@ -37,9 +86,8 @@ def encrypt(data: str, uid: str) -> str:
     """
     if not data:
         return data
-    key = derive_key(uid)
-    aesgcm = AESGCM(key)
-    nonce = os.urandom(12)  # GCM standard nonce size
+    aesgcm = _get_cipher(uid)
+    nonce = os.urandom(_NONCE_SIZE)  # GCM standard nonce size
 
     # Data must be bytes
     plaintext_bytes = data.encode('utf-8')
@@ -60,14 +108,13 @@ def decrypt(encrypted_data: str, uid: str) -> str:
         return encrypted_data
 
     try:
-        key = derive_key(uid)
-        aesgcm = AESGCM(key)
+        aesgcm = _get_cipher(uid)
 
         encrypted_payload = base64.b64decode(encrypted_data.encode('utf-8'))
 
         # Extract nonce and ciphertext
-        nonce = encrypted_payload[:12]
-        ciphertext = encrypted_payload[12:]
+        nonce = encrypted_payload[:_NONCE_SIZE]
+        ciphertext = encrypted_payload[_NONCE_SIZE:]
 
         decrypted_bytes = aesgcm.decrypt(nonce, ciphertext, None)
 
@@ -80,6 +127,24 @@ def decrypt(encrypted_data: str, uid: str) -> str:
         return encrypted_data
 
 
+def encrypt_bytes(data: bytes, uid: str) -> bytes:
+    """
+    Encrypts raw bytes using a user-specific key.
+    Returns nonce + ciphertext + tag, without any text encoding.
+    """
+    nonce = os.urandom(_NONCE_SIZE)
+    return nonce + _get_cipher(uid).encrypt(nonce, data, None)
+
+
+def decrypt_bytes(encrypted_data: bytes, uid: str) -> bytes:
+    """
+    Decrypts the output of ``encrypt_bytes``.
+    Unlike ``decrypt``, raises ``cryptography.exceptions.InvalidTag`` on a wrong key or corrupted data.
+    """
+    view = memoryview(encrypted_data)
+    return _get_cipher(uid).decrypt(view[:_NONCE_SIZE], view[_NONCE_SIZE:], None)
+
+
 def encrypt_audio_chunk(data: bytes, uid: str) -> bytes:
     """
     Encrypt audio chunk and return length-prefixed binary format.
@@ -87,9 +152,8 @@ def encrypt_audio_chunk(data: bytes, uid: str) -> bytes:
 
     This format allows concatenating multiple encrypted chunks without decryption.
     """
-    key = derive_key(uid)
-    aesgcm = AESGCM(key)
-    nonce = os.urandom(12)
+    aesgcm = _get_cipher(uid)
+    nonce = os.urandom(_NONCE_SIZE)
 
     # Encrypt (includes authentication tag)
     ciphertext = aesgcm.encrypt(nonce, data, None)
@@ -99,7 +163,7 @@ def encrypt_audio_chunk(data: bytes, uid: str) -> bytes:
 
     # Add length prefix (4 bytes, big-endian)
     length = len(encrypted_payload)
-    return struct.pack('>I', length) + encrypted_payload
+    return _LENGTH_PREFIX.pack(length) + encrypted_payload
 
 
 def decrypt_audio_chunk(encrypted_data: bytes, uid: str, offset: int = 0):
@@ -107,36 +171,58 @@ def decrypt_audio_chunk(encrypted_data: bytes, uid: str, offset: int = 0):
     Decrypt a single length-prefixed chunk.
     Returns: (decrypted_data, bytes_consumed)
     """
+    view = memoryview(encrypted_data)
     # Read length prefix
-    length = struct.unpack('>I', encrypted_data[offset : offset + 4])[0]
-    offset += 4
+    (length,) = _LENGTH_PREFIX.unpack_from(view, offset)
+    start = offset + _LENGTH_PREFIX.size
 
-    # Extract encrypted payload
-    encrypted_payload = encrypted_data[offset : offset + length]
+    # Slice nonce and ciphertext as views; no copies of the payload
+    nonce = view[start : start + _NONCE_SIZE]
+    ciphertext = view[start + _NONCE_SIZE : start + length]
 
-    # Extract nonce and ciphertext
-    nonce = encrypted_payload[:12]
-    ciphertext = encrypted_payload[12:]
+    decrypted = _get_cipher(uid).decrypt(nonce, ciphertext, None)
 
-    # Decrypt
-    key = derive_key(uid)
-    aesgcm = AESGCM(key)
-    decrypted = aesgcm.decrypt(nonce, ciphertext, None)
+    return decrypted, _LENGTH_PREFIX.size + length
 
-    return decrypted, 4 + length
+
+def audio_chunk_frame_size(encrypted_data: bytes, offset: int = 0) -> int:
+    """
+    Total bytes of the length-prefixed chunk at offset, read from its prefix alone.
+    """
+    (length,) = _LENGTH_PREFIX.unpack_from(encrypted_data, offset)
+    return _LENGTH_PREFIX.size + length
 
 
 def decrypt_audio_file(encrypted_data: bytes, uid: str) -> bytes:
     """
     Decrypt an entire merged audio file (multiple concatenated chunks).
     Each chunk is length-prefixed, allowing simple concatenation during merge.
-    """
-    decrypted_audio = bytearray()
-    offset = 0
 
-    while offset < len(encrypted_data):
-        chunk_data, bytes_consumed = decrypt_audio_chunk(encrypted_data, uid, offset)
-        decrypted_audio.extend(chunk_data)
-        offset += bytes_consumed
+    The length prefixes are walked first so the plaintext can be written into a
+    single preallocated buffer; ciphertext is passed to AESGCM as memoryview
+    slices of the input.
+    """
+    view = memoryview(encrypted_data)
+    total = len(view)
 
-    return bytes(decrypted_audio)
+    frames = []
+    plaintext_size = 0
+    offset = 0
+    while offset < total:
+        (length,) = _LENGTH_PREFIX.unpack_from(view, offset)
+        start = offset + _LENGTH_PREFIX.size
+        frames.append((start, length))
+        plaintext_size += max(0, length - _NONCE_SIZE - _TAG_SIZE)
+        offset = start + length
+
+    aesgcm = _get_cipher(uid)
+    decrypted_audio = bytearray(plaintext_size)
+    out = memoryview(decrypted_audio)
+    position = 0
+    for start, length in frames:
+        nonce = view[start : start + _NONCE_SIZE]
+        chunk = aesgcm.decrypt(nonce, view[start + _NONCE_SIZE : start + length], None)
+        out[position : position + len(chunk)] = chunk
+        position += len(chunk)
+
+    return bytes(out[:position])
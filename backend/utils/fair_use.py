@@ -1,7 +1,7 @@
 """
 Fair-use engine for Omi.
 
-Tracks per-user rolling speech hours via Redis minute buckets,
+Tracks per-user rolling speech hours via Redis minute/hour/day rollup buckets,
 detects soft-cap violations, triggers LLM classification,
 and manages graduated enforcement (warning → throttle → restrict).
 """
@@ -114,8 +114,13 @@ def _normalize_speech_source(source: str) -> str:
     return normalized if normalized in _VALID_SPEECH_SOURCES else 'realtime'
 
 
+def _rollup_key(uid: str, source: str) -> str:
+    """Redis hash of a user's speech rollups for one lane (see _ROLLUP_LUA)."""
+    return f'fair_use:v3:speech:{source}:{uid}'
+
+
 def _redis_key(uid: str, source: str) -> str:
-    """Redis sorted set key for a user's speech minute buckets."""
+    """Pre-rollup sorted set of a lane's minute buckets; folded into the rollup hash on next touch."""
     return f'fair_use:v2:speech:{source}:{uid}'
 
 
@@ -123,6 +128,15 @@ def _bucket_key(uid: str, source: str) -> str:
     return f'fair_use:v2:bucket:{source}:{uid}'
 
 
+def _speech_keys(uid: str, source: str) -> List[str]:
+    return [_rollup_key(uid, source), _bucket_key(uid, source), _redis_key(uid, source)]
+
+
+# Combined pre-v2 meter, still counted by live enforcement until it is folded into its own rollup lane.
+def _legacy_speech_keys(uid: str) -> List[str]:
+    return [_rollup_key(uid, 'legacy'), f'fair_use:bucket:{uid}', f'fair_use:speech:{uid}']
+
+
 def _classifier_lock_key(uid: str) -> str:
     """Redis key to deduplicate concurrent classifier runs."""
     return f'fair_use:classifier_lock:{uid}'
@@ -144,21 +158,156 @@ def _release_lock(key: str, token: str) -> None:
 
 
 # ---------------------------------------------------------------------------
-# Speech tracking (Redis sorted set of minute buckets)
+# Speech tracking (Redis minute buckets with hour/day rollups)
 # ---------------------------------------------------------------------------
 
 
-_RECORD_SPEECH_ONCE_SCRIPT = """
-if redis.call('set', KEYS[1], '1', 'EX', ARGV[4], 'NX') then
-    redis.call('hincrby', KEYS[2], ARGV[1], ARGV[2])
-    redis.call('expire', KEYS[2], ARGV[4])
-    redis.call('zadd', KEYS[3], ARGV[3], ARGV[1])
-    redis.call('expire', KEYS[3], ARGV[4])
-    return 1
+# Each lane is one hash holding three tiers of buckets: 'm:<bucket>' per FAIR_USE_BUCKET_SECONDS,
+# 'h:<hour>' and 'd:<UTC day>' rolled up at write time. A rolling window is summed as its leading
+# partial hour in buckets, its leading partial day in hours and the rest in days, so a 168h read
+# touches at most 59 + 23 + 8 fields per lane and the totals never leave Redis.
+# Field 'p' is the oldest bucket not yet pruned; writes delete expired fields from there, at most
+# _ROLLUP_PRUNE_STEP buckets per call. Pre-rollup zset/hash pairs (KEYS[i+1], KEYS[i+2]) are
+# merged into the hash and deleted whenever they exist, which also absorbs writes from older
+# workers during a rolling deploy.
+_ROLLUP_LUA = """
+local function fold_legacy(dst, old_hash, old_zset, hour, day, ttl)
+    if redis.call('exists', old_zset) == 0 then
+        return
+    end
+    local members = redis.call('zrange', old_zset, 0, -1)
+    local oldest = nil
+    for i = 1, #members, 1000 do
+        local batch = {}
+        for j = i, math.min(i + 999, #members) do
+            batch[#batch + 1] = members[j]
+        end
+        local values = redis.call('hmget', old_hash, unpack(batch))
+        for j, member in ipairs(batch) do
+            local ms = tonumber(values[j])
+            local bucket = tonumber(member)
+            if ms and bucket then
+                redis.call('hincrby', dst, 'm:' .. member, ms)
+                redis.call('hincrby', dst, 'h:' .. math.floor(bucket / hour), ms)
+                redis.call('hincrby', dst, 'd:' .. math.floor(bucket / day), ms)
+                if not oldest or bucket < oldest then
+                    oldest = bucket
+                end
+            end
+        end
+    end
+    if oldest then
+        local pruned = tonumber(redis.call('hget', dst, 'p'))
+        if not pruned or oldest < pruned then
+            redis.call('hset', dst, 'p', oldest)
+        end
+        redis.call('expire', dst, ttl)
+    end
+    redis.call('del', old_hash, old_zset)
 end
-return 0
+
+local function window_total(key, first, last, hour, day)
+    local fields = {}
+    local bucket = first
+    while bucket <= last and bucket % hour ~= 0 do
+        fields[#fields + 1] = 'm:' .. bucket
+        bucket = bucket + 1
+    end
+    while bucket <= last and bucket % day ~= 0 do
+        fields[#fields + 1] = 'h:' .. math.floor(bucket / hour)
+        bucket = bucket + hour
+    end
+    while bucket <= last do
+        fields[#fields + 1] = 'd:' .. math.floor(bucket / day)
+        bucket = bucket + day
+    end
+    local total = 0
+    if #fields > 0 then
+        for _, value in ipairs(redis.call('hmget', key, unpack(fields))) do
+            total = total + (tonumber(value) or 0)
+        end
+    end
+    return total
+end
+"""
+
+# KEYS: rollup hash, pre-rollup hash, pre-rollup zset[, once key]
+# ARGV: bucket, ms, ttl, hour span, day span, oldest retained bucket, prune step
+_RECORD_SPEECH_SCRIPT = _ROLLUP_LUA + """
+if KEYS[4] and not redis.call('set', KEYS[4], '1', 'EX', ARGV[3], 'NX') then
+    return 0
+end
+local key = KEYS[1]
+local bucket = tonumber(ARGV[1])
+local ms = tonumber(ARGV[2])
+local ttl = tonumber(ARGV[3])
+local hour = tonumber(ARGV[4])
+local day = tonumber(ARGV[5])
+fold_legacy(key, KEYS[2], KEYS[3], hour, day, ttl)
+redis.call('hincrby', key, 'm:' .. bucket, ms)
+redis.call('hincrby', key, 'h:' .. math.floor(bucket / hour), ms)
+redis.call('hincrby', key, 'd:' .. math.floor(bucket / day), ms)
+
+local retained = tonumber(ARGV[6])
+local pruned = tonumber(redis.call('hget', key, 'p')) or bucket
+if pruned < retained then
+    local stop = math.min(retained, pruned + tonumber(ARGV[7]))
+    local fields = {}
+    for b = pruned, stop - 1 do
+        fields[#fields + 1] = 'm:' .. b
+        if (b + 1) % hour == 0 then
+            fields[#fields + 1] = 'h:' .. math.floor(b / hour)
+        end
+        if (b + 1) % day == 0 then
+            fields[#fields + 1] = 'd:' .. math.floor(b / day)
+        end
+        if #fields >= 1000 then
+            redis.call('hdel', key, unpack(fields))
+            fields = {}
+        end
+    end
+    if #fields > 0 then
+        redis.call('hdel', key, unpack(fields))
+    end
+    pruned = stop
+end
+redis.call('hset', key, 'p', pruned)
+redis.call('expire', key, ttl)
+return 1
+"""
+
+# KEYS: (rollup hash, pre-rollup hash, pre-rollup zset) per lane
+# ARGV: last bucket, hour span, day span, ttl, first bucket of each window...
+_ROLLING_SPEECH_SCRIPT = _ROLLUP_LUA + """
+local last = tonumber(ARGV[1])
+local hour = tonumber(ARGV[2])
+local day = tonumber(ARGV[3])
+local ttl = tonumber(ARGV[4])
+local totals = {}
+for w = 5, #ARGV do
+    totals[#totals + 1] = 0
+end
+for i = 1, #KEYS, 3 do
+    fold_legacy(KEYS[i], KEYS[i + 1], KEYS[i + 2], hour, day, ttl)
+    if redis.call('exists', KEYS[i]) == 1 then
+        for w = 5, #ARGV do
+            totals[w - 4] = totals[w - 4] + window_total(KEYS[i], tonumber(ARGV[w]), last, hour, day)
+        end
+    end
+end
+return totals
 """
 
+# Buckets whose expired fields one write may delete; a lane idle for days catches up over a few writes.
+_ROLLUP_PRUNE_STEP = 1440
+
+_ROLLING_WINDOWS = (('daily_ms', 24 * 3600), ('three_day_ms', 3 * 24 * 3600), ('weekly_ms', 7 * 24 * 3600))
+
+
+def _rollup_spans() -> tuple[int, int]:
+    """Buckets per hour and per UTC day for the h:/d: tiers."""
+    return max(1, 3600 // FAIR_USE_BUCKET_SECONDS), max(1, 86400 // FAIR_USE_BUCKET_SECONDS)
+
 
 def record_speech_ms(
     uid: str,
@@ -167,12 +316,10 @@ def record_speech_ms(
     idempotency_key: Optional[str] = None,
     raise_on_error: bool = False,
 ) -> None:
-    """Record speech milliseconds into the current minute bucket.
+    """Record speech milliseconds into the current bucket and its hour/day rollups.
 
-    Uses a Redis sorted set where:
-      - member = Unix minute timestamp (as string)
-      - score = Unix minute timestamp (for range queries)
-    The speech_ms is stored in a separate hash keyed by minute.
+    One atomic script call per record: it folds any pre-rollup keys of the lane into
+    the rollup hash, increments the three tiers and prunes fields past retention.
     Source is part of the Redis key. Live enforcement reads only realtime and
     sync_fresh; sync_backfill is deliberately isolated from live hard caps.
     """
@@ -182,45 +329,27 @@ def record_speech_ms(
     try:
         normalized_source = _normalize_speech_source(source)
         now = int(time.time())
-        bucket_minute = now // FAIR_USE_BUCKET_SECONDS
+        bucket = now // FAIR_USE_BUCKET_SECONDS
+        hour_span, day_span = _rollup_spans()
         logger.info(f'fair_use: record_speech_ms uid={uid} ms={speech_ms} source={normalized_source}')
 
-        pipe = redis_client.pipeline(transaction=False)
-        # Increment speech_ms for this minute bucket
-        bucket_key = _bucket_key(uid, normalized_source)
-        zset_key = _redis_key(uid, normalized_source)
+        keys = _speech_keys(uid, normalized_source)
         if idempotency_key:
-            once_key = f'fair_use:v2:once:speech:{normalized_source}:{uid}:{idempotency_key}'
-            redis_client.eval(
-                _RECORD_SPEECH_ONCE_SCRIPT,
-                3,
-                once_key,
-                bucket_key,
-                zset_key,
-                str(bucket_minute),
-                speech_ms,
-                bucket_minute * FAIR_USE_BUCKET_SECONDS,
-                FAIR_USE_REDIS_RETENTION_SECONDS,
-            )
-            return
-        pipe.hincrby(bucket_key, str(bucket_minute), speech_ms)
-        pipe.expire(bucket_key, FAIR_USE_REDIS_RETENTION_SECONDS)
-
-        # Add minute to sorted set (score = timestamp for range queries)
-        pipe.zadd(zset_key, {str(bucket_minute): bucket_minute * FAIR_USE_BUCKET_SECONDS})
-        pipe.expire(zset_key, FAIR_USE_REDIS_RETENTION_SECONDS)
-
-        # Prune old zset members older than retention window
-        cutoff_ts = now - FAIR_USE_REDIS_RETENTION_SECONDS
-        # First, get stale members so we can also prune the hash (#5748 reviewer fix)
-        stale_members = redis_client.zrangebyscore(zset_key, 0, cutoff_ts)
-        pipe.zremrangebyscore(zset_key, 0, cutoff_ts)
-        # Prune matching hash fields to prevent unbounded growth
-        if stale_members:
-            stale_fields = [m.decode() if isinstance(m, bytes) else m for m in stale_members]
-            pipe.hdel(bucket_key, *stale_fields)
-
-        pipe.execute()
+            keys.append(f'fair_use:v2:once:speech:{normalized_source}:{uid}:{idempotency_key}')
+        # Same retention as the zset pruning it replaces: keep buckets newer than now - retention.
+        retained_bucket = (now - FAIR_USE_REDIS_RETENTION_SECONDS) // FAIR_USE_BUCKET_SECONDS + 1
+        redis_client.eval(
+            _RECORD_SPEECH_SCRIPT,
+            len(keys),
+            *keys,
+            bucket,
+            speech_ms,
+            FAIR_USE_REDIS_RETENTION_SECONDS,
+            hour_span,
+            day_span,
+            retained_bucket,
+            _ROLLUP_PRUNE_STEP,
+        )
     except Exception as e:
         logger.error(f'fair_use: Redis error recording speech for {uid}: {e}')
         if raise_on_error:
@@ -230,51 +359,42 @@ def record_speech_ms(
 def get_rolling_speech_ms(uid: str, sources: Optional[tuple[str, ...]] = None) -> Dict[str, Any]:
     """Get speech totals for rolling windows: daily (24h), 3-day (72h), weekly (168h).
 
-    Returns dict with keys: daily_ms, three_day_ms, weekly_ms.
+    Returns dict with keys: daily_ms, three_day_ms, weekly_ms. All lanes and windows
+    are summed server-side in one script call.
     """
-    result: Dict[str, Any] = {'daily_ms': 0, 'three_day_ms': 0, 'weekly_ms': 0}
+    result: Dict[str, Any] = {name: 0 for name, _ in _ROLLING_WINDOWS}
     if not FAIR_USE_ENABLED:
         return result
 
     try:
         now = int(time.time())
-        cutoff_weekly = now - (7 * 24 * 3600)
-        cutoff_daily = now - (24 * 3600)
-        cutoff_3day = now - (3 * 24 * 3600)
-
-        selected_sources = sources or LIVE_SPEECH_SOURCES
-        source_keys = [
-            (_bucket_key(uid, _normalize_speech_source(source)), _redis_key(uid, _normalize_speech_source(source)))
-            for source in selected_sources
-        ]
+        hour_span, day_span = _rollup_spans()
+        keys: List[str] = []
+        for source in dict.fromkeys(_normalize_speech_source(source) for source in sources or LIVE_SPEECH_SOURCES):
+            keys.extend(_speech_keys(uid, source))
         if sources is None:
             # Transitional compatibility: retain the previous combined meter
             # in live enforcement until its seven-day TTL naturally expires.
-            # New backfill is written only to the isolated v2 key.
-            source_keys.append((f'fair_use:bucket:{uid}', f'fair_use:speech:{uid}'))
-        for bucket_key, zset_key in source_keys:
-            members = redis_client.zrangebyscore(zset_key, cutoff_weekly, '+inf')
-            if not members:
-                continue
-            fields = [m.decode() if isinstance(m, bytes) else m for m in members]
-            bucket_values = redis_client.hmget(bucket_key, fields)
-            for member, value in zip(members, bucket_values):
-                if value is None:
-                    continue
-                ms = int(value)
-                member_str = member.decode() if isinstance(member, bytes) else member
-                bucket_ts = int(member_str) * FAIR_USE_BUCKET_SECONDS
-
-                result['weekly_ms'] += ms
-                if bucket_ts >= cutoff_3day:
-                    result['three_day_ms'] += ms
-                if bucket_ts >= cutoff_daily:
-                    result['daily_ms'] += ms
-
+            # New backfill is written only to the isolated lane keys.
+            keys.extend(_legacy_speech_keys(uid))
+        # A bucket counts when its start is inside the window: bucket * size >= now - window.
+        first_buckets = [-((window - now) // FAIR_USE_BUCKET_SECONDS) for _, window in _ROLLING_WINDOWS]
+        totals = redis_client.eval(
+            _ROLLING_SPEECH_SCRIPT,
+            len(keys),
+            *keys,
+            now // FAIR_USE_BUCKET_SECONDS,
+            hour_span,
+            day_span,
+            FAIR_USE_REDIS_RETENTION_SECONDS,
+            *first_buckets,
+        )
+        for (name, _), total in zip(_ROLLING_WINDOWS, totals):
+            result[name] = int(total)
         return result
     except Exception as e:
         logger.error(f'fair_use: Redis error reading speech for {uid}: {e}')
-        return result
+        return {name: 0 for name, _ in _ROLLING_WINDOWS}
 
 
 def get_rolling_backfill_speech_ms(uid: str) -> Dict[str, Any]:
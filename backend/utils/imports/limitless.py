@@ -5,13 +5,18 @@ Parses Limitless lifelog exports and creates Omi conversations.
 Uses "light import" mode - no AI processing, just stores the data directly.
 """
 
+import json
 import os
 import re
+import time
 import uuid
 import traceback
+from collections import deque
+from concurrent.futures import Future, ThreadPoolExecutor
+from dataclasses import dataclass
 from datetime import datetime, timezone
 from pathlib import Path
-from typing import Any, Dict, List, Tuple, Optional
+from typing import Any, Deque, Dict, Iterator, List, Tuple, Optional
 from zipfile import ZipFile
 
 import database.conversations as conversations_db
@@ -250,6 +255,131 @@ def find_legacy_limitless_conversation_id(uid: str, started_at: datetime) -> Opt
     return None
 
 
+# Lifelogs are parsed by a thread pool, a bounded number ahead of the writer so a
+# multi-year export never sits in memory at once. Parsing is GIL-bound; the pool
+# mostly overlaps ZIP reads and the per-lifelog legacy-row queries.
+_IMPORT_WORKERS = int(os.getenv('LIMITLESS_IMPORT_WORKERS', '8'))
+_PARSE_AHEAD = _IMPORT_WORKERS * 8
+# Firestore caps one commit at 500 writes and 10 MiB; stay under both.
+_WRITE_BATCH_MAX_DOCS = 450
+_WRITE_BATCH_MAX_BYTES = 8 * 1024 * 1024
+_PROGRESS_INTERVAL_SECONDS = 2.0
+_FORMATTED_SUMMARY_APP_ID = '01KBTYQAZSQFRZ809BQ46HW76M'
+
+
+@dataclass
+class _ParsedLifelog:
+    path: str
+    conversation: Optional[Dict[str, Any]] = None  # None for a lifelog with no transcript
+    source_started_at: Optional[datetime] = None
+    size_bytes: int = 0
+    error: Optional[str] = None
+
+
+def build_lifelog_conversation(
+    uid: str, lifelog_path: str, content: str, language_code: str = 'en'
+) -> Tuple[Optional[Conversation], Optional[datetime]]:
+    """Light-import Conversation for one lifelog, and the start time its file carried.
+
+    Returns (None, None) for a lifelog without transcript lines.
+    """
+    started_at, segments, title, plain_summary, formatted_summary = parse_lifelog_md(content, Path(lifelog_path).name)
+    if not segments:
+        return None, None
+
+    conversation_id = conversation_id_for_lifelog(uid, lifelog_path, started_at=started_at)
+
+    # Calculate finished_at from last segment
+    if started_at:
+        last_segment_end = max(seg.end for seg in segments)
+        finished_at = datetime.fromtimestamp(started_at.timestamp() + last_segment_end, tz=timezone.utc)
+    else:
+        finished_at = datetime.now(timezone.utc)
+
+    source_started_at = started_at
+    if not started_at:
+        started_at = datetime.now(timezone.utc)
+
+    # Use plain summary (unformatted H2/H3 headers) for overview,
+    # fall back to transcript excerpt if no headers found
+    overview = plain_summary if plain_summary else _create_overview_from_transcript(segments)
+
+    # Create apps_results with formatted markdown summary
+    apps_results: List[AppResult] = []
+    if formatted_summary:
+        apps_results.append(AppResult(app_id=_FORMATTED_SUMMARY_APP_ID, content=formatted_summary))
+
+    # Create structured data directly (no AI)
+    structured = Structured(
+        title=title or 'Imported Conversation',
+        overview=overview,
+        emoji='💬',
+        category=CategoryEnum.other,
+        action_items=[],
+        events=[],
+    )
+
+    conversation = Conversation(
+        id=conversation_id,
+        created_at=started_at,  # Use started_at as created_at for proper ordering
+        started_at=started_at,
+        finished_at=finished_at,
+        source=ConversationSource.limitless,
+        language=language_code,
+        structured=structured,
+        transcript_segments=segments,
+        apps_results=apps_results,
+        status=ConversationStatus.completed,
+        discarded=False,
+        imported=True,
+    )
+    return conversation, source_started_at
+
+
+def _parse_lifelog_member(zf: ZipFile, uid: str, lifelog_path: str, language_code: str) -> _ParsedLifelog:
+    try:
+        content = zf.read(lifelog_path).decode('utf-8')
+        conversation, source_started_at = build_lifelog_conversation(uid, lifelog_path, content, language_code)
+        if conversation is None:
+            return _ParsedLifelog(path=lifelog_path)
+        data = conversation.model_dump()
+        return _ParsedLifelog(
+            path=lifelog_path,
+            conversation=data,
+            source_started_at=source_started_at,
+            size_bytes=len(json.dumps(data, default=str)),
+        )
+    except Exception as e:
+        return _ParsedLifelog(path=lifelog_path, error=f"Error processing {lifelog_path}: {str(e)}")
+
+
+def _parsed_in_order(executor: ThreadPoolExecutor, parse: Any, paths: List[str]) -> Iterator[_ParsedLifelog]:
+    """Parse results in archive order, keeping at most _PARSE_AHEAD lifelogs in flight."""
+    in_flight: Deque[Future] = deque()
+    for path in paths:
+        in_flight.append(executor.submit(parse, path))
+        if len(in_flight) >= _PARSE_AHEAD:
+            yield in_flight.popleft().result()
+    while in_flight:
+        yield in_flight.popleft().result()
+
+
+def _legacy_skip_or_error(uid: str, parsed: _ParsedLifelog) -> Tuple[bool, Optional[str]]:
+    """(skip, error): skip when a pre-deterministic-ID Limitless row already holds this lifelog."""
+    if not parsed.source_started_at or parsed.conversation is None:
+        return False, None
+    try:
+        legacy_id = find_legacy_limitless_conversation_id(uid, parsed.source_started_at)
+    except Exception as e:
+        return False, f"Error processing {parsed.path}: {str(e)}"
+    return bool(legacy_id and legacy_id != parsed.conversation['id']), None
+
+
+def _lifelog_paths(all_files: List[str]) -> List[str]:
+    # Handle both "lifelogs/..." and "something/lifelogs/..." structures
+    return [name for name in all_files if ('lifelogs/' in name or name.startswith('lifelogs')) and name.endswith('.md')]
+
+
 def process_limitless_import(job_id: str, uid: str, zip_path: str, language_code: str = 'en') -> None:
     """
     Background worker to process a Limitless ZIP export using LIGHT IMPORT mode.
@@ -260,7 +390,12 @@ def process_limitless_import(job_id: str, uid: str, zip_path: str, language_code
     - Skips AI processing (no memories, trends, action items, apps)
     - Just stores the conversation with transcript
 
-    This makes imports almost instant (~0.1 sec per file instead of ~7 sec).
+    Lifelogs are parsed in parallel and written in batched create-if-absent commits
+    (one existence read and one commit per batch instead of one of each per file).
+    Progress is written at most every _PROGRESS_INTERVAL_SECONDS together with a
+    checkpoint: the last lifelog path before which everything is stored, plus the
+    counters at that point. A run of a job that already has a checkpoint resumes
+    after that path; a lifelog written twice is still created only once.
 
     Args:
         job_id: The import job ID
@@ -269,28 +404,27 @@ def process_limitless_import(job_id: str, uid: str, zip_path: str, language_code
         language_code: Language code for conversation processing
     """
     try:
+        job = import_jobs_db.get_import_job(job_id) or {}
+        checkpoint: Dict[str, Any] = job.get('checkpoint') or {}
+
         # Update status to processing
         import_jobs_db.update_import_job(
             job_id,
             {
                 'status': ImportJobStatus.processing.value,
-                'started_at': datetime.now(timezone.utc).isoformat(),
+                'started_at': job.get('started_at') or datetime.now(timezone.utc).isoformat(),
             },
         )
 
         # Open and scan the ZIP file
-        with ZipFile(zip_path, 'r') as zf:
+        with ZipFile(zip_path, 'r') as zf, ThreadPoolExecutor(
+            max_workers=_IMPORT_WORKERS, thread_name_prefix='limitless-import'
+        ) as executor:
             all_files = zf.namelist()
             logger.info(f"[Limitless Import] ZIP contains {len(all_files)} entries")
             logger.info(f"[Limitless Import] First 20 entries: {all_files[:20]}")
 
-            # Find all lifelog markdown files
-            # Handle both "lifelogs/..." and "something/lifelogs/..." structures
-            lifelog_files = [
-                name
-                for name in all_files
-                if ('lifelogs/' in name or name.startswith('lifelogs')) and name.endswith('.md')
-            ]
+            lifelog_files = _lifelog_paths(all_files)
 
             logger.info(f"[Limitless Import] Found {len(lifelog_files)} lifelog files")
             if lifelog_files:
@@ -316,133 +450,151 @@ def process_limitless_import(job_id: str, uid: str, zip_path: str, language_code
                 )
                 return
 
-            processed_files = 0
-            conversations_created = 0
-            conversations_skipped = 0
-            errors: List[str] = []
-
-            for lifelog_path in lifelog_files:
-                try:
-                    # Read and parse the lifelog
-                    content = zf.read(lifelog_path).decode('utf-8')
-                    filename = Path(lifelog_path).name
-
-                    started_at, segments, title, plain_summary, formatted_summary = parse_lifelog_md(content, filename)
-
-                    # Skip empty files
-                    if not segments:
-                        processed_files += 1
-                        import_jobs_db.update_import_job(job_id, {'processed_files': processed_files})
-                        continue
+            resume_index = 0
+            if checkpoint.get('path') in lifelog_files:
+                resume_index = lifelog_files.index(checkpoint['path']) + 1
+                logger.info(f"[Limitless Import] Resuming job {job_id} after {resume_index} lifelogs")
+            else:
+                checkpoint = {}
 
-                    conversation_id = conversation_id_for_lifelog(uid, lifelog_path, started_at=started_at)
+            consumed = int(checkpoint.get('processed_files', 0))
+            conversations_created = int(checkpoint.get('conversations_created', 0))
+            conversations_skipped = int(checkpoint.get('conversations_skipped', 0))
+            prior_errors = int(checkpoint.get('errors', 0))
+            first_error: Optional[str] = checkpoint.get('first_error')
+            errors: List[str] = []
 
-                    # Calculate finished_at from last segment
-                    if segments and started_at:
-                        last_segment_end = max(seg.end for seg in segments)
-                        finished_at = datetime.fromtimestamp(started_at.timestamp() + last_segment_end, tz=timezone.utc)
+            batch: List[_ParsedLifelog] = []
+            batch_ids: set[str] = set()
+            batch_bytes = 0
+            consumed_path: Optional[str] = checkpoint.get('path')
+            saved: Dict[str, Any] = dict(checkpoint)
+            last_progress_at = time.monotonic()
+
+            def record_error(message: str) -> None:
+                nonlocal first_error
+                logger.info(message)
+                errors.append(message)
+                first_error = first_error or message
+
+            def flush() -> None:
+                nonlocal batch, batch_ids, batch_bytes, conversations_created, conversations_skipped, saved
+                skipped_before = conversations_skipped
+                existing = conversations_db.get_existing_conversation_ids(
+                    uid, [parsed.conversation['id'] for parsed in batch if parsed.conversation is not None]
+                )
+                candidates = [parsed for parsed in batch if parsed.conversation['id'] not in existing]
+                conversations_skipped += len(batch) - len(candidates)
+
+                # Skip lifelogs a legacy random-UUID Limitless row already holds, so the first
+                # post-upgrade re-import does not insert a deterministic duplicate.
+                to_write: List[_ParsedLifelog] = []
+                for parsed, (skip, error) in zip(
+                    candidates, executor.map(lambda parsed: _legacy_skip_or_error(uid, parsed), candidates)
+                ):
+                    if error:
+                        record_error(error)
+                    elif skip:
+                        conversations_skipped += 1
                     else:
-                        finished_at = started_at or datetime.now(timezone.utc)
-
-                    source_started_at = started_at
-                    if not started_at:
-                        started_at = datetime.now(timezone.utc)
-
-                    # Use plain summary (unformatted H2/H3 headers) for overview,
-                    # fall back to transcript excerpt if no headers found
-                    overview = plain_summary if plain_summary else _create_overview_from_transcript(segments)
-
-                    # Create apps_results with formatted markdown summary
-                    apps_results: List[AppResult] = []
-                    if formatted_summary:
-                        apps_results.append(AppResult(app_id='01KBTYQAZSQFRZ809BQ46HW76M', content=formatted_summary))
-
-                    # Create structured data directly (no AI)
-                    structured = Structured(
-                        title=title or 'Imported Conversation',
-                        overview=overview,
-                        emoji='💬',
-                        category=CategoryEnum.other,
-                        action_items=[],
-                        events=[],
-                    )
-
-                    # Create conversation object directly (no AI processing).
-                    conversation = Conversation(
-                        id=conversation_id,
-                        created_at=started_at,  # Use started_at as created_at for proper ordering
-                        started_at=started_at,
-                        finished_at=finished_at,
-                        source=ConversationSource.limitless,
-                        language=language_code,
-                        structured=structured,
-                        transcript_segments=segments,
-                        apps_results=apps_results,
-                        status=ConversationStatus.completed,
-                        discarded=False,
-                        imported=True,
-                    )
+                        to_write.append(parsed)
 
-                    # Create-if-absent so re-importing the same export skips lifelogs already
-                    # stored instead of overwriting them. This is atomic (Firestore create()),
-                    # so it never duplicates and never clobbers edits a user may have made to a
-                    # previously-imported conversation ("first import wins").
-                    # Before create, skip when a legacy random-UUID Limitless row already
-                    # exists at this started_at so the first post-upgrade re-import does
-                    # not insert a deterministic duplicate.
-                    legacy_id = (
-                        find_legacy_limitless_conversation_id(uid, source_started_at) if source_started_at else None
-                    )
-                    if legacy_id and legacy_id != conversation_id:
-                        conversations_skipped += 1
-                        logger.info("[Limitless Import] Skipped already-imported lifelog")
-                    elif lifecycle_service.persist_imported_conversation(uid, conversation.model_dump()):
+                # Create-if-absent: never duplicates and never clobbers edits a user made to a
+                # previously-imported conversation ("first import wins").
+                results = lifecycle_service.persist_imported_conversations(
+                    uid, [parsed.conversation for parsed in to_write]
+                )
+                for parsed, result in zip(to_write, results):
+                    if isinstance(result, Exception):
+                        record_error(f"Error processing {parsed.path}: {str(result)}")
+                    elif result:
                         conversations_created += 1
                     else:
                         conversations_skipped += 1
-                        logger.info("[Limitless Import] Skipped already-imported lifelog")
-
-                except Exception as e:
-                    error_msg = f"Error processing {lifelog_path}: {str(e)}"
-                    logger.info(error_msg)
-                    errors.append(error_msg)
-
-                processed_files += 1
-
-                # Update progress every 10 files to reduce database writes
-                if processed_files % 10 == 0 or processed_files == total_files:
-                    import_jobs_db.update_import_job(
-                        job_id,
-                        {
-                            'processed_files': processed_files,
-                            'conversations_created': conversations_created,
-                            'conversations_skipped': conversations_skipped,
-                        },
+                if conversations_skipped > skipped_before:
+                    logger.info(
+                        f"[Limitless Import] Skipped already-imported lifelogs: {conversations_skipped - skipped_before}"
                     )
 
+                saved = {
+                    'path': consumed_path,
+                    'processed_files': consumed,
+                    'conversations_created': conversations_created,
+                    'conversations_skipped': conversations_skipped,
+                    'errors': prior_errors + len(errors),
+                    'first_error': first_error,
+                }
+                batch, batch_ids, batch_bytes = [], set(), 0
+
+            def report_progress() -> bool:
+                """Write throttled progress; False once the user has cancelled the job."""
+                nonlocal last_progress_at
+                if time.monotonic() - last_progress_at < _PROGRESS_INTERVAL_SECONDS:
+                    return True
+                last_progress_at = time.monotonic()
+                current = import_jobs_db.get_import_job(job_id)
+                if current and current.get('status') == ImportJobStatus.cancelled.value:
+                    return False
+                import_jobs_db.update_import_job(
+                    job_id,
+                    {
+                        'processed_files': consumed,
+                        'conversations_created': conversations_created,
+                        'conversations_skipped': conversations_skipped,
+                        'checkpoint': saved,
+                    },
+                )
+                return True
+
+            parse = lambda path: _parse_lifelog_member(zf, uid, path, language_code)  # noqa: E731
+            cancelled = False
+            for parsed in _parsed_in_order(executor, parse, lifelog_files[resume_index:]):
+                if parsed.error:
+                    record_error(parsed.error)
+                elif parsed.conversation is not None:
+                    if batch and (
+                        len(batch) >= _WRITE_BATCH_MAX_DOCS or batch_bytes + parsed.size_bytes > _WRITE_BATCH_MAX_BYTES
+                    ):
+                        flush()
+                    if parsed.conversation['id'] in batch_ids:
+                        # Same identity twice in one archive: the first occurrence wins.
+                        conversations_skipped += 1
+                    else:
+                        batch.append(parsed)
+                        batch_ids.add(parsed.conversation['id'])
+                        batch_bytes += parsed.size_bytes
+                consumed += 1
+                consumed_path = parsed.path
+                if not report_progress():
+                    cancelled = True
+                    break
+
+            if batch and not cancelled:
+                flush()
+            error_count = prior_errors + len(errors)
             logger.info(
                 f"[Limitless Import] Done: {conversations_created} created, "
-                f"{conversations_skipped} skipped (already imported), {len(errors)} errors"
+                f"{conversations_skipped} skipped (already imported), {error_count} errors"
             )
 
             # Mark as completed
             final_status = ImportJobStatus.completed.value
             error_msg = None
 
-            if errors:
+            if error_count:
                 # Only a hard failure if nothing was created and nothing was skipped
                 # (a re-import that skips everything is a success, not a failure).
                 if conversations_created == 0 and conversations_skipped == 0:
                     final_status = ImportJobStatus.failed.value
-                    error_msg = f"All files failed to process. First error: {errors[0]}"
+                    error_msg = f"All files failed to process. First error: {first_error}"
                 else:
                     # Partial success
-                    error_msg = f"{len(errors)} files failed to process"
+                    error_msg = f"{error_count} files failed to process"
 
             # A user cancel during processing must stick: don't overwrite a cancelled job with the
             # final completed/failed status.
-            current = import_jobs_db.get_import_job(job_id)
-            if current and current.get('status') == ImportJobStatus.cancelled.value:
+            current = None if cancelled else import_jobs_db.get_import_job(job_id)
+            if cancelled or (current and current.get('status') == ImportJobStatus.cancelled.value):
                 logger.info(f"Import job {job_id} was cancelled; skipping final status write")
                 return
 
@@ -452,8 +604,10 @@ def process_limitless_import(job_id: str, uid: str, zip_path: str, language_code
                     'status': final_status,
                     'completed_at': datetime.now(timezone.utc).isoformat(),
                     'error': error_msg,
+                    'processed_files': consumed,
                     'conversations_created': conversations_created,
                     'conversations_skipped': conversations_skipped,
+                    'checkpoint': None,
                 },
             )
 
@@ -465,8 +619,8 @@ def process_limitless_import(job_id: str, uid: str, zip_path: str, language_code
                         f"Imported {conversations_created} new conversations "
                         f"({conversations_skipped} already imported) from your Limitless data."
                     )
-                if errors:
-                    complete_body += f" {len(errors)} file(s) could not be processed."
+                if error_count:
+                    complete_body += f" {error_count} file(s) could not be processed."
                 send_notification(
                     user_id=uid,
                     title="Limitless Import Complete! 🎉",
@@ -6,9 +6,11 @@ one implementation instead of maintaining copies of PCM mixing logic.
 
 from __future__ import annotations
 
-import struct
+import math
 from dataclasses import dataclass
-from typing import List
+from typing import List, Literal
+
+import numpy as np
 
 
 @dataclass(frozen=True)
@@ -37,26 +39,59 @@ def build_channel_config(source: str) -> List[ChannelConfig]:
 
 
 def mix_n_channel_buffers(buffers: List[bytearray]) -> bytes:
-    """Mix signed-16-bit mono buffers, clipping the result to int16."""
+    """Mix signed-16-bit mono buffers, clipping the result to int16.
+
+    Channels are read as zero-copy int16 views and summed in an int32
+    accumulator, so the clip matches per-sample ``max(-32768, min(32767, sum))``.
+    """
     min_len = min((len(buffer) for buffer in buffers), default=0)
     if min_len < 2:
         return b''
     min_len -= min_len % 2
     sample_count = min_len // 2
-    channels = [struct.unpack(f'<{sample_count}h', buffer[:min_len]) for buffer in buffers]
-    mixed = [max(-32768, min(32767, sum(channel[index] for channel in channels))) for index in range(sample_count)]
-    return struct.pack(f'<{len(mixed)}h', *mixed)
+    if len(buffers) == 1:
+        return bytes(memoryview(buffers[0])[:min_len])
+    mixed = np.zeros(sample_count, dtype=np.int32)
+    for buffer in buffers:
+        mixed += np.frombuffer(buffer, dtype='<i2', count=sample_count)
+    np.clip(mixed, -32768, 32767, out=mixed)
+    return mixed.astype('<i2').tobytes()
+
 
+ResampleMethod = Literal['nearest', 'linear', 'polyphase']
 
-def resample_pcm(pcm_data: bytes, source_rate: int, target_rate: int) -> bytes:
-    """Resample PCM by deterministic duplication/decimation for stream routing."""
+
+def resample_pcm(pcm_data: bytes, source_rate: int, target_rate: int, method: ResampleMethod = 'nearest') -> bytes:
+    """Resample PCM for stream routing.
+
+    ``nearest`` (default) is the deterministic duplication/decimation the
+    stream routing has always used: output sample ``i`` is input sample
+    ``int(i / ratio)``. ``linear`` interpolates between neighbours and
+    ``polyphase`` runs an anti-aliased polyphase FIR (scipy); both round and
+    clip to int16. Every method yields ``int(sample_count * ratio)`` samples.
+    """
     if source_rate == target_rate or source_rate <= 0 or target_rate <= 0:
         return pcm_data
     sample_count = len(pcm_data) // 2
     if sample_count == 0:
         return pcm_data
-    samples = struct.unpack(f'<{sample_count}h', pcm_data[: sample_count * 2])
+    samples = np.frombuffer(pcm_data, dtype='<i2', count=sample_count)
     ratio = target_rate / source_rate
     output_count = int(sample_count * ratio)
-    output = [samples[min(int(index / ratio), sample_count - 1)] for index in range(output_count)]
-    return struct.pack(f'<{len(output)}h', *output)
+    if method == 'nearest':
+        # float64 division then truncation reproduces Python's int(index / ratio)
+        indices = (np.arange(output_count, dtype=np.float64) / ratio).astype(np.int64)
+        np.minimum(indices, sample_count - 1, out=indices)
+        return samples[indices].astype('<i2', copy=False).tobytes()
+    if method == 'linear':
+        positions = np.arange(output_count, dtype=np.float64) / ratio
+        resampled = np.interp(positions, np.arange(sample_count, dtype=np.float64), samples)
+    elif method == 'polyphase':
+        from scipy.signal import resample_poly  # scipy is untyped; imported lazily, off the default path
+
+        divisor = math.gcd(source_rate, target_rate)
+        resampled = resample_poly(samples.astype(np.float64), target_rate // divisor, source_rate // divisor)
+        resampled = resampled[:output_count]
+    else:
+        raise ValueError(f'unknown resample method: {method}')
+    return np.clip(np.rint(resampled), -32768, 32767).astype('<i2').tobytes()
@@ -25,6 +25,7 @@ import tiktoken
 from models.structured_extraction import StructuredExtraction
 from utils.byok import get_byok_key
 from utils.llm.byok_errors import handle_llm_error
+from utils.llm.embedding_cache import CachedEmbeddings
 from utils.llm.model_config import (
     MODEL_QOS_PROFILES,
     _ANTHROPIC_ONLY_FEATURES,
@@ -667,10 +668,13 @@ llm_mini = _LazyClientProxy(_create_legacy_llm_mini)
 # ---------------------------------------------------------------------------
 # Embeddings, parser, utilities
 # ---------------------------------------------------------------------------
-embeddings = _OpenAIEmbeddingsProxy(
+embeddings = CachedEmbeddings(
+    _OpenAIEmbeddingsProxy(
+        model="text-embedding-3-large",
+        default=None,
+        ctor_kwargs={},
+    ),
     model="text-embedding-3-large",
-    default=None,
-    ctor_kwargs={},
 )
 parser = PydanticOutputParser(pydantic_object=StructuredExtraction)
 
@@ -0,0 +1,216 @@
+"""Content-addressed cache in front of the OpenAI embeddings client.
+
+Reprocessing a conversation, merging conversations and re-saving memories or
+action items re-embed text that has not changed. ``CachedEmbeddings`` keys every
+input by model and SHA-256 of its text and serves it from an in-process LRU, then
+Redis, before calling the provider. Vectors are stored as little-endian float16
+(6 KiB for a 3072-dim vector instead of ~60 KiB of JSON); every caller gets the
+float16-rounded vector, hit or miss, so the same text always yields the same values.
+
+Misses from concurrent callers are coalesced: while a provider call is in flight,
+new misses queue and the next free caller sends them as one ``embed_documents``
+request, and a text already in flight is awaited rather than embedded twice.
+Callers are grouped by BYOK key, since the caller that sends a batch sends it with
+its own key.
+"""
+
+import hashlib
+import logging
+import os
+import struct
+import threading
+from concurrent.futures import Future
+from dataclasses import dataclass, field
+from typing import Any, Dict, List, Optional, Sequence, Tuple
+
+from cachetools import LRUCache
+
+from utils.byok import get_byok_key
+
+logger = logging.getLogger(__name__)
+
+EMBEDDING_CACHE_ENABLED = os.getenv('EMBEDDING_CACHE_ENABLED', 'true').lower() == 'true'
+EMBEDDING_CACHE_REDIS_TTL_SECONDS = int(os.getenv('EMBEDDING_CACHE_REDIS_TTL_SECONDS', str(30 * 24 * 3600)))
+# 4096 float16 vectors of text-embedding-3-large is ~25 MiB.
+EMBEDDING_CACHE_LOCAL_MAX = int(os.getenv('EMBEDDING_CACHE_LOCAL_MAX', '4096'))
+
+_KEY_PREFIX = 'emb:v1'
+# Coalesced requests stay inside one provider request: langchain splits at 1000
+# inputs, and OpenAI rejects a request over 300k tokens (~4 characters a token).
+_COALESCE_MAX_INPUTS = 1000
+_COALESCE_MAX_CHARS = 800_000
+# Provider calls in flight per group before new misses start queueing.
+_MAX_INFLIGHT_CALLS = 2
+
+_local_cache: LRUCache[str, bytes] = LRUCache(maxsize=EMBEDDING_CACHE_LOCAL_MAX)
+_local_cache_lock = threading.Lock()
+
+
+def _cache_key(model: str, text: str) -> str:
+    return f'{_KEY_PREFIX}:{model}:{hashlib.sha256(text.encode("utf-8")).hexdigest()}'
+
+
+def encode_vector(vector: Sequence[float]) -> bytes:
+    return struct.pack(f'<{len(vector)}e', *vector)
+
+
+def decode_vector(data: bytes) -> List[float]:
+    return list(struct.unpack(f'<{len(data) // 2}e', data))
+
+
+def clear_embedding_cache() -> None:
+    """Drop the in-process tier (tests, model swaps)."""
+    with _local_cache_lock:
+        _local_cache.clear()
+
+
+def _redis() -> Any | None:
+    try:
+        from database.redis_db import r
+    except Exception as e:
+        logger.warning(f'embedding cache: redis unavailable: {e}')
+        return None
+    return r
+
+
+def _redis_get(keys: List[str]) -> Dict[str, bytes]:
+    client = _redis()
+    if client is None or not keys:
+        return {}
+    try:
+        values = client.mget(keys)
+    except Exception as e:
+        logger.warning(f'embedding cache: redis read failed for {len(keys)} keys: {e}')
+        return {}
+    return {key: value for key, value in zip(keys, values) if value}
+
+
+def _redis_set(entries: Dict[str, bytes]) -> None:
+    client = _redis()
+    if client is None or not entries:
+        return
+    try:
+        pipe = client.pipeline(transaction=False)
+        for key, value in entries.items():
+            pipe.set(key, value, ex=EMBEDDING_CACHE_REDIS_TTL_SECONDS)
+        pipe.execute()
+    except Exception as e:
+        logger.warning(f'embedding cache: redis write failed for {len(entries)} keys: {e}')
+
+
+@dataclass
+class _Group:
+    """Miss queue of one (model, BYOK key) group."""
+
+    pending: List[List[Tuple[str, str]]] = field(default_factory=list)
+    inflight: Dict[str, 'Future[bytes]'] = field(default_factory=dict)
+    calls: int = 0
+
+
+class CachedEmbeddings:
+    """``embed_documents``/``embed_query`` over an embeddings client, served from the cache tiers.
+
+    Anything else (``aembed_*``, attributes) is forwarded to the wrapped client uncached.
+    """
+
+    def __init__(self, client: Any, model: str):
+        self._client = client
+        self._model = model
+        self._cond = threading.Condition()
+        self._groups: Dict[str, _Group] = {}
+
+    def embed_documents(self, texts: List[str]) -> List[List[float]]:
+        if not EMBEDDING_CACHE_ENABLED:
+            return self._client.embed_documents(texts)
+        keys = [_cache_key(self._model, text) for text in texts]
+        found: Dict[str, bytes] = {}
+        with _local_cache_lock:
+            for key in keys:
+                value = _local_cache.get(key)
+                if value is not None:
+                    found[key] = value
+
+        missing = {key: text for key, text in zip(keys, texts) if key not in found}
+        from_redis = _redis_get(list(missing))
+        if from_redis:
+            found.update(from_redis)
+            with _local_cache_lock:
+                _local_cache.update(from_redis)
+            missing = {key: text for key, text in missing.items() if key not in from_redis}
+
+        if missing:
+            found.update(self._embed_coalesced(missing))
+        return [decode_vector(found[key]) for key in keys]
+
+    def embed_query(self, text: str) -> List[float]:
+        # OpenAI embeds queries and documents identically, so both share one cache entry.
+        if not EMBEDDING_CACHE_ENABLED:
+            return self._client.embed_query(text)
+        return self.embed_documents([text])[0]
+
+    def __getattr__(self, name: str) -> Any:
+        return getattr(self._client, name)
+
+    def _group_key(self) -> str:
+        byok = get_byok_key('openai')
+        return f'{self._model}:{hashlib.sha256(byok.encode()).hexdigest() if byok else "default"}'
+
+    def _embed_coalesced(self, missing: Dict[str, str]) -> Dict[str, bytes]:
+        """Embed cache misses, joining in-flight and queued requests of the same group."""
+        group_key = self._group_key()
+        with self._cond:
+            group = self._groups.setdefault(group_key, _Group())
+            futures: Dict[str, Future[bytes]] = {}
+            submission: List[Tuple[str, str]] = []
+            for key, text in missing.items():
+                future = group.inflight.get(key)
+                if future is None:
+                    future = Future()
+                    group.inflight[key] = future
+                    submission.append((key, text))
+                futures[key] = future
+            if submission:
+                group.pending.append(submission)
+
+            while not all(future.done() for future in futures.values()):
+                if group.pending and group.calls < _MAX_INFLIGHT_CALLS:
+                    self._send_batch(group)
+                else:
+                    self._cond.wait()
+            if not group.pending and not group.inflight and group.calls == 0:
+                self._groups.pop(group_key, None)
+        return {key: future.result() for key, future in futures.items()}
+
+    def _send_batch(self, group: _Group) -> None:
+        """Send queued submissions as one provider request. Called and returns with ``_cond`` held."""
+        batch: List[Tuple[str, str]] = []
+        chars = 0
+        while group.pending:
+            submission = group.pending[0]
+            size = sum(len(text) for _, text in submission)
+            if batch and (len(batch) + len(submission) > _COALESCE_MAX_INPUTS or chars + size > _COALESCE_MAX_CHARS):
+                break
+            batch.extend(group.pending.pop(0))
+            chars += size
+        group.calls += 1
+        self._cond.release()
+        encoded: Dict[str, bytes] = {}
+        error: Optional[BaseException] = None
+        try:
+            vectors = self._client.embed_documents([text for _, text in batch])
+            encoded = {key: encode_vector(vector) for (key, _), vector in zip(batch, vectors)}
+            with _local_cache_lock:
+                _local_cache.update(encoded)
+            _redis_set(encoded)
+        except BaseException as e:
+            error = e
+        finally:
+            self._cond.acquire()
+        group.calls -= 1
+        for key, _ in batch:
+            future = group.inflight.pop(key)
+            if key in encoded:
+                future.set_result(encoded[key])
+            else:
+                future.set_exception(error or RuntimeError('embedding provider returned too few vectors'))
+        self._cond.notify_all()
@@ -0,0 +1,155 @@
+"""Reusable in-memory index of one user's knowledge graph for traversal (WS-N).
+
+Built once from a graph snapshot so repeated traversals in a chat turn skip
+the per-call work: both directions of every edge live in one CSR-style
+adjacency (per-node offsets into a flat half-edge list, in the order the
+per-call adjacency lists had), labels and aliases are pre-lowered for seed
+resolution, and each half-edge carries its triple already filtered to the
+allowed long-term memory ids.
+"""
+
+from __future__ import annotations
+
+from typing import Any, Dict, List, NamedTuple, Optional, Sequence, Set, Tuple, cast
+
+GraphNode = Dict[str, Any]
+GraphEdge = Dict[str, Any]
+
+
+class TripleFields(NamedTuple):
+    source_id: str
+    source_label: str
+    relation: str
+    target_id: str
+    target_label: str
+    memory_ids: Tuple[str, ...]
+
+
+class HalfEdge(NamedTuple):
+    edge_id: Any
+    neighbor_id: str
+    triple: Optional[TripleFields]  # None when no allowed memory cites the edge or an endpoint is missing
+
+
+def _triple_fields(
+    edge: GraphEdge,
+    source_id: str,
+    target_id: str,
+    nodes_by_id: Dict[str, GraphNode],
+    allowed_memory_ids: Set[str],
+) -> Optional[TripleFields]:
+    raw_memory_ids = edge.get("memory_ids")
+    memory_ids = (
+        tuple(
+            memory_id
+            for memory_id in cast(List[Any], raw_memory_ids)
+            if isinstance(memory_id, str) and memory_id in allowed_memory_ids
+        )
+        if isinstance(raw_memory_ids, list)
+        else ()
+    )
+    if not memory_ids:
+        return None
+
+    source = nodes_by_id.get(source_id)
+    target = nodes_by_id.get(target_id)
+    if not source or not target:
+        return None
+
+    return TripleFields(
+        source_id=source["id"],
+        source_label=source.get("label", ""),
+        relation=edge.get("label", ""),
+        target_id=target["id"],
+        target_label=target.get("label", ""),
+        memory_ids=memory_ids,
+    )
+
+
+class KnowledgeGraphIndex:
+    """Seed lookup, adjacency and citation content for one graph snapshot.
+
+    ``citations`` maps long-term memory ids to their content when the index was
+    built together with the memory items; it is None for ad-hoc indexes, whose
+    callers load citations themselves.
+    """
+
+    def __init__(
+        self,
+        graph: Dict[str, Any],
+        allowed_memory_ids: Set[str],
+        citations: Optional[Dict[str, str]] = None,
+    ):
+        raw_nodes = graph.get("nodes")
+        raw_edges = graph.get("edges")
+        nodes = cast(List[GraphNode], raw_nodes) if isinstance(raw_nodes, list) else []
+        edges = cast(List[GraphEdge], raw_edges) if isinstance(raw_edges, list) else []
+        self.nodes_by_id: Dict[str, GraphNode] = {
+            node_id: node for node in nodes if isinstance((node_id := node.get("id")), str)
+        }
+        self.citations = citations
+
+        self._exact: Dict[str, List[Any]] = {}
+        self._terms: List[Tuple[Any, str, Tuple[str, ...]]] = []
+        for node in nodes:
+            node_id = node.get("id")
+            if not node_id:
+                continue
+            label = (node.get("label") or "").lower()
+            raw_aliases = node.get("aliases")
+            aliases = (
+                tuple(str(alias).lower() for alias in cast(List[Any], raw_aliases))
+                if isinstance(raw_aliases, list)
+                else ()
+            )
+            for term in {label, *aliases}:
+                self._exact.setdefault(term, []).append(node_id)
+            self._terms.append((node_id, label, aliases))
+
+        buckets: Dict[str, List[HalfEdge]] = {}
+        for edge in edges:
+            source_id = edge.get("source_id")
+            target_id = edge.get("target_id")
+            if not source_id or not target_id:
+                continue
+            edge_id = edge.get("id")
+            buckets.setdefault(source_id, []).append(
+                HalfEdge(
+                    edge_id, target_id, _triple_fields(edge, source_id, target_id, self.nodes_by_id, allowed_memory_ids)
+                )
+            )
+            buckets.setdefault(target_id, []).append(
+                HalfEdge(
+                    edge_id, source_id, _triple_fields(edge, target_id, source_id, self.nodes_by_id, allowed_memory_ids)
+                )
+            )
+
+        self._positions: Dict[str, int] = {}
+        self._offsets: List[int] = [0]
+        self._half_edges: List[HalfEdge] = []
+        for node_id, half_edges in buckets.items():
+            self._positions[node_id] = len(self._positions)
+            self._half_edges.extend(half_edges)
+            self._offsets.append(len(self._half_edges))
+
+    def resolve_seeds(self, entity_query: str) -> List[Any]:
+        """Node ids whose label or alias equals the query, else those containing it."""
+        query = (entity_query or "").strip().lower()
+        if not query:
+            return []
+        exact = self._exact.get(query)
+        if exact:
+            return list(exact)
+        return [
+            node_id
+            for node_id, label, aliases in self._terms
+            if query in label or any(query in alias for alias in aliases)
+        ]
+
+    def neighbors(self, node_id: str, limit: int) -> Sequence[HalfEdge]:
+        """The first ``limit`` half-edges leaving node_id, in edge order."""
+        position = self._positions.get(node_id)
+        if position is None:
+            return ()
+        start = self._offsets[position]
+        return self._half_edges[start : min(start + limit, self._offsets[position + 1])]
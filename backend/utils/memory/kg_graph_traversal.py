@@ -9,12 +9,17 @@ from __future__ import annotations
 
 import logging
 import os
+import threading
+from collections import deque
 from dataclasses import dataclass, field
-from typing import Any, Callable, Dict, List, Optional, Set, Tuple, cast
+from typing import Any, Callable, Deque, Dict, List, Optional, Set, Tuple, cast
+
+from cachetools import TTLCache
 
 from database._client import db as default_db_client
 from database import knowledge_graph as kg_db
 from utils.memory.atom_keyword_index import is_indexable_long_term_atom
+from utils.memory.kg_graph_index import KnowledgeGraphIndex
 from utils.memory.memory_system import (  # compatibility exports; never a gate
     MemorySystem as MemorySystem,
     resolve_memory_system as resolve_memory_system,
@@ -32,6 +37,11 @@ MAX_TRAVERSAL_HOPS = int(os.environ.get("KG_TRAVERSAL_MAX_HOPS", "2"))
 MAX_EDGES_PER_NODE = int(os.environ.get("KG_TRAVERSAL_MAX_EDGES_PER_NODE", "25"))
 MAX_TRIPLES = int(os.environ.get("KG_TRAVERSAL_MAX_TRIPLES", "60"))
 
+# Per-user traversal index: (graph write version, index). Writes on this
+# instance bump the version; other instances pick them up within the TTL.
+_graph_index_cache = TTLCache[str, Tuple[int, KnowledgeGraphIndex]](maxsize=2000, ttl=30)
+_graph_index_lock = threading.Lock()
+
 
 @dataclass(frozen=True)
 class GraphTriple:
@@ -92,83 +102,40 @@ def _normalize_hops(requested: int) -> Tuple[int, bool]:
     return requested, False
 
 
-def _resolve_seed_node_ids(nodes: List[GraphNode], entity_query: str) -> List[str]:
-    query = (entity_query or "").strip().lower()
-    if not query:
-        return []
+def _load_knowledge_graph_index(uid: str, *, db_client: Any) -> KnowledgeGraphIndex:
+    items = fetch_authoritative_product_memory_items(uid=uid, db_client=db_client)
+    allowed_memory_ids = {item.memory_id for item in items if is_indexable_long_term_atom(item)}
+    items_by_id = {item.memory_id: item for item in items}
+    citations = {
+        memory_id: (item.content or "").strip()
+        for memory_id, item in items_by_id.items()
+        if is_indexable_long_term_atom(item)
+    }
+    get_knowledge_graph = cast(Callable[[str], Dict[str, Any]], getattr(kg_db, "get_knowledge_graph"))
+    return KnowledgeGraphIndex(get_knowledge_graph(uid), allowed_memory_ids, citations)
 
-    exact: List[str] = []
-    partial: List[str] = []
-    for node in nodes:
-        node_id = node.get("id")
-        if not node_id:
-            continue
-        label = (node.get("label") or "").lower()
-        raw_aliases = node.get("aliases")
-        aliases = (
-            [str(alias).lower() for alias in cast(List[Any], raw_aliases)] if isinstance(raw_aliases, list) else []
-        )
-        if label == query or query in aliases:
-            exact.append(node_id)
-        elif query in label or any(query in alias for alias in aliases):
-            partial.append(node_id)
 
-    return exact or partial
+def get_knowledge_graph_index(uid: str, *, db_client: Any = None) -> KnowledgeGraphIndex:
+    """Cached traversal index for uid, rebuilt after a local graph write or when the TTL lapses."""
+    client = db_client if db_client is not None else default_db_client
+    version = kg_db.knowledge_graph_version(uid)
+    with _graph_index_lock:
+        cached = _graph_index_cache.get(uid)
+    if cached is not None and cached[0] == version:
+        return cached[1]
 
+    index = _load_knowledge_graph_index(uid, db_client=client)
+    with _graph_index_lock:
+        _graph_index_cache[uid] = (version, index)
+    return index
 
-def _build_adjacency(edges: List[GraphEdge]) -> Dict[str, List[GraphEdge]]:
-    adjacency: Dict[str, List[GraphEdge]] = {}
-    for edge in edges:
-        source_id = edge.get("source_id")
-        target_id = edge.get("target_id")
-        if not source_id or not target_id:
-            continue
-        adjacency.setdefault(source_id, []).append(edge)
-        reverse: GraphEdge = {
-            "id": edge.get("id"),
-            "source_id": target_id,
-            "target_id": source_id,
-            "label": edge.get("label", ""),
-            "memory_ids": edge.get("memory_ids") or [],
-            "_reversed": True,
-        }
-        adjacency.setdefault(target_id, []).append(reverse)
-    return adjacency
-
-
-def _edge_triple(
-    edge: GraphEdge,
-    nodes_by_id: Dict[str, GraphNode],
-    hop_distance: int,
-    allowed_memory_ids: Set[str],
-) -> Optional[GraphTriple]:
-    raw_memory_ids = edge.get("memory_ids")
-    memory_ids = (
-        tuple(
-            memory_id
-            for memory_id in cast(List[Any], raw_memory_ids)
-            if isinstance(memory_id, str) and memory_id in allowed_memory_ids
-        )
-        if isinstance(raw_memory_ids, list)
-        else ()
-    )
-    if not memory_ids:
-        return None
-
-    source = nodes_by_id.get(edge.get("source_id") or "")
-    target = nodes_by_id.get(edge.get("target_id") or "")
-    if not source or not target:
-        return None
-
-    return GraphTriple(
-        source_id=source["id"],
-        source_label=source.get("label", ""),
-        relation=edge.get("label", ""),
-        target_id=target["id"],
-        target_label=target.get("label", ""),
-        memory_ids=memory_ids,
-        hop_distance=hop_distance,
-    )
+
+def clear_knowledge_graph_index(uid: Optional[str] = None) -> None:
+    with _graph_index_lock:
+        if uid is None:
+            _graph_index_cache.clear()
+        else:
+            _graph_index_cache.pop(uid, None)
 
 
 def traverse_knowledge_graph(
@@ -193,59 +160,42 @@ def traverse_knowledge_graph(
         result.skipped_reason = "invalid_uid"
         return result
 
-    allowed_memory_ids = _long_term_memory_ids(uid, db_client=client)
     if graph is None:
-        get_knowledge_graph = cast(Callable[[str], Dict[str, Any]], getattr(kg_db, "get_knowledge_graph"))
-        graph = get_knowledge_graph(uid)
-
-    raw_nodes = graph.get("nodes")
-    raw_edges = graph.get("edges")
-    nodes = cast(List[GraphNode], raw_nodes) if isinstance(raw_nodes, list) else []
-    edges = cast(List[GraphEdge], raw_edges) if isinstance(raw_edges, list) else []
-    nodes_by_id: Dict[str, GraphNode] = {
-        node_id: node for node in nodes if isinstance((node_id := node.get("id")), str)
-    }
-    result.seed_node_ids = _resolve_seed_node_ids(nodes, entity_query)
+        index = get_knowledge_graph_index(uid, db_client=client)
+    else:
+        index = KnowledgeGraphIndex(graph, _long_term_memory_ids(uid, db_client=client))
+    nodes_by_id = index.nodes_by_id
+    result.seed_node_ids = index.resolve_seeds(entity_query)
     if not result.seed_node_ids:
         return result
 
-    adjacency = _build_adjacency(edges)
-    visited_nodes: Set[str] = set()
+    visited_nodes: Set[str] = set(result.seed_node_ids)
     collected_edge_ids: Set[str] = set()
     collected_triples: List[GraphTriple] = []
     collected_node_ids: Set[str] = set(result.seed_node_ids)
 
-    frontier: List[Tuple[str, int]] = [(node_id, 0) for node_id in result.seed_node_ids]
-    for node_id in result.seed_node_ids:
-        visited_nodes.add(node_id)
-
+    frontier: Deque[Tuple[str, int]] = deque((node_id, 0) for node_id in result.seed_node_ids)
     while frontier and len(collected_triples) < MAX_TRIPLES:
-        current_id, depth = frontier.pop(0)
+        current_id, depth = frontier.popleft()
         if depth >= effective_hops:
             continue
 
-        node_edges = adjacency.get(current_id, [])[:MAX_EDGES_PER_NODE]
-        for edge in node_edges:
-            edge_id = edge.get("id")
+        for edge_id, neighbor_id, fields in index.neighbors(current_id, MAX_EDGES_PER_NODE):
             if edge_id and edge_id in collected_edge_ids:
                 continue
-
-            triple = _edge_triple(edge, nodes_by_id, depth + 1, allowed_memory_ids)
-            if triple is None:
+            if fields is None:
                 continue
 
             if edge_id:
                 collected_edge_ids.add(edge_id)
-            collected_triples.append(triple)
+            collected_triples.append(GraphTriple(*fields, hop_distance=depth + 1))
             if len(collected_triples) >= MAX_TRIPLES:
                 break
 
-            neighbor_id = edge.get("target_id")
-            if neighbor_id:
-                collected_node_ids.add(neighbor_id)
-                if neighbor_id not in visited_nodes and depth + 1 < effective_hops:
-                    visited_nodes.add(neighbor_id)
-                    frontier.append((neighbor_id, depth + 1))
+            collected_node_ids.add(neighbor_id)
+            if neighbor_id not in visited_nodes and depth + 1 < effective_hops:
+                visited_nodes.add(neighbor_id)
+                frontier.append((neighbor_id, depth + 1))
 
     result.triples = collected_triples
     result.nodes = [nodes_by_id[node_id] for node_id in sorted(collected_node_ids) if node_id in nodes_by_id]
@@ -258,7 +208,11 @@ def traverse_knowledge_graph(
                 seen_citations.add(memory_id)
                 cited_ids.append(memory_id)
 
-    if cited_ids:
+    if cited_ids and index.citations is not None:
+        for memory_id in cited_ids:
+            if memory_id in index.citations:
+                result.memory_citations.append({"memory_id": memory_id, "content": index.citations[memory_id]})
+    elif cited_ids:
         items_by_id = {
             item.memory_id: item for item in fetch_authoritative_product_memory_items(uid=uid, db_client=client)
         }
@@ -1435,6 +1435,12 @@ class MemoryService:
 
     def _invalidate_prompt_cache(self, uid: str) -> None:
         clear_rejected_memory_feedback_cache(uid)
+        try:
+            from utils.memory.kg_graph_traversal import clear_knowledge_graph_index
+        except ImportError:
+            pass
+        else:
+            clear_knowledge_graph_index(uid)
         try:
             from utils.llms.memory import clear_prompt_data_cache
         except ImportError:
@@ -57,6 +57,7 @@ from utils.memory_ingestion.models import (
     VectorUpsert,
 )
 from utils.memory_ingestion.redaction import redact_payload, redact_text
+from utils.memory_ingestion.similarity import MemoryTextIndex, NearDuplicateIndex
 from utils.memory_ingestion.stages.verify_output import verify_output
 
 
@@ -929,6 +930,8 @@ def _decide_frames(
         memory for memory in user_state.reviewed_memories if memory.status == "active"
     ]
     rejected = user_state.rejected_memories
+    active_index = _memory_text_index(active)
+    rejected_index = _memory_text_index(rejected)
     for frame in frames:
         frame_id = frame.frame_id or ""
         if frame_id in decisions_by_frame or frame_id in resolutions_by_frame:
@@ -943,7 +946,15 @@ def _decide_frames(
                 )
             )
             continue
-        decision = _decision_for_frame(frame, active, rejected, routing, id_factory)
+        decision = _decision_for_frame(
+            frame,
+            active,
+            rejected,
+            routing,
+            id_factory,
+            active_index=active_index,
+            rejected_index=rejected_index,
+        )
         decisions.append(decision)
         resolutions.append(
             FrameResolution(
@@ -962,6 +973,9 @@ def _decision_for_frame(
     rejected_memories: list[ExistingMemorySnapshot],
     routing: RoutingConfig,
     id_factory: StableIdFactory,
+    *,
+    active_index: MemoryTextIndex | None = None,
+    rejected_index: MemoryTextIndex | None = None,
 ) -> MemoryDecision:
     frame_id = frame.frame_id or ""
     matching_active: ExistingMemorySnapshot | None = None
@@ -978,8 +992,8 @@ def _decision_for_frame(
         action = "reject_ephemeral"
         rationale = "Ephemeral frame should not become durable memory."
     else:
-        matching_rejected = _find_matching_memory(frame, rejected_memories)
-        matching_active = _find_matching_memory(frame, active_memories)
+        matching_rejected = _find_matching_memory(frame, rejected_memories, rejected_index)
+        matching_active = _find_matching_memory(frame, active_memories, active_index)
         conflicting_active = _find_conflicting_memory(frame, active_memories)
         if matching_rejected:
             action = "reject_matches_rejected"
@@ -1032,7 +1046,7 @@ def _decision_for_frame(
         else:
             action = "route_to_review"
             rationale = "Frame is not eligible for automatic memory creation."
-    target = matching_active or _find_matching_memory(frame, active_memories)
+    target = matching_active or _find_matching_memory(frame, active_memories, active_index)
     preconditions: list[MutationPrecondition] = []
     target_ids: list[str] = []
     if target:
@@ -1065,31 +1079,24 @@ def _decision_for_frame(
     )
 
 
+def _memory_text_index(memories: list[ExistingMemorySnapshot]) -> MemoryTextIndex:
+    return MemoryTextIndex([_normalized_text(memory.normalized_text or memory.text) for memory in memories])
+
+
 def _find_matching_memory(
-    frame: MemoryEventFrame, memories: list[ExistingMemorySnapshot]
+    frame: MemoryEventFrame,
+    memories: list[ExistingMemorySnapshot],
+    index: MemoryTextIndex | None = None,
 ) -> ExistingMemorySnapshot | None:
-    frame_text = _normalized_text(frame.canonical_text)
-    for memory in memories:
-        memory_text = _normalized_text(memory.normalized_text or memory.text)
-        if _memory_texts_match(frame_text, memory_text):
-            return memory
-    return None
-
+    """Return the first memory whose text matches the frame, in list order.
 
-def _memory_texts_match(left: str, right: str) -> bool:
-    if left == right:
-        return True
-    if not left or not right:
-        return False
-    shorter, longer = (left, right) if len(left) <= len(right) else (right, left)
-    if len(shorter) >= 8 and shorter in longer:
-        return True
-    left_tokens = set(left.split())
-    right_tokens = set(right.split())
-    if not left_tokens or not right_tokens:
-        return False
-    overlap = len(left_tokens & right_tokens)
-    return overlap >= 3 and overlap / min(len(left_tokens), len(right_tokens)) >= 0.8
+    ``index`` must be built from ``memories``; callers deciding many frames
+    against the same snapshot pass one in instead of rebuilding it per frame.
+    """
+    if index is None:
+        index = _memory_text_index(memories)
+    position = index.first_match(_normalized_text(frame.canonical_text))
+    return memories[position] if position is not None else None
 
 
 def _find_conflicting_memory(
@@ -1330,24 +1337,6 @@ def _triple_canonical(triple: DerivedTriple) -> str:
     return f"{subj}|{triple.predicate}|{obj_text}".casefold()
 
 
-def _edit_distance(a: str, b: str) -> int:
-    """Levenshtein edit distance between two strings."""
-    if len(a) < len(b):
-        return _edit_distance(b, a)
-    if len(b) == 0:
-        return len(a)
-    prev_row = list(range(len(b) + 1))
-    for i, ca in enumerate(a):
-        curr_row = [i + 1]
-        for j, cb in enumerate(b):
-            insertions = prev_row[j + 1] + 1
-            deletions = curr_row[j] + 1
-            substitutions = prev_row[j] + (ca != cb)
-            curr_row.append(min(insertions, deletions, substitutions))
-        prev_row = curr_row
-    return prev_row[-1]
-
-
 def _dedupe_triples(
     triples: list[DerivedTriple],
 ) -> list[DerivedTriple]:
@@ -1402,17 +1391,12 @@ def _dedupe_triples(
 
     # --- Pass 3: near-duplicate suppression (edit distance < 5) ---
     kept: list[DerivedTriple] = []
-    seen_canonicals: list[str] = []
+    seen_canonicals = NearDuplicateIndex(max_distance=4)
     for t in pass2_best:
         canon = _triple_canonical(t)
-        is_dup = False
-        for existing in seen_canonicals:
-            if _edit_distance(canon, existing) < 5:
-                is_dup = True
-                break
-        if not is_dup:
+        if not seen_canonicals.contains_near(canon):
             kept.append(t)
-            seen_canonicals.append(canon)
+            seen_canonicals.add(canon)
 
     return kept
 
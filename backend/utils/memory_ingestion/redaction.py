@@ -13,6 +13,9 @@ class SecretPattern:
     category: str
     placeholder: str
     regex: re.Pattern[str]
+    # Literals every match contains at least one of (compared case-insensitively
+    # when the regex is), so text without any of them is never scanned.
+    hints: tuple[str, ...] = ()
 
 
 SECRET_PATTERNS = [
@@ -20,21 +23,25 @@ SECRET_PATTERNS = [
         category="private_key",
         placeholder="[REDACTED_PRIVATE_KEY]",
         regex=re.compile(r"-----BEGIN [A-Z ]*PRIVATE KEY-----.*?-----END [A-Z ]*PRIVATE KEY-----", re.DOTALL),
+        hints=("-----BEGIN",),
     ),
     SecretPattern(
         category="private_key",
         placeholder="[REDACTED_PRIVATE_KEY]",
         regex=re.compile(r"-----BEGIN [A-Z ]*PRIVATE KEY-----"),
+        hints=("-----BEGIN",),
     ),
     SecretPattern(
         category="database_url",
         placeholder="[REDACTED_DATABASE_URL]",
         regex=re.compile(r"\b[a-z][a-z0-9+.-]*://[^/\s:@]+:[^@\s]+@[^/\s]+[^\s]*", re.IGNORECASE),
+        hints=("://",),
     ),
     SecretPattern(
         category="api_key",
         placeholder="[REDACTED_API_KEY]",
         regex=re.compile(r"\b(?:sk[-_][A-Za-z0-9_-]{16,}|ghp_[A-Za-z0-9_]{20,}|AKIA[0-9A-Z]{16})\b"),
+        hints=("sk-", "sk_", "ghp_", "AKIA"),
     ),
     SecretPattern(
         category="one_time_code",
@@ -43,6 +50,7 @@ SECRET_PATTERNS = [
             r"\b(?:one[- ]?time code|verification code|2fa code|mfa code|otp)\s+(?:is\s+)?['\"]?([0-9]{4,8})\b",
             re.IGNORECASE,
         ),
+        hints=("code", "otp"),
     ),
     SecretPattern(
         category="token",
@@ -51,20 +59,40 @@ SECRET_PATTERNS = [
             r"\b(?:token|auth[_-]?token|access[_-]?token|bearer)\s*[:=]\s*['\"]?([A-Za-z0-9._~+/=-]{16,})",
             re.IGNORECASE,
         ),
+        hints=("token", "bearer"),
     ),
     SecretPattern(
         category="password",
         placeholder="[REDACTED_PASSWORD]",
         regex=re.compile(r"\b(?:password|passwd|pwd)\s*[:=]\s*['\"]?([^'\"\s]{8,})", re.IGNORECASE),
+        hints=("pass", "pwd"),
     ),
     SecretPattern(
         category="cookie",
         placeholder="[REDACTED_COOKIE]",
         regex=re.compile(r"\b(?:session|cookie)\s*[:=]\s*['\"]?([A-Za-z0-9._~+/=-]{16,})", re.IGNORECASE),
+        hints=("session", "cookie"),
     ),
 ]
 
 
+def _fold(text: str) -> str:
+    folded = text.lower()
+    if text.isascii():
+        return folded
+    # Under re.IGNORECASE these also match ASCII "i"/"s", but lower() does not map
+    # them there (and turns U+0130 into "i" plus U+0307), so a hint check could
+    # skip a real match. Folding too much only ever means an unneeded scan.
+    return folded.replace("\u0307", "").replace("\u0131", "i").replace("\u017f", "s")
+
+
+def _may_match(pattern: SecretPattern, text: str, folded: str) -> bool:
+    if not pattern.hints:
+        return True
+    haystack = folded if pattern.regex.flags & re.IGNORECASE else text
+    return any(hint in haystack for hint in pattern.hints)
+
+
 def redact_text(
     text: str,
     *,
@@ -73,33 +101,47 @@ def redact_text(
     hmac_key: str | None,
     payload_path: str | None = None,
 ) -> tuple[str, list[RedactionRecord]]:
+    """Replace secrets with placeholders, returning the redacted text and one record per match.
+
+    Patterns apply in ``SECRET_PATTERNS`` order, each over the output of the ones
+    before it: an earlier pattern wins an overlap, and record offsets and ids are
+    positions in the text that pattern saw. Each pattern's records are emitted
+    last match first.
+    """
     redactions: list[RedactionRecord] = []
     redacted = text
-    offset = 0
+    folded = _fold(text)
     for pattern in SECRET_PATTERNS:
-        replacements: list[tuple[int, int, str, str]] = []
-        for match in pattern.regex.finditer(redacted):
+        if not _may_match(pattern, redacted, folded):
+            continue
+        matches = list(pattern.regex.finditer(redacted))
+        if not matches:
+            continue
+        parts: list[str] = []
+        cursor = 0
+        for match in matches:
+            parts.append(redacted[cursor : match.start()])
+            parts.append(pattern.placeholder)
+            cursor = match.end()
+        parts.append(redacted[cursor:])
+        for match in reversed(matches):
             secret_value = match.group(1) if match.groups() else match.group(0)
-            replacements.append((match.start(), match.end(), pattern.placeholder, secret_value))
-        for start, end, placeholder, secret_value in reversed(replacements):
-            absolute_start = start + offset
-            absolute_end = end + offset
-            value_hash = stable_hmac(hmac_key, secret_value) if hmac_key else None
             redactions.append(
                 RedactionRecord(
                     redaction_id=id_factory.new_id(
-                        "redaction", source_event_id, payload_path, absolute_start, pattern.category
+                        "redaction", source_event_id, payload_path, match.start(), pattern.category
                     ),
                     source_event_id=source_event_id,
                     category=pattern.category,  # type: ignore[arg-type]
-                    placeholder=placeholder,
-                    char_start=absolute_start,
-                    char_end=absolute_end,
+                    placeholder=pattern.placeholder,
+                    char_start=match.start(),
+                    char_end=match.end(),
                     payload_path=payload_path,
-                    value_hash=value_hash,
+                    value_hash=stable_hmac(hmac_key, secret_value) if hmac_key else None,
                 )
             )
-            redacted = redacted[:start] + placeholder + redacted[end:]
+        redacted = "".join(parts)
+        folded = _fold(redacted)
     return redacted, redactions
 
 
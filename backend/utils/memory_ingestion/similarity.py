@@ -0,0 +1,181 @@
+"""Indexed near-duplicate matching for memory ingestion dedupe.
+
+Both indexes return exactly what a linear scan with the same predicate would,
+but only verify the candidates that an inverted index can prove are possible
+matches, so lookups stay cheap as the number of stored texts grows.
+"""
+
+from __future__ import annotations
+
+from collections import Counter
+from typing import Sequence
+
+_SUBSTRING_MIN_CHARS = 8
+_TOKEN_OVERLAP_MIN = 3
+_TOKEN_OVERLAP_RATIO = 0.8
+
+
+def edit_distance_within(a: str, b: str, limit: int) -> bool:
+    """Return whether the Levenshtein distance between a and b is at most limit.
+
+    Only the diagonal band of width 2 * limit + 1 is computed, and the scan stops
+    as soon as a whole row exceeds the limit.
+    """
+    if abs(len(a) - len(b)) > limit:
+        return False
+    if len(a) < len(b):
+        a, b = b, a
+    width = len(b)
+    if width == 0:
+        return len(a) <= limit
+    over = limit + 1
+    prev_row = [j if j <= limit else over for j in range(width + 1)]
+    for i, ca in enumerate(a, start=1):
+        curr_row = [over] * (width + 1)
+        curr_row[0] = i if i <= limit else over
+        row_min = curr_row[0]
+        for j in range(max(1, i - limit), min(width, i + limit) + 1):
+            value = min(prev_row[j] + 1, curr_row[j - 1] + 1, prev_row[j - 1] + (ca != b[j - 1]))
+            if value > over:
+                value = over
+            curr_row[j] = value
+            if value < row_min:
+                row_min = value
+        if row_min > limit:
+            return False
+        prev_row = curr_row
+    return prev_row[width] <= limit
+
+
+def _partition(length: int, parts: int) -> list[tuple[int, int]]:
+    base, extra = divmod(length, parts)
+    segments: list[tuple[int, int]] = []
+    start = 0
+    for index in range(parts):
+        size = base + (1 if index >= parts - extra else 0)
+        segments.append((start, size))
+        start += size
+    return segments
+
+
+class NearDuplicateIndex:
+    """Answer "is any added text within max_distance edits of this one?".
+
+    Each added text is split into max_distance + 1 segments. A string within
+    max_distance edits must contain one of those segments verbatim, shifted by
+    at most max_distance characters, so a query only verifies texts sharing a
+    segment at a compatible length and offset (pigeonhole blocking).
+    """
+
+    def __init__(self, max_distance: int):
+        self.max_distance = max_distance
+        self._texts: list[str] = []
+        self._short: dict[int, list[int]] = {}
+        self._segments: dict[tuple[int, int, str], list[int]] = {}
+
+    def __len__(self) -> int:
+        return len(self._texts)
+
+    def add(self, text: str) -> None:
+        position = len(self._texts)
+        self._texts.append(text)
+        length = len(text)
+        if length <= self.max_distance:
+            self._short.setdefault(length, []).append(position)
+            return
+        for index, (start, size) in enumerate(_partition(length, self.max_distance + 1)):
+            self._segments.setdefault((length, index, text[start : start + size]), []).append(position)
+
+    def contains_near(self, text: str) -> bool:
+        limit = self.max_distance
+        size_of_text = len(text)
+        checked: set[int] = set()
+        for length in range(max(0, size_of_text - limit), size_of_text + limit + 1):
+            if length <= limit:
+                for position in self._short.get(length, ()):
+                    if edit_distance_within(text, self._texts[position], limit):
+                        return True
+                continue
+            for index, (start, size) in enumerate(_partition(length, limit + 1)):
+                for offset in range(max(0, start - limit), min(size_of_text - size, start + limit) + 1):
+                    for position in self._segments.get((length, index, text[offset : offset + size]), ()):
+                        if position in checked:
+                            continue
+                        checked.add(position)
+                        if edit_distance_within(text, self._texts[position], limit):
+                            return True
+        return False
+
+
+def memory_texts_match(left: str, right: str) -> bool:
+    if left == right:
+        return True
+    if not left or not right:
+        return False
+    shorter, longer = (left, right) if len(left) <= len(right) else (right, left)
+    if len(shorter) >= _SUBSTRING_MIN_CHARS and shorter in longer:
+        return True
+    left_tokens = set(left.split())
+    right_tokens = set(right.split())
+    if not left_tokens or not right_tokens:
+        return False
+    overlap = len(left_tokens & right_tokens)
+    return overlap >= _TOKEN_OVERLAP_MIN and overlap / min(len(left_tokens), len(right_tokens)) >= _TOKEN_OVERLAP_RATIO
+
+
+class MemoryTextIndex:
+    """Find the first normalized memory text that memory_texts_match a query.
+
+    Candidates come from three indexes, one per clause of the predicate: exact
+    text, character 8-grams for containment, and a token inverted index whose
+    posting counts give the shared-token overlap directly.
+    """
+
+    def __init__(self, texts: Sequence[str]):
+        self._texts = list(texts)
+        self._exact: dict[str, int] = {}
+        self._prefixes: dict[str, list[int]] = {}
+        self._grams: dict[str, list[int]] = {}
+        self._tokens: dict[str, list[int]] = {}
+        self._token_counts: list[int] = []
+        for position, text in enumerate(self._texts):
+            self._exact.setdefault(text, position)
+            tokens = set(text.split())
+            self._token_counts.append(len(tokens))
+            for token in tokens:
+                self._tokens.setdefault(token, []).append(position)
+            if len(text) < _SUBSTRING_MIN_CHARS:
+                continue
+            self._prefixes.setdefault(text[:_SUBSTRING_MIN_CHARS], []).append(position)
+            for gram in {text[i : i + _SUBSTRING_MIN_CHARS] for i in range(len(text) - _SUBSTRING_MIN_CHARS + 1)}:
+                self._grams.setdefault(gram, []).append(position)
+
+    def __len__(self) -> int:
+        return len(self._texts)
+
+    def first_match(self, text: str) -> int | None:
+        """Return the lowest position a linear memory_texts_match scan would stop at."""
+        candidates: set[int] = set()
+        exact = self._exact.get(text)
+        if exact is not None:
+            candidates.add(exact)
+        if text:
+            if len(text) >= _SUBSTRING_MIN_CHARS:
+                # Query contained in a longer stored text.
+                candidates.update(self._grams.get(text[:_SUBSTRING_MIN_CHARS], ()))
+                # Stored text contained in the query: its prefix is one of the query's 8-grams.
+                for i in range(len(text) - _SUBSTRING_MIN_CHARS + 1):
+                    candidates.update(self._prefixes.get(text[i : i + _SUBSTRING_MIN_CHARS], ()))
+            tokens = set(text.split())
+            if len(tokens) >= _TOKEN_OVERLAP_MIN:
+                shared = Counter(position for token in tokens for position in self._tokens.get(token, ()))
+                for position, overlap in shared.items():
+                    if (
+                        overlap >= _TOKEN_OVERLAP_MIN
+                        and overlap / min(len(tokens), self._token_counts[position]) >= _TOKEN_OVERLAP_RATIO
+                    ):
+                        candidates.add(position)
+        for position in sorted(candidates):
+            if memory_texts_match(text, self._texts[position]):
+                return position
+        return None
@@ -389,6 +389,30 @@ for _list_route in ('action-items', 'conversations', 'memories'):
     for _list_outcome in ('complete', 'truncated'):
         LIST_READ_REQUEST_TOTAL.labels(route=_list_route, outcome=_list_outcome)
 
+IN_MEMORY_CACHE_REQUESTS_TOTAL = Counter(
+    'in_memory_cache_requests_total',
+    'In-process cache lookups by cache name and result (hit, stale, miss)',
+    ['cache', 'result'],
+)
+
+IN_MEMORY_CACHE_EVICTIONS_TOTAL = Counter(
+    'in_memory_cache_evictions_total',
+    'In-process cache entries evicted to stay within the byte budget',
+    ['cache'],
+)
+
+IN_MEMORY_CACHE_BYTES = Gauge(
+    'in_memory_cache_bytes',
+    'Estimated bytes held by an in-process cache',
+    ['cache'],
+)
+
+IN_MEMORY_CACHE_REFRESH_FAILURES_TOTAL = Counter(
+    'in_memory_cache_refresh_failures_total',
+    'Background stale-while-revalidate refreshes that raised',
+    ['cache'],
+)
+
 MEMORY_HISTORICAL_MATERIALIZATION_TOTAL = Counter(
     'memory_historical_materialization_total',
     'Lazy historical-memory materialization outcomes',
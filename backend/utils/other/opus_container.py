@@ -0,0 +1,144 @@
+"""Seekable Opus container for private cloud sync audio chunks.
+
+Layout (integers little-endian):
+
+    header  magic b'OPXC' | version u8 | channels u8 | frame_ms u8 | reserved u8
+            | frames_per_block u16 | sample_rate u32 | pcm_len u32 | frame_count u32
+    index   one u32 per block: the byte length of that block
+    blocks  frames_per_block packets each, framed as [u16 length][packet] like the
+            legacy format written by encode_pcm_to_opus
+
+Legacy blobs start with a u32 packet count instead. Read that way, b'OPXC' is
+over a billion 20ms packets, so the two formats cannot be confused.
+
+Encrypted blobs store the header+index and every block as separate
+encrypt_audio_chunk frames. Concatenated frames are what decrypt_audio_file
+already accepts, so a whole-blob decrypt yields the plaintext container, while a
+reader holding the index can fetch and decrypt only the blocks it needs.
+"""
+
+from __future__ import annotations
+
+import struct
+from typing import Callable, List, NamedTuple, Optional, Sequence
+
+MAGIC = b'OPXC'
+VERSION = 2
+FRAMES_PER_BLOCK = 50  # one second of 20ms frames
+
+_HEADER = struct.Struct('<4sBBBxHIII')
+_BLOCK_SIZE = struct.Struct('<I')
+_PACKET_LENGTH = struct.Struct('<H')
+
+
+class OpusContainerIndex(NamedTuple):
+    sample_rate: int
+    channels: int
+    frame_ms: int
+    frames_per_block: int
+    pcm_len: int
+    frame_count: int
+    block_sizes: tuple[int, ...]
+
+    @property
+    def header_size(self) -> int:
+        return _HEADER.size + _BLOCK_SIZE.size * len(self.block_sizes)
+
+    @property
+    def frame_bytes(self) -> int:
+        return self.sample_rate * self.frame_ms // 1000 * self.channels * 2
+
+    @property
+    def pcm_bytes(self) -> int:
+        """Length of the PCM16 a full decode returns (padding of the last frame trimmed)."""
+        decoded = self.frame_count * self.frame_bytes
+        return self.pcm_len if 0 < self.pcm_len < decoded else decoded
+
+    def block_range(self, first_block: int, last_block: int, frame_overhead: int = 0) -> tuple[int, int]:
+        """Byte span [start, end) of blocks first_block..last_block in the stored blob.
+
+        frame_overhead is the per-frame size added by encryption; the header is
+        one frame and every block is one frame.
+        """
+        start = self.header_size + frame_overhead
+        start += sum(size + frame_overhead for size in self.block_sizes[:first_block])
+        length = sum(size + frame_overhead for size in self.block_sizes[first_block : last_block + 1])
+        return start, start + length
+
+
+def is_opus_container(data: bytes) -> bool:
+    return data[: len(MAGIC)] == MAGIC
+
+
+def build_opus_container(
+    packets: Sequence[bytes],
+    pcm_len: int,
+    *,
+    sample_rate: int,
+    channels: int,
+    frame_ms: int,
+    frames_per_block: int = FRAMES_PER_BLOCK,
+    seal: Optional[Callable[[bytes], bytes]] = None,
+) -> bytes:
+    """Pack encoded packets into a container; seal, when given, encrypts the header and each block."""
+    blocks = [
+        b''.join(_PACKET_LENGTH.pack(len(packet)) + packet for packet in packets[start : start + frames_per_block])
+        for start in range(0, len(packets), frames_per_block)
+    ]
+    header = _HEADER.pack(
+        MAGIC, VERSION, channels, frame_ms, frames_per_block, sample_rate, pcm_len, len(packets)
+    ) + b''.join(_BLOCK_SIZE.pack(len(block)) for block in blocks)
+    if seal is None:
+        return b''.join([header, *blocks])
+    return b''.join([seal(header), *(seal(block) for block in blocks)])
+
+
+def _unpack_fixed_header(data: bytes) -> tuple:
+    if len(data) < _HEADER.size:
+        raise ValueError(f"Opus container header too short: {len(data)} bytes (need {_HEADER.size})")
+    fields = _HEADER.unpack_from(data)
+    magic, version, channels, frame_ms, frames_per_block, sample_rate = fields[:6]
+    if magic != MAGIC:
+        raise ValueError("Not an Opus container")
+    if version != VERSION:
+        raise ValueError(f"Unsupported Opus container version {version}")
+    if not (channels and frame_ms and frames_per_block and sample_rate):
+        raise ValueError("Invalid Opus container header")
+    return fields
+
+
+def container_header_size(data: bytes) -> int:
+    """Bytes of header+index the container starting with data needs; data only has to hold the fixed header."""
+    fields = _unpack_fixed_header(data)
+    frames_per_block, frame_count = fields[4], fields[7]
+    return _HEADER.size + _BLOCK_SIZE.size * -(-frame_count // frames_per_block)
+
+
+def parse_opus_container_header(data: bytes) -> OpusContainerIndex:
+    """Parse the plaintext header+index at the start of data.
+
+    Raises:
+        ValueError: If data is not a container or is shorter than its index
+    """
+    _, _, channels, frame_ms, frames_per_block, sample_rate, pcm_len, frame_count = _unpack_fixed_header(data)
+    end = container_header_size(data)
+    if len(data) < end:
+        raise ValueError(f"Truncated Opus container index: need {end} bytes, have {len(data)}")
+    block_sizes = tuple(size for (size,) in _BLOCK_SIZE.iter_unpack(data[_HEADER.size : end]))
+    return OpusContainerIndex(sample_rate, channels, frame_ms, frames_per_block, pcm_len, frame_count, block_sizes)
+
+
+def split_packets(data: bytes, offset: int = 0) -> List[bytes]:
+    """Split length-prefixed packets from data[offset:], e.g. one or more concatenated blocks."""
+    view = memoryview(data)
+    packets: List[bytes] = []
+    while offset < len(data):
+        if offset + _PACKET_LENGTH.size > len(data):
+            raise ValueError(f"Truncated Opus container: packet length at offset {offset}")
+        (length,) = _PACKET_LENGTH.unpack_from(view, offset)
+        offset += _PACKET_LENGTH.size
+        if offset + length > len(data):
+            raise ValueError(f"Truncated Opus container: packet needs {length} bytes at offset {offset}")
+        packets.append(bytes(view[offset : offset + length]))
+        offset += length
+    return packets
@@ -1,13 +1,15 @@
+import bisect
 import datetime
 import hashlib
 import io
 import json
 import os
 import struct
+import tempfile
 import threading
 import time
 import wave
-from typing import Any, Callable, Dict, List, Optional, Tuple
+from typing import Any, Callable, Dict, Iterator, List, NamedTuple, Optional, Tuple
 from concurrent.futures import as_completed, wait, FIRST_COMPLETED
 
 from utils.executors import postprocess_executor, storage_executor
@@ -19,6 +21,7 @@ except Exception as e:
     _opus_import_error: Optional[Exception] = e
 else:
     _opus_import_error = None
+from cachetools import TTLCache
 from google.cloud import storage
 from google.oauth2 import service_account
 from google.cloud.exceptions import NotFound as BlobNotFound
@@ -28,6 +31,7 @@ from database.redis_db import cache_signed_url, get_cached_signed_url
 from utils import encryption
 from utils.cloud_tasks import enqueue_audio_merge_job, is_audio_merge_dispatch_enabled
 from utils.observability.fallback import record_fallback
+from utils.other import opus_container
 from utils.other.deferred_delete import DeferredDeleter
 from database import users as users_db
 import logging
@@ -41,6 +45,8 @@ _STORAGE_CHUNK_SEM = threading.BoundedSemaphore(32)
 # (deferred_delete.py) holds those instead of pool threads.
 _PRECACHE_FILE_SEM = threading.BoundedSemaphore(4)
 _CHUNK_WINDOW_SIZE = 8
+# Gap silence is yielded in blocks of at most this many bytes (~32s of 16kHz PCM16).
+_MERGE_SILENCE_BLOCK_BYTES = 1 << 20
 
 _merge_tracker_lock = threading.Lock()
 _active_merges: dict[str, float] = {}
@@ -53,6 +59,8 @@ OPUS_SAMPLE_RATE = 16000
 OPUS_CHANNELS = 1
 OPUS_FRAME_DURATION_MS = 20  # 20ms frames (standard for voice)
 OPUS_FRAME_SIZE = OPUS_SAMPLE_RATE * OPUS_FRAME_DURATION_MS // 1000  # 320 samples per frame
+# Frames decoded and discarded before a seek target; RFC 7845 recommends 80ms of pre-roll.
+_SEEKABLE_OPUS_PREROLL_FRAMES = 4
 
 # Valid private cloud sync extensions (longest first for correct matching)
 PRIVATE_CLOUD_EXTENSIONS = ['.batch.enc', '.batch.bin', '.opus.enc', '.opus', '.enc', '.bin']
@@ -437,22 +445,7 @@ def download_syncing_temporal_file(file_path: str) -> bool:
 # ************************************************
 
 
-def encode_pcm_to_opus(pcm_data: bytes, sample_rate: int = OPUS_SAMPLE_RATE, channels: int = OPUS_CHANNELS) -> bytes:
-    """
-    Encode PCM16 audio to Opus.
-
-    Format: 4-byte little-endian packet count, then for each packet:
-    2-byte little-endian length prefix followed by the Opus packet bytes.
-    This allows exact reconstruction on decode.
-
-    Args:
-        pcm_data: Raw PCM16 audio bytes
-        sample_rate: Sample rate in Hz (default 16000)
-        channels: Number of audio channels (default 1)
-
-    Returns:
-        Length-prefixed Opus packets as bytes
-    """
+def _encode_opus_packets(pcm_data: bytes, sample_rate: int, channels: int) -> List[bytes]:
     opus = _get_opuslib()
     encoder = opus.Encoder(sample_rate, channels, opus.APPLICATION_VOIP)
     frame_size = sample_rate * OPUS_FRAME_DURATION_MS // 1000
@@ -472,22 +465,89 @@ def encode_pcm_to_opus(pcm_data: bytes, sample_rate: int = OPUS_SAMPLE_RATE, cha
         padded = remaining + b'\x00' * (bytes_per_frame - len(remaining))
         encoded = encoder.encode(padded, frame_size)
         packets.append(encoded)
+    return packets
+
+
+def encode_pcm_to_opus(pcm_data: bytes, sample_rate: int = OPUS_SAMPLE_RATE, channels: int = OPUS_CHANNELS) -> bytes:
+    """
+    Encode PCM16 audio to Opus.
+
+    Format: 4-byte little-endian packet count, then for each packet:
+    2-byte little-endian length prefix followed by the Opus packet bytes.
+    This allows exact reconstruction on decode.
+
+    Args:
+        pcm_data: Raw PCM16 audio bytes
+        sample_rate: Sample rate in Hz (default 16000)
+        channels: Number of audio channels (default 1)
+
+    Returns:
+        Length-prefixed Opus packets as bytes
+    """
+    packets = _encode_opus_packets(pcm_data, sample_rate, channels)
 
     # Pack: [packet_count (4 bytes)] + [original_pcm_len (4 bytes)] + [len (2 bytes) + data] per packet
-    output: bytes = struct.pack('<I', len(packets))
-    output += struct.pack('<I', len(pcm_data))
+    parts = [struct.pack('<I', len(packets)), struct.pack('<I', len(pcm_data))]
     for pkt in packets:
-        output += struct.pack('<H', len(pkt)) + pkt
+        parts.append(struct.pack('<H', len(pkt)))
+        parts.append(pkt)
+    return b''.join(parts)
+
 
-    return output
+def encode_pcm_to_seekable_opus(
+    pcm_data: bytes,
+    sample_rate: int = OPUS_SAMPLE_RATE,
+    channels: int = OPUS_CHANNELS,
+    seal: Optional[Callable[[bytes], bytes]] = None,
+) -> bytes:
+    """
+    Encode PCM16 audio to the seekable Opus container (see utils/other/opus_container.py).
+
+    The packets are the ones encode_pcm_to_opus writes, grouped into one-second
+    blocks behind a block index so a time window can be decoded from its blocks.
+
+    Args:
+        pcm_data: Raw PCM16 audio bytes
+        sample_rate: Sample rate in Hz (default 16000)
+        channels: Number of audio channels (default 1)
+        seal: Optional encryption (encrypt_audio_chunk bound to a uid), applied to
+            the header and to each block separately
+
+    Returns:
+        Container bytes
+    """
+    packets = _encode_opus_packets(pcm_data, sample_rate, channels)
+    return opus_container.build_opus_container(
+        packets,
+        len(pcm_data),
+        sample_rate=sample_rate,
+        channels=channels,
+        frame_ms=OPUS_FRAME_DURATION_MS,
+        seal=seal,
+    )
+
+
+def _decode_opus_packets(packets: List[bytes], sample_rate: int, channels: int) -> bytes:
+    frame_size = sample_rate * OPUS_FRAME_DURATION_MS // 1000
+    opus = _get_opuslib()
+    decoder = opus.Decoder(sample_rate, channels)
+
+    pcm_parts: List[bytes] = []
+    for pkt_data in packets:
+        decoded = decoder.decode(pkt_data, frame_size)
+        pcm_parts.append(decoded)
+    return b''.join(pcm_parts)
 
 
 def decode_opus_to_pcm(opus_data: bytes, sample_rate: int = OPUS_SAMPLE_RATE, channels: int = OPUS_CHANNELS) -> bytes:
     """
     Decode length-prefixed Opus packets back to PCM16.
 
+    Accepts both the legacy format and the seekable container; a container
+    carries its own sample rate and channel count.
+
     Args:
-        opus_data: Length-prefixed Opus packets (from encode_pcm_to_opus)
+        opus_data: Length-prefixed Opus packets (from encode_pcm_to_opus or encode_pcm_to_seekable_opus)
         sample_rate: Sample rate in Hz (default 16000)
         channels: Number of audio channels (default 1)
 
@@ -497,11 +557,17 @@ def decode_opus_to_pcm(opus_data: bytes, sample_rate: int = OPUS_SAMPLE_RATE, ch
     Raises:
         ValueError: If opus_data is too short or has invalid header/packet structure
     """
+    if opus_container.is_opus_container(opus_data):
+        index = opus_container.parse_opus_container_header(opus_data)
+        packets = opus_container.split_packets(opus_data, index.header_size)
+        if len(packets) != index.frame_count:
+            raise ValueError(f"Opus container has {len(packets)} packets, index expects {index.frame_count}")
+        result = _decode_opus_packets(packets, index.sample_rate, index.channels)
+        return result[: index.pcm_bytes]
+
     if len(opus_data) < 8:
         raise ValueError(f"Opus data too short: {len(opus_data)} bytes (need at least 8 for header)")
 
-    frame_size = sample_rate * OPUS_FRAME_DURATION_MS // 1000
-
     offset = 0
     packet_count = struct.unpack_from('<I', opus_data, offset)[0]
     offset += 4
@@ -521,21 +587,53 @@ def decode_opus_to_pcm(opus_data: bytes, sample_rate: int = OPUS_SAMPLE_RATE, ch
         packets.append(opus_data[offset : offset + pkt_len])
         offset += pkt_len
 
-    opus = _get_opuslib()
-    decoder = opus.Decoder(sample_rate, channels)
-
-    pcm_parts: List[bytes] = []
-    for pkt_data in packets:
-        decoded = decoder.decode(pkt_data, frame_size)
-        pcm_parts.append(decoded)
-
-    result = b''.join(pcm_parts)
+    result = _decode_opus_packets(packets, sample_rate, channels)
     # Trim to original PCM length to remove padding from partial final frame
     if original_pcm_len > 0 and original_pcm_len < len(result):
         result = result[:original_pcm_len]
     return result
 
 
+def decode_opus_container_window(
+    index: opus_container.OpusContainerIndex, read_blocks: Callable[[int, int], bytes], start: int, end: int
+) -> bytes:
+    """
+    Decode PCM16 bytes [start, end) of a seekable container without touching other blocks.
+
+    Args:
+        index: The container's parsed header
+        read_blocks: Returns the plaintext of blocks first..last (inclusive), concatenated
+        start: First PCM byte of the window
+        end: PCM byte just past the window, at most index.pcm_bytes
+
+    Returns:
+        end - start bytes of PCM16
+    """
+    if start >= end:
+        return b''
+    frame_bytes = index.frame_bytes
+    frames_per_block = index.frames_per_block
+    first_frame = start // frame_bytes
+    last_frame = (end - 1) // frame_bytes
+    # Decode a few frames before the window and drop them so the decoder state
+    # has converged by the first requested sample.
+    preroll_frame = max(0, first_frame - _SEEKABLE_OPUS_PREROLL_FRAMES)
+    first_block = preroll_frame // frames_per_block
+    last_block = last_frame // frames_per_block
+
+    packets = opus_container.split_packets(read_blocks(first_block, last_block))
+    base = first_block * frames_per_block
+    expected = min(index.frame_count, (last_block + 1) * frames_per_block) - base
+    if len(packets) != expected:
+        raise ValueError(
+            f"Opus container blocks {first_block}-{last_block} have {len(packets)} packets, expected {expected}"
+        )
+
+    pcm = _decode_opus_packets(packets[preroll_frame - base : last_frame - base + 1], index.sample_rate, index.channels)
+    offset = start - preroll_frame * frame_bytes
+    return pcm[offset : offset + end - start]
+
+
 def _get_extension_for_path(path: str) -> str:
     """Extract the private cloud sync extension from a GCS path."""
     if path.endswith('.batch.enc'):
@@ -590,6 +688,11 @@ def upload_audio_chunk(
     # Format timestamp to 3 decimal places for cleaner filenames
     formatted_timestamp = f'{timestamp:.3f}'
 
+    if _seekable_opus_enabled():
+        return _upload_seekable_audio_chunk(
+            bucket, chunk_data, uid, conversation_id, formatted_timestamp, protection_level
+        )
+
     upload_data = encode_pcm_to_opus(chunk_data)
 
     if protection_level == 'enhanced':
@@ -606,6 +709,45 @@ def upload_audio_chunk(
     return path
 
 
+def _seekable_opus_enabled() -> bool:
+    """Write new private cloud sync chunks as seekable Opus containers.
+
+    Enable only once every reader is on a build whose decode_opus_to_pcm
+    understands the container.
+    """
+    return os.getenv('PRIVATE_CLOUD_SEEKABLE_OPUS', 'false').lower() == 'true'
+
+
+def _upload_seekable_audio_chunk(
+    bucket: Any, chunk_data: bytes, uid: str, conversation_id: str, formatted_timestamp: str, protection_level: str
+) -> str:
+    if protection_level == 'enhanced':
+        upload_data = encode_pcm_to_seekable_opus(
+            chunk_data, seal=lambda block: encryption.encrypt_audio_chunk(block, uid)
+        )
+        path = f'chunks/{uid}/{conversation_id}/{formatted_timestamp}.opus.enc'
+    else:
+        upload_data = encode_pcm_to_seekable_opus(chunk_data)
+        path = f'chunks/{uid}/{conversation_id}/{formatted_timestamp}.opus'
+    blob = bucket.blob(path)
+    # Listing returns metadata, so playback can lay out a conversation without reading headers.
+    blob.metadata = {'opus_container': str(opus_container.VERSION), 'pcm_bytes': str(len(chunk_data))}
+    blob.upload_from_string(upload_data, content_type='application/octet-stream')
+    del upload_data
+    return path
+
+
+def _seekable_pcm_bytes(blob: Any) -> Optional[int]:
+    """Decoded PCM length recorded on a seekable container blob, or None for any other blob."""
+    metadata = blob.metadata
+    if not isinstance(metadata, dict) or metadata.get('opus_container') != str(opus_container.VERSION):
+        return None
+    try:
+        return int(metadata['pcm_bytes'])
+    except (KeyError, ValueError):
+        return None
+
+
 def upload_audio_chunks_batch(
     chunks: List[Dict[str, Any]],
     uid: str,
@@ -718,7 +860,8 @@ def list_audio_chunks(uid: str, conversation_id: str) -> List[Dict[str, Any]]:
     List all audio chunks for a conversation.
 
     Returns:
-        List of dicts with chunk info: {'timestamp': float, 'path': str, 'size': int}
+        List of dicts with chunk info: {'timestamp': float, 'path': str, 'size': int, 'is_batch': bool,
+        'pcm_bytes': decoded length for seekable Opus containers, else None}
     """
     bucket = _get_storage_client().bucket(private_cloud_sync_bucket)
     prefix = f'chunks/{uid}/{conversation_id}/'
@@ -749,6 +892,7 @@ def list_audio_chunks(uid: str, conversation_id: str) -> List[Dict[str, Any]]:
                         'path': blob.name,
                         'size': blob.size,
                         'is_batch': is_batch,
+                        'pcm_bytes': _seekable_pcm_bytes(blob),
                     }
                 )
             except ValueError:
@@ -802,18 +946,20 @@ def _align_pcm16_frames(pcm_data: bytes, source: str) -> bytes:
     return pcm_data[:-remainder]
 
 
-def download_audio_chunks_and_merge(
+def stream_audio_chunks_and_merge(
     uid: str,
     conversation_id: str,
     timestamps: List[float],
     fill_gaps: bool = True,
     sample_rate: int = 16000,
-) -> bytes:
+    prefetch: int = _CHUNK_WINDOW_SIZE,
+) -> Iterator[bytes]:
     """
-    Download and merge audio chunks on-demand, handling mixed encryption states.
-    Downloads chunks in parallel.
-    Normalizes all chunks to unencrypted PCM format for consistent merging.
-    Supports both single-chunk blobs and batch blobs (from upload_audio_chunks_batch).
+    Yield the PCM16 download_audio_chunks_and_merge returns, in time order, block by block.
+    Chunks are downloaded in parallel, but at most ``prefetch`` of them are in flight or
+    decoded and waiting at once, and each is yielded as soon as every earlier chunk has
+    been, so memory stays bounded by the prefetch window instead of the conversation.
+    Gap silence is yielded in blocks of at most _MERGE_SILENCE_BLOCK_BYTES.
 
     Args:
         uid: User ID
@@ -822,9 +968,10 @@ def download_audio_chunks_and_merge(
         fill_gaps: If True, insert silence (zero bytes) between chunks to maintain
                    continuous time-aligned audio. Default True.
         sample_rate: Audio sample rate in Hz (default 16000)
+        prefetch: Maximum number of chunk/batch blobs downloaded ahead of the output
 
-    Returns:
-        Merged audio bytes (PCM16)
+    Raises:
+        FileNotFoundError: After the last block if no audio was yielded at all
     """
 
     bucket = _get_storage_client().bucket(private_cloud_sync_bucket)
@@ -929,16 +1076,25 @@ def download_audio_chunks_and_merge(
         logger.warning(f"Warning: Chunk not found for timestamp {formatted_timestamp}")
         return (timestamp, None)
 
-    # Download data with bounded concurrency (sliding window + global semaphore, #7387)
-    chunk_results: Dict[float, bytes] = {}
-
-    individual_timestamps = [ts for ts in timestamps if round(ts, 3) not in ts_to_batch_path]
-    unique_batch_paths = list(set(ts_to_batch_path.values()))
-
-    # Build unified job list: ('individual', ts) or ('batch', path)
-    jobs = [('individual', ts) for ts in individual_timestamps] + [('batch', p) for p in unique_batch_paths]
+    # Output order of the requested timestamps, and the job producing each one's audio.
+    # Batch blobs land under their own start timestamp (the batch chunk_info's), which
+    # is only merged when that exact timestamp was requested.
+    order = sorted(timestamps) if fill_gaps else list(timestamps)
+    key_jobs: Dict[float, Tuple[str, Any]] = {
+        ts: ('individual', ts) for ts in timestamps if round(ts, 3) not in ts_to_batch_path
+    }
+    for path in set(ts_to_batch_path.values()):
+        key_jobs[batch_paths[path]['timestamp']] = ('batch', path)
+    last_use: Dict[float, int] = {}
+    jobs: List[Tuple[float, Tuple[str, Any]]] = []
+    for index, ts in enumerate(order):
+        if ts not in key_jobs:
+            continue
+        if ts not in last_use:
+            jobs.append((ts, key_jobs[ts]))
+        last_use[ts] = index
 
-    def _submit_job(job: Tuple[str, Any]) -> Tuple[Any, str, Any]:
+    def _submit_job(job: Tuple[str, Any]) -> Any:
         kind, key = job
         _STORAGE_CHUNK_SEM.acquire()
         try:
@@ -947,86 +1103,271 @@ def download_audio_chunks_and_merge(
             else:
                 f = storage_executor.submit(_download_and_decode_blob, key)
             f.add_done_callback(lambda _: _STORAGE_CHUNK_SEM.release())
-            return (f, kind, key)
+            return f
         except Exception:
             _STORAGE_CHUNK_SEM.release()
             raise
 
-    # Sliding window: at most _CHUNK_WINDOW_SIZE in-flight per call
-    pending: Dict[Any, Tuple[Any, str, Any]] = {}
+    # Sliding window (global semaphore, #7387): in-flight + decoded-but-unyielded <= prefetch
+    window = max(1, prefetch)
+    pending: Dict[Any, Tuple[float, str, Any]] = {}
+    ready: Dict[float, bytes | None] = {}
     job_iter = iter(jobs)
-    for job in job_iter:
-        finfo = _submit_job(job)
-        pending[finfo[0]] = finfo
-        if len(pending) >= _CHUNK_WINDOW_SIZE:
-            break
-
-    while pending:
-        done, _ = wait(pending.keys(), return_when=FIRST_COMPLETED)
+
+    def _fill_window(at_least_one: bool = False) -> None:
+        # at_least_one: decoded chunks held for a repeated timestamp may fill the
+        # window, but the chunk the output is waiting on must still be fetched.
+        while len(pending) + len(ready) < window or (at_least_one and not pending):
+            next_job = next(job_iter, None)
+            if next_job is None:
+                return
+            result_key, (kind, key) = next_job
+            pending[_submit_job((kind, key))] = (result_key, kind, key)
+
+    def _collect(done: Any) -> None:
         for future in done:
-            _, kind, key = pending.pop(future)
+            result_key, kind, key = pending.pop(future)
+            pcm_data = None
             try:
                 if kind == 'individual':
-                    timestamp, pcm_data = future.result()
-                    if pcm_data is not None:
-                        chunk_results[timestamp] = pcm_data
+                    _, pcm_data = future.result()
                 else:
                     pcm_data = future.result()
-                    if pcm_data is not None:
-                        batch_info = batch_paths[key]
-                        chunk_results[batch_info['timestamp']] = pcm_data
             except Exception as e:
                 logger.warning(f"Chunk download failed ({kind}={key}): {e}")
+            ready[result_key] = pcm_data
 
-        for job in job_iter:
-            finfo = _submit_job(job)
-            pending[finfo[0]] = finfo
-            if len(pending) >= _CHUNK_WINDOW_SIZE:
-                break
+    emitted = 0
+    current_time = order[0] if order else 0.0  # Track current audio end time in seconds
+    try:
+        _fill_window()
+        for index, timestamp in enumerate(order):
+            if timestamp not in last_use:
+                continue
+            while timestamp not in ready:
+                _fill_window(at_least_one=True)
+                done, _ = wait(pending.keys(), return_when=FIRST_COMPLETED)
+                _collect(done)
+            pcm_data = ready[timestamp] if last_use[timestamp] > index else ready.pop(timestamp)
+            _fill_window()
+            if pcm_data is None:
+                continue
+
+            if fill_gaps:
+                # Calculate gap from current position to this chunk's start
+                gap_seconds = timestamp - current_time
+                if gap_seconds > 0:
+                    # Insert silence: 16-bit mono = 2 bytes per sample
+                    silence_left = int(gap_seconds * sample_rate) * 2
+                    logger.debug(f"Filled {gap_seconds:.3f}s gap ({silence_left} bytes) before chunk at {timestamp}")
+                    while silence_left > 0:
+                        block = min(silence_left, _MERGE_SILENCE_BLOCK_BYTES)
+                        silence_left -= block
+                        emitted += block
+                        yield bytes(block)
+                # Update current time based on chunk duration (PCM16 mono: 2 bytes per sample)
+                current_time = timestamp + len(pcm_data) / (sample_rate * 2)
+
+            if pcm_data:
+                emitted += len(pcm_data)
+                yield pcm_data
+            del pcm_data
+    finally:
+        # Consumer stopped early or a download raised: drop queued work; running jobs
+        # finish on their own and release the semaphore from their done callbacks.
+        for future in pending:
+            future.cancel()
+        ready.clear()
+
+    if not emitted:
+        raise FileNotFoundError(f"No chunks found for conversation {conversation_id}")
 
-    # Merge chunks
+
+def download_audio_chunks_and_merge(
+    uid: str,
+    conversation_id: str,
+    timestamps: List[float],
+    fill_gaps: bool = True,
+    sample_rate: int = 16000,
+) -> bytes:
+    """
+    Download and merge audio chunks on-demand, handling mixed encryption states.
+    Downloads chunks in parallel.
+    Normalizes all chunks to unencrypted PCM format for consistent merging.
+    Supports both single-chunk blobs and batch blobs (from upload_audio_chunks_batch).
+    Collects stream_audio_chunks_and_merge; prefer that for long conversations.
+
+    Args:
+        uid: User ID
+        conversation_id: Conversation ID
+        timestamps: List of chunk timestamps to merge
+        fill_gaps: If True, insert silence (zero bytes) between chunks to maintain
+                   continuous time-aligned audio. Default True.
+        sample_rate: Audio sample rate in Hz (default 16000)
+
+    Returns:
+        Merged audio bytes (PCM16)
+    """
     merged_data = bytearray()
+    for block in stream_audio_chunks_and_merge(
+        uid, conversation_id, timestamps, fill_gaps=fill_gaps, sample_rate=sample_rate
+    ):
+        merged_data.extend(block)
+    return bytes(merged_data)
 
-    if fill_gaps and timestamps and chunk_results:
-        # Sort timestamps to ensure proper ordering
-        sorted_timestamps = sorted(timestamps)
-        first_timestamp = sorted_timestamps[0]
-        current_time = first_timestamp  # Track current audio end time in seconds
 
-        for timestamp in sorted_timestamps:
-            if timestamp not in chunk_results:
-                continue
+# Single-chunk extensions in the order download_audio_chunks_and_merge tries them.
+_SINGLE_CHUNK_PRIORITY = ('opus.enc', 'enc', 'opus', 'bin')
+_SEEKABLE_HEADER_PREFIX_BYTES = 4096
+_seekable_layout_cache: TTLCache = TTLCache(maxsize=256, ttl=300)
+_seekable_layout_lock = threading.Lock()
+# Cached for conversations that cannot be range-read, so their scrubs skip the listing too.
+_NOT_SEEKABLE = object()
 
-            pcm_data = chunk_results[timestamp]
 
-            # Calculate gap from current position to this chunk's start
-            gap_seconds = timestamp - current_time
-            if gap_seconds > 0:
-                # Insert silence: 16-bit mono = 2 bytes per sample
-                gap_samples = int(gap_seconds * sample_rate)
-                silence_bytes = bytes(gap_samples * 2)  # Zero bytes for silence
-                merged_data.extend(silence_bytes)
-                logger.debug(f"Filled {gap_seconds:.3f}s gap ({len(silence_bytes)} bytes) before chunk at {timestamp}")
+class _SeekableChunk(NamedTuple):
+    offset: int  # first byte of the chunk in the merged PCM
+    length: int
+    path: str
+    encrypted: bool
 
-            merged_data.extend(pcm_data)
 
-            # Update current time based on chunk duration
-            # PCM16 mono: 2 bytes per sample
-            chunk_duration = len(pcm_data) / (sample_rate * 2)
-            current_time = timestamp + chunk_duration
-    else:
-        # Original behavior - just concatenate without gap filling
-        for timestamp in timestamps:
-            if timestamp in chunk_results:
-                merged_data.extend(chunk_results[timestamp])
+class SeekableMergedAudio:
+    """The PCM download_audio_chunks_and_merge(fill_gaps=True) would return, read by byte range.
 
-    # Free memory from chunk results immediately after merging
-    chunk_results.clear()
+    Built only when every chunk is a seekable Opus container, so a range read
+    fetches the container headers and the blocks covering the range instead of
+    downloading, decrypting and decoding the whole conversation. Gaps read as
+    silence exactly where the merge inserts it.
+    """
 
-    if not merged_data:
-        raise FileNotFoundError(f"No chunks found for conversation {conversation_id}")
+    def __init__(self, uid: str, chunks: List[_SeekableChunk], size: int):
+        self.uid = uid
+        self.size = size
+        self._chunks = chunks
+        self._offsets = [chunk.offset for chunk in chunks]
+        self._indexes: Dict[str, opus_container.OpusContainerIndex] = {}
+
+    def read(self, start: int, end: int) -> bytes:
+        """Merged PCM bytes [start, end)."""
+        end = min(end, self.size)
+        if start >= end:
+            return b''
+        out = bytearray(end - start)
+        bucket = _get_storage_client().bucket(private_cloud_sync_bucket)
+        position = max(0, bisect.bisect_right(self._offsets, start) - 1)
+        reads: List[Tuple[int, Any]] = []
+        for chunk in self._chunks[position:]:
+            if chunk.offset >= end:
+                break
+            lo = max(start, chunk.offset)
+            hi = min(end, chunk.offset + chunk.length)
+            if lo >= hi:
+                continue
+            # Chunks are fetched in parallel; each one's header and block GETs stay in order.
+            reads.append(
+                (lo, storage_executor.submit(self._read_chunk, bucket, chunk, lo - chunk.offset, hi - chunk.offset))
+            )
+        for lo, future in reads:
+            pcm = future.result()
+            out[lo - start : lo - start + len(pcm)] = pcm
+        return bytes(out)
+
+    def _index(self, bucket: Any, chunk: _SeekableChunk) -> opus_container.OpusContainerIndex:
+        index = self._indexes.get(chunk.path)
+        if index is not None:
+            return index
+        blob = bucket.blob(chunk.path)
+        prefix = blob.download_as_bytes(start=0, end=_SEEKABLE_HEADER_PREFIX_BYTES - 1)
+        if chunk.encrypted:
+            needed = encryption.audio_chunk_frame_size(prefix)
+            if len(prefix) < needed:
+                prefix = blob.download_as_bytes(start=0, end=needed - 1)
+            header, _ = encryption.decrypt_audio_chunk(prefix, self.uid)
+        else:
+            needed = opus_container.container_header_size(prefix)
+            if len(prefix) < needed:
+                prefix = blob.download_as_bytes(start=0, end=needed - 1)
+            header = prefix
+        index = opus_container.parse_opus_container_header(header)
+        self._indexes[chunk.path] = index
+        return index
+
+    def _read_chunk(self, bucket: Any, chunk: _SeekableChunk, start: int, end: int) -> bytes:
+        index = self._index(bucket, chunk)
+        overhead = encryption.AUDIO_CHUNK_OVERHEAD if chunk.encrypted else 0
+
+        def read_blocks(first_block: int, last_block: int) -> bytes:
+            lo, hi = index.block_range(first_block, last_block, overhead)
+            data = bucket.blob(chunk.path).download_as_bytes(start=lo, end=hi - 1)
+            return encryption.decrypt_audio_file(data, self.uid) if chunk.encrypted else data
+
+        return decode_opus_container_window(index, read_blocks, start, end)
+
+
+def get_seekable_merged_audio(
+    uid: str, conversation_id: str, timestamps: List[float], sample_rate: int = 16000
+) -> Optional[SeekableMergedAudio]:
+    """
+    Lay out the merged audio of these chunks for range reads, without downloading them.
 
-    return bytes(merged_data)
+    The layout comes from the chunk listing (container blobs record their decoded
+    length in metadata) and follows download_audio_chunks_and_merge with
+    fill_gaps=True. Layouts are cached briefly so a scrubbing client's range
+    requests share one listing.
+
+    Returns:
+        None when there is nothing to play or any chunk is a batch blob or a
+        legacy (non-container) blob; callers then fall back to the full merge.
+        That answer is cached the same way.
+    """
+    if not timestamps:
+        return None
+    key = (uid, conversation_id, tuple(sorted(timestamps)), sample_rate)
+    with _seekable_layout_lock:
+        cached = _seekable_layout_cache.get(key)
+    if cached is not None:
+        return None if cached is _NOT_SEEKABLE else cached
+
+    audio = _build_seekable_merged_audio(uid, conversation_id, key[2], sample_rate)
+    with _seekable_layout_lock:
+        _seekable_layout_cache[key] = _NOT_SEEKABLE if audio is None else audio
+    return audio
+
+
+def _build_seekable_merged_audio(
+    uid: str, conversation_id: str, sorted_timestamps: Tuple[float, ...], sample_rate: int
+) -> Optional[SeekableMergedAudio]:
+    sources: Dict[float, Dict[str, Any]] = {}
+    for chunk in list_audio_chunks(uid, conversation_id):
+        if chunk.get('is_batch'):
+            return None
+        ts = round(chunk['timestamp'], 3)
+        ext = _get_extension_for_path(chunk['path'])
+        current = sources.get(ts)
+        if current is None or _SINGLE_CHUNK_PRIORITY.index(ext) < _SINGLE_CHUNK_PRIORITY.index(current['ext']):
+            sources[ts] = {**chunk, 'ext': ext}
+
+    chunks: List[_SeekableChunk] = []
+    offset = 0
+    current_time = sorted_timestamps[0]
+    for timestamp in sorted_timestamps:
+        source = sources.get(round(timestamp, 3))
+        if source is None:
+            continue
+        if source['ext'] not in ('opus', 'opus.enc') or source.get('pcm_bytes') is None:
+            return None
+        gap_seconds = timestamp - current_time
+        if gap_seconds > 0:
+            offset += int(gap_seconds * sample_rate) * 2
+        length = source['pcm_bytes'] - source['pcm_bytes'] % _PCM16_FRAME_BYTES
+        chunks.append(_SeekableChunk(offset, length, source['path'], source['ext'] == 'opus.enc'))
+        offset += length
+        current_time = timestamp + length / (sample_rate * 2)
+
+    if not offset:
+        return None
+    return SeekableMergedAudio(uid, chunks, offset)
 
 
 def get_cached_merged_audio_path(uid: str, conversation_id: str, audio_file_id: str) -> str:
@@ -1039,17 +1380,23 @@ def get_or_create_merged_audio(
     conversation_id: str,
     audio_file_id: str,
     timestamps: List[float],
-    pcm_to_wav_func: Callable[[bytes], bytes],
+    pcm_to_wav_func: Optional[Callable[[bytes], bytes]] = None,
     fill_gaps: bool = True,
     sample_rate: int = 16000,
     caller: str = 'unknown',
-) -> tuple[bytes, bool]:
+    return_data: bool = True,
+) -> tuple[Optional[bytes], bool]:
     """
     Get merged audio from cache or create it.
     Cached files are stored in GCS with 1-day TTL (via lifecycle policy).
 
+    Without pcm_to_wav_func the merge is streamed into a WAV temp file on disk and
+    uploaded from there, so the full PCM is never held in memory; with it, the
+    merged PCM is built in memory and converted by the caller's function.
+    Pass return_data=False (precache) to skip reading the audio back.
+
     Returns:
-        Tuple of (audio_data_bytes, was_cached)
+        Tuple of (audio_data_bytes, was_cached); audio_data_bytes is None when return_data is False
     """
     bucket = _get_storage_client().bucket(private_cloud_sync_bucket)
     cache_path = get_cached_merged_audio_path(uid, conversation_id, audio_file_id)
@@ -1068,7 +1415,7 @@ def get_or_create_merged_audio(
                 expires_at = datetime.datetime.fromisoformat(expires_at_str)
                 if datetime.datetime.now(datetime.timezone.utc) < expires_at:
                     logger.debug(f'audio_merge cache_hit {log_ctx}')
-                    return cache_blob.download_as_bytes(), True
+                    return (cache_blob.download_as_bytes() if return_data else None), True
                 else:
                     logger.debug(f'audio_merge cache_expired {log_ctx}')
             except (ValueError, TypeError):
@@ -1091,10 +1438,18 @@ def get_or_create_merged_audio(
     logger.info(f'audio_merge cache_miss {log_ctx}')
 
     merge_start = time.monotonic()
+    wav_path = None
+    wav_data = None
     try:
-        pcm_data = download_audio_chunks_and_merge(
-            uid, conversation_id, timestamps, fill_gaps=fill_gaps, sample_rate=sample_rate
-        )
+        if pcm_to_wav_func is not None:
+            pcm_data = download_audio_chunks_and_merge(
+                uid, conversation_id, timestamps, fill_gaps=fill_gaps, sample_rate=sample_rate
+            )
+            wav_data = pcm_to_wav_func(pcm_data)
+            del pcm_data
+            wav_size = len(wav_data)
+        else:
+            wav_path, wav_size = _write_merged_wav_file(uid, conversation_id, timestamps, fill_gaps, sample_rate)
     finally:
         merge_duration = time.monotonic() - merge_start
         with _merge_tracker_lock:
@@ -1106,12 +1461,18 @@ def get_or_create_merged_audio(
                 for k in stale:
                     del _recent_merges[k]
 
-    wav_data = pcm_to_wav_func(pcm_data)
-    del pcm_data
-
-    wav_kb = len(wav_data) // 1024
+    wav_kb = wav_size // 1024
     logger.info(f'audio_merge complete {log_ctx} duration={merge_duration:.1f}s size={wav_kb}KB')
 
+    try:
+        if wav_path is not None and return_data:
+            with open(wav_path, 'rb') as wav_file:
+                wav_data = wav_file.read()
+    except Exception:
+        if wav_path and os.path.exists(wav_path):
+            os.remove(wav_path)
+        raise
+
     def _upload_to_cache():
         try:
             expires_at = datetime.datetime.now(datetime.timezone.utc) + datetime.timedelta(days=3)
@@ -1119,14 +1480,48 @@ def get_or_create_merged_audio(
                 'expires_at': expires_at.isoformat(),
                 'audio_file_id': audio_file_id,
             }
-            cache_blob.upload_from_string(wav_data, content_type='audio/wav')
+            if wav_path is not None:
+                cache_blob.upload_from_filename(wav_path, content_type='audio/wav')
+            else:
+                cache_blob.upload_from_string(wav_data, content_type='audio/wav')
             logger.info(f'audio_merge cached {log_ctx}')
         except Exception as e:
             logger.error(f'audio_merge cache_upload_failed {log_ctx}: {e}')
+        finally:
+            if wav_path is not None:
+                os.remove(wav_path)
+
+    try:
+        storage_executor.submit(_upload_to_cache)
+    except Exception:
+        if wav_path is not None:
+            os.remove(wav_path)
+        raise
 
-    storage_executor.submit(_upload_to_cache)
+    return (wav_data if return_data else None), False
 
-    return wav_data, False
+
+def _write_merged_wav_file(
+    uid: str, conversation_id: str, timestamps: List[float], fill_gaps: bool, sample_rate: int
+) -> tuple[str, int]:
+    """Stream the merged PCM into a temp WAV file; returns (path, size). The caller removes the file."""
+    fd, wav_path = tempfile.mkstemp(prefix='merged-', suffix='.wav')
+    try:
+        with os.fdopen(fd, 'wb') as wav_file:
+            # wave writes the header up front and patches the sizes on close.
+            with wave.open(wav_file, 'wb') as wav_writer:
+                wav_writer.setnchannels(1)
+                wav_writer.setsampwidth(2)  # 16-bit audio
+                wav_writer.setframerate(sample_rate)
+                for block in stream_audio_chunks_and_merge(
+                    uid, conversation_id, timestamps, fill_gaps=fill_gaps, sample_rate=sample_rate
+                ):
+                    wav_writer.writeframesraw(block)
+            wav_size = wav_file.tell()
+    except BaseException:
+        os.remove(wav_path)
+        raise
+    return wav_path, wav_size
 
 
 def get_merged_audio_signed_url(uid: str, conversation_id: str, audio_file_id: str) -> str | None:
@@ -1168,17 +1563,6 @@ def delete_cached_merged_audio(uid: str, conversation_id: str) -> None:
         blob.delete()
 
 
-def _pcm_to_wav(pcm_data: bytes, sample_rate: int = 16000, channels: int = 1) -> bytes:
-    """Convert PCM16 data to WAV format."""
-    wav_buffer = io.BytesIO()
-    with wave.open(wav_buffer, 'wb') as wav_file:
-        wav_file.setnchannels(channels)
-        wav_file.setsampwidth(2)  # 16-bit audio
-        wav_file.setframerate(sample_rate)
-        wav_file.writeframes(pcm_data)
-    return wav_buffer.getvalue()
-
-
 # ----------------------------------------------------------------------------
 # Playback artifacts: merged MP3 under playback/, expiry via the bucket's
 # 30-day lifecycle rule on the prefix (existence == validity, no metadata).
@@ -1411,10 +1795,10 @@ def precache_conversation_audio(
                     conversation_id=conversation_id,
                     audio_file_id=audio_file_id,
                     timestamps=timestamps,
-                    pcm_to_wav_func=_pcm_to_wav,
                     fill_gaps=fill_gaps,
                     sample_rate=sample_rate,
                     caller='process_conversation',
+                    return_data=False,
                 )
             except Exception as e:
                 logger.error(f"[PRECACHE] Error caching audio file {af.get('id')}: {e}")
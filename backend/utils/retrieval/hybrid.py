@@ -10,49 +10,110 @@ extra dependency or index — BM25 runs in-memory over the small candidate set.
 
 import math
 import re
-from typing import Any, Dict, List
+import threading
+from typing import Any, Dict, List, Sequence, Tuple
+
+import numpy as np
+from cachetools import LRUCache
 
 _TOKEN_RE = re.compile(r"[a-z0-9]+")
 
+# content -> (term frequencies, token count). Candidate sets for one user overlap
+# heavily across queries and chat turns, so tokenizing each text once pays off.
+_doc_token_cache: LRUCache[str, Tuple[Dict[str, int], int]] = LRUCache(maxsize=20000)
+_doc_token_cache_lock = threading.Lock()
+
 
 def _tokenize(text: str) -> List[str]:
     return _TOKEN_RE.findall((text or "").lower())
 
 
-def bm25_scores(query: str, docs: List[str], k1: float = 1.5, b: float = 0.75) -> List[float]:
-    """Classic Okapi BM25 score of `query` against each doc in `docs` (same order)."""
-    doc_tokens = [_tokenize(d) for d in docs]
-    n = len(doc_tokens)
+def _doc_term_counts(text: str) -> Tuple[Dict[str, int], int]:
+    key = text or ""
+    with _doc_token_cache_lock:
+        cached = _doc_token_cache.get(key)
+    if cached is not None:
+        return cached
+    tokens = _tokenize(key)
+    freq: Dict[str, int] = {}
+    for t in tokens:
+        freq[t] = freq.get(t, 0) + 1
+    entry = (freq, len(tokens))
+    with _doc_token_cache_lock:
+        _doc_token_cache[key] = entry
+    return entry
+
+
+def clear_doc_token_cache() -> None:
+    with _doc_token_cache_lock:
+        _doc_token_cache.clear()
+
+
+def bm25_scores_batch(queries: Sequence[str], docs: List[str], k1: float = 1.5, b: float = 0.75) -> List[List[float]]:
+    """Okapi BM25 scores of each query against each doc, one row per query.
+
+    Only query terms contribute to BM25, so the docs are reduced to a dense
+    (docs x distinct query terms) frequency matrix shared by the whole batch and
+    each query's row is accumulated term by term over it, in the same order and
+    with the same float operations as the per-doc loop this replaced.
+    """
+    n = len(docs)
     if n == 0:
-        return []
-
-    avgdl = (sum(len(d) for d in doc_tokens) / n) or 1.0
-
-    df: Dict[str, int] = {}
-    for toks in doc_tokens:
-        for t in set(toks):
-            df[t] = df.get(t, 0) + 1
-
-    q_terms = _tokenize(query)
-    scores: List[float] = []
-    for toks in doc_tokens:
-        if not toks:
-            scores.append(0.0)
-            continue
-        freq: Dict[str, int] = {}
-        for t in toks:
-            freq[t] = freq.get(t, 0) + 1
-        dl = len(toks)
-        s = 0.0
-        for t in q_terms:
-            tf = freq.get(t)
-            if not tf:
+        return [[] for _ in queries]
+
+    counts = [_doc_term_counts(d) for d in docs]
+    dl = np.fromiter((length for _, length in counts), dtype=np.int64, count=n)
+    avgdl = (int(dl.sum()) / n) or 1.0
+    norm = k1 * (1 - b + b * dl / avgdl)
+
+    query_terms = [_tokenize(q) for q in queries]
+    columns: Dict[str, int] = {}
+    for terms in query_terms:
+        for t in terms:
+            columns.setdefault(t, len(columns))
+    tf = np.zeros((n, len(columns)), dtype=np.int64)
+    for t, j in columns.items():
+        tf[:, j] = np.fromiter((freq.get(t, 0) for freq, _ in counts), dtype=np.int64, count=n)
+    df = np.count_nonzero(tf, axis=0)
+
+    results: List[List[float]] = []
+    for terms in query_terms:
+        scores = np.zeros(n, dtype=np.float64)
+        for t in terms:
+            j = columns[t]
+            n_t = int(df[j])
+            if not n_t:
                 continue
-            n_t = df.get(t, 0)
             idf = math.log(1 + (n - n_t + 0.5) / (n_t + 0.5))
-            s += idf * (tf * (k1 + 1)) / (tf + k1 * (1 - b + b * dl / avgdl))
-        scores.append(s)
-    return scores
+            col = tf[:, j]
+            # Docs without the term add exactly 0.0, matching the skipped branch of the scalar loop.
+            scores += idf * (col * (k1 + 1)) / (col + norm)
+        results.append(scores.tolist())
+    return results
+
+
+def bm25_scores(query: str, docs: List[str], k1: float = 1.5, b: float = 0.75) -> List[float]:
+    """Classic Okapi BM25 score of `query` against each doc in `docs` (same order)."""
+    return bm25_scores_batch([query], docs, k1=k1, b=b)[0]
+
+
+def _fuse(bm: List[float], candidates: List[Dict[str, Any]], limit: int, k: int) -> List[Dict[str, Any]]:
+    n = len(candidates)
+    positions = np.arange(n)
+    # vector rank = position in the input list (0 = best); bm25 rank = position after
+    # sorting by BM25 score desc, ties by input position (stable)
+    bm_order = np.argsort(-np.asarray(bm, dtype=np.float64), kind="stable")
+    bm_rank = np.empty(n, dtype=np.int64)
+    bm_rank[bm_order] = positions
+    hybrid = 1.0 / (k + positions + 1) + 1.0 / (k + bm_rank + 1)
+
+    fused: List[Dict[str, Any]] = []
+    for i in np.argsort(-hybrid, kind="stable")[: max(0, limit)].tolist():
+        item = dict(candidates[i])
+        item["_bm25"] = bm[i]
+        item["_hybrid_score"] = float(hybrid[i])
+        fused.append(item)
+    return fused
 
 
 def rrf_rerank(query: str, candidates: List[Dict[str, Any]], limit: int, k: int = 60) -> List[Dict[str, Any]]:
@@ -60,26 +121,16 @@ def rrf_rerank(query: str, candidates: List[Dict[str, Any]], limit: int, k: int
 
     `candidates` must be ordered best-first by vector relevance and each must carry a
     'content' key. Returns a new list (copies), best-first, truncated to `limit`, each
-    annotated with '_hybrid_score' and '_bm25'.
+    annotated with '_hybrid_score' and '_bm25'. Only the returned candidates are copied.
     """
-    if not candidates:
-        return []
-
-    contents = [c.get("content", "") for c in candidates]
-    bm = bm25_scores(query, contents)
+    return rrf_rerank_batch([query], candidates, limit, k=k)[0]
 
-    # vector rank = position in the input list (0 = best)
-    vec_rank = {i: i for i in range(len(candidates))}
-    # bm25 rank = position after sorting by BM25 score desc (stable on ties)
-    bm_order = sorted(range(len(candidates)), key=lambda i: (bm[i], -i), reverse=True)
-    bm_rank = {i: r for r, i in enumerate(bm_order)}
 
-    fused: List[Dict[str, Any]] = []
-    for i, c in enumerate(candidates):
-        item = dict(c)
-        item["_bm25"] = bm[i]
-        item["_hybrid_score"] = 1.0 / (k + vec_rank[i] + 1) + 1.0 / (k + bm_rank[i] + 1)
-        fused.append(item)
-
-    fused.sort(key=lambda x: x["_hybrid_score"], reverse=True)
-    return fused[: max(0, limit)]
+def rrf_rerank_batch(
+    queries: Sequence[str], candidates: List[Dict[str, Any]], limit: int, k: int = 60
+) -> List[List[Dict[str, Any]]]:
+    """`rrf_rerank` for several queries over one candidate set, sharing tokenization and term counts."""
+    if not candidates:
+        return [[] for _ in queries]
+    contents = [c.get("content", "") for c in candidates]
+    return [_fuse(bm, candidates, limit, k) for bm in bm25_scores_batch(queries, contents)]
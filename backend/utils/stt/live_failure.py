@@ -2,6 +2,7 @@
 
 from __future__ import annotations
 
+import inspect
 import logging
 from typing import Any, Protocol
 
@@ -197,7 +198,13 @@ async def send_live_stt_audio(
         return False
 
     try:
-        accepted = stt_socket.send(audio)
+        # Gated sockets expose ``send_async`` so their VAD window can join the
+        # cross-session batch instead of running its own ORT call inline.
+        send_async = getattr(stt_socket, 'send_async', None)
+        if inspect.iscoroutinefunction(send_async):
+            accepted = await send_async(audio)
+        else:
+            accepted = stt_socket.send(audio)
     except Exception:
         await terminate_live_stt_session(
             websocket,
@@ -2,7 +2,7 @@ import logging
 import math
 import os
 import threading
-from typing import Any, Dict, List, Literal, Optional, Tuple, Union, overload
+from typing import Any, Dict, List, Literal, Optional, Sequence, Tuple, Union, overload
 
 import httpx
 import numpy as np
@@ -126,6 +126,9 @@ VAD_SAMPLE_RATE = 16000
 VAD_WINDOW_SAMPLES = 512  # 32 ms at 16 kHz
 VAD_CONTEXT_SAMPLES = 64  # prepended to each window
 _STATE_SHAPE = (2, 1, 128)
+# Upper bound on independent streams advanced together by one ORT call during
+# file-level VAD. Each lane costs one (576,) input row plus its recurrent state.
+VAD_MAX_BATCH_STREAMS = 64
 
 
 def _get_ort_session() -> ort.InferenceSession:
@@ -192,6 +195,52 @@ def run_vad_window(
     return float(output[0][0]), new_state, new_context  # type: ignore[reportUnknownVariableType,reportUnknownArgumentType]  # onnxruntime untyped
 
 
+def make_fresh_batch_state(batch_size: int) -> Tuple[np.ndarray[Any, Any], np.ndarray[Any, Any]]:
+    """Return zeroed recurrent state + context for ``batch_size`` independent streams.
+
+    Returns (states, contexts) where:
+      states: float32 (2, batch_size, 128) — one recurrent state lane per stream
+      contexts: float32 (batch_size, 64) — tail of each stream's previous window
+    """
+    return (
+        np.zeros((_STATE_SHAPE[0], batch_size, _STATE_SHAPE[2]), dtype=np.float32),
+        np.zeros((batch_size, VAD_CONTEXT_SAMPLES), dtype=np.float32),
+    )
+
+
+def run_vad_batch(
+    audio_windows: np.ndarray[Any, Any],
+    states: np.ndarray[Any, Any],
+    contexts: np.ndarray[Any, Any],
+) -> Tuple[np.ndarray[Any, Any], np.ndarray[Any, Any], np.ndarray[Any, Any]]:
+    """Run VAD on one 512-sample window for each of B independent streams.
+
+    Each row carries its own recurrent state and context, so a single ORT call
+    advances every stream by one window exactly as ``run_vad_window`` would.
+
+    Args:
+        audio_windows: float32 array of shape (B, 512) — 16 kHz mono
+        states: float32 array of shape (2, B, 128) — recurrent state per stream
+        contexts: float32 array of shape (B, 64) — context per stream
+
+    Returns:
+        (speech_probabilities: (B,), new_states: (2, B, 128), new_contexts: (B, 64))
+    """
+    sess = _get_ort_session()
+    windows = audio_windows.astype(np.float32, copy=False)
+    x = np.concatenate([contexts, windows], axis=1)  # shape: (B, 576)
+    output, new_states = sess.run(  # type: ignore[reportUnknownVariableType,reportUnknownMemberType]  # onnxruntime untyped
+        None,
+        {
+            'input': x,
+            'state': np.ascontiguousarray(states),
+            'sr': np.array(VAD_SAMPLE_RATE, dtype=np.int64),
+        },
+    )
+    new_contexts = windows[:, -VAD_CONTEXT_SAMPLES:]
+    return np.asarray(output, dtype=np.float32)[:, 0], new_states, new_contexts  # type: ignore[reportUnknownArgumentType]  # onnxruntime untyped
+
+
 @overload
 def vad_is_empty(file_path: str, return_segments: Literal[True], cache: bool = False) -> List[Dict[str, Any]]: ...
 
@@ -200,11 +249,18 @@ def vad_is_empty(file_path: str, return_segments: Literal[True], cache: bool = F
 def vad_is_empty(file_path: str, return_segments: Literal[False] = False, cache: bool = False) -> bool: ...
 
 
+def _vad_cache_key(file_path: str) -> str:
+    return f'vad_is_empty:{file_path}'
+
+
+_VAD_CACHE_TTL = 60 * 60 * 24
+
+
 def vad_is_empty(
     file_path: str, return_segments: bool = False, cache: bool = False
 ) -> Union[bool, List[Dict[str, Any]]]:
     """Uses hosted pyannote VAD (best quality) with local ONNX Silero fallback."""
-    caching_key = f'vad_is_empty:{file_path}'
+    caching_key = _vad_cache_key(file_path)
     if cache:
         cached = redis_db.get_generic_cache(caching_key)
         if cached is not None:
@@ -229,13 +285,30 @@ def vad_is_empty(
         segments = _run_file_vad(file_path)
 
     if cache:
-        redis_db.set_generic_cache(caching_key, segments, ttl=60 * 60 * 24)
+        redis_db.set_generic_cache(caching_key, segments, ttl=_VAD_CACHE_TTL)
     if return_segments:
         return segments
     logger.info(f'vad_is_empty {len(segments) == 0}')
     return len(segments) == 0
 
 
+def _decode_16khz_samples(file_path: str, *, raise_on_decode_error: bool = False) -> Optional[np.ndarray[Any, Any]]:
+    """Decode an audio file to 16 kHz mono float32 samples, or None if unreadable."""
+    try:
+        audio: Any = AudioSegment.from_file(file_path)  # type: ignore[reportUnknownMemberType]  # pydub untyped
+    except Exception as e:
+        if raise_on_decode_error:
+            raise VADAudioDecodeError('audio could not be decoded for VAD') from e
+        logger.error(f'Failed to read audio file {file_path}: {e}')
+        return None
+
+    # Convert to 16 kHz mono float32
+    audio = audio.set_frame_rate(VAD_SAMPLE_RATE).set_channels(1).set_sample_width(2)  # type: ignore[reportUnknownMemberType]  # pydub untyped
+    samples = np.array(audio.get_array_of_samples(), dtype=np.float32) / 32768.0  # type: ignore[reportUnknownMemberType]  # pydub untyped
+    del audio
+    return samples
+
+
 def _run_file_vad(
     file_path: str,
     threshold: float = 0.5,
@@ -247,19 +320,10 @@ def _run_file_vad(
     Reads the file, resamples to 16 kHz mono, and iterates 512-sample windows
     with 64-sample context. Returns list of dicts: [{start, end, duration}, ...]
     """
-    try:
-        audio: Any = AudioSegment.from_file(file_path)  # type: ignore[reportUnknownMemberType]  # pydub untyped
-    except Exception as e:
-        if raise_on_decode_error:
-            raise VADAudioDecodeError('audio could not be decoded for VAD') from e
-        logger.error(f'Failed to read audio file {file_path}: {e}')
+    samples = _decode_16khz_samples(file_path, raise_on_decode_error=raise_on_decode_error)
+    if samples is None:
         return []
 
-    # Convert to 16 kHz mono float32
-    audio = audio.set_frame_rate(VAD_SAMPLE_RATE).set_channels(1).set_sample_width(2)  # type: ignore[reportUnknownMemberType]  # pydub untyped
-    samples = np.array(audio.get_array_of_samples(), dtype=np.float32) / 32768.0  # type: ignore[reportUnknownMemberType]  # pydub untyped
-    del audio
-
     try:
         return _segments_from_16khz_samples(samples, threshold=threshold)
     except Exception as e:
@@ -270,38 +334,125 @@ def _run_file_vad(
         del samples
 
 
+def run_files_vad(
+    file_paths: Sequence[str],
+    threshold: float = 0.5,
+    *,
+    max_batch_streams: int = VAD_MAX_BATCH_STREAMS,
+    cache: bool = False,
+) -> List[List[Dict[str, Any]]]:
+    """Local Silero VAD for several files, sharing every ORT call across files.
+
+    Files are independent streams, so each keeps its own recurrent state lane
+    and the result for a file is the same as ``_run_file_vad`` on it alone.
+    Unreadable files yield ``[]`` (fail-soft, like ``_run_file_vad``); an
+    inference failure raises for the whole call. Results follow input order.
+
+    With ``cache``, files share ``vad_is_empty``'s per-path cache: cached
+    segments are returned as is and only the misses are run and written back.
+    """
+    if cache:
+        cached: List[Optional[List[Dict[str, Any]]]] = [
+            redis_db.get_generic_cache(_vad_cache_key(path)) for path in file_paths
+        ]
+        misses = [index for index, segments in enumerate(cached) if segments is None]
+        if misses:
+            fresh = run_files_vad(
+                [file_paths[index] for index in misses], threshold, max_batch_streams=max_batch_streams
+            )
+            for index, segments in zip(misses, fresh):
+                redis_db.set_generic_cache(_vad_cache_key(file_paths[index]), segments, ttl=_VAD_CACHE_TTL)
+                cached[index] = segments
+        return [segments or [] for segments in cached]
+
+    results: List[List[Dict[str, Any]]] = [[] for _ in file_paths]
+    for group_start in range(0, len(file_paths), max(1, max_batch_streams)):
+        group = range(group_start, min(group_start + max(1, max_batch_streams), len(file_paths)))
+        decoded: List[Tuple[int, np.ndarray[Any, Any]]] = []
+        for index in group:
+            samples = _decode_16khz_samples(file_paths[index])
+            if samples is not None:
+                decoded.append((index, samples))
+        if not decoded:
+            continue
+        probabilities = _speech_probabilities_batch([samples for _, samples in decoded])
+        for (index, _), probs in zip(decoded, probabilities):
+            results[index] = _segments_from_speech_flags(probs > threshold)
+        del decoded
+    return results
+
+
+def _window_frames(samples: np.ndarray[Any, Any]) -> np.ndarray[Any, Any]:
+    """Return a (n_windows, 576) strided view of context+window model inputs.
+
+    Row ``i`` is the 64-sample tail of window ``i - 1`` (zeros for the first
+    window) followed by window ``i``, which is exactly what ``run_vad_window``
+    feeds the model when the context is threaded through sequentially.
+    """
+    n_windows = len(samples) // VAD_WINDOW_SAMPLES
+    padded = np.zeros(VAD_CONTEXT_SAMPLES + n_windows * VAD_WINDOW_SAMPLES, dtype=np.float32)
+    padded[VAD_CONTEXT_SAMPLES:] = samples[: n_windows * VAD_WINDOW_SAMPLES]
+    frame_len = VAD_CONTEXT_SAMPLES + VAD_WINDOW_SAMPLES
+    if n_windows == 0:
+        return np.zeros((0, frame_len), dtype=np.float32)
+    return np.lib.stride_tricks.sliding_window_view(padded, frame_len)[::VAD_WINDOW_SAMPLES]
+
+
+def _speech_probabilities_batch(streams: Sequence[np.ndarray[Any, Any]]) -> List[np.ndarray[Any, Any]]:
+    """Silero speech probability per 512-sample window for independent streams.
+
+    All streams advance in lockstep: step ``i`` feeds window ``i`` of every
+    stream that still has one as a single batched ORT call. Streams are laid
+    out longest-first so finished streams always drop off the end of the batch
+    and the recurrent state shrinks by slicing instead of reshuffling.
+    """
+    frames = [_window_frames(samples) for samples in streams]
+    probabilities = [np.empty(len(f), dtype=np.float32) for f in frames]
+    order = sorted(range(len(frames)), key=lambda i: len(frames[i]), reverse=True)
+    active = len(order)
+    while active and len(frames[order[active - 1]]) == 0:
+        active -= 1
+    if not active:
+        return probabilities
+
+    sess = _get_ort_session()
+    sr = np.array(VAD_SAMPLE_RATE, dtype=np.int64)
+    states, _ = make_fresh_batch_state(active)
+    batch = np.empty((active, VAD_CONTEXT_SAMPLES + VAD_WINDOW_SAMPLES), dtype=np.float32)
+    step = 0
+    while active:
+        for lane in range(active):
+            batch[lane] = frames[order[lane]][step]
+        output, states = sess.run(  # type: ignore[reportUnknownVariableType,reportUnknownMemberType]  # onnxruntime untyped
+            None,
+            {'input': batch[:active], 'state': states, 'sr': sr},
+        )
+        for lane in range(active):
+            probabilities[order[lane]][step] = output[lane][0]  # type: ignore[reportUnknownArgumentType]  # onnxruntime untyped
+        step += 1
+        finished = active
+        while active and len(frames[order[active - 1]]) <= step:
+            active -= 1
+        if active and active != finished:
+            states = np.ascontiguousarray(states[:, :active])  # type: ignore[reportUnknownArgumentType]  # onnxruntime untyped
+    return probabilities
+
+
+def _segments_from_speech_flags(is_speech: np.ndarray[Any, Any]) -> List[Dict[str, Any]]:
+    """Convert per-window speech flags to [{start, end, duration}] time segments."""
+    if not is_speech.any():
+        return []
+    edges = np.diff(np.concatenate(([0], is_speech.astype(np.int8), [0])))
+    window_sec = VAD_WINDOW_SAMPLES / VAD_SAMPLE_RATE
+    starts = (np.flatnonzero(edges == 1) * window_sec).tolist()
+    ends = (np.flatnonzero(edges == -1) * window_sec).tolist()
+    return [{'start': start, 'end': end, 'duration': end - start} for start, end in zip(starts, ends)]
+
+
 def _segments_from_16khz_samples(samples: np.ndarray[Any, Any], *, threshold: float = 0.5) -> List[Dict[str, Any]]:
     """Run Silero over 16 kHz mono samples and return speech segments."""
-    state, context = make_fresh_state()
-    is_speech_flags: List[bool] = []
-
-    # Process in 512-sample windows
-    offset = 0
-    while offset + VAD_WINDOW_SAMPLES <= len(samples):
-        window = samples[offset : offset + VAD_WINDOW_SAMPLES]
-        prob, state, context = run_vad_window(window, state, context)
-        is_speech_flags.append(prob > threshold)
-        offset += VAD_WINDOW_SAMPLES
-    # Convert per-window flags to time segments
-    window_sec = VAD_WINDOW_SAMPLES / VAD_SAMPLE_RATE
-    segments: List[Dict[str, Any]] = []
-    in_speech = False
-    start = 0.0
-    for i, flag in enumerate(is_speech_flags):
-        t = i * window_sec
-        if flag and not in_speech:
-            in_speech = True
-            start = t
-        elif not flag and in_speech:
-            in_speech = False
-            end = t
-            segments.append({'start': start, 'end': end, 'duration': end - start})
-    # Close any open segment
-    if in_speech:
-        end = len(is_speech_flags) * window_sec
-        segments.append({'start': start, 'end': end, 'duration': end - start})
-
-    return segments
+    (probabilities,) = _speech_probabilities_batch([samples])
+    return _segments_from_speech_flags(probabilities > threshold)
 
 
 def vad_is_empty_strict(file_path: str) -> bool:
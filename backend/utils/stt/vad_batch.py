@@ -0,0 +1,182 @@
+"""
+Cross-session VAD micro-batching for live VADStreamingGate instances.
+
+Every live gate needs one Silero window per 32 ms. Run one at a time, a busy
+pod makes hundreds of single-row ORT calls per window period. The scheduler
+collects pending windows from every gate on the event loop and runs them as
+one batched call once ``VAD_GATE_BATCH_MAX_SIZE`` streams are waiting or
+``VAD_GATE_BATCH_MAX_DELAY_MS`` has passed since the first one arrived.
+
+Recurrent state and context stay owned by each gate: a request carries them
+in and gets the advanced values back, so a batched window produces the same
+probability as ``run_vad_window`` on that gate alone.
+
+Config (env):
+  VAD_GATE_BATCH_ENABLED      — 'true' routes gated sockets through the scheduler (default off)
+  VAD_GATE_BATCH_MAX_DELAY_MS — latency budget for collecting a batch (default 4 ms)
+  VAD_GATE_BATCH_MAX_SIZE     — streams per ORT call before an early flush (default 256)
+"""
+
+import asyncio
+import logging
+import os
+import weakref
+from dataclasses import dataclass
+from typing import Any, List, Optional, Tuple
+
+import numpy as np
+
+from utils.stt.vad import run_vad_batch
+
+logger = logging.getLogger('vad_batch')
+
+VAD_GATE_BATCH_ENABLED = os.getenv('VAD_GATE_BATCH_ENABLED', 'false').lower() == 'true'
+VAD_GATE_BATCH_MAX_DELAY_MS = float(os.getenv('VAD_GATE_BATCH_MAX_DELAY_MS', '4'))
+VAD_GATE_BATCH_MAX_SIZE = int(os.getenv('VAD_GATE_BATCH_MAX_SIZE', '256'))
+
+
+def is_batch_enabled() -> bool:
+    return VAD_GATE_BATCH_ENABLED
+
+
+@dataclass
+class _PendingStream:
+    """One gate's windows waiting for the next batched flush."""
+
+    windows: np.ndarray[Any, Any]  # (n, 512) float32
+    state: np.ndarray[Any, Any]  # (2, 1, 128)
+    context: np.ndarray[Any, Any]  # (1, 64)
+    future: 'asyncio.Future[Tuple[np.ndarray[Any, Any], np.ndarray[Any, Any], np.ndarray[Any, Any]]]'
+
+
+class VADBatchScheduler:
+    """Event-loop micro-batcher that shares Silero ORT calls across gates.
+
+    Not thread-safe: one scheduler serves one event loop (see
+    ``get_vad_batch_scheduler``). Inference runs inline on the loop, as the
+    per-gate path did, but as one call per window step instead of one per gate.
+    """
+
+    def __init__(
+        self,
+        max_batch_size: int = VAD_GATE_BATCH_MAX_SIZE,
+        max_delay_ms: float = VAD_GATE_BATCH_MAX_DELAY_MS,
+    ):
+        self.max_batch_size = max(1, max_batch_size)
+        self.max_delay_sec = max(0.0, max_delay_ms) / 1000.0
+        self._pending: List[_PendingStream] = []
+        self._flush_handle: Optional[asyncio.TimerHandle] = None
+
+        # Metrics
+        self.batches_total = 0
+        self.windows_total = 0
+        self.max_batch_seen = 0
+
+    async def infer(
+        self,
+        windows: np.ndarray[Any, Any],
+        state: np.ndarray[Any, Any],
+        context: np.ndarray[Any, Any],
+    ) -> Tuple[np.ndarray[Any, Any], np.ndarray[Any, Any], np.ndarray[Any, Any]]:
+        """Queue one gate's consecutive windows and await their probabilities.
+
+        Args:
+            windows: float32 (n, 512) consecutive 16 kHz windows of one stream
+            state: float32 (2, 1, 128) recurrent state before the first window
+            context: float32 (1, 64) context before the first window
+
+        Returns:
+            (probabilities: (n,), new_state: (2, 1, 128), new_context: (1, 64))
+        """
+        loop = asyncio.get_running_loop()
+        if len(windows) == 0:
+            return np.empty(0, dtype=np.float32), state, context
+        future: asyncio.Future[Any] = loop.create_future()
+        self._pending.append(_PendingStream(windows, state, context, future))
+        if len(self._pending) >= self.max_batch_size:
+            self._flush()
+        elif self._flush_handle is None:
+            self._flush_handle = loop.call_later(self.max_delay_sec, self._flush)
+        return await future
+
+    def _flush(self) -> None:
+        if self._flush_handle is not None:
+            self._flush_handle.cancel()
+            self._flush_handle = None
+        while self._pending:
+            batch = self._pending[: self.max_batch_size]
+            del self._pending[: self.max_batch_size]
+            # A gate whose caller was cancelled no longer needs its windows.
+            batch = [stream for stream in batch if not stream.future.done()]
+            if not batch:
+                continue
+            try:
+                results = self._run(batch)
+            except Exception as e:
+                logger.exception('VAD batch inference failed streams=%d', len(batch))
+                for stream in batch:
+                    if not stream.future.done():
+                        stream.future.set_exception(e)
+                continue
+            except BaseException as e:
+                # Cancelled or interrupted mid-flush: the windows already taken would
+                # otherwise never resolve. Fail them (their gates fall back to direct
+                # send) and leave the rest queued for a fresh flush.
+                error = RuntimeError(f'VAD batch flush interrupted: {type(e).__name__}')
+                for stream in batch:
+                    if not stream.future.done():
+                        stream.future.set_exception(error)
+                if self._pending and self._flush_handle is None:
+                    self._flush_handle = batch[0].future.get_loop().call_later(0, self._flush)
+                raise
+            for stream, result in zip(batch, results):
+                if not stream.future.done():
+                    stream.future.set_result(result)
+
+    def _run(
+        self, batch: List[_PendingStream]
+    ) -> List[Tuple[np.ndarray[Any, Any], np.ndarray[Any, Any], np.ndarray[Any, Any]]]:
+        """Advance every stream in lockstep, one batched ORT call per window step.
+
+        Streams are ordered longest-first so the ones still holding windows at
+        a given step are always a prefix of the batch.
+        """
+        order = sorted(range(len(batch)), key=lambda i: len(batch[i].windows), reverse=True)
+        probabilities = [np.empty(len(stream.windows), dtype=np.float32) for stream in batch]
+        states = np.concatenate([batch[i].state for i in order], axis=1)
+        contexts = np.concatenate([batch[i].context for i in order], axis=0)
+        active = len(order)
+        step = 0
+        while active:
+            windows = np.stack([batch[order[lane]].windows[step] for lane in range(active)])
+            probs, states, contexts = run_vad_batch(windows, states[:, :active], contexts[:active])
+            for lane in range(active):
+                probabilities[order[lane]][step] = probs[lane]
+            self.batches_total += 1
+            self.windows_total += active
+            self.max_batch_seen = max(self.max_batch_seen, active)
+            step += 1
+            finished = active
+            while active and len(batch[order[active - 1]].windows) <= step:
+                active -= 1
+            # Streams that just ran out keep the state from their final window.
+            for lane in range(active, finished):
+                stream = batch[order[lane]]
+                stream.state = np.ascontiguousarray(states[:, lane : lane + 1])
+                stream.context = contexts[lane : lane + 1].copy()
+        return [(probabilities[i], stream.state, stream.context) for i, stream in enumerate(batch)]
+
+
+_schedulers: 'weakref.WeakKeyDictionary[asyncio.AbstractEventLoop, VADBatchScheduler]' = weakref.WeakKeyDictionary()
+
+
+def get_vad_batch_scheduler() -> Optional[VADBatchScheduler]:
+    """Return the running loop's shared scheduler, or None when batching is off."""
+    if not VAD_GATE_BATCH_ENABLED:
+        return None
+    loop = asyncio.get_running_loop()
+    scheduler = _schedulers.get(loop)
+    if scheduler is None:
+        scheduler = VADBatchScheduler()
+        _schedulers[loop] = scheduler
+    return scheduler
@@ -11,22 +11,23 @@ Modes (VAD_GATE_MODE env var):
   active — VAD gates audio: silence skipped, KeepAlive sent instead
 """
 
+import asyncio
 import audioop
 import logging
 import os
 import threading
 import time
 from bisect import bisect_right
-from collections import deque
 from dataclasses import dataclass
 from enum import Enum
-from typing import Any, Deque, Dict, List, Optional, Tuple
+from typing import Any, Dict, List, Optional, Tuple
 
 import numpy as np
 
 from utils.metrics import OMI_LIVE_STT_MISALIGNED_FRAMES_TOTAL
 from utils.observability.fallback import record_fallback
 from utils.stt.socket import STTSocket
+from utils.stt.vad_batch import VADBatchScheduler, get_vad_batch_scheduler
 from utils.stt.vad import (
     VAD_WINDOW_SAMPLES,
     _get_ort_session,  # type: ignore[reportPrivateUsage]  # internal helper, same package
@@ -131,6 +132,142 @@ class WallTimeMapper:
         return cp_wall + (dg_sec - cp_dg)
 
 
+# ---------------------------------------------------------------------------
+# Preallocated per-gate audio buffers
+# ---------------------------------------------------------------------------
+class PreRollRing:
+    """Fixed-capacity byte ring holding the most recent PCM of a stream.
+
+    ``append`` copies a chunk in and drops the oldest bytes beyond ``keep``;
+    the backing buffer only grows when a single retention exceeds capacity.
+    """
+
+    def __init__(self, capacity: int):
+        self._buf = bytearray(max(1, capacity))
+        self._start = 0
+        self._size = 0
+
+    def __len__(self) -> int:
+        return self._size
+
+    def clear(self) -> None:
+        self._start = 0
+        self._size = 0
+
+    def _grow(self, capacity: int) -> None:
+        data = self.read()
+        self._buf = bytearray(capacity)
+        self._buf[: len(data)] = data
+        self._start = 0
+
+    def append(self, data: bytes, keep: int) -> None:
+        """Add data, then keep only the newest ``keep`` bytes (keep >= len(data))."""
+        if keep > len(self._buf):
+            self._grow(keep)
+        capacity = len(self._buf)
+        view = memoryview(data)
+        if len(view) > capacity:
+            view = view[len(view) - capacity :]
+        write_at = (self._start + self._size) % capacity
+        first = min(len(view), capacity - write_at)
+        self._buf[write_at : write_at + first] = view[:first]
+        self._buf[: len(view) - first] = view[first:]
+        total = self._size + len(view)
+        new_size = min(total, keep, capacity)
+        self._start = (self._start + total - new_size) % capacity
+        self._size = new_size
+
+    def read(self) -> bytes:
+        end = self._start + self._size
+        if end <= len(self._buf):
+            return bytes(self._buf[self._start : end])
+        return bytes(self._buf[self._start :]) + bytes(self._buf[: end - len(self._buf)])
+
+
+class VadSampleBuffer:
+    """Accumulates int16 16 kHz VAD input and hands out complete float32 windows.
+
+    Samples are appended into a preallocated int16 buffer; complete windows are
+    scaled into a reusable float32 buffer and the < 1 window tail is moved to the
+    front. Linear resampling runs through cached index/weight plans and scratch
+    buffers and matches the np.interp resampler sample for sample.
+    """
+
+    def __init__(self, window_samples: int, capacity: int = 8192):
+        self.window_samples = window_samples
+        self._samples = np.zeros(max(capacity, window_samples), dtype=np.int16)
+        self._fill = 0
+        self._windows = np.empty(0, dtype=np.float32)
+        self._scratch = np.empty(0, dtype=np.float64)
+        self._weights = np.empty(0, dtype=np.float64)
+        self._plan: Optional[Tuple[int, int, np.ndarray[Any, Any], np.ndarray[Any, Any], np.ndarray[Any, Any]]] = None
+
+    def __len__(self) -> int:
+        return self._fill
+
+    def clear(self) -> None:
+        self._fill = 0
+
+    def _reserve(self, extra: int) -> np.ndarray[Any, Any]:
+        needed = self._fill + extra
+        if needed > len(self._samples):
+            grown = np.zeros(max(needed, 2 * len(self._samples)), dtype=np.int16)
+            grown[: self._fill] = self._samples[: self._fill]
+            self._samples = grown
+        return self._samples[self._fill : needed]
+
+    def append(self, samples: np.ndarray[Any, Any]) -> None:
+        """Append int16 samples already at the VAD rate."""
+        self._reserve(len(samples))[:] = samples
+        self._fill += len(samples)
+
+    def append_resampled(self, samples: np.ndarray[Any, Any], ratio: float) -> None:
+        """Append int16 samples linearly resampled by ``ratio`` (truncated to int16 like astype)."""
+        n_in = len(samples)
+        n_out = int(n_in * ratio)
+        if n_in < 2 or n_out < 2:
+            indices = np.linspace(0, n_in - 1, n_out)
+            self.append(np.interp(indices, np.arange(n_in), samples.astype(np.float64)).astype(np.int16))
+            return
+        plan = self._plan
+        if plan is None or plan[0] != n_in or plan[1] != n_out:
+            positions = np.linspace(0, n_in - 1, n_out)
+            left = np.minimum(positions.astype(np.intp), n_in - 2)
+            plan = (n_in, n_out, left, left + 1, positions - left)
+            self._plan = plan
+            self._scratch = np.empty(n_in + 2 * n_out, dtype=np.float64)
+        _, _, left, right, frac = plan
+        source = self._scratch[:n_in]
+        low = self._scratch[n_in : n_in + n_out]
+        high = self._scratch[n_in + n_out :]
+        source[:] = samples
+        np.take(source, left, out=low)
+        np.take(source, right, out=high)
+        # np.interp on unit-spaced points: (fp[j+1] - fp[j]) * (x - j) + fp[j]
+        np.subtract(high, low, out=high)
+        np.multiply(high, frac, out=high)
+        np.add(high, low, out=high)
+        self._reserve(n_out)[:] = high
+        self._fill += n_out
+
+    def take_windows(self) -> np.ndarray[Any, Any]:
+        """Every complete window as float32 in [-1, 1), shape (n, window_samples).
+
+        The result is a view of a reused buffer, valid until the next call.
+        """
+        n_windows = self._fill // self.window_samples
+        consumed = n_windows * self.window_samples
+        if consumed > len(self._windows):
+            self._windows = np.empty(consumed, dtype=np.float32)
+        windows = self._windows[:consumed]
+        np.multiply(self._samples[:consumed], np.float32(1.0 / 32768.0), out=windows)
+        tail = self._fill - consumed
+        if consumed and tail:
+            self._samples[:tail] = self._samples[consumed : self._fill]
+        self._fill = tail
+        return windows.reshape(n_windows, self.window_samples)
+
+
 # ---------------------------------------------------------------------------
 # VAD Streaming Gate (per-session)
 # ---------------------------------------------------------------------------
@@ -173,12 +310,13 @@ class VADStreamingGate:
         # Eagerly init the shared ONNX session (fail-fast at gate creation)
         _get_ort_session()
         self._vad_window_samples = VAD_WINDOW_SAMPLES  # 512 for 16kHz (Silero v6)
-        self._vad_buffer = np.array([], dtype=np.float32)  # Buffer for cross-chunk accumulation
+        self._vad_buffer = VadSampleBuffer(self._vad_window_samples)  # Cross-chunk accumulation
         self._pcm_remainder = b''  # Trailing bytes of a frame split across chunks
         self._vad_state: np.ndarray[Any, Any]
         self._vad_context: np.ndarray[Any, Any]
         self._vad_state, self._vad_context = make_fresh_state()  # Per-connection ONNX recurrent state + context
         self._vad_inference_lock = threading.Lock()
+        self._vad_async_lock = asyncio.Lock()  # Serializes batched chunks of this gate
         self._speech_threshold = VAD_GATE_SPEECH_THRESHOLD
 
         # State machine
@@ -190,10 +328,11 @@ class VADStreamingGate:
         self._finalize_silence_ms = VAD_GATE_FINALIZE_SILENCE_MS
         self._hangover_finalized = False  # True once finalize sent during current hangover
 
-        # Pre-roll buffer: stores recent audio chunks for playback on speech onset.
-        # Tracks accumulated duration to respect _pre_roll_ms regardless of chunk size.
-        self._pre_roll: Deque[bytes] = deque()
-        self._pre_roll_total_ms: float = 0.0
+        # Pre-roll buffer: the most recent _pre_roll_ms of input (never less than the
+        # current chunk), replayed on speech onset. Cut on frame boundaries.
+        self._frame_bytes = self._sample_width * channels
+        self._pre_roll_bytes = int(sample_rate * self._pre_roll_ms / 1000) * self._frame_bytes
+        self._pre_roll = PreRollRing(self._pre_roll_bytes + sample_rate * self._frame_bytes // 10)
 
         # Timestamp mapper
         self.dg_wall_mapper = WallTimeMapper()
@@ -226,11 +365,10 @@ class VADStreamingGate:
             # Reset state machine to start fresh in active mode
             self._state = GateState.SILENCE
             self._pre_roll.clear()
-            self._pre_roll_total_ms = 0.0
             self._hangover_finalized = False
             # Reset VAD recurrent state and buffer for clean active-mode start
             self._vad_state, self._vad_context = make_fresh_state()
-            self._vad_buffer = np.array([], dtype=np.float32)
+            self._vad_buffer.clear()
             self._pcm_remainder = b''
             # Sync mapper cursor: DG received all audio during shadow phase
             self.dg_wall_mapper._provider_cursor_sec = self._audio_cursor_ms / 1000.0  # type: ignore[reportPrivateUsage]  # sync internal mapper cursor
@@ -250,8 +388,8 @@ class VADStreamingGate:
             return False
         return (wall_time - ref_time) >= VAD_GATE_KEEPALIVE_SEC
 
-    def _convert_for_vad(self, pcm_data: bytes) -> np.ndarray[Any, Any]:
-        """Convert audio to float32 at 16kHz mono for VAD."""
+    def _buffer_for_vad(self, pcm_data: bytes) -> None:
+        """Append a chunk to the VAD buffer as int16 at 16kHz mono."""
         # A client may split PCM16 anywhere, so a chunk can end mid-frame. Carry
         # those bytes into the next chunk: np.frombuffer rejects a partial sample,
         # and dropping it would shift every later sample by one byte.
@@ -264,7 +402,7 @@ class VADStreamingGate:
         else:
             self._pcm_remainder = b''
         if not data:
-            return np.array([], dtype=np.float32)
+            return
 
         # Convert to mono if stereo
         if self.channels == 2:
@@ -272,15 +410,20 @@ class VADStreamingGate:
 
         data_int16 = np.frombuffer(data, dtype=np.int16)
 
-        # Resample to 16kHz if needed
+        # Resample to 16kHz if needed (linear interpolation)
         if self.sample_rate != self._vad_sample_rate:
-            # Simple linear interpolation resampling
-            ratio = self._vad_sample_rate / self.sample_rate
-            n_out = int(len(data_int16) * ratio)
-            indices = np.linspace(0, len(data_int16) - 1, n_out)
-            data_int16 = np.interp(indices, np.arange(len(data_int16)), data_int16.astype(np.float64)).astype(np.int16)
+            self._vad_buffer.append_resampled(data_int16, self._vad_sample_rate / self.sample_rate)
+        else:
+            self._vad_buffer.append(data_int16)
 
-        return data_int16.astype(np.float32) / 32768.0
+    def _take_vad_windows(self, pcm_data: bytes) -> np.ndarray[Any, Any]:
+        """Buffer a chunk's VAD samples and return every complete window, shape (n, 512).
+
+        Buffers samples across chunks to handle cases where chunk size < window size.
+        The windows are a view of the buffer's reused storage, valid until the next call.
+        """
+        self._buffer_for_vad(pcm_data)
+        return self._vad_buffer.take_windows()
 
     def _run_vad(self, pcm_data: bytes) -> bool:
         """Run ONNX Silero VAD on audio chunk. Returns True if speech detected.
@@ -288,45 +431,26 @@ class VADStreamingGate:
         Uses the shared ONNX InferenceSession with per-connection recurrent
         state (h/c stored on this instance). No model pool needed — ONNX
         sessions are stateless and thread-safe for different input data.
-
-        Buffers samples across chunks to handle cases where chunk size < window size.
         """
         with self._vad_inference_lock:
-            float_data = self._convert_for_vad(pcm_data)
-
-            # Always append to buffer for cross-chunk accumulation
-            self._vad_buffer = np.concatenate([self._vad_buffer, float_data])
-            del float_data
-
             is_speech = False
-            if len(self._vad_buffer) >= self._vad_window_samples:
-                # Process all complete windows in buffer
-                while len(self._vad_buffer) >= self._vad_window_samples:
-                    window = self._vad_buffer[: self._vad_window_samples]
-                    self._vad_buffer = self._vad_buffer[self._vad_window_samples :]
-
-                    prob, self._vad_state, self._vad_context = run_vad_window(
-                        window, self._vad_state, self._vad_context
-                    )
-                    if prob > self._speech_threshold:
-                        is_speech = True
-
-            # Keep buffer bounded (max 1 window of leftover)
-            if len(self._vad_buffer) > self._vad_window_samples:
-                self._vad_buffer = self._vad_buffer[-self._vad_window_samples :]
-
+            # Process all complete windows in buffer
+            for window in self._take_vad_windows(pcm_data):
+                prob, self._vad_state, self._vad_context = run_vad_window(window, self._vad_state, self._vad_context)
+                if prob > self._speech_threshold:
+                    is_speech = True
             return is_speech
 
-    def process_audio(self, pcm_data: bytes, wall_time: float) -> GateOutput:
-        """Process an audio chunk through the VAD gate.
-
-        Args:
-            pcm_data: Raw PCM16 audio bytes
-            wall_time: Wall-clock timestamp of this chunk
+    async def _run_vad_batched(self, pcm_data: bytes, scheduler: VADBatchScheduler) -> bool:
+        """Same decision as ``_run_vad``, with inference shared across gates by ``scheduler``."""
+        windows = self._take_vad_windows(pcm_data)
+        if len(windows) == 0:
+            return False
+        probs, self._vad_state, self._vad_context = await scheduler.infer(windows, self._vad_state, self._vad_context)
+        return bool((probs > self._speech_threshold).any())
 
-        Returns:
-            GateOutput with audio to send and control signals
-        """
+    def _begin_chunk(self, pcm_data: bytes, wall_time: float) -> float:
+        """Count an incoming chunk and advance the audio cursor. Returns chunk duration (ms)."""
         if self._first_audio_wall_time is None:
             self._first_audio_wall_time = wall_time
 
@@ -337,10 +461,35 @@ class VADStreamingGate:
         n_samples = len(pcm_data) // (self._sample_width * self.channels)
         chunk_ms = (n_samples * 1000.0) / self.sample_rate
         self._audio_cursor_ms += chunk_ms
+        return chunk_ms
+
+    def process_audio(self, pcm_data: bytes, wall_time: float) -> GateOutput:
+        """Process an audio chunk through the VAD gate.
+
+        Args:
+            pcm_data: Raw PCM16 audio bytes
+            wall_time: Wall-clock timestamp of this chunk
 
-        # Run VAD
+        Returns:
+            GateOutput with audio to send and control signals
+        """
+        chunk_ms = self._begin_chunk(pcm_data, wall_time)
         is_speech = self._run_vad(pcm_data)
+        return self._apply_vad_decision(pcm_data, is_speech, wall_time, chunk_ms)
+
+    async def process_audio_async(self, pcm_data: bytes, wall_time: float, scheduler: VADBatchScheduler) -> GateOutput:
+        """``process_audio`` with the VAD window batched with other live gates.
+
+        Chunks of one gate are serialized so recurrent state and the state
+        machine see them in arrival order while the batch is collected.
+        """
+        async with self._vad_async_lock:
+            chunk_ms = self._begin_chunk(pcm_data, wall_time)
+            is_speech = await self._run_vad_batched(pcm_data, scheduler)
+            return self._apply_vad_decision(pcm_data, is_speech, wall_time, chunk_ms)
 
+    def _apply_vad_decision(self, pcm_data: bytes, is_speech: bool, wall_time: float, chunk_ms: float) -> GateOutput:
+        """Update counters and the gate state machine from one chunk's VAD decision."""
         if is_speech:
             self._last_speech_ms = self._audio_cursor_ms
             self._chunks_speech += 1
@@ -380,28 +529,35 @@ class VADStreamingGate:
 
         return output
 
+    @property
+    def _pre_roll_total_ms(self) -> float:
+        return len(self._pre_roll) / (self._frame_bytes * self.sample_rate) * 1000.0
+
+    def _buffer_pre_roll(self, pcm_data: bytes) -> None:
+        """Keep the last _pre_roll_ms of input, or the whole chunk if it is longer.
+
+        The retained audio starts on a frame boundary of the input stream, so a
+        client splitting PCM16 mid-sample never shifts the replayed pre-roll.
+        """
+        keep = max(len(pcm_data), self._pre_roll_bytes)
+        if keep > len(pcm_data):
+            keep = max(len(pcm_data), keep - (keep - self._bytes_received) % self._frame_bytes)
+        self._pre_roll.append(pcm_data, keep)
+
     def _update_state(self, pcm_data: bytes, is_speech: bool, wall_time: float) -> GateOutput:
         """State machine transition logic."""
         wall_rel = wall_time - self._first_audio_wall_time if self._first_audio_wall_time else 0.0
         chunk_duration_sec = len(pcm_data) / (self._sample_width * self.channels * self.sample_rate)
-        chunk_ms = chunk_duration_sec * 1000.0
-
         if self._state == GateState.SILENCE:
-            # Buffer for pre-roll (time-based eviction)
-            self._pre_roll.append(pcm_data)
-            self._pre_roll_total_ms += chunk_ms
-            while self._pre_roll_total_ms > self._pre_roll_ms and len(self._pre_roll) > 1:
-                evicted = self._pre_roll.popleft()
-                evicted_ms = (len(evicted) / (self._sample_width * self.channels * self.sample_rate)) * 1000.0
-                self._pre_roll_total_ms -= evicted_ms
+            # Buffer for pre-roll (sample-accurate time-based eviction)
+            self._buffer_pre_roll(pcm_data)
 
             if is_speech:
                 # Transition: SILENCE → SPEECH
                 self._state = GateState.SPEECH
                 # Emit pre-roll + current chunk
-                pre_roll_audio = b''.join(self._pre_roll)
+                pre_roll_audio = self._pre_roll.read()
                 self._pre_roll.clear()
-                self._pre_roll_total_ms = 0.0
 
                 # Record mapper checkpoint for pre-roll start
                 pre_roll_duration = len(pre_roll_audio) / (self._sample_width * self.channels * self.sample_rate)
@@ -469,10 +625,7 @@ class VADStreamingGate:
                     self._finalize_count += 1
                 self._hangover_finalized = False
                 self._pre_roll.clear()
-                self._pre_roll_total_ms = 0.0
-                self._pre_roll.append(pcm_data)
-                chunk_ms_local = (len(pcm_data) / (self._sample_width * self.channels * self.sample_rate)) * 1000.0
-                self._pre_roll_total_ms = chunk_ms_local
+                self._buffer_pre_roll(pcm_data)
                 # pcm_data is buffered in pre-roll and will count as skipped if never sent
                 self.dg_wall_mapper.on_silence_skipped()
                 return GateOutput(
@@ -630,17 +783,38 @@ class GatedSTTSocket(STTSocket):
         try:
             gate_out = self._gate.process_audio(data, now)
         except Exception:
-            logger.exception('VAD gate process error, falling back to direct send uid=%s', self._gate.uid)
-            record_fallback(
-                component='vad',
-                from_mode='gated',
-                to_mode='direct',
-                reason='other',
-                outcome='degraded',
-            )
-            self._gate.mode = 'off'  # Disable timestamp remapping in stream_transcript wrapper
-            self._gate = None  # Disable gate for rest of session
-            return self._conn.send(data)
+            return self._send_after_gate_failure(self._gate, data)
+        return self._deliver(self._gate, data, gate_out)
+
+    async def send_async(self, data: bytes, wall_time: Optional[float] = None) -> bool:
+        """``send`` with VAD batched across live sessions when the scheduler is enabled."""
+        scheduler = get_vad_batch_scheduler()
+        if self._gate is None or scheduler is None or self.is_connection_dead:
+            return self.send(data, wall_time)
+
+        gate = self._gate
+        now = wall_time or time.time()
+        try:
+            gate_out = await gate.process_audio_async(data, now, scheduler)
+        except Exception:
+            return self._send_after_gate_failure(gate, data)
+        return self._deliver(gate, data, gate_out)
+
+    def _send_after_gate_failure(self, gate: VADStreamingGate, data: bytes) -> bool:
+        logger.exception('VAD gate process error, falling back to direct send uid=%s', gate.uid)
+        record_fallback(
+            component='vad',
+            from_mode='gated',
+            to_mode='direct',
+            reason='other',
+            outcome='degraded',
+        )
+        gate.mode = 'off'  # Disable timestamp remapping in stream_transcript wrapper
+        self._gate = None  # Disable gate for rest of session
+        return self._conn.send(data)
+
+    def _deliver(self, gate: VADStreamingGate, data: bytes, gate_out: GateOutput) -> bool:
+        """Forward the gate's decision for one chunk to the provider connection."""
         if self._raw_file:
             self._raw_file.write(data)
         if self._gated_file and gate_out.audio_to_send:
@@ -657,8 +831,8 @@ class GatedSTTSocket(STTSocket):
             try:
                 self._conn.finalize()
             except Exception:
-                self._gate._finalize_errors += 1  # type: ignore[reportPrivateUsage]  # internal counter
-                logger.warning('finalize failed uid=%s session=%s', self._gate.uid, self._gate.session_id)
+                gate._finalize_errors += 1  # type: ignore[reportPrivateUsage]  # internal counter
+                logger.warning('finalize failed uid=%s session=%s', gate.uid, gate.session_id)
                 # A failed speech-boundary flush means the provider may have
                 # dropped the pending utterance. Report the send as rejected so
                 # the shared live-STT boundary delivers a terminal failure to
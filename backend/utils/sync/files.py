@@ -1,14 +1,17 @@
 import logging
+import mmap
 import os
 import re
 import shutil
 import struct
+import threading
 import wave
-from typing import Any, List, Optional
+from typing import Any, List, Optional, Tuple
 
 from fastapi import HTTPException, UploadFile
 
 from models.conversation_enums import ConversationSource
+from utils.executors import sync_executor
 from utils.log_sanitizer import sanitize
 from utils.request_validation import parse_sync_filename_timestamp
 from utils.sync import playback as sync_playback
@@ -24,6 +27,10 @@ else:
 logger = logging.getLogger(__name__)
 
 MAX_SYNC_FRAME_BYTES = 65536
+_FRAME_PREFIX = struct.Struct('<I')
+# Decoded frames buffered per WAV write (~20 s at the default 10 ms frame).
+_DECODE_BATCH_FRAMES = 2048
+SYNC_DECODE_PARALLELISM = max(1, int(os.getenv('SYNC_DECODE_PARALLELISM', '4')))
 
 
 def _get_opus_decoder_class() -> Any:
@@ -35,12 +42,41 @@ def _get_opus_decoder_class() -> Any:
     return Decoder
 
 
+def _index_length_prefixed_frames(data: Any) -> Tuple[List[Tuple[int, int]], bool]:
+    """Locate every ``[uint32 length][payload]`` frame of a sync file in one pass.
+
+    Returns the (start, length) span of each complete frame and whether the
+    stream ended in a truncated or invalid frame. Spans before the bad frame
+    stay usable so a damaged tail does not cost the recording before it.
+    """
+    spans: List[Tuple[int, int]] = []
+    offset, end = 0, len(data)
+    while offset < end:
+        if end - offset < _FRAME_PREFIX.size:
+            logger.warning('Opus decode: truncated length prefix')
+            return spans, True
+        (frame_length,) = _FRAME_PREFIX.unpack_from(data, offset)
+        if frame_length == 0 or frame_length > MAX_SYNC_FRAME_BYTES:
+            logger.warning('Opus decode: invalid frame length')
+            return spans, True
+        start = offset + _FRAME_PREFIX.size
+        if end - start < frame_length:
+            logger.warning('Opus decode: truncated frame')
+            return spans, True
+        spans.append((start, frame_length))
+        offset = start + frame_length
+    return spans, False
+
+
 def decode_opus_file_to_wav(
     opus_file_path: str, wav_file_path: str, sample_rate: int = 16000, channels: int = 1, frame_size: int = 160
 ) -> bool:
     """Decode an Opus file with length-prefixed frames to WAV format.
 
-    Writes directly to WAV file to avoid accumulating all PCM data in memory.
+    The file is memory-mapped and its frame index parsed up front; decoded PCM
+    is collected in a fixed, reused buffer and flushed to the WAV file in
+    batches of ``_DECODE_BATCH_FRAMES`` frames, so memory stays bounded
+    without a write call per 10 ms frame.
     """
     if not os.path.exists(opus_file_path):
         logger.warning(f"File not found: {sanitize(opus_file_path)}")
@@ -48,7 +84,6 @@ def decode_opus_file_to_wav(
 
     decoder = _get_opus_decoder_class()(sample_rate, channels)
     frame_count = 0
-    corrupt_stream = False
 
     try:
         with open(opus_file_path, 'rb') as f, wave.open(wav_file_path, 'wb') as wav_file:
@@ -56,33 +91,37 @@ def decode_opus_file_to_wav(
             wav_file.setsampwidth(2)
             wav_file.setframerate(sample_rate)
 
-            while True:
-                length_bytes = f.read(4)
-                if not length_bytes:
-                    break
-                if len(length_bytes) < 4:
-                    logger.warning('Opus decode: truncated length prefix')
-                    corrupt_stream = True
-                    break
-
-                frame_length = struct.unpack('<I', length_bytes)[0]
-                if frame_length == 0 or frame_length > MAX_SYNC_FRAME_BYTES:
-                    logger.warning('Opus decode: invalid frame length')
-                    corrupt_stream = True
-                    break
-                opus_data = f.read(frame_length)
-                if len(opus_data) < frame_length:
-                    logger.warning('Opus decode: truncated frame')
-                    corrupt_stream = True
-                    break
-                try:
-                    pcm_frame = decoder.decode(opus_data, frame_size=frame_size)
-                    wav_file.writeframes(pcm_frame)
+            # mmap rejects empty files; an empty upload simply has no frames.
+            data: Any = mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ) if os.fstat(f.fileno()).st_size else b''
+            try:
+                spans, corrupt_stream = _index_length_prefixed_frames(data)
+
+                batch = bytearray(frame_size * channels * 2 * _DECODE_BATCH_FRAMES)
+                batch_view = memoryview(batch)
+                filled = 0
+                for start, length in spans:
+                    try:
+                        pcm_frame = decoder.decode(data[start : start + length], frame_size=frame_size)
+                    except Exception as e:
+                        logger.warning('Opus decode: frame failed exception_type=%s', type(e).__name__)
+                        corrupt_stream = True
+                        break
+                    if filled + len(pcm_frame) > len(batch):
+                        wav_file.writeframesraw(batch_view[:filled])
+                        filled = 0
+                        if len(pcm_frame) > len(batch):
+                            wav_file.writeframesraw(pcm_frame)
+                            frame_count += 1
+                            continue
+                    batch[filled : filled + len(pcm_frame)] = pcm_frame
+                    filled += len(pcm_frame)
                     frame_count += 1
-                except Exception as e:
-                    logger.warning('Opus decode: frame failed exception_type=%s', type(e).__name__)
-                    corrupt_stream = True
-                    break
+                if filled:
+                    wav_file.writeframesraw(batch_view[:filled])
+                batch_view.release()
+            finally:
+                if isinstance(data, mmap.mmap):
+                    data.close()
 
         if frame_count > 0:
             if corrupt_stream:
@@ -234,6 +273,75 @@ def detect_source_from_filenames(filenames: List[Optional[str]]) -> Conversation
     return ConversationSource.omi
 
 
+def _decode_sync_file(path: str) -> Optional[str]:
+    """Decode one uploaded sync file to WAV, returning its path or None when unreadable.
+
+    The source .bin is removed either way.
+    """
+    wav_path = path.replace('.bin', '.wav')
+    filename = os.path.basename(path)
+    frame_size = 160
+    match = re.search(r'_fs(\d+)', filename)
+    if match:
+        try:
+            frame_size = int(match.group(1))
+            logger.info(f"Found frame size {frame_size} in filename: {filename}")
+        except ValueError:
+            logger.error(f"Invalid frame size format in filename: {filename}, using default {frame_size}")
+
+    if _is_pcm_codec(filename):
+        sample_rate_match = re.search(r'_pcm(?:8|16)_(\d+)_', filename)
+        sample_rate = (
+            int(sample_rate_match.group(1)) if sample_rate_match else (16000 if '_pcm16_' in filename else 8000)
+        )
+        sample_width = 1 if '_pcm8_' in filename else 2
+        success = decode_pcm_file_to_wav(path, wav_path, sample_rate=sample_rate, sample_width=sample_width)
+    else:
+        success = decode_opus_file_to_wav(path, wav_path, frame_size=frame_size)
+
+    if os.path.exists(path):
+        os.remove(path)
+
+    if success and get_wav_duration(wav_path) == 0:
+        success = False
+
+    if not success:
+        if os.path.exists(wav_path):
+            os.remove(wav_path)
+        return None
+    return wav_path
+
+
+def _decode_sync_files_parallel(files_path: List[str]) -> List[Optional[str]]:
+    """Decode files across up to SYNC_DECODE_PARALLELISM threads, preserving input order.
+
+    The calling thread drains the shared queue too, and helpers that never got
+    a worker are cancelled rather than awaited. Callers already run on
+    sync_executor, so waiting on queued helpers could otherwise deadlock a
+    saturated pool; libopus runs outside the GIL, so helpers that do start
+    decode in parallel.
+    """
+    results: List[Optional[str]] = [None] * len(files_path)
+    pending = iter(range(len(files_path)))
+    pending_lock = threading.Lock()
+
+    def drain() -> None:
+        while True:
+            with pending_lock:
+                index = next(pending, None)
+            if index is None:
+                return
+            results[index] = _decode_sync_file(files_path[index])
+
+    helper_count = min(SYNC_DECODE_PARALLELISM, len(files_path)) - 1
+    helpers = [sync_executor.submit(drain) for _ in range(helper_count)]
+    drain()
+    for helper in helpers:
+        if not helper.cancel():
+            helper.result()
+    return results
+
+
 def decode_files_to_wav(files_path: List[str]) -> List[str]:
     """Decode each uploaded sync file, isolating unreadable files from their batch.
 
@@ -244,38 +352,9 @@ def decode_files_to_wav(files_path: List[str]) -> List[str]:
     """
     wav_files: List[str] = []
     unreadable: List[str] = []
-    for path in files_path:
-        wav_path = path.replace('.bin', '.wav')
-        filename = os.path.basename(path)
-        frame_size = 160
-        match = re.search(r'_fs(\d+)', filename)
-        if match:
-            try:
-                frame_size = int(match.group(1))
-                logger.info(f"Found frame size {frame_size} in filename: {filename}")
-            except ValueError:
-                logger.error(f"Invalid frame size format in filename: {filename}, using default {frame_size}")
-
-        if _is_pcm_codec(filename):
-            sample_rate_match = re.search(r'_pcm(?:8|16)_(\d+)_', filename)
-            sample_rate = (
-                int(sample_rate_match.group(1)) if sample_rate_match else (16000 if '_pcm16_' in filename else 8000)
-            )
-            sample_width = 1 if '_pcm8_' in filename else 2
-            success = decode_pcm_file_to_wav(path, wav_path, sample_rate=sample_rate, sample_width=sample_width)
-        else:
-            success = decode_opus_file_to_wav(path, wav_path, frame_size=frame_size)
-
-        if os.path.exists(path):
-            os.remove(path)
-
-        if success and get_wav_duration(wav_path) == 0:
-            success = False
-
-        if not success:
-            unreadable.append(filename)
-            if os.path.exists(wav_path):
-                os.remove(wav_path)
+    for path, wav_path in zip(files_path, _decode_sync_files_parallel(files_path)):
+        if wav_path is None:
+            unreadable.append(os.path.basename(path))
             continue
 
         # Short, successfully decoded audio is not proof of silence. Preserve it
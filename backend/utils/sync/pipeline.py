@@ -120,7 +120,7 @@ from utils.stt.speaker_embedding import (
     compare_embeddings,
     extract_embedding_from_bytes,
 )
-from utils.stt.vad import vad_is_empty
+from utils.stt.vad import run_files_vad, vad_is_empty
 from utils.sync.files import decode_files_to_wav, get_timestamp_from_path, get_wav_duration
 from utils.sync.backfill import release_backfill_slot, reserve_backfill_speech
 from utils.sync.content_id import compute_sync_segment_id
@@ -733,10 +733,32 @@ def _merge_and_cap_vad_segments(voice_segments: list) -> list:
     return segments
 
 
-def retrieve_vad_segments(path: str, segmented_paths: set, errors: list = None):
+def _prefetch_local_vad_segments(wav_paths: list) -> dict:
+    """Run local Silero VAD for every file of a job in shared batched ORT calls.
+
+    Returns ``{path: segments}``. Files whose segments ``vad_is_empty`` already
+    cached are not rerun, and new results are cached the same way. Paths missing
+    from the result (hosted VAD configured, single file, or a failed batch) take
+    the per-file ``vad_is_empty`` path in ``retrieve_vad_segments``.
+    """
+    if len(wav_paths) < 2 or os.getenv('HOSTED_VAD_API_URL'):
+        return {}
+    try:
+        return dict(zip(wav_paths, run_files_vad(wav_paths, cache=True)))
+    except Exception as e:
+        logger.warning(
+            'event=sync_vad_batch outcome=fallback exception_type=%s file_count=%d',
+            _bounded_exception_type(e),
+            len(wav_paths),
+        )
+        return {}
+
+
+def retrieve_vad_segments(path: str, segmented_paths: set, errors: list = None, voice_segments: list = None):
     try:
         start_timestamp = get_timestamp_from_path(path)
-        voice_segments = vad_is_empty(path, return_segments=True, cache=True)
+        if voice_segments is None:
+            voice_segments = vad_is_empty(path, return_segments=True, cache=True)
     except Exception as e:
         error_code = 'sync_vad_failed'
         logger.error(
@@ -1620,11 +1642,16 @@ async def _run_sync_vad_phase(wav_paths: list, segmented_paths: set) -> tuple[li
     """Finish all mutating VAD work before the coordinator advances or cleans up."""
     phase_started = time.monotonic()
     vad_errors: list[str] = []
+    prefetched_segments = await run_blocking(sync_executor, _prefetch_local_vad_segments, wav_paths)
 
     def _run_vad_bg(path: str):
         local_errors: list[str] = []
         try:
-            retrieve_vad_segments(path, segmented_paths, local_errors)
+            voice_segments = prefetched_segments.get(path)
+            if voice_segments is None:
+                retrieve_vad_segments(path, segmented_paths, local_errors)
+            else:
+                retrieve_vad_segments(path, segmented_paths, local_errors, voice_segments=voice_segments)
         except Exception as error:
             if not local_errors:
                 local_errors.append(_bounded_exception_type(error))
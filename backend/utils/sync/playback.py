@@ -2,6 +2,8 @@ from __future__ import annotations
 
 import io
 import logging
+import struct
+import sys
 import wave
 from typing import Any
 
@@ -24,13 +26,18 @@ from utils.other.storage import (
     get_merged_audio_signed_url,
     get_or_create_merged_audio,
     get_playback_artifact_signed_url,
+    get_seekable_merged_audio,
     is_playback_unavailable,
+    SeekableMergedAudio,
 )
 
 logger = logging.getLogger(__name__)
 
 AUDIO_SAMPLE_RATE = 16000
 AUDIO_URLS_POLL_AFTER_MS = 3000
+# Largest Range served from seekable chunks (~2 min of 16 kHz PCM16). Longer and
+# open-ended ranges ("bytes=0-") read most of the file; the cached merged WAV serves those.
+SEEKABLE_RANGE_MAX_BYTES = 4 << 20
 
 
 def pcm_to_wav(pcm_data: bytes, sample_rate: int = 16000, channels: int = 1, sample_width: int = 2) -> bytes:
@@ -44,6 +51,27 @@ def pcm_to_wav(pcm_data: bytes, sample_rate: int = 16000, channels: int = 1, sam
     return wav_buffer.getvalue()
 
 
+def wav_header(pcm_size: int, sample_rate: int = 16000, channels: int = 1, sample_width: int = 2) -> bytes:
+    """The 44-byte header pcm_to_wav writes in front of pcm_size bytes of PCM."""
+    block_align = channels * sample_width
+    return struct.pack(
+        '<4sI4s4sIHHIIHH4sI',
+        b'RIFF',
+        36 + pcm_size,
+        b'WAVE',
+        b'fmt ',
+        16,
+        1,  # PCM
+        channels,
+        sample_rate,
+        sample_rate * block_align,
+        block_align,
+        sample_width * 8,
+        b'data',
+        pcm_size,
+    )
+
+
 def parse_range_header(range_header: str, file_size: int) -> tuple[int, int] | None:
     """
     Parse HTTP Range header and return (start, end) tuple.
@@ -109,10 +137,10 @@ def precache_audio_file(
             conversation_id=conversation_id,
             audio_file_id=audio_file_id,
             timestamps=timestamps,
-            pcm_to_wav_func=pcm_to_wav,
             fill_gaps=fill_gaps,
             sample_rate=AUDIO_SAMPLE_RATE,
             caller=caller,
+            return_data=False,
         )
     except HTTPException:
         raise
@@ -372,11 +400,18 @@ def _get_inline_download_payload(
             conversation_id=conversation_id,
             audio_file_id=audio_file_id,
             timestamps=audio_file['chunk_timestamps'],
-            pcm_to_wav_func=pcm_to_wav,
             fill_gaps=True,
             sample_rate=AUDIO_SAMPLE_RATE,
             caller='sync_download',
         )
+        if audio_data is None:
+            # Only return_data=False yields no bytes; merge inline rather than serve an empty body.
+            audio_data = pcm_to_wav(
+                download_audio_chunks_and_merge(
+                    uid, conversation_id, audio_file['chunk_timestamps'], fill_gaps=True, sample_rate=AUDIO_SAMPLE_RATE
+                ),
+                sample_rate=AUDIO_SAMPLE_RATE,
+            )
         return audio_data, "audio/wav", "wav"
 
     audio_data = download_audio_chunks_and_merge(
@@ -385,6 +420,79 @@ def _get_inline_download_payload(
     return audio_data, "application/octet-stream", "pcm"
 
 
+def _download_headers(conversation_id: str, audio_file_id: str, extension: str) -> dict[str, str]:
+    # Create descriptive filename
+    filename = f"conversation_{conversation_id}_audio_{audio_file_id}.{extension}"
+    return {
+        "Content-Disposition": f"attachment; filename={filename}",
+        "Accept-Ranges": "bytes",
+        "Cache-Control": "public, max-age=3600",
+    }
+
+
+def _stream_seekable_range(
+    audio: SeekableMergedAudio,
+    format: str,
+    conversation_id: str,
+    audio_file_id: str,
+    range_header: str,
+) -> Response:
+    """Answer a Range request by decoding only the container blocks it covers."""
+    if format == "wav":
+        prefix, content_type, extension = wav_header(audio.size, AUDIO_SAMPLE_RATE), "audio/wav", "wav"
+    else:
+        prefix, content_type, extension = b'', "application/octet-stream", "pcm"
+    file_size = len(prefix) + audio.size
+    base_headers = _download_headers(conversation_id, audio_file_id, extension)
+
+    range_tuple = parse_range_header(range_header, file_size)
+    if range_tuple is None:
+        return Response(status_code=416, headers={"Content-Range": f"bytes */{file_size}", **base_headers})
+
+    start, end = range_tuple
+    body = prefix[start : end + 1]
+    if end >= len(prefix):
+        body += audio.read(max(start, len(prefix)) - len(prefix), end + 1 - len(prefix))
+    return StreamingResponse(
+        io.BytesIO(body),
+        status_code=206,
+        media_type=content_type,
+        headers={
+            "Content-Length": str(len(body)),
+            "Content-Range": f"bytes {start}-{end}/{file_size}",
+            **base_headers,
+        },
+    )
+
+
+def _is_bounded_range(range_header: str) -> bool:
+    """Whether a Range names its end (or a suffix length) and spans at most SEEKABLE_RANGE_MAX_BYTES."""
+    # Against an unbounded size, "bytes=N-" spans everything and a suffix keeps its length.
+    range_tuple = parse_range_header(range_header, sys.maxsize)
+    if range_tuple is None:
+        return False
+    start, end = range_tuple
+    return end - start + 1 <= SEEKABLE_RANGE_MAX_BYTES
+
+
+def _try_seekable_range(
+    uid: str, conversation_id: str, audio_file_id: str, audio_file: dict[str, Any], format: str, range_header: str
+) -> Response | None:
+    """Range response from seekable chunks, or None to fall back to the full merge."""
+    if not _is_bounded_range(range_header):
+        return None
+    try:
+        seekable = get_seekable_merged_audio(
+            uid, conversation_id, audio_file['chunk_timestamps'], sample_rate=AUDIO_SAMPLE_RATE
+        )
+        if seekable is None:
+            return None
+        return _stream_seekable_range(seekable, format, conversation_id, audio_file_id, range_header)
+    except Exception as e:
+        logger.warning(f"Seekable range read failed, falling back to full merge: {e}")
+        return None
+
+
 def _stream_audio_response(
     audio_data: bytes,
     content_type: str,
@@ -393,15 +501,8 @@ def _stream_audio_response(
     audio_file_id: str,
     range_header: str | None,
 ) -> Response:
-    # Create descriptive filename
-    filename = f"conversation_{conversation_id}_audio_{audio_file_id}.{extension}"
     file_size = len(audio_data)
-
-    base_headers = {
-        "Content-Disposition": f"attachment; filename={filename}",
-        "Accept-Ranges": "bytes",
-        "Cache-Control": "public, max-age=3600",
-    }
+    base_headers = _download_headers(conversation_id, audio_file_id, extension)
 
     if range_header:
         # Parse the range request
@@ -463,6 +564,11 @@ def download_audio_file_response(
                 )
             audio_data, content_type, extension = payload
         else:
+            range_header = request.headers.get("Range")
+            if range_header:
+                response = _try_seekable_range(uid, conversation_id, audio_file_id, audio_file, format, range_header)
+                if response is not None:
+                    return response
             audio_data, content_type, extension = _get_inline_download_payload(
                 uid, conversation_id, audio_file_id, audio_file, format
             )
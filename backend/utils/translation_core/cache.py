@@ -7,7 +7,7 @@ import os
 from collections import OrderedDict
 from dataclasses import dataclass
 from threading import Lock
-from typing import Any, Callable, Protocol, cast
+from typing import Any, Callable, Protocol, Sequence, cast
 
 import redis
 from redis.exceptions import RedisError
@@ -37,6 +37,19 @@ class PersistentTranslationStore(Protocol):
 
     def put_negative(self, fingerprint: str, target_language: str, ttl_seconds: int) -> None: ...
 
+    def get_many(self, fingerprints: Sequence[str], target_language: str) -> dict[str, CachedTranslation]:
+        """Per-key fallback; stores with a batch read override it with one round-trip."""
+        found: dict[str, CachedTranslation] = {}
+        for fingerprint in fingerprints:
+            value = self.get(fingerprint, target_language)
+            if value is not None:
+                found[fingerprint] = value
+        return found
+
+    def is_negative_many(self, fingerprints: Sequence[str], target_language: str) -> set[str]:
+        """Per-key fallback; stores with a batch read override it with one round-trip."""
+        return {fingerprint for fingerprint in fingerprints if self.is_negative(fingerprint, target_language)}
+
 
 class RedisTranslationStore:
     """Lazy Redis adapter; importing translation never constructs a client."""
@@ -54,21 +67,25 @@ class RedisTranslationStore:
             raw = client.get(_translation_key(fingerprint, target_language))
         except RedisError:
             return None
-        if raw is None:
-            return None
+        return _decode_cached_translation(raw)
+
+    def get_many(self, fingerprints: Sequence[str], target_language: str) -> dict[str, CachedTranslation]:
+        """Read every fingerprint with one MGET; unreadable or malformed entries are misses."""
+        if not fingerprints:
+            return {}
+        client = self._get_configured_client()
+        if client is None:
+            return {}
         try:
-            decoded = raw.decode('utf-8') if isinstance(raw, bytes) else str(raw)
-            value: object = json.loads(decoded)
-        except (UnicodeDecodeError, TypeError, ValueError, json.JSONDecodeError):
-            return None
-        if not isinstance(value, dict):
-            return None
-        payload = cast(dict[object, object], value)
-        text = payload.get('text')
-        detected_language = payload.get('detected_lang', '')
-        if not isinstance(text, str) or not text.strip() or not isinstance(detected_language, str):
-            return None
-        return CachedTranslation(text=text, detected_language=detected_language)
+            raws = client.mget([_translation_key(fingerprint, target_language) for fingerprint in fingerprints])
+        except RedisError:
+            return {}
+        found: dict[str, CachedTranslation] = {}
+        for fingerprint, raw in zip(fingerprints, raws):
+            value = _decode_cached_translation(raw)
+            if value is not None:
+                found[fingerprint] = value
+        return found
 
     def put(
         self,
@@ -101,6 +118,19 @@ class RedisTranslationStore:
         except RedisError:
             return False
 
+    def is_negative_many(self, fingerprints: Sequence[str], target_language: str) -> set[str]:
+        """Check every negative marker with one MGET; a present key is a hit, as with EXISTS."""
+        if not fingerprints:
+            return set()
+        client = self._get_configured_client()
+        if client is None:
+            return set()
+        try:
+            raws = client.mget([_negative_key(fingerprint, target_language) for fingerprint in fingerprints])
+        except RedisError:
+            return set()
+        return {fingerprint for fingerprint, raw in zip(fingerprints, raws) if raw is not None}
+
     def put_negative(self, fingerprint: str, target_language: str, ttl_seconds: int) -> None:
         client = self._get_configured_client()
         if client is None:
@@ -162,6 +192,35 @@ class TranslationCache:
             self._put_memory(key, persistent_value)
         return persistent_value
 
+    def get_many(self, fingerprints: Sequence[str], target_language: str) -> dict[str, CachedTranslation]:
+        """Resolve fingerprints from memory, then all memory misses in one persistent read."""
+        found: dict[str, CachedTranslation] = {}
+        misses: list[str] = []
+        with self._memory_lock:
+            for fingerprint in dict.fromkeys(fingerprints):
+                key = _memory_key(fingerprint, target_language)
+                memory_value = self._memory.pop(key, None)
+                if memory_value is not None:
+                    self._memory[key] = memory_value
+                    found[fingerprint] = memory_value
+                else:
+                    misses.append(fingerprint)
+        for _fingerprint in found:
+            self._metrics.cache('memory', 'hit')
+        for _fingerprint in misses:
+            self._metrics.cache('memory', 'miss')
+
+        if self._persistent is None or not misses:
+            return found
+        persistent_values = self._persistent.get_many(misses, target_language)
+        for fingerprint in misses:
+            persistent_value = persistent_values.get(fingerprint)
+            self._metrics.cache('redis', 'hit' if persistent_value is not None else 'miss')
+            if persistent_value is not None:
+                self._put_memory(_memory_key(fingerprint, target_language), persistent_value)
+                found[fingerprint] = persistent_value
+        return found
+
     def put(
         self,
         fingerprint: str,
@@ -182,6 +241,15 @@ class TranslationCache:
         self._metrics.cache('negative', 'hit' if found else 'miss')
         return found
 
+    def is_negative_many(self, fingerprints: Sequence[str], target_language: str) -> set[str]:
+        if self._persistent is None or not fingerprints:
+            return set()
+        unique = list(dict.fromkeys(fingerprints))
+        found = self._persistent.is_negative_many(unique, target_language)
+        for fingerprint in unique:
+            self._metrics.cache('negative', 'hit' if fingerprint in found else 'miss')
+        return found
+
     def put_negative(self, fingerprint: str, target_language: str, profile: TranslationProfile) -> None:
         if self._persistent is not None:
             self._persistent.put_negative(fingerprint, target_language, profile.negative_cache_ttl_seconds)
@@ -225,6 +293,24 @@ def _create_redis_client() -> Any:
     )
 
 
+def _decode_cached_translation(raw: object) -> CachedTranslation | None:
+    if raw is None:
+        return None
+    try:
+        decoded = raw.decode('utf-8') if isinstance(raw, bytes) else str(raw)
+        value: object = json.loads(decoded)
+    except (UnicodeDecodeError, TypeError, ValueError, json.JSONDecodeError):
+        return None
+    if not isinstance(value, dict):
+        return None
+    payload = cast(dict[object, object], value)
+    text = payload.get('text')
+    detected_language = payload.get('detected_lang', '')
+    if not isinstance(text, str) or not text.strip() or not isinstance(detected_language, str):
+        return None
+    return CachedTranslation(text=text, detected_language=detected_language)
+
+
 def _translation_key(fingerprint: str, target_language: str) -> str:
     return f'translate:v1:{fingerprint}:{target_language}'
 
@@ -65,16 +65,27 @@ class TranslationEngine:
         outcomes: dict[int, TranslationOutcome] = {}
         pending: list[TranslationUnit] = []
 
+        # Each lookup phase is one batched read for the whole call (then one more
+        # for the negative markers of what missed), not a round-trip per unit.
+        full_fingerprints: dict[int, str] = {}
         for unit in units:
-            full_fingerprint = fingerprint_text(unit.text)
             if not unit.text.strip():
                 outcomes[unit.ordinal] = _unchanged(unit, '')
                 continue
-            cached = self.cache.get(full_fingerprint, target_language)
+            full_fingerprints[unit.ordinal] = fingerprint_text(unit.text)
+        cached_units = self.cache.get_many(list(full_fingerprints.values()), target_language)
+        unresolved = [fingerprint for fingerprint in full_fingerprints.values() if fingerprint not in cached_units]
+        negative_units = self.cache.is_negative_many(unresolved, target_language) if unresolved else set()
+
+        for unit in units:
+            full_fingerprint = full_fingerprints.get(unit.ordinal)
+            if full_fingerprint is None:
+                continue
+            cached = cached_units.get(full_fingerprint)
             if cached is not None:
                 outcomes[unit.ordinal] = _outcome_from_value(unit, cached)
                 continue
-            if self.cache.is_negative(full_fingerprint, target_language):
+            if full_fingerprint in negative_units:
                 outcomes[unit.ordinal] = _unchanged(unit, _base_language(target_language))
                 continue
             pending.append(unit)
@@ -87,11 +98,19 @@ class TranslationEngine:
         segment_text: dict[str, str] = {segment.fingerprint: segment.text for segment in plan.unique_segments}
         missing: list[tuple[str, str]] = []
 
+        cached_segments = self.cache.get_many(
+            [segment.fingerprint for segment in plan.unique_segments], target_language
+        )
+        unresolved = [
+            segment.fingerprint for segment in plan.unique_segments if segment.fingerprint not in cached_segments
+        ]
+        negative_segments = self.cache.is_negative_many(unresolved, target_language) if unresolved else set()
+
         for segment in plan.unique_segments:
-            cached = self.cache.get(segment.fingerprint, target_language)
+            cached = cached_segments.get(segment.fingerprint)
             if cached is not None:
                 segment_values[segment.fingerprint] = cached
-            elif self.cache.is_negative(segment.fingerprint, target_language):
+            elif segment.fingerprint in negative_segments:
                 # A negative-cache hit marks "this segment needs no translation", which is not a
                 # language detection. It must not vote in the unit's dominant language, or a unit
                 # mixing cached target-language text with foreign speech reports the target
@@ -4,9 +4,11 @@ Wrapped 2025 generation logic.
 Computes analytics from user's 2025 data and generates LLM-based insights.
 """
 
+import os
+import threading
 from collections import Counter
-from datetime import datetime, timezone, date
-from typing import List, Dict, Any, Set, cast
+from datetime import datetime, timedelta, timezone, date
+from typing import Callable, List, Dict, Any, Optional, Set, cast
 
 import database.wrapped as wrapped_db
 import database.conversations as conversations_db
@@ -16,6 +18,7 @@ from models.conversation import Conversation
 from utils.conversations.factory import deserialize_conversations
 from utils.llm.clients import get_llm
 from utils.notifications import send_notification
+from utils.wrapped.stages import Stage, run_stages
 import json
 import logging
 
@@ -26,6 +29,23 @@ logger = logging.getLogger(__name__)
 YEAR_2025_START = datetime(2025, 1, 1, 0, 0, 0, tzinfo=timezone.utc)
 YEAR_2025_END = datetime(2026, 1, 1, 0, 0, 0, tzinfo=timezone.utc)
 
+# Conversations are read a page at a time, up to the same cap the single fetch used.
+_CONVERSATION_PAGE_SIZE = 200
+_MAX_CONVERSATIONS = 10000
+# LLM context is title + overview lines, newest first, up to this many characters.
+_MAX_CONTEXT_CHARS = 800000
+# Signature phrases are counted over the most recent conversations only.
+_SIGNATURE_PHRASE_SAMPLE = 50
+
+# Independent LLM analyses run side by side, up to WRAPPED_STAGE_CONCURRENCY per generation and
+# WRAPPED_MAX_LLM_CALLS across all generations in this process, so a burst of Wrapped requests
+# queues for model slots instead of multiplying them.
+WRAPPED_STAGE_CONCURRENCY = int(os.getenv("WRAPPED_STAGE_CONCURRENCY", "4"))
+WRAPPED_MAX_LLM_CALLS = int(os.getenv("WRAPPED_MAX_LLM_CALLS", "8"))
+_llm_slots = threading.BoundedSemaphore(WRAPPED_MAX_LLM_CALLS)
+# Stage results an unfinished generation checkpointed are reused by a retry within this window.
+_STAGE_CHECKPOINT_MAX_AGE = timedelta(hours=24)
+
 # Common phrases to look for (safe, non-sensitive)
 SIGNATURE_PHRASES = [
     "let's do this",
@@ -124,12 +144,12 @@ def _find_signature_phrases(conversations: List[Conversation], sample_size: int
     return dict(phrase_counts)
 
 
-def _determine_archetype_with_llm(conversations: List[Conversation], stats: Dict[str, Any]) -> Dict[str, str]:
+def _determine_archetype_with_llm(corpus: '_WrappedCorpus', stats: Dict[str, Any]) -> Dict[str, str]:
     """Use Gemini to determine decision style archetype based on conversation patterns."""
     logger.info(f"[Wrapped]   - Starting decision style analysis with Gemini...")
 
     try:
-        context = _build_conversations_context(conversations, max_chars=300000)
+        context = corpus.context(max_chars=300000)
         logger.info(f"[Wrapped]     - Built context: {len(context)} chars")
 
         archetypes_str = "\n".join([f"- {a['name']}: {a['description']}" for a in DECISION_ARCHETYPES])
@@ -182,12 +202,12 @@ Make the description specific to THIS person based on what you see in their conv
         return {"name": "Reflective Executor", "description": "You think deeply, then move decisively."}
 
 
-def _find_top_phrases_with_llm(conversations: List[Conversation]) -> List[Dict[str, Any]]:
+def _find_top_phrases_with_llm(corpus: '_WrappedCorpus') -> List[Dict[str, Any]]:
     """Use Gemini to find the user's top 5 most used phrases."""
     logger.info(f"[Wrapped]   - Starting top phrases analysis with Gemini...")
 
     try:
-        context = _build_conversations_context(conversations, max_chars=400000)
+        context = corpus.context(max_chars=400000)
         logger.info(f"[Wrapped]     - Built context: {len(context)} chars")
 
         prompt = f"""Analyze these conversation summaries and identify this person's TOP 5 MOST USED PHRASES or expressions.
@@ -246,39 +266,84 @@ Be specific with actual phrases from their conversations. Avoid generic filler w
         ]
 
 
-def _build_conversations_context(conversations: List[Conversation], max_chars: int = 800000) -> str:
-    """Build a context string from conversations for Gemini analysis (title + overview for broad coverage)."""
-    context_parts: List[str] = []
-    total_chars = 0
-
-    for conv in conversations:
-        if not conv.created_at:
-            continue
-
-        date_str = conv.created_at.strftime("%Y-%m-%d %H:%M")
-        title = conv.structured.title if conv.structured else "Untitled"
-        overview = conv.structured.overview if conv.structured else ""
-
-        # Use only title and overview for broader coverage (no transcript)
-        entry = f"[{date_str}] {title}: {overview}\n"
+def _context_entry(conv: Conversation) -> str:
+    """One conversation's line of LLM context (title + overview for broad coverage, no transcript)."""
+    date_str = conv.created_at.strftime("%Y-%m-%d %H:%M")
+    title = conv.structured.title if conv.structured else "Untitled"
+    overview = conv.structured.overview if conv.structured else ""
+    return f"[{date_str}] {title}: {overview}\n"
 
-        if total_chars + len(entry) > max_chars:
-            break
 
-        context_parts.append(entry)
-        total_chars += len(entry)
-
-    return "\n".join(context_parts)
+class _WrappedCorpus:
+    """
+    What generation needs from the year's conversations, folded in one page at a time.
 
+    Keeps the numbers the stats are computed from and the context lines shared by
+    every LLM stage, instead of every conversation with its transcript.
+    """
 
-def _analyze_memorable_days_with_llm(conversations: List[Conversation]) -> Dict[str, Any]:
+    def __init__(self):
+        self.count = 0
+        self.first_created_at: Optional[datetime] = None
+        self.last_created_at: Optional[datetime] = None
+        self.active_days: Set[date] = set()
+        self.total_seconds = 0.0
+        self.category_counts: Counter[str] = Counter()
+        self.phrase_counts: Counter[str] = Counter()
+        self._context_entries: List[str] = []
+        self._context_chars = 0
+        self._context_full = False
+        self._contexts: Dict[int, str] = {}
+        self._contexts_lock = threading.Lock()
+
+    def add(self, conversations: List[Conversation]) -> None:
+        """Fold in the next page (conversations arrive newest first)."""
+        sample_left = _SIGNATURE_PHRASE_SAMPLE - self.count
+        if sample_left > 0:
+            self.phrase_counts.update(_find_signature_phrases(conversations[:sample_left]))
+
+        for conv in conversations:
+            self.count += 1
+            if conv.created_at:
+                self.first_created_at = self.first_created_at or conv.created_at
+                self.last_created_at = conv.created_at
+                self.active_days.add(conv.created_at.date())
+            self.total_seconds += _compute_conversation_duration(conv)
+            cat = conv.structured.category.value if conv.structured and conv.structured.category else "other"
+            self.category_counts[cat] += 1
+
+            if conv.created_at and not self._context_full:
+                entry = _context_entry(conv)
+                if self._context_chars + len(entry) > _MAX_CONTEXT_CHARS:
+                    self._context_full = True
+                else:
+                    self._context_entries.append(entry)
+                    self._context_chars += len(entry)
+
+    def context(self, max_chars: int = _MAX_CONTEXT_CHARS) -> str:
+        """Context string for Gemini analysis: newest conversations first, up to ``max_chars``."""
+        with self._contexts_lock:
+            if max_chars in self._contexts:
+                return self._contexts[max_chars]
+            parts: List[str] = []
+            total_chars = 0
+            for entry in self._context_entries:
+                if total_chars + len(entry) > max_chars:
+                    break
+                parts.append(entry)
+                total_chars += len(entry)
+            self._contexts[max_chars] = "\n".join(parts)
+            return self._contexts[max_chars]
+
+
+def _analyze_memorable_days_with_llm(corpus: '_WrappedCorpus') -> Dict[str, Any]:
     """Use Gemini to analyze and find the most memorable days of the year."""
     logger.info(f"[Wrapped]   - Starting memorable days analysis with Gemini...")
 
     try:
         # Build context from all conversations
-        context = _build_conversations_context(conversations)
-        logger.info(f"[Wrapped]     - Built context: {len(context)} chars from {len(conversations)} conversations")
+        context = corpus.context()
+        logger.info(f"[Wrapped]     - Built context: {len(context)} chars from {corpus.count} conversations")
 
         prompt = f"""Analyze these conversation transcripts from someone's year and identify the most memorable days.
 
@@ -360,12 +425,12 @@ Be specific and reference actual events from the conversations. Make titles catc
         }
 
 
-def _find_funniest_event_with_llm(conversations: List[Conversation]) -> Dict[str, Any]:
+def _find_funniest_event_with_llm(corpus: '_WrappedCorpus') -> Dict[str, Any]:
     """Use Gemini to find the funniest event/moment from the year."""
     logger.info(f"[Wrapped]   - Starting funniest event analysis with Gemini...")
 
     try:
-        context = _build_conversations_context(conversations)
+        context = corpus.context()
         logger.info(f"[Wrapped]     - Built context: {len(context)} chars")
 
         prompt = f"""Analyze these conversation transcripts and find the FUNNIEST moment or event from this person's year.
@@ -420,12 +485,12 @@ Pick something genuinely funny and retell it in an entertaining way. Make the us
         }
 
 
-def _find_most_embarrassing_event_with_llm(conversations: List[Conversation]) -> Dict[str, Any]:
+def _find_most_embarrassing_event_with_llm(corpus: '_WrappedCorpus') -> Dict[str, Any]:
     """Use Gemini to find the most embarrassing moment from the year."""
     logger.info(f"[Wrapped]   - Starting most embarrassing event analysis with Gemini...")
 
     try:
-        context = _build_conversations_context(conversations)
+        context = corpus.context()
         logger.info(f"[Wrapped]     - Built context: {len(context)} chars")
 
         prompt = f"""Analyze these conversation transcripts and find the MOST EMBARRASSING moment or event from this person's year.
@@ -480,12 +545,12 @@ Frame it in a lighthearted, relatable way - we've all been there! Make it funny
         }
 
 
-def _find_top_buddies_with_llm(conversations: List[Conversation]) -> List[Dict[str, Any]]:
+def _find_top_buddies_with_llm(corpus: '_WrappedCorpus') -> List[Dict[str, Any]]:
     """Use Gemini to find the top 5 people the user interacted with most."""
     logger.info(f"[Wrapped]   - Starting top buddies analysis with Gemini...")
 
     try:
-        context = _build_conversations_context(conversations)
+        context = corpus.context()
         logger.info(f"[Wrapped]     - Built context: {len(context)} chars")
 
         prompt = f"""Analyze these conversation transcripts and identify the TOP 5 PEOPLE this person interacted with, talked about, or mentioned most frequently throughout the year.
@@ -560,12 +625,12 @@ IMPORTANT:
         ]
 
 
-def _find_obsessions_with_llm(conversations: List[Conversation]) -> Dict[str, Any]:
+def _find_obsessions_with_llm(corpus: '_WrappedCorpus') -> Dict[str, Any]:
     """Find what shows, movies, books, celebrities, and food the user couldn't stop talking about."""
     logger.info(f"[Wrapped]   - Starting obsessions analysis with Gemini...")
 
     try:
-        context = _build_conversations_context(conversations)
+        context = corpus.context()
         logger.info(f"[Wrapped]     - Built context: {len(context)} chars")
 
         prompt = f"""Analyze these conversation summaries and find what this person COULDN'T STOP TALKING ABOUT in 2025.
@@ -624,12 +689,12 @@ Be specific with actual names. If something isn't clearly mentioned, make your b
         }
 
 
-def _find_movie_recommendations_with_llm(conversations: List[Conversation]) -> List[str]:
+def _find_movie_recommendations_with_llm(corpus: '_WrappedCorpus') -> List[str]:
     """Find 5 movies the user would recommend to friends based on their conversations."""
     logger.info(f"[Wrapped]   - Starting movie recommendations analysis with Gemini...")
 
     try:
-        context = _build_conversations_context(conversations)
+        context = corpus.context()
         logger.info(f"[Wrapped]     - Built context: {len(context)} chars")
 
         prompt = f"""Analyze these conversation summaries and determine 5 MOVIES this person would recommend to friends.
@@ -681,12 +746,12 @@ Include a mix of movies they mentioned AND movies that match their vibe/interest
         ]
 
 
-def _find_struggles_and_wins_with_llm(conversations: List[Conversation]) -> Dict[str, Any]:
+def _find_struggles_and_wins_with_llm(corpus: '_WrappedCorpus') -> Dict[str, Any]:
     """Find the biggest struggle and personal win of the year."""
     logger.info(f"[Wrapped]   - Starting struggles and wins analysis with Gemini...")
 
     try:
-        context = _build_conversations_context(conversations)
+        context = corpus.context()
         logger.info(f"[Wrapped]     - Built context: {len(context)} chars")
 
         prompt = f"""Analyze these conversation summaries and identify the most significant STRUGGLE and WIN from this person's year.
@@ -743,12 +808,91 @@ Be specific and empathetic. These should feel personal and meaningful."""
         }
 
 
+def _fetch_corpus(uid: str) -> _WrappedCorpus:
+    """Stream the year's completed conversations page by page into a compact corpus."""
+    corpus = _WrappedCorpus()
+    for page in conversations_db.iter_conversation_pages_in_range(
+        uid,
+        start_date=YEAR_2025_START,
+        end_date=YEAR_2025_END,
+        statuses=["completed"],
+        include_discarded=False,
+        page_size=_CONVERSATION_PAGE_SIZE,
+        max_conversations=_MAX_CONVERSATIONS,
+    ):
+        corpus.add(deserialize_conversations(page))
+
+    logger.info(f"[Wrapped]   - Found {corpus.count} conversations for 2025")
+    if corpus.count:
+        logger.info(f"[Wrapped]   - First conversation date: {corpus.first_created_at}")
+        logger.info(f"[Wrapped]   - Last conversation date: {corpus.last_created_at}")
+    return corpus
+
+
+def _fetch_action_items(uid: str) -> List[Dict[str, Any]]:
+    action_items = action_items_db.get_action_items(
+        uid=uid,
+        start_date=YEAR_2025_START,
+        end_date=YEAR_2025_END,
+        limit=10000,
+    )
+    completed_count = sum(1 for item in action_items if item.get("completed", False))
+    logger.info(f"[Wrapped]   - Found {len(action_items)} action items for 2025")
+    logger.info(f"[Wrapped]   - Completed: {completed_count}, Pending: {len(action_items) - completed_count}")
+    return action_items
+
+
+def _with_llm_slot(fn: Callable[..., Any]) -> Callable[..., Any]:
+    def run(**kwargs: Any) -> Any:
+        with _llm_slots:
+            return fn(**kwargs)
+
+    return run
+
+
+def _wrapped_stages(uid: str) -> List[Stage]:
+    """The generation graph: two fetches feed the stats and the shared corpus every LLM stage reads."""
+    return [
+        Stage("corpus", lambda: _fetch_corpus(uid), checkpoint=False),
+        Stage("action_items", lambda: _fetch_action_items(uid), checkpoint=False),
+        Stage("stats", _compute_all_stats, deps=("corpus", "action_items")),
+        Stage("decision_style", _with_llm_slot(_determine_archetype_with_llm), deps=("corpus", "stats")),
+        Stage("top_phrases", _with_llm_slot(_find_top_phrases_with_llm), deps=("corpus",)),
+        Stage("memorable_days", _with_llm_slot(_analyze_memorable_days_with_llm), deps=("corpus",)),
+        Stage("funniest_event", _with_llm_slot(_find_funniest_event_with_llm), deps=("corpus",)),
+        Stage("most_embarrassing_event", _with_llm_slot(_find_most_embarrassing_event_with_llm), deps=("corpus",)),
+        Stage("top_buddies", _with_llm_slot(_find_top_buddies_with_llm), deps=("corpus",)),
+        Stage("obsessions", _with_llm_slot(_find_obsessions_with_llm), deps=("corpus",)),
+        Stage("movie_recommendations", _with_llm_slot(_find_movie_recommendations_with_llm), deps=("corpus",)),
+        Stage("struggles_wins", _with_llm_slot(_find_struggles_and_wins_with_llm), deps=("corpus",)),
+    ]
+
+
+_STAGE_PROGRESS_STEPS = {
+    "corpus": "Fetching conversations...",
+    "action_items": "Fetching action items...",
+    "stats": "Computing statistics...",
+    "decision_style": "Analyzing your personality...",
+    "top_phrases": "Finding your catchphrases...",
+    "memorable_days": "Finding your memorable days...",
+    "funniest_event": "Finding your funniest moment...",
+    "most_embarrassing_event": "Finding your most cringe moment...",
+    "top_buddies": "Finding your top buddies...",
+    "obsessions": "Finding your obsessions...",
+    "movie_recommendations": "Generating movie recommendations...",
+    "struggles_wins": "Finding your wins and struggles...",
+}
+
+
 def generate_wrapped_2025(uid: str, year: int = 2025):
     """
     Generate Wrapped 2025 for a user.
 
     This fetches all 2025 data, computes analytics, generates LLM insights,
-    and stores the result in Firestore.
+    and stores the result in Firestore. The steps run as a stage graph (see
+    ``_wrapped_stages``): independent LLM analyses run concurrently, and each
+    finished stage is checkpointed so a retry after a failure only reruns the
+    stages that had not finished.
     """
     import time
 
@@ -757,169 +901,54 @@ def generate_wrapped_2025(uid: str, year: int = 2025):
     try:
         logger.info(f"[Wrapped] ========== Starting Wrapped 2025 generation for user {uid} ==========")
         logger.info(f"[Wrapped] Date range: {YEAR_2025_START} to {YEAR_2025_END}")
-
-        # Step 1: Fetch conversations
-        step_start = time.time()
         _update_progress(uid, year, "Fetching conversations...", 0.1)
-        logger.info(f"[Wrapped] Step 1: Fetching conversations...")
-
-        conversations_data = conversations_db.get_conversations_without_photos(
-            uid=uid,
-            limit=10000,  # Get all conversations for the year
-            offset=0,
-            include_discarded=False,
-            statuses=["completed"],
-            start_date=YEAR_2025_START,
-            end_date=YEAR_2025_END,
-        )
-
-        conversations = deserialize_conversations(conversations_data)
-        logger.info(
-            f"[Wrapped] Step 1 complete: Found {len(conversations)} conversations for 2025 (took {time.time() - step_start:.2f}s)"
-        )
-
-        if conversations:
-            logger.info(f"[Wrapped]   - First conversation date: {conversations[0].created_at}")
-            logger.info(f"[Wrapped]   - Last conversation date: {conversations[-1].created_at}")
-
-        # Step 2: Fetch action items
-        step_start = time.time()
-        _update_progress(uid, year, "Fetching action items...", 0.2)
-        logger.info(f"[Wrapped] Step 2: Fetching action items...")
-
-        action_items = action_items_db.get_action_items(
-            uid=uid,
-            start_date=YEAR_2025_START,
-            end_date=YEAR_2025_END,
-            limit=10000,
-        )
-        logger.info(
-            f"[Wrapped] Step 2 complete: Found {len(action_items)} action items for 2025 (took {time.time() - step_start:.2f}s)"
-        )
-
-        completed_count = sum(1 for item in action_items if item.get("completed", False))
-        logger.info(f"[Wrapped]   - Completed: {completed_count}, Pending: {len(action_items) - completed_count}")
-
-        # Step 3: Compute basic stats
-        step_start = time.time()
-        _update_progress(uid, year, "Computing statistics...", 0.3)
-        logger.info(f"[Wrapped] Step 3: Computing statistics...")
-
-        result = _compute_all_stats(conversations, action_items)
-        logger.info(f"[Wrapped] Step 3 complete: Statistics computed (took {time.time() - step_start:.2f}s)")
-        logger.info(f"[Wrapped]   - Total hours: {result.get('total_time_hours', 0)}")
-        logger.info(f"[Wrapped]   - Top categories: {result.get('top_categories', [])}")
-        logger.info(f"[Wrapped]   - Signature phrase: {result.get('signature_phrase', {})}")
-
-        # Step 4: Determine decision style with Gemini
-        step_start = time.time()
-        _update_progress(uid, year, "Analyzing your personality...", 0.50)
-        logger.info(f"[Wrapped] Step 4: Analyzing decision style with Gemini...")
-
-        decision_style = _determine_archetype_with_llm(conversations, result)
-        result["decision_style"] = decision_style
-        logger.info(f"[Wrapped] Step 4 complete: Decision style analyzed (took {time.time() - step_start:.2f}s)")
-        logger.info(f"[Wrapped]   - Archetype: {decision_style.get('name')}")
-
-        # Step 5: Find top phrases with Gemini
-        step_start = time.time()
-        _update_progress(uid, year, "Finding your catchphrases...", 0.58)
-        logger.info(f"[Wrapped] Step 5: Finding top phrases with Gemini...")
 
-        top_phrases = _find_top_phrases_with_llm(conversations)
-        result["top_phrases"] = top_phrases
-        logger.info(f"[Wrapped] Step 5 complete: Top phrases found (took {time.time() - step_start:.2f}s)")
-        logger.info(f"[Wrapped]   - Top phrases: {len(top_phrases)} found")
-
-        # Step 6: Analyze memorable days with Gemini
-        step_start = time.time()
-        _update_progress(uid, year, "Finding your memorable days...", 0.65)
-        logger.info(f"[Wrapped] Step 6: Analyzing memorable days with Gemini...")
-
-        memorable_days = _analyze_memorable_days_with_llm(conversations)
-        result["memorable_days"] = memorable_days
-        logger.info(f"[Wrapped] Step 6 complete: Memorable days analyzed (took {time.time() - step_start:.2f}s)")
-        logger.info(f"[Wrapped]   - Most fun day: {memorable_days.get('most_fun_day', {}).get('title', 'N/A')}")
-        logger.info(
-            f"[Wrapped]   - Most productive day: {memorable_days.get('most_productive_day', {}).get('title', 'N/A')}"
-        )
-        logger.info(
-            f"[Wrapped]   - Most stressful day: {memorable_days.get('most_stressful_day', {}).get('title', 'N/A')}"
+        def on_stage_start(stage: Stage, finished: int, total: int) -> None:
+            _update_progress(
+                uid, year, _STAGE_PROGRESS_STEPS.get(stage.name, "Working..."), 0.1 + 0.85 * finished / total
+            )
+
+        outputs = run_stages(
+            _wrapped_stages(uid),
+            max_workers=WRAPPED_STAGE_CONCURRENCY,
+            checkpoints=wrapped_db.get_wrapped_stage_results(uid, year, max_age=_STAGE_CHECKPOINT_MAX_AGE),
+            save_checkpoint=lambda name, value: wrapped_db.save_wrapped_stage_result(uid, year, name, value),
+            on_stage_start=on_stage_start,
         )
 
-        # Step 7: Find funniest event with Gemini
-        step_start = time.time()
-        _update_progress(uid, year, "Finding your funniest moment...", 0.72)
-        logger.info(f"[Wrapped] Step 7: Finding funniest event with Gemini...")
-
-        funniest_event = _find_funniest_event_with_llm(conversations)
-        result["funniest_event"] = funniest_event
-        logger.info(f"[Wrapped] Step 7 complete: Funniest event found (took {time.time() - step_start:.2f}s)")
-        logger.info(f"[Wrapped]   - Funniest: {funniest_event.get('title', 'N/A')}")
-
-        # Step 8: Find most embarrassing event with Gemini
-        step_start = time.time()
-        _update_progress(uid, year, "Finding your most cringe moment...", 0.78)
-        logger.info(f"[Wrapped] Step 8: Finding most embarrassing event with Gemini...")
-
-        embarrassing_event = _find_most_embarrassing_event_with_llm(conversations)
-        result["most_embarrassing_event"] = embarrassing_event
-        logger.info(f"[Wrapped] Step 8 complete: Embarrassing event found (took {time.time() - step_start:.2f}s)")
-        logger.info(f"[Wrapped]   - Most embarrassing: {embarrassing_event.get('title', 'N/A')}")
-
-        # Step 9: Find top buddies with Gemini
-        step_start = time.time()
-        _update_progress(uid, year, "Finding your top buddies...", 0.80)
-        logger.info(f"[Wrapped] Step 9: Finding top buddies with Gemini...")
-
-        top_buddies = _find_top_buddies_with_llm(conversations)
-        result["top_buddies"] = top_buddies
-        logger.info(f"[Wrapped] Step 9 complete: Top buddies found (took {time.time() - step_start:.2f}s)")
-        logger.info(f"[Wrapped]   - Top buddies: {len(top_buddies)} found")
-
-        # Step 10: Find obsessions (shows, movies, books, celebrities, food)
-        step_start = time.time()
-        _update_progress(uid, year, "Finding your obsessions...", 0.86)
-        logger.info(f"[Wrapped] Step 10: Finding obsessions with Gemini...")
-
-        obsessions = _find_obsessions_with_llm(conversations)
-        result["obsessions"] = obsessions
-        logger.info(f"[Wrapped] Step 10 complete: Obsessions found (took {time.time() - step_start:.2f}s)")
-        logger.info(f"[Wrapped]   - Obsessions: {obsessions}")
-
-        # Step 11: Find movie recommendations
-        step_start = time.time()
-        _update_progress(uid, year, "Generating movie recommendations...", 0.90)
-        logger.info(f"[Wrapped] Step 11: Finding movie recommendations with Gemini...")
-
-        movie_recs = _find_movie_recommendations_with_llm(conversations)
-        result["movie_recommendations"] = movie_recs
-        logger.info(f"[Wrapped] Step 11 complete: Movie recommendations found (took {time.time() - step_start:.2f}s)")
-        logger.info(f"[Wrapped]   - Movies: {movie_recs}")
-
-        # Step 12: Find struggles and wins
-        step_start = time.time()
-        _update_progress(uid, year, "Finding your wins and struggles...", 0.94)
-        logger.info(f"[Wrapped] Step 12: Finding struggles and wins with Gemini...")
-
-        struggles_wins = _find_struggles_and_wins_with_llm(conversations)
-        result["struggle"] = struggles_wins.get("struggle", {})
-        result["personal_win"] = struggles_wins.get("personal_win", {})
-        logger.info(f"[Wrapped] Step 12 complete: Struggles and wins found (took {time.time() - step_start:.2f}s)")
-
-        # Step 13: Save result
+        result: Dict[str, Any] = dict(outputs["stats"])
+        for name in (
+            "decision_style",
+            "top_phrases",
+            "memorable_days",
+            "funniest_event",
+            "most_embarrassing_event",
+            "top_buddies",
+            "obsessions",
+            "movie_recommendations",
+        ):
+            result[name] = outputs[name]
+        result["struggle"] = outputs["struggles_wins"].get("struggle", {})
+        result["personal_win"] = outputs["struggles_wins"].get("personal_win", {})
+        logger.info(f"[Wrapped]   - Archetype: {result['decision_style'].get('name')}")
+
+        # Save result
         step_start = time.time()
         _update_progress(uid, year, "Saving your Wrapped...", 0.98)
-        logger.info(f"[Wrapped] Step 13: Saving result to Firestore...")
+        logger.info(f"[Wrapped] Saving result to Firestore...")
 
         wrapped_db.update_wrapped_status(uid, year, WrappedStatus.DONE, result=result)
-        logger.info(f"[Wrapped] Step 13 complete: Result saved (took {time.time() - step_start:.2f}s)")
+        try:
+            wrapped_db.clear_wrapped_stage_results(uid, year)
+        except Exception as e:
+            logger.warning(f"[Wrapped] Could not clear stage checkpoints for user {uid}: {e}")
+        logger.info(f"[Wrapped] Result saved (took {time.time() - step_start:.2f}s)")
 
-        # Step 14: Send notification
+        # Send notification
         step_start = time.time()
-        logger.info(f"[Wrapped] Step 14: Sending notification...")
+        logger.info(f"[Wrapped] Sending notification...")
         _send_wrapped_ready_notification(uid)
-        logger.info(f"[Wrapped] Step 14 complete: Notification sent (took {time.time() - step_start:.2f}s)")
+        logger.info(f"[Wrapped] Notification sent (took {time.time() - step_start:.2f}s)")
 
         total_time = time.time() - start_time
         logger.info(f"[Wrapped] ========== Wrapped 2025 generation completed for user {uid} ==========")
@@ -935,43 +964,31 @@ def generate_wrapped_2025(uid: str, year: int = 2025):
         wrapped_db.update_wrapped_status(uid, year, WrappedStatus.ERROR, error=str(e))
 
 
-def _compute_all_stats(conversations: List[Conversation], action_items: List[Dict[str, Any]]) -> Dict[str, Any]:
-    """Compute all analytics stats from conversations and action items."""
-    logger.info(
-        f"[Wrapped]   - Computing stats from {len(conversations)} conversations, {len(action_items)} action items"
-    )
+def _compute_all_stats(corpus: _WrappedCorpus, action_items: List[Dict[str, Any]]) -> Dict[str, Any]:
+    """Compute all analytics stats from the conversation corpus and action items."""
+    logger.info(f"[Wrapped]   - Computing stats from {corpus.count} conversations, {len(action_items)} action items")
     result: Dict[str, Any] = {}
 
     # === Section 1: Your Year in Numbers ===
     logger.info(f"[Wrapped]   - Section 1: Year in Numbers...")
-    total_conversations = len(conversations)
+    total_conversations = corpus.count
     result["total_conversations"] = total_conversations
 
     # Days active (unique days with conversations)
-    active_days: Set[date] = set()
-    for conv in conversations:
-        if conv.created_at:
-            active_days.add(conv.created_at.date())
-    result["days_active"] = len(active_days)
-    logger.info(f"[Wrapped]     - Days active: {len(active_days)}")
+    result["days_active"] = len(corpus.active_days)
+    logger.info(f"[Wrapped]     - Days active: {len(corpus.active_days)}")
 
     # Total time
-    total_seconds = sum(_compute_conversation_duration(c) for c in conversations)
-    result["total_time_hours"] = round(total_seconds / 3600, 1)
+    result["total_time_hours"] = round(corpus.total_seconds / 3600, 1)
     logger.info(
         f"[Wrapped]     - Total time: {result['total_time_hours']} hours across {total_conversations} conversations"
     )
 
     # === Section 2: What You Talked About ===
     logger.info(f"[Wrapped]   - Section 2: Topics & Categories...")
-    category_counts: Counter[str] = Counter()
-
-    for conv in conversations:
-        cat = conv.structured.category.value if conv.structured and conv.structured.category else "other"
-        category_counts[cat] += 1
 
     # Top categories
-    top_cats = category_counts.most_common(5)
+    top_cats = corpus.category_counts.most_common(5)
     result["top_categories"] = [cat for cat, _ in top_cats]
     result["category_breakdown"] = [{"category": cat, "count": count} for cat, count in top_cats]
 
@@ -987,8 +1004,8 @@ def _compute_all_stats(conversations: List[Conversation], action_items: List[Dic
 
     # === Section 4: Voice Patterns ===
     logger.info(f"[Wrapped]   - Section 4: Voice Patterns...")
-    # Signature phrases
-    phrase_counts = _find_signature_phrases(conversations)
+    # Signature phrases (counted over the most recent conversations as they were streamed)
+    phrase_counts = corpus.phrase_counts
     logger.info(f"[Wrapped]     - Found {len(phrase_counts)} signature phrases")
     if phrase_counts:
         top_phrase = max(phrase_counts.items(), key=lambda x: x[1])
@@ -999,7 +1016,7 @@ def _compute_all_stats(conversations: List[Conversation], action_items: List[Dic
     else:
         result["signature_phrase"] = None
 
-    # Note: Decision style and top phrases computed via LLM in main function
+    # Note: Decision style and top phrases computed via LLM stages
 
     logger.info(f"[Wrapped]   - All stats computed successfully")
     return result
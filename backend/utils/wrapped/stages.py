@@ -0,0 +1,131 @@
+"""
+Dependency-ordered stage execution for Wrapped generation.
+
+A stage runs as soon as the stages it depends on have results, on a bounded
+thread pool, so independent LLM analyses overlap instead of running one after
+another. Checkpointed stage results are handed back on a retry and the stage is
+skipped; a stage only runs at all if some checkpointed stage still needs it.
+"""
+
+import logging
+import time
+from concurrent.futures import FIRST_COMPLETED, Future, ThreadPoolExecutor, wait
+from dataclasses import dataclass
+from typing import Any, Callable, Dict, List, Optional, Set, Tuple
+
+logger = logging.getLogger(__name__)
+
+
+@dataclass(frozen=True)
+class Stage:
+    """One unit of work. ``run`` is called with the results of ``deps`` as keyword arguments."""
+
+    name: str
+    run: Callable[..., Any]
+    deps: Tuple[str, ...] = ()
+    # Checkpointed stages are the outputs; the rest (fetches, shared context) exist to feed them.
+    checkpoint: bool = True
+
+
+def _validate(stages: Dict[str, Stage]) -> None:
+    for stage in stages.values():
+        unknown = [dep for dep in stage.deps if dep not in stages]
+        if unknown:
+            raise ValueError(f"stage {stage.name} depends on unknown stages: {unknown}")
+
+    visiting: Set[str] = set()
+    done: Set[str] = set()
+
+    def visit(name: str) -> None:
+        if name in done:
+            return
+        if name in visiting:
+            raise ValueError(f"stage dependency cycle through {name}")
+        visiting.add(name)
+        for dep in stages[name].deps:
+            visit(dep)
+        visiting.discard(name)
+        done.add(name)
+
+    for name in stages:
+        visit(name)
+
+
+def _stages_to_run(stages: Dict[str, Stage], results: Dict[str, Any]) -> Set[str]:
+    """Unfinished checkpointed stages plus whatever unfinished stages they transitively need."""
+    needed: Set[str] = set()
+    todo = [name for name, stage in stages.items() if stage.checkpoint and name not in results]
+    while todo:
+        name = todo.pop()
+        if name in needed:
+            continue
+        needed.add(name)
+        todo.extend(dep for dep in stages[name].deps if dep not in results)
+    return needed
+
+
+def run_stages(
+    stages: List[Stage],
+    *,
+    max_workers: int,
+    checkpoints: Optional[Dict[str, Any]] = None,
+    save_checkpoint: Optional[Callable[[str, Any], None]] = None,
+    on_stage_start: Optional[Callable[[Stage, int, int], None]] = None,
+) -> Dict[str, Any]:
+    """
+    Run ``stages`` in dependency order, up to ``max_workers`` at a time.
+
+    Args:
+        stages: The stage graph
+        max_workers: Stages running concurrently
+        checkpoints: Results saved by an earlier attempt, by stage name
+        save_checkpoint: Called with (name, result) as each checkpointed stage finishes;
+            a failure to save is logged and the run continues
+        on_stage_start: Called with (stage, finished count, count to run) before each stage
+
+    Returns:
+        Results of every checkpointed stage, by name
+
+    Raises:
+        The first exception a stage raises; stages not yet started are cancelled.
+    """
+    by_name = {stage.name: stage for stage in stages}
+    _validate(by_name)
+    results: Dict[str, Any] = {
+        name: value for name, value in (checkpoints or {}).items() if name in by_name and by_name[name].checkpoint
+    }
+    if results:
+        logger.info(f"[Wrapped] Resuming with checkpointed stages: {sorted(results)}")
+    pending = _stages_to_run(by_name, results)
+    total = len(pending)
+    started_at: Dict[str, float] = {}
+
+    with ThreadPoolExecutor(max_workers=max_workers, thread_name_prefix='wrapped-stage') as executor:
+        running: Dict[Future, str] = {}
+        try:
+            while pending or running:
+                ready = [name for name in pending if all(dep in results for dep in by_name[name].deps)]
+                for name in sorted(ready):
+                    stage = by_name[name]
+                    pending.discard(name)
+                    if on_stage_start is not None:
+                        on_stage_start(stage, total - len(pending) - len(running) - 1, total)
+                    started_at[name] = time.time()
+                    running[executor.submit(stage.run, **{dep: results[dep] for dep in stage.deps})] = name
+
+                finished, _ = wait(list(running), return_when=FIRST_COMPLETED)
+                for future in finished:
+                    name = running.pop(future)
+                    results[name] = future.result()
+                    logger.info(f"[Wrapped] Stage {name} complete (took {time.time() - started_at[name]:.2f}s)")
+                    if by_name[name].checkpoint and save_checkpoint is not None:
+                        try:
+                            save_checkpoint(name, results[name])
+                        except Exception as e:
+                            logger.warning(f"[Wrapped] Could not checkpoint stage {name}: {e}")
+        except BaseException:
+            for future in running:
+                future.cancel()
+            raise
+
+    return {name: value for name, value in results.items() if by_name[name].checkpoint}
@@ -35,8 +35,23 @@ function decryptText(encryptedB64: string, uid: string): string {
   }
 }
 
+// Binary enhanced layout: prefix + nonce + AES-GCM(zlib(json)); see backend/database/conversations.py
+const SEGMENTS_BLOB_V2_PREFIX = Buffer.from([0x00, 0x54, 0x53, 0x02]);
+
+function decryptSegmentsBlob(blob: Buffer, uid: string): Buffer {
+  const payload = blob.subarray(SEGMENTS_BLOB_V2_PREFIX.length);
+  const nonce = payload.subarray(0, 12);
+  const tag = payload.subarray(payload.length - 16);
+  const ciphertext = payload.subarray(12, payload.length - 16);
+
+  const decipher = crypto.createDecipheriv('aes-256-gcm', deriveKey(uid), nonce);
+  decipher.setAuthTag(tag);
+  return Buffer.concat([decipher.update(ciphertext), decipher.final()]);
+}
+
 // Decompress/decrypt transcript_segments stored in Firestore
-// Backend stores them as: compressed bytes (standard), encrypted+compressed string (enhanced), or raw array (legacy)
+// Backend stores them as: compressed bytes (standard), encrypted+compressed string or
+// prefixed encrypted bytes (enhanced), or raw array (legacy)
 function extractTranscriptSegments(convo: any, uid: string): any[] {
   const raw = convo.transcript_segments;
   if (!raw) return [];
@@ -44,6 +59,18 @@ function extractTranscriptSegments(convo: any, uid: string): any[] {
   // Legacy: already an array
   if (Array.isArray(raw)) return raw;
 
+  if (raw instanceof Uint8Array) {
+    const blob = Buffer.from(raw);
+    if (blob.subarray(0, SEGMENTS_BLOB_V2_PREFIX.length).equals(SEGMENTS_BLOB_V2_PREFIX)) {
+      try {
+        return JSON.parse(zlib.inflateSync(decryptSegmentsBlob(blob, uid)).toString('utf-8'));
+      } catch (e) {
+        console.error('Failed to extract transcript_segments:', e);
+        return [];
+      }
+    }
+  }
+
   const isCompressed = convo.transcript_segments_compressed === true;
   const isEncrypted = convo.data_protection_level === 'enhanced';
 